@@ -0,0 +1,191 @@
+# harness.py
+# Shared parallel, resumable runner for benchmark cells
+#
+# A benchmark is a grid of independent cells — (prompt, approach, repetition)
+# for the phase 2 comparisons, (domain, memory config) for the memory
+# benchmark, one cell per repetition for the reliability test. Each cell spends
+# nearly all its time waiting on the LLM API, so run_cells() fans them out over
+# a bounded pool instead of looping one at a time:
+#
+#   - "async" (default): cells run as tasks on one event loop, at most
+#     max_workers at a time. Coroutine cell functions are awaited (e.g. around
+#     run_assembly); plain functions run in worker threads. Output stays routed
+#     to the calling job, so this is the pool the dashboard uses.
+#   - "process": cells run in a ProcessPoolExecutor for full isolation. Cell
+#     functions must be module-level (picklable).
+#
+# Every finished cell is checkpointed to the benchmark's results file, so an
+# interrupted run picks up where it stopped when given the same file again.
+#
+# Usage:
+#   results = run_cells(cells, run_one_cell, results_path="results/x.json", max_workers=4)
+
+import asyncio
+import inspect
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+POOLS = ("async", "process")
+
+
+def cell_key(*parts: Any) -> str:
+    """Stable identifier for a cell, e.g. cell_key("finance_01", "assembly", 0)."""
+    return "/".join(str(part) for part in parts)
+
+
+def cell_session_name(key: str) -> str:
+    """
+    ConversationLogger session folder for a cell.
+
+    Default session names are per second, so cells started together would
+    share (and overwrite) one folder.
+    """
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", key).strip("_")
+    return f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{slug}"
+
+
+def results_path_for(output_dir: Optional[str], prefix: str, resume: Optional[str] = None) -> Optional[str]:
+    """
+    Results file for a run: the file being resumed, else a new timestamped
+    {prefix}_{timestamp}.json in output_dir (None if neither is given).
+    """
+    if resume:
+        return resume
+    if not output_dir:
+        return None
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+
+
+def load_checkpoint(results_path: Optional[str]) -> Dict[str, Any]:
+    """Cells already finished in a results file ({} if there is none)."""
+    if not results_path or not os.path.exists(results_path):
+        return {}
+    try:
+        with open(results_path, encoding="utf-8") as f:
+            return json.load(f).get("cells", {})
+    except (OSError, ValueError) as e:
+        print(f"[!] Could not read checkpoint {results_path}: {e}")
+        return {}
+
+
+def write_results(results_path: str, data: Dict[str, Any]) -> None:
+    """Write a results file atomically (a crash never leaves half a file)."""
+    directory = os.path.dirname(results_path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
+        os.replace(tmp_path, results_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _call_cell(run_cell: Callable, cell: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one cell to completion in the current thread/process."""
+    if inspect.iscoroutinefunction(run_cell):
+        return asyncio.run(run_cell(cell))
+    return run_cell(cell)
+
+
+def run_cells(
+    cells: List[Dict[str, Any]],
+    run_cell: Callable[[Dict[str, Any]], Any],
+    results_path: Optional[str] = None,
+    header: Optional[Dict[str, Any]] = None,
+    max_workers: int = 4,
+    pool: str = "async",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run every cell not already in the checkpoint, at most max_workers at once.
+
+    Args:
+        cells: Cell dicts, each with a unique "key" plus whatever run_cell needs
+        run_cell: Function (or coroutine function) taking a cell and returning
+            a JSON-serializable result dict
+        results_path: Results file to checkpoint into and resume from (None:
+            no checkpointing)
+        header: Written alongside the cells while the run is in progress
+            (test name, config, ...)
+        max_workers: Maximum cells running at the same time
+        pool: "async" or "process" (see module docstring)
+
+    Returns:
+        {key: result} for every cell, in the order of `cells`. A cell whose
+        run_cell raised gets {"error": ...} and is not checkpointed, so it is
+        retried on resume.
+    """
+    if pool not in POOLS:
+        raise ValueError(f"Unknown pool '{pool}', expected one of {POOLS}")
+
+    done = load_checkpoint(results_path)
+    pending = [cell for cell in cells if cell["key"] not in done]
+    if done:
+        print(f"[Harness] Resuming: {len(cells) - len(pending)}/{len(cells)} cells already complete")
+    print(f"[Harness] Running {len(pending)} cell(s), {max(1, max_workers)} at a time ({pool} pool)")
+
+    start = time.time()
+
+    def finish(cell: Dict[str, Any], result: Optional[Dict[str, Any]], error: Optional[BaseException]) -> None:
+        if error is not None:
+            print(f"[Harness] Cell {cell['key']} failed: {error}")
+            failed[cell["key"]] = {"error": str(error)}
+            return
+        done[cell["key"]] = result
+        print(f"[Harness] Cell {cell['key']} complete ({len(done)}/{len(cells)}, {time.time() - start:.0f}s)")
+        if results_path:
+            write_results(results_path, {**(header or {}), "status": "in_progress", "cells": done})
+
+    failed: Dict[str, Dict[str, Any]] = {}
+    if pending:
+        if pool == "process":
+            _run_processes(pending, run_cell, max_workers, finish)
+        else:
+            asyncio.run(_run_async(pending, run_cell, max_workers, finish))
+
+    return {cell["key"]: done.get(cell["key"], failed.get(cell["key"])) for cell in cells}
+
+
+async def _run_async(
+    cells: List[Dict[str, Any]],
+    run_cell: Callable,
+    max_workers: int,
+    finish: Callable,
+) -> None:
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def run_one(cell: Dict[str, Any]) -> None:
+        async with semaphore:
+            try:
+                if inspect.iscoroutinefunction(run_cell):
+                    result = await run_cell(cell)
+                else:
+                    result = await asyncio.to_thread(run_cell, cell)
+            except Exception as e:
+                finish(cell, None, e)
+            else:
+                finish(cell, result, None)
+
+    await asyncio.gather(*(run_one(cell) for cell in cells))
+
+
+def _run_processes(
+    cells: List[Dict[str, Any]],
+    run_cell: Callable,
+    max_workers: int,
+    finish: Callable,
+) -> None:
+    with ProcessPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(_call_cell, run_cell, cell): cell for cell in cells}
+        for future in as_completed(futures):
+            error = future.exception()
+            finish(futures[future], None if error else future.result(), error)
@@ -0,0 +1,137 @@
+# judge_cache.py
+# Memoized LLM-judge results shared by the benchmark scorers
+#
+# A judge verdict depends only on what is judged, the rubric it is judged
+# against and the judge model, so cached_judge() stores each verdict under a
+# hash of exactly those three things. Re-scoring an unchanged idea or
+# transcript (re-running a benchmark, re-analysing saved results) is then read
+# from disk instead of calling the API, and editing a rubric changes the hash,
+# so stale verdicts are never reused.
+#
+# The cache is a judge_cache/ directory in the benchmark's results directory
+# holding one <key>.json file per verdict, each written atomically, so
+# concurrent cells and processes never rewrite or clobber each other's
+# entries. Failed or unparseable verdicts are never cached.
+#
+# Usage:
+#   verdict = cached_judge(results_dir, model, rubric, content, ask_the_judge)
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from framework.persona_manager import _write_json_atomic
+
+JUDGE_CACHE_DIR = "judge_cache"
+
+
+def judge_key(model: str, rubric: str, content: Any) -> str:
+    """Cache key: SHA-256 over the judge model, rubric text and judged content."""
+    payload = json.dumps([model, rubric, content], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class JudgeCache:
+    """
+    Verdicts stored one per file in a judge_cache/ directory.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Folder holding the verdict files (created on first write)
+        """
+        self.directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached verdict for a key, or None."""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                verdict = json.load(f)["verdict"]
+        except FileNotFoundError:
+            verdict = None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[!] Ignoring unreadable judge verdict {self._path(key)}: {e}")
+            verdict = None
+        with self._lock:
+            if verdict is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return verdict
+
+    def put(self, key: str, verdict: Dict[str, Any], model: str) -> None:
+        """Store a verdict in its own file (failures are reported, not raised)."""
+        entry = {
+            "model": model,
+            "verdict": verdict,
+            "cached_at": datetime.now().isoformat(),
+        }
+        try:
+            _write_json_atomic(self._path(key), entry)
+        except Exception as e:
+            print(f"[!] Failed to save judge verdict to cache: {e}")
+
+    def __len__(self) -> int:
+        return len(list(self.directory.glob("*.json")))
+
+
+_caches: Dict[str, JudgeCache] = {}
+_caches_lock = threading.Lock()
+
+
+def judge_cache(cache_dir: Optional[str]) -> Optional[JudgeCache]:
+    """The shared JudgeCache for a results directory (None disables caching)."""
+    if not cache_dir:
+        return None
+    path = os.path.abspath(os.path.join(cache_dir, JUDGE_CACHE_DIR))
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = JudgeCache(path)
+        return _caches[path]
+
+
+def cached_judge(
+    cache_dir: Optional[str],
+    model: str,
+    rubric: str,
+    content: Any,
+    judge: Callable[[], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Return the cached verdict for (model, rubric, content), or call judge().
+
+    Args:
+        cache_dir: Results directory holding judge_cache/ (None: no cache)
+        model: Judge model
+        rubric: Everything fixed about the judgement (system prompt, rubric
+            template), so editing it invalidates earlier verdicts
+        content: What is being judged (idea, transcript, ...); JSON-serializable
+        judge: Makes the LLM call and returns the parsed verdict. Raise to
+            signal a failed judgement — failures are not cached.
+
+    Returns:
+        The verdict dict
+    """
+    cache = judge_cache(cache_dir)
+    if cache is None:
+        return judge()
+
+    key = judge_key(model, rubric, content)
+    verdict = cache.get(key)
+    if verdict is not None:
+        return verdict
+
+    verdict = judge()
+    cache.put(key, verdict, model)
+    return verdict
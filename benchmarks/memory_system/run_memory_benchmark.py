@@ -6,9 +6,11 @@
 #   python benchmarks/memory_system/run_memory_benchmark.py --domains finance healthcare --mode fast
 #   python benchmarks/memory_system/run_memory_benchmark.py  # uses defaults
 
+import asyncio
 import json
 import os
 import argparse
+import time
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -16,7 +18,11 @@ from typing import Dict, List, Optional
 from dotenv import load_dotenv
 load_dotenv()
 
-from src.idea_generation.generator import multiple_llm_idea_generator
+from framework import ConversationLogger
+from src.idea_generation.generator import run_assembly
+from benchmarks.harness import cell_key, cell_session_name, results_path_for, run_cells, write_results
+from benchmarks.judge_cache import cached_judge
+from benchmarks.usage_meter import UsageMeter, metered_openai
 from benchmarks.phase_2_quality_vs_single_llm.scoring import (
     score_idea_llm,
     compare_n_scores,
@@ -60,6 +66,9 @@ DOMAIN_PROMPTS = {
     "sustainability": "Sustainability-focused consumer apps and services",
 }
 
+# Flat token price for cost estimates (same default as ConversationMonitor)
+DEFAULT_COST_PER_1K_TOKENS = 0.002
+
 
 @dataclass
 class ConversationQualityMetrics:
@@ -69,13 +78,17 @@ class ConversationQualityMetrics:
     concept_density: float      # Unique substantive concepts per turn
 
 
-def _count_repetitions_llm(logs: list, inspiration: str, judge_model: str) -> int:
+REPETITION_JUDGE_SYSTEM = "You are a conversation analyst. Count repetitions accurately. Output only JSON."
+
+
+def _count_repetitions_llm(logs: list, inspiration: str, judge_model: str, cache_dir: Optional[str] = None) -> int:
     """
     Use LLM to count how many times the same point was raised more than once.
     Returns count of repetitions (0 = clean conversation).
+
+    Verdicts are memoized in cache_dir by transcript, rubric and judge model.
     """
     from openai import OpenAI
-    client = OpenAI()
 
     if not logs:
         return 0
@@ -96,11 +109,12 @@ Each repeated instance counts as 1 repetition (e.g., if idea X is mentioned 3 ti
 Respond ONLY with a JSON object:
 {{"repetition_count": <integer>, "notes": "<brief explanation>"}}"""
 
-    try:
+    def judge() -> dict:
+        client = OpenAI()
         response = client.chat.completions.create(
             model=judge_model,
             messages=[
-                {"role": "system", "content": "You are a conversation analyst. Count repetitions accurately. Output only JSON."},
+                {"role": "system", "content": REPETITION_JUDGE_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.1,
@@ -108,7 +122,10 @@ Respond ONLY with a JSON object:
         content = response.choices[0].message.content
         start = content.find('{')
         end = content.rfind('}')
-        data = json.loads(content[start:end+1])
+        return json.loads(content[start:end+1])
+
+    try:
+        data = cached_judge(cache_dir, judge_model, REPETITION_JUDGE_SYSTEM, prompt, judge)
         return max(0, data.get("repetition_count", 0))
     except Exception as e:
         print(f"[!] Repetition count LLM call failed: {e}")
@@ -170,47 +187,123 @@ def _compute_quality_metrics(
     logs: list,
     inspiration: str,
     judge_model: str,
+    cache_dir: Optional[str] = None,
 ) -> ConversationQualityMetrics:
     """Compute all three conversation quality metrics for a run."""
     return ConversationQualityMetrics(
-        repetition_count=_count_repetitions_llm(logs, inspiration, judge_model),
+        repetition_count=_count_repetitions_llm(logs, inspiration, judge_model, cache_dir),
         dead_end_recovery=_count_dead_end_recoveries(logs),
         concept_density=_compute_concept_density(logs),
     )
 
 
-def _run_single_config(
+def _turn_latencies(logs: list) -> List[float]:
+    """
+    Seconds between consecutive exchanges of the same phase — the wall time
+    of each turn after the first, including facilitator and memory work.
+    """
+    latencies = []
+    for prev, cur in zip(logs, logs[1:]):
+        if prev.get("phase") != cur.get("phase"):
+            continue
+        try:
+            delta = (datetime.fromisoformat(cur["timestamp"]) - datetime.fromisoformat(prev["timestamp"])).total_seconds()
+        except (KeyError, TypeError, ValueError):
+            continue
+        latencies.append(delta)
+    return latencies
+
+
+def _usage_metrics(meter_summary: dict, logs: list, wall_seconds: float, cost_per_1k_tokens: float) -> dict:
+    """Token, call, latency and cost figures for one Assembly run."""
+    turns = len(logs)
+    latencies = _turn_latencies(logs)
+    return {
+        **meter_summary,
+        "wall_seconds": round(wall_seconds, 2),
+        "turns": turns,
+        "tokens_per_turn": round(meter_summary["total_tokens"] / turns, 1) if turns else 0.0,
+        "llm_calls_per_turn": round(meter_summary["llm_calls"] / turns, 2) if turns else 0.0,
+        "turn_seconds_mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "turn_seconds_max": round(max(latencies), 2) if latencies else 0.0,
+        "estimated_cost": round(meter_summary["total_tokens"] / 1000.0 * cost_per_1k_tokens, 4),
+    }
+
+
+def pareto_frontier(points: List[dict], quality_key: str = "avg_score", cost_key: str = "avg_total_tokens") -> List[dict]:
+    """
+    Mark which configs are Pareto-optimal on quality (higher is better)
+    versus cost (lower is better).
+
+    Args:
+        points: One dict per config with at least "config", quality_key and cost_key
+        quality_key: Field holding the quality measure
+        cost_key: Field holding the cost measure
+
+    Returns:
+        Copies of the points, sorted by cost, each with "pareto_optimal" and
+        "dominated_by" (configs at least as good on both axes and strictly
+        better on one)
+    """
+    marked = []
+    for point in points:
+        dominated_by = [
+            other["config"] for other in points
+            if other is not point
+            and other[quality_key] >= point[quality_key]
+            and other[cost_key] <= point[cost_key]
+            and (other[quality_key] > point[quality_key] or other[cost_key] < point[cost_key])
+        ]
+        marked.append({**point, "pareto_optimal": not dominated_by, "dominated_by": dominated_by})
+    return sorted(marked, key=lambda p: (p[cost_key], -p[quality_key]))
+
+
+def _deployment_tiers(frontier: List[dict]) -> dict:
+    """Cheapest and highest-quality configs on the frontier."""
+    optimal = [p for p in frontier if p["pareto_optimal"]]
+    if not optimal:
+        return {}
+    return {
+        "budget": min(optimal, key=lambda p: (p["avg_total_tokens"], -p["avg_score"]))["config"],
+        "quality": max(optimal, key=lambda p: (p["avg_score"], -p["avg_total_tokens"]))["config"],
+    }
+
+
+async def _run_single_config(
     domain_prompt: str,
     memory_config: dict,
     assembly_mode: str,
     judge_model: str,
+    session_name: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    cost_per_1k_tokens: float = DEFAULT_COST_PER_1K_TOKENS,
 ) -> dict:
     """
     Run Assembly under a single memory config, score the output idea, and
-    compute conversation quality metrics.
+    compute conversation quality metrics. Judge verdicts are cached in
+    cache_dir (normally the results directory).
+
+    Every LLM request Assembly makes is metered (judge calls are not), giving
+    real prompt/completion tokens, call counts, per-turn latency and cost.
 
     Returns:
-        Dict with idea, score, quality metrics, and raw logs.
+        Dict with idea, score, quality metrics, usage, and raw logs.
     """
     print(f"  [>] Running memory_mode='{memory_config['memory_mode']}' ({memory_config['label']})...")
 
-    # Temporarily override the memory_mode in the mode config
-    # We do this by monkey-patching MODE_CONFIGS for this run
-    from src.idea_generation import config as cfg_module
-    original_mode_config = cfg_module.MODE_CONFIGS[assembly_mode].copy()
-    cfg_module.MODE_CONFIGS[assembly_mode]["memory_mode"] = memory_config["memory_mode"]
-    for key, val in memory_config.get("config_overrides", {}).items():
-        cfg_module.MODE_CONFIGS[assembly_mode][key] = val
-
-    try:
-        result = multiple_llm_idea_generator(
+    # Per-run overrides; MODE_CONFIGS itself is left alone so configs can run side by side
+    overrides = {"memory_mode": memory_config["memory_mode"], **memory_config.get("config_overrides", {})}
+    logger = ConversationLogger(session_name=session_name)
+    start = time.perf_counter()
+    with metered_openai(), UsageMeter() as meter:
+        result = await run_assembly(
             inspiration=domain_prompt,
             number_of_ideas=1,
             mode=assembly_mode,
+            logger=logger,
+            config_overrides=overrides,
         )
-    finally:
-        # Restore original config
-        cfg_module.MODE_CONFIGS[assembly_mode] = original_mode_config
+    wall_seconds = time.perf_counter() - start
 
     # Extract idea
     if isinstance(result, dict):
@@ -222,16 +315,12 @@ def _run_single_config(
 
     # Score with LLM judge
     print(f"    [>] Scoring idea...")
-    score = score_idea_llm(idea=idea, inspiration=domain_prompt, model=judge_model)
+    score = await asyncio.to_thread(score_idea_llm, idea=idea, inspiration=domain_prompt, model=judge_model, cache_dir=cache_dir)
 
-    # Load logs for quality metrics
-    try:
-        with open("meeting_logs.txt", "r", encoding="utf-8") as f:
-            logs = json.load(f)
-    except Exception:
-        logs = []
+    # This run's own exchanges (meeting_logs.txt is shared by concurrent runs)
+    logs = list(logger.exchanges)
 
-    quality = _compute_quality_metrics(logs, domain_prompt, judge_model)
+    quality = await asyncio.to_thread(_compute_quality_metrics, logs, domain_prompt, judge_model, cache_dir)
 
     return {
         "memory_config": memory_config["name"],
@@ -239,20 +328,44 @@ def _run_single_config(
         "idea": idea,
         "score": score.to_dict(),
         "quality_metrics": asdict(quality),
+        "usage": _usage_metrics(meter.summary(), logs, wall_seconds, cost_per_1k_tokens),
         "logs_count": len(logs),
     }
 
 
+async def _run_config_cell(cell: dict) -> dict:
+    """Harness cell: one memory config on one domain."""
+    return await _run_single_config(
+        domain_prompt=cell["domain_prompt"],
+        memory_config=cell["memory_config"],
+        assembly_mode=cell["assembly_mode"],
+        judge_model=cell["judge_model"],
+        session_name=cell_session_name(cell["key"]),
+        cache_dir=cell["cache_dir"],
+        cost_per_1k_tokens=cell["cost_per_1k_tokens"],
+    )
+
+
 def run_memory_benchmark(
     domain_ids: list,
     memory_configs: list = None,
     assembly_mode: str = "medium",
     judge_model: str = "gpt-5.1",
     output_dir: str = "results",
+    max_workers: int = 4,
+    pool: str = "async",
+    resume: Optional[str] = None,
+    cost_per_1k_tokens: float = DEFAULT_COST_PER_1K_TOKENS,
 ) -> dict:
     """
     For each domain, run Assembly under each memory config, score all with
     LLM judge, compare using compare_n_scores() and aggregate_n_way_results().
+    Each run's token usage, LLM calls and per-turn latency are summarised per
+    config and set against quality in a Pareto view (cost_summary, pareto).
+
+    Every (domain, memory config) pair is an independent cell; up to
+    max_workers run at once and each is checkpointed to the results file as
+    it finishes (see benchmarks/harness.py).
 
     Args:
         domain_ids: List of domain keys from DOMAIN_PROMPTS (e.g. ["finance", "health"])
@@ -260,6 +373,10 @@ def run_memory_benchmark(
         assembly_mode: Assembly run mode ("fast", "medium", "standard", "deep")
         judge_model: LLM model for scoring
         output_dir: Directory to save results JSON
+        max_workers: Maximum cells in flight at once
+        pool: "async" or "process"
+        resume: Results file of an interrupted benchmark to continue
+        cost_per_1k_tokens: Token price used for cost estimates
 
     Returns:
         Full results dict with per-domain comparisons and aggregated stats
@@ -271,6 +388,7 @@ def run_memory_benchmark(
 
     all_comparisons = []
     all_quality = {cfg["name"]: [] for cfg in memory_configs}
+    all_usage = {cfg["name"]: [] for cfg in memory_configs}
 
     print(f"\n{'='*60}")
     print(f"MEMORY BENCHMARK: {len(domain_ids)} domain(s) × {len(memory_configs)} config(s)")
@@ -278,25 +396,61 @@ def run_memory_benchmark(
     print(f"Memory configs: {[c['name'] for c in memory_configs]}")
     print(f"{'='*60}\n")
 
+    benchmark_config = {
+        "domains": domain_ids,
+        "assembly_mode": assembly_mode,
+        "judge_model": judge_model,
+        "memory_configs": [c["name"] for c in memory_configs],
+        "cost_per_1k_tokens": cost_per_1k_tokens,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+    valid_domains = []
     for domain_id in domain_ids:
-        domain_prompt = DOMAIN_PROMPTS.get(domain_id)
-        if not domain_prompt:
+        if domain_id in DOMAIN_PROMPTS:
+            valid_domains.append(domain_id)
+        else:
             print(f"[!] Unknown domain '{domain_id}', skipping. Valid: {list(DOMAIN_PROMPTS.keys())}")
-            continue
 
+    output_file = results_path_for(output_dir, "memory_benchmark", resume)
+    cells = [
+        {
+            "key": cell_key(domain_id, mem_cfg["name"]),
+            "domain_prompt": DOMAIN_PROMPTS[domain_id],
+            "memory_config": mem_cfg,
+            "assembly_mode": assembly_mode,
+            "judge_model": judge_model,
+            "cache_dir": output_dir,
+            "cost_per_1k_tokens": cost_per_1k_tokens,
+        }
+        for domain_id in valid_domains
+        for mem_cfg in memory_configs
+    ]
+    cell_results = run_cells(
+        cells,
+        _run_config_cell,
+        results_path=output_file,
+        header={"benchmark_config": benchmark_config},
+        max_workers=max_workers,
+        pool=pool,
+    )
+
+    for domain_id in valid_domains:
+        domain_prompt = DOMAIN_PROMPTS[domain_id]
         print(f"\n--- Domain: {domain_id} ---")
         print(f"    Prompt: {domain_prompt[:80]}...")
 
         domain_results = {}
         for mem_cfg in memory_configs:
-            run_result = _run_single_config(
-                domain_prompt=domain_prompt,
-                memory_config=mem_cfg,
-                assembly_mode=assembly_mode,
-                judge_model=judge_model,
-            )
+            run_result = cell_results[cell_key(domain_id, mem_cfg["name"])]
+            if "score" not in run_result:
+                print(f"[!] {mem_cfg['name']} failed on '{domain_id}': {run_result.get('error')}")
+                continue
             domain_results[mem_cfg["name"]] = run_result
             all_quality[mem_cfg["name"]].append(run_result["quality_metrics"])
+            all_usage[mem_cfg["name"]].append({**run_result.get("usage", {}), "score_total": run_result["score"]["total"]})
+        if not domain_results:
+            continue
 
         # N-way score comparison for this domain
         scores: Dict[str, IdeaScore] = {}
@@ -340,17 +494,35 @@ def run_memory_benchmark(
             "avg_concept_density": sum(m["concept_density"] for m in metrics_list) / len(metrics_list),
         }
 
+    # Aggregate cost/latency and place each config on the quality-vs-cost frontier
+    cost_summary = {}
+    for cfg_name, runs in all_usage.items():
+        runs = [r for r in runs if "total_tokens" in r]
+        if not runs:
+            continue
+        n = len(runs)
+        cost_summary[cfg_name] = {
+            "runs": n,
+            "avg_score": round(sum(r["score_total"] for r in runs) / n, 2),
+            "avg_prompt_tokens": round(sum(r["prompt_tokens"] for r in runs) / n, 1),
+            "avg_completion_tokens": round(sum(r["completion_tokens"] for r in runs) / n, 1),
+            "avg_total_tokens": round(sum(r["total_tokens"] for r in runs) / n, 1),
+            "avg_llm_calls": round(sum(r["llm_calls"] for r in runs) / n, 1),
+            "avg_tokens_per_turn": round(sum(r["tokens_per_turn"] for r in runs) / n, 1),
+            "avg_turn_seconds": round(sum(r["turn_seconds_mean"] for r in runs) / n, 2),
+            "avg_wall_seconds": round(sum(r["wall_seconds"] for r in runs) / n, 1),
+            "avg_estimated_cost": round(sum(r["estimated_cost"] for r in runs) / n, 4),
+        }
+    frontier = pareto_frontier([{"config": name, **stats} for name, stats in cost_summary.items()])
+    pareto = {"axes": {"quality": "avg_score", "cost": "avg_total_tokens"}, "points": frontier, "tiers": _deployment_tiers(frontier)}
+
     results = {
-        "benchmark_config": {
-            "domains": domain_ids,
-            "assembly_mode": assembly_mode,
-            "judge_model": judge_model,
-            "memory_configs": [c["name"] for c in memory_configs],
-            "timestamp": datetime.now().isoformat(),
-        },
+        "benchmark_config": benchmark_config,
         "comparisons": all_comparisons,
         "aggregated": aggregated,
         "quality_summary": quality_summary,
+        "cost_summary": cost_summary,
+        "pareto": pareto,
     }
 
     # Print final summary table
@@ -373,11 +545,31 @@ def run_memory_benchmark(
         print(f"    Avg dead-end recov: {q['avg_dead_end_recovery']:.1f}")
         print(f"    Avg concept density:{q['avg_concept_density']:.1f} concepts/turn")
 
-    # Save results
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = os.path.join(output_dir, f"memory_benchmark_{timestamp}.json")
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    print(f"\n{'='*60}")
+    print("FINAL RESULTS — COST AND LATENCY")
+    print(f"{'='*60}")
+    for cfg_name, c in cost_summary.items():
+        label = next((m["label"] for m in memory_configs if m["name"] == cfg_name), cfg_name)
+        print(f"  {label}:")
+        print(f"    Avg tokens:         {c['avg_total_tokens']:,.0f} "
+              f"({c['avg_prompt_tokens']:,.0f} prompt / {c['avg_completion_tokens']:,.0f} completion)")
+        print(f"    Avg LLM calls:      {c['avg_llm_calls']:.0f}")
+        print(f"    Avg turn latency:   {c['avg_turn_seconds']:.1f}s")
+        print(f"    Avg est. cost:      ${c['avg_estimated_cost']:.4f}")
+
+    print(f"\n{'='*60}")
+    print("PARETO — QUALITY VS TOKENS")
+    print(f"{'='*60}")
+    for point in frontier:
+        marker = "*" if point["pareto_optimal"] else " "
+        dominated = f" (dominated by {', '.join(point['dominated_by'])})" if point["dominated_by"] else ""
+        print(f"  {marker} {point['config']}: {point['avg_score']:.2f}/20 at {point['avg_total_tokens']:,.0f} tokens{dominated}")
+    if pareto["tiers"]:
+        print(f"  Budget tier:  {pareto['tiers']['budget']}")
+        print(f"  Quality tier: {pareto['tiers']['quality']}")
+
+    # Save results (cells kept for --resume)
+    write_results(output_file, {**results, "status": "complete", "cells": cell_results})
     print(f"\n[OK] Results saved to: {output_file}")
 
     return results
@@ -409,6 +601,28 @@ if __name__ == "__main__":
         default="benchmarks/memory_system/results",
         help="Directory to save results (default: benchmarks/memory_system/results)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum (domain, memory config) cells running at once (default: 4)"
+    )
+    parser.add_argument(
+        "--pool",
+        choices=["async", "process"],
+        default="async",
+        help="Run cells as tasks on one event loop or in separate processes (default: async)"
+    )
+    parser.add_argument(
+        "--resume",
+        help="Results file of an interrupted run to continue"
+    )
+    parser.add_argument(
+        "--cost-per-1k",
+        type=float,
+        default=DEFAULT_COST_PER_1K_TOKENS,
+        help=f"Token price for cost estimates (default: {DEFAULT_COST_PER_1K_TOKENS})"
+    )
 
     args = parser.parse_args()
 
@@ -418,4 +632,8 @@ if __name__ == "__main__":
         assembly_mode=args.mode,
         judge_model=args.judge,
         output_dir=args.output_dir,
+        max_workers=args.workers,
+        pool=args.pool,
+        resume=args.resume,
+        cost_per_1k_tokens=args.cost_per_1k,
     )
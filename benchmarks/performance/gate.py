@@ -0,0 +1,273 @@
+# gate.py
+# Performance regression gate: profile the pipeline and compare to a baseline
+#
+# Runs the performance benchmark's profile_mode() for each gated mode against
+# the simulated backend and compares, per mode:
+#   - turn latency p50 / p95 (median over --repeats runs)
+#   - tokens per run (prompt + completion)
+#   - LLM calls per run
+# to the committed baseline (baseline.json next to this file). Any metric that
+# got worse by more than its threshold fails the gate: a diff table is printed
+# and the process exits 1.
+#
+# Calls are deterministic on the simulated backend and tokens nearly so
+# (prompts carry timestamps and generated names), so their thresholds are
+# tight. Latency is wall-clock and noisy, so it needs both the relative
+# threshold and LATENCY_SLACK_SECONDS exceeded to count.
+#
+# Usage:
+#   python -m benchmarks.performance.gate
+#   python -m benchmarks.performance.gate --modes fast --threshold tokens_per_run=0.1
+#   python -m benchmarks.performance.gate --update-baseline   # after an intended change
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.performance.run_performance_benchmark import profile_mode
+
+DEFAULT_BASELINE = str(Path(__file__).resolve().parent / "baseline.json")
+GATE_MODES = ["fast", "medium"]
+DEFAULT_LATENCY_MS = 20.0
+DEFAULT_REPEATS = 3
+
+# Allowed relative increase per metric before it counts as a regression
+THRESHOLDS = {
+    "turn_seconds_p50": 0.25,
+    "turn_seconds_p95": 0.35,
+    "tokens_per_run": 0.05,
+    "calls_per_run": 0.05,
+}
+METRICS = list(THRESHOLDS)
+LATENCY_METRICS = ("turn_seconds_p50", "turn_seconds_p95")
+
+# Latency changes smaller than this are treated as noise whatever the ratio
+LATENCY_SLACK_SECONDS = 0.005
+
+
+def measure_mode(mode: str, latency_ms: float, repeats: int = DEFAULT_REPEATS) -> Dict[str, float]:
+    """
+    Profile one mode `repeats` times and reduce it to the gated metrics.
+
+    Returns:
+        {"turn_seconds_p50", "turn_seconds_p95", "tokens_per_run", "calls_per_run"}
+    """
+    profiles = []
+    for _ in range(max(1, repeats)):
+        with tempfile.TemporaryDirectory(prefix=f"gate_{mode}_") as workdir:
+            profiles.append(asyncio.run(profile_mode(mode, workdir, latency=latency_ms / 1000)))
+
+    last = profiles[-1]
+    return {
+        "turn_seconds_p50": round(statistics.median(p["summary"]["turn_seconds_p50"] for p in profiles), 4),
+        "turn_seconds_p95": round(statistics.median(p["summary"]["turn_seconds_p95"] for p in profiles), 4),
+        "tokens_per_run": sum(s["prompt_tokens"] + s["completion_tokens"] for s in last["llm_calls_by_kind"].values()),
+        "calls_per_run": last["llm_calls_total"],
+    }
+
+
+def measure(modes: List[str], latency_ms: float, repeats: int = DEFAULT_REPEATS) -> Dict[str, Dict[str, float]]:
+    """Gated metrics for every mode."""
+    metrics = {}
+    for mode in modes:
+        print(f"[Gate] Profiling {mode} mode ({repeats}x)...")
+        metrics[mode] = measure_mode(mode, latency_ms, repeats)
+    return metrics
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    thresholds: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Diff current metrics against the baseline.
+
+    Args:
+        baseline: {mode: {metric: value}} from the baseline file
+        current: {mode: {metric: value}} just measured
+        thresholds: Allowed relative increase per metric (default: THRESHOLDS)
+
+    Returns:
+        One row per (mode, metric): {"mode", "metric", "baseline", "current",
+        "change", "threshold", "status"}; status is "ok", "improved",
+        "regressed" or "no baseline"
+    """
+    thresholds = {**THRESHOLDS, **(thresholds or {})}
+    rows = []
+    for mode, values in current.items():
+        for metric in METRICS:
+            value = values[metric]
+            base = baseline.get(mode, {}).get(metric)
+            row = {"mode": mode, "metric": metric, "baseline": base, "current": value,
+                   "change": None, "threshold": thresholds[metric], "status": "no baseline"}
+            if base is not None:
+                delta = value - base
+                change = delta / base if base else (0.0 if delta == 0 else float("inf"))
+                noise = metric in LATENCY_METRICS and abs(delta) <= LATENCY_SLACK_SECONDS
+                if change > thresholds[metric] and not noise:
+                    status = "regressed"
+                elif change < -thresholds[metric] and not noise:
+                    status = "improved"
+                else:
+                    status = "ok"
+                row.update(change=round(change, 4), status=status)
+            rows.append(row)
+    return rows
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    """Render compare() rows as a fixed-width diff table."""
+    def fmt(metric: str, value: Optional[float]) -> str:
+        if value is None:
+            return "-"
+        if metric in LATENCY_METRICS:
+            return f"{value * 1000:.1f} ms"
+        return f"{value:,.0f}"
+
+    header = f"{'MODE':<10} {'METRIC':<18} {'BASELINE':>12} {'CURRENT':>12} {'CHANGE':>9} {'LIMIT':>7}  STATUS"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        change = "-" if row["change"] is None else f"{row['change']:+.1%}"
+        status = row["status"].upper() if row["status"] == "regressed" else row["status"]
+        lines.append(
+            f"{row['mode']:<10} {row['metric']:<18} {fmt(row['metric'], row['baseline']):>12} "
+            f"{fmt(row['metric'], row['current']):>12} {change:>9} {'+' + format(row['threshold'], '.0%'):>7}  {status}"
+        )
+    return "\n".join(lines)
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    """Read a baseline file, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_baseline(path: str, metrics: Dict[str, Dict[str, float]], latency_ms: float, repeats: int) -> None:
+    """Record metrics as the new baseline."""
+    baseline = {
+        "recorded": datetime.now().strftime("%Y%m%d_%H%M%S"),
+        "backend": "simulated",
+        "latency_ms": latency_ms,
+        "repeats": repeats,
+        "modes": metrics,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+
+def _parse_thresholds(values: List[str]) -> Dict[str, float]:
+    thresholds = {}
+    for value in values:
+        metric, _, limit = value.partition("=")
+        if metric not in THRESHOLDS or not limit:
+            raise argparse.ArgumentTypeError(f"Expected METRIC=FRACTION with METRIC one of {METRICS}, got '{value}'")
+        thresholds[metric] = float(limit)
+    return thresholds
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the gate.
+
+    Returns:
+        0 if nothing regressed (or the baseline was updated), 1 on a
+        regression, 2 if there is no baseline to compare against
+    """
+    parser = argparse.ArgumentParser(
+        description="Fail when pipeline latency, tokens or calls regress past the committed baseline"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help="Baseline JSON (default: benchmarks/performance/baseline.json)"
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        help=f"Modes to gate (default: the baseline's modes, else {GATE_MODES})"
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        help=f"Simulated latency per LLM call in ms (default: the baseline's, else {DEFAULT_LATENCY_MS:g})"
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=DEFAULT_REPEATS,
+        help=f"Runs per mode; latency is the median across runs (default: {DEFAULT_REPEATS})"
+    )
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        metavar="METRIC=FRACTION",
+        help="Override a regression threshold, e.g. turn_seconds_p95=0.5 (repeatable)"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record the measured metrics as the new baseline instead of comparing"
+    )
+    parser.add_argument(
+        "--output",
+        help="Also write the comparison rows to this JSON file"
+    )
+
+    args = parser.parse_args(argv)
+    try:
+        thresholds = _parse_thresholds(args.threshold)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None and not args.update_baseline:
+        print(f"[Gate] No baseline at {args.baseline}; record one with --update-baseline")
+        return 2
+
+    baseline = baseline or {}
+    modes = args.modes or list(baseline.get("modes", {})) or GATE_MODES
+    latency_ms = args.latency_ms if args.latency_ms is not None else baseline.get("latency_ms", DEFAULT_LATENCY_MS)
+    if baseline and latency_ms != baseline.get("latency_ms"):
+        print(f"[Gate] Warning: measuring at {latency_ms:g} ms/call, baseline was recorded at {baseline.get('latency_ms')} ms/call")
+
+    current = measure(modes, latency_ms, args.repeats)
+
+    if args.update_baseline:
+        write_baseline(args.baseline, current, latency_ms, args.repeats)
+        print(f"[OK] Baseline updated: {args.baseline}")
+        return 0
+
+    rows = compare(baseline.get("modes", {}), current, thresholds)
+    print()
+    print(format_table(rows))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"baseline": args.baseline, "latency_ms": latency_ms, "rows": rows}, f, indent=2)
+
+    regressed = [row for row in rows if row["status"] == "regressed"]
+    if regressed:
+        print(f"\n[FAIL] {len(regressed)} metric(s) regressed past threshold")
+        return 1
+    print("\n[OK] No performance regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,478 @@
+# run_performance_benchmark.py
+# Speed benchmark: meeting_facilitator across run modes against a simulated LLM
+#
+# The phase_1/phase_2/memory benchmarks measure quality; this one measures
+# where the time goes. Each mode in MODE_CONFIGS runs the real meeting loop
+# (persona generation, facilitator decisions, persona turns, summary and belief
+# updates, idea tracking, shared memory, mediator) with every OpenAI client
+# replaced by the deterministic backend in simulated_llm.py, so runs are free,
+# repeatable and isolate the pipeline's own overhead from API variance.
+#
+# Reported per mode:
+#   - per-turn wall time, broken down by stage (LLM call sites + "other")
+#   - LLM calls and prompt tokens per turn (by call kind)
+#   - peak RSS of the process
+#   - event-loop blocking time (lag of a probe task that sleeps in a loop)
+#
+# Usage:
+#   python benchmarks/performance/run_performance_benchmark.py --modes fast medium
+#   python benchmarks/performance/run_performance_benchmark.py --latency-ms 0  # pure overhead
+
+import argparse
+import asyncio
+import copy
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from framework import ConversationLogger, FacilitatorAgent
+from framework.monitor import ConversationMonitor
+from framework.persona_manager import PersonaManager
+from src.idea_generation.config import MODE_CONFIGS
+from src.idea_generation.generator import select_phases
+from src.idea_generation.orchestration import meeting_facilitator
+from benchmarks.performance.simulated_llm import SimulatedLLM, simulated_openai
+
+INSPIRATION = "Personal finance tools for young professionals aged 22-35"
+
+# Stand-in for generate_phases_for_domain(); max_turns comes from the mode
+SIMULATED_PHASES = [
+    {"phase_id": "problem_discovery", "goal": "Map the problem space and who feels it most",
+     "desired_outcome": "Ranked list of pain points", "phase_type": "debate"},
+    {"phase_id": "pain_point_analysis", "goal": "Identify the most critical unmet needs",
+     "desired_outcome": "Top three needs with evidence", "phase_type": "debate"},
+    {"phase_id": "solution_exploration", "goal": "Brainstorm solution approaches",
+     "desired_outcome": "Candidate solutions with trade-offs", "phase_type": "debate"},
+    {"phase_id": "business_model", "goal": "Determine a sustainable revenue model",
+     "desired_outcome": "Pricing and channel hypothesis", "phase_type": "debate"},
+    {"phase_id": "decision_synthesis", "goal": "Choose the best solution and define the MVP",
+     "desired_outcome": "One idea with must-haves and non-goals", "phase_type": "integration"},
+]
+
+ALL_MODES = ["fast", "medium", "standard", "deep"]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class LoopBlockingProbe:
+    """
+    Measures how long the event loop is unable to run other tasks.
+
+    A probe task sleeps `interval` seconds at a time; whenever it wakes more
+    than `threshold` seconds late, the overshoot is counted as blocking.
+    """
+
+    def __init__(self, interval: float = 0.005, threshold: float = 0.005):
+        self.interval = interval
+        self.threshold = threshold
+        self.blocked_seconds = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - expected
+            self.max_lag = max(self.max_lag, lag)
+            if lag > self.threshold:
+                self.blocked_seconds += lag
+                self.stalls += 1
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> Dict[str, float]:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        return {
+            "blocked_seconds": round(self.blocked_seconds, 4),
+            "max_lag_seconds": round(self.max_lag, 4),
+            "stalls": self.stalls,
+        }
+
+
+class TurnProfiler(ConversationMonitor):
+    """
+    Silent monitor that splits a meeting into turns and attributes time and
+    LLM calls to them.
+
+    A turn starts with the facilitator's next-speaker decision (or, for a
+    mediator intervention, at on_turn_start) and ends where the next one
+    starts or the phase ends. Stage times come from on_llm_call (parallel
+    summary and belief updates each add their own latency, so stages can
+    overlap); whatever is left of the turn's wall time is reported as "other"
+    (gap detection, logging, ...). Backend calls are counted against
+    the turn that was open when they finished, except next-speaker decisions,
+    which belong to the turn they open.
+    """
+
+    def __init__(self):
+        super().__init__(enable_display=False)
+        self.turns: List[Dict[str, Any]] = []
+        self._phase_id: Optional[str] = None
+        self._open: Optional[Dict[str, Any]] = None
+        self._pending_calls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _close(self, at: float) -> None:
+        turn, self._open = self._open, None
+        if turn is None:
+            return
+        if turn["speaker"] is None:
+            return  # Facilitator ended the phase; no turn was taken
+        turn["wall_seconds"] = at - turn.pop("_start")
+        turn["stages"]["other"] = max(0.0, turn["wall_seconds"] - sum(turn["stages"].values()))
+        self.turns.append(turn)
+
+    def _begin(self, at: float) -> Dict[str, Any]:
+        self._close(at)
+        self._open = {
+            "phase": self._phase_id,
+            "speaker": None,
+            "_start": at,
+            "stages": {},
+            "llm_calls": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "calls_by_kind": {},
+        }
+        return self._open
+
+    def on_phase_start(self, phase_id: str, goal: str) -> None:
+        with self._lock:
+            self._close(time.perf_counter())
+            self._phase_id = phase_id
+
+    def on_phase_complete(self, phase_id: str, **kwargs) -> None:
+        with self._lock:
+            self._close(time.perf_counter())
+
+    def on_turn_start(self, speaker: str, turn_num: int, max_turns: int) -> None:
+        with self._lock:
+            turn = self._open
+            if turn is None or turn["speaker"] is not None:
+                turn = self._begin(time.perf_counter())
+            turn["speaker"] = speaker
+            turn["turn"] = turn_num
+
+    def on_llm_call(self, site: str, seconds: float, **kwargs) -> None:
+        super().on_llm_call(site=site, seconds=seconds, **kwargs)
+        with self._lock:
+            if site == "facilitator_next_speaker":
+                self._begin(time.perf_counter() - seconds)
+                pending, self._pending_calls = self._pending_calls, []
+                for call in pending:
+                    self._count(call)
+            if self._open is not None:
+                stages = self._open["stages"]
+                stages[site] = stages.get(site, 0.0) + seconds
+
+    def on_backend_call(self, call: Dict[str, Any]) -> None:
+        """SimulatedLLM on_call hook (runs in worker threads)."""
+        with self._lock:
+            if call["kind"] == "next_speaker":
+                self._pending_calls.append(call)
+            else:
+                self._count(call)
+
+    def _count(self, call: Dict[str, Any]) -> None:
+        turn = self._open
+        if turn is None:
+            return
+        turn["llm_calls"] += 1
+        turn["prompt_tokens"] += call["prompt_tokens"]
+        turn["completion_tokens"] += call["completion_tokens"]
+        turn["calls_by_kind"][call["kind"]] = turn["calls_by_kind"].get(call["kind"], 0) + 1
+
+    def on_idea_tracked(self, title: str, status: str, **kwargs) -> None:
+        pass
+
+    def display_summary(self) -> None:
+        pass
+
+
+def _mean(values: List[float]) -> float:
+    return round(statistics.fmean(values), 4) if values else 0.0
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 4)
+
+
+def summarize_turns(turns: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Per-turn averages over a mode's turns."""
+    walls = [t["wall_seconds"] for t in turns]
+    stage_names = sorted({name for t in turns for name in t["stages"]})
+    kinds = sorted({kind for t in turns for kind in t["calls_by_kind"]})
+    count = len(turns) or 1
+    return {
+        "turns": len(turns),
+        "turn_seconds_mean": _mean(walls),
+        "turn_seconds_p50": _percentile(walls, 50),
+        "turn_seconds_p95": _percentile(walls, 95),
+        "turn_seconds_max": round(max(walls), 4) if walls else 0.0,
+        "stage_seconds_per_turn": {
+            name: round(sum(t["stages"].get(name, 0.0) for t in turns) / count, 4) for name in stage_names
+        },
+        "llm_calls_per_turn": round(sum(t["llm_calls"] for t in turns) / count, 2),
+        "prompt_tokens_per_turn": round(sum(t["prompt_tokens"] for t in turns) / count, 1),
+        "completion_tokens_per_turn": round(sum(t["completion_tokens"] for t in turns) / count, 1),
+        "calls_per_turn_by_kind": {
+            kind: round(sum(t["calls_by_kind"].get(kind, 0) for t in turns) / count, 2) for kind in kinds
+        },
+    }
+
+
+async def profile_mode(
+    mode: str,
+    workdir: str,
+    latency: float = 0.02,
+    per_token_latency: float = 0.0,
+    config_overrides: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Run one meeting in `mode` against the simulated backend and profile it.
+
+    Args:
+        mode: Key of MODE_CONFIGS
+        workdir: Scratch directory for persona cache and conversation logs
+        latency: Simulated seconds per LLM call
+        per_token_latency: Simulated seconds per completion token
+        config_overrides: Applied on top of the mode config
+
+    Returns:
+        {"mode", "config", "summary", "llm_calls_by_kind", "wall_seconds",
+         "peak_rss_mb", "event_loop", "turns"}
+    """
+    config = dict(MODE_CONFIGS[mode])
+    if config_overrides:
+        config.update(config_overrides)
+
+    profiler = TurnProfiler()
+    backend = SimulatedLLM(latency=latency, per_token_latency=per_token_latency, on_call=profiler.on_backend_call)
+    phases = select_phases(copy.deepcopy(SIMULATED_PHASES), config)
+    for phase in phases:
+        phase["max_turns"] = config["max_turns_per_phase"]
+
+    probe = LoopBlockingProbe()
+    with simulated_openai(backend):
+        persona_manager = PersonaManager(
+            cache_dir=os.path.join(workdir, "dynamic_personas"),
+            archive_dir=os.path.join(workdir, "personas_archive"),
+            model_name=config["model"],
+        )
+        facilitator = FacilitatorAgent(model_name=config["model"])
+        logger = ConversationLogger(base_dir=os.path.join(workdir, "conversation_logs"))
+        shared_context = {
+            "inspiration": INSPIRATION,
+            "number_of_ideas": 1,
+            "ideas": [],
+            "ideas_discussed": [],
+            "current_focus": None,
+        }
+
+        probe.start()
+        start = time.perf_counter()
+        # As run_assembly does once the phases are known
+        persona_manager.prefetch_personas(
+            inspiration=INSPIRATION,
+            phases=phases,
+            count=config.get("personas_per_phase", 4),
+        )
+        await meeting_facilitator(
+            persona_manager=persona_manager,
+            inspiration=INSPIRATION,
+            phases=phases,
+            shared_context=shared_context,
+            facilitator=facilitator,
+            logger=logger,
+            monitor=profiler,
+            enable_summary_updates=config["enable_summary_updates"],
+            use_async_updates=True,
+            model_name=config["model"],
+            personas_per_phase=config.get("personas_per_phase", 4),
+            enable_mediator=config.get("enable_mediator", True),
+            memory_mode=config.get("memory_mode", "structured"),
+            stream_turns=config.get("stream_turns", True),
+        )
+        wall = time.perf_counter() - start
+        event_loop = await probe.stop()
+
+    by_kind: Dict[str, Dict[str, float]] = {}
+    for call in backend.calls:
+        stats = by_kind.setdefault(call["kind"], {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0})
+        stats["calls"] += 1
+        stats["prompt_tokens"] += call["prompt_tokens"]
+        stats["completion_tokens"] += call["completion_tokens"]
+
+    return {
+        "mode": mode,
+        "config": {key: config.get(key) for key in (
+            "phase_selection", "num_phases", "max_turns_per_phase", "personas_per_phase",
+            "enable_summary_updates", "enable_mediator", "memory_mode",
+        )},
+        "phases": [p["phase_id"] for p in phases],
+        "wall_seconds": round(wall, 4),
+        "summary": summarize_turns(profiler.turns),
+        "llm_calls_total": len(backend.calls),
+        "llm_calls_by_kind": by_kind,
+        "peak_rss_mb": peak_rss_mb(),
+        "event_loop": event_loop,
+        "turns": [
+            {
+                **t,
+                "wall_seconds": round(t["wall_seconds"], 4),
+                "stages": {name: round(seconds, 4) for name, seconds in t["stages"].items()},
+            }
+            for t in profiler.turns
+        ],
+    }
+
+
+def run_performance_benchmark(
+    modes: Optional[List[str]] = None,
+    latency_ms: float = 20.0,
+    per_token_latency_ms: float = 0.0,
+    output_dir: str = "benchmarks/performance/results",
+) -> Dict[str, Any]:
+    """
+    Profile meeting_facilitator in each mode and save the results JSON.
+
+    Modes run one after another in this process, so peak RSS is cumulative:
+    each mode reports the high-water mark reached by the end of its run.
+
+    Args:
+        modes: Keys of MODE_CONFIGS (default: all four)
+        latency_ms: Simulated milliseconds per LLM call
+        per_token_latency_ms: Simulated milliseconds per completion token
+        output_dir: Directory to save results JSON
+
+    Returns:
+        Results dict ({"timestamp", "benchmark_config", "summary", "modes"})
+    """
+    modes = modes or ALL_MODES
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"\n{'='*60}")
+    print(f"PERFORMANCE BENCHMARK: {len(modes)} mode(s), simulated latency {latency_ms:g} ms/call")
+    print(f"{'='*60}\n")
+
+    profiles = {}
+    for mode in modes:
+        print(f"[Performance] Profiling {mode} mode...")
+        with tempfile.TemporaryDirectory(prefix=f"perf_{mode}_") as workdir:
+            profiles[mode] = asyncio.run(profile_mode(
+                mode,
+                workdir,
+                latency=latency_ms / 1000,
+                per_token_latency=per_token_latency_ms / 1000,
+            ))
+        summary = profiles[mode]["summary"]
+        print(
+            f"[Performance] {mode}: {summary['turns']} turns in {profiles[mode]['wall_seconds']:.2f}s | "
+            f"{summary['turn_seconds_mean']*1000:.1f} ms/turn | "
+            f"{summary['llm_calls_per_turn']:.1f} calls/turn | "
+            f"{summary['prompt_tokens_per_turn']:.0f} prompt tokens/turn | "
+            f"loop blocked {profiles[mode]['event_loop']['blocked_seconds']:.3f}s"
+        )
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results = {
+        "timestamp": timestamp,
+        "benchmark_config": {
+            "modes": modes,
+            "latency_ms": latency_ms,
+            "per_token_latency_ms": per_token_latency_ms,
+            "inspiration": INSPIRATION,
+            "timestamp": timestamp,
+        },
+        "summary": {
+            mode: {
+                **profile["summary"],
+                "wall_seconds": profile["wall_seconds"],
+                "peak_rss_mb": profile["peak_rss_mb"],
+                "event_loop_blocked_seconds": profile["event_loop"]["blocked_seconds"],
+            }
+            for mode, profile in profiles.items()
+        },
+        "modes": profiles,
+    }
+
+    output_file = os.path.join(output_dir, f"performance_benchmark_{timestamp}.json")
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n[OK] Results saved to: {output_file}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Profile Assembly's meeting loop per mode against a simulated LLM backend"
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=ALL_MODES,
+        default=ALL_MODES,
+        help="Modes to profile (default: all)"
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=20.0,
+        help="Simulated latency per LLM call in ms (default: 20; 0 measures pure overhead)"
+    )
+    parser.add_argument(
+        "--per-token-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated latency per completion token in ms (default: 0)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="benchmarks/performance/results",
+        help="Directory to save results (default: benchmarks/performance/results)"
+    )
+
+    args = parser.parse_args()
+
+    run_performance_benchmark(
+        modes=args.modes,
+        latency_ms=args.latency_ms,
+        per_token_latency_ms=args.per_token_latency_ms,
+        output_dir=args.output_dir,
+    )
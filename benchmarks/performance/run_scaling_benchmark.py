@@ -0,0 +1,433 @@
+# run_scaling_benchmark.py
+# Scaling benchmark: how meeting cost grows with persona count and turn count
+#
+# Per-turn work in meeting_facilitator depends on personas_per_phase (one
+# summary update per persona, N belief states in the mediator prompt) and on
+# how far the meeting has got (history and shared_context grow every turn).
+# This benchmark sweeps each dimension on its own against the simulated
+# backend, holding the other at a base value:
+#
+#   - personas: 2 -> 10 at a fixed turn count
+#   - turns:    3 -> 30 at a fixed persona count
+#
+# For every point it records per-turn latency, tokens and calls by component
+# (LLM call kind / stage) and the peak Python heap of the run (tracemalloc, in
+# a separate pass so it does not skew timings). Each component's run-total cost
+# is fitted as cost ~ x^k over the sweep; k noticeably above 1 means it grows
+# superlinearly and is flagged. Results are saved as JSON plus an HTML report
+# with the growth curves.
+#
+# Usage:
+#   python benchmarks/performance/run_scaling_benchmark.py
+#   python benchmarks/performance/run_scaling_benchmark.py --memory-mode full_history --latency-ms 0
+
+import argparse
+import asyncio
+import html
+import json
+import math
+import os
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.performance.run_performance_benchmark import profile_mode
+
+PERSONA_COUNTS = [2, 4, 6, 8, 10]
+TURN_COUNTS = [3, 6, 10, 15, 20, 30]
+BASE_PERSONAS = 4
+BASE_TURNS = 10
+SWEEPS = ("personas", "turns")
+
+# Fitted exponent above which a component counts as growing superlinearly
+SUPERLINEAR_EXPONENT = 1.2
+
+# Single debate phase with the mediator on, so every turn does the full work
+BASE_MODE = "medium"
+BASE_OVERRIDES = {"phase_selection": "first_n", "num_phases": 1, "enable_mediator": True}
+
+
+def fit_exponent(xs: List[float], ys: List[float]) -> Optional[float]:
+    """
+    Least-squares slope of log(y) against log(x), i.e. k in y ~ x^k.
+
+    Returns:
+        The exponent, or None with fewer than two positive points
+    """
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(p[0] for p in points) / len(points)
+    mean_y = sum(p[1] for p in points) / len(points)
+    var_x = sum((p[0] - mean_x) ** 2 for p in points)
+    if var_x == 0:
+        return None
+    return round(sum((p[0] - mean_x) * (p[1] - mean_y) for p in points) / var_x, 3)
+
+
+def _point_metrics(profile: Dict[str, Any], heap_peak_mb: float) -> Dict[str, Any]:
+    """Run totals for one sweep point, by component."""
+    summary = profile["summary"]
+    turns = summary["turns"]
+    tokens_by_kind = {
+        kind: stats["prompt_tokens"] + stats["completion_tokens"]
+        for kind, stats in profile["llm_calls_by_kind"].items()
+    }
+    return {
+        "turns": turns,
+        "wall_seconds": profile["wall_seconds"],
+        "turn_seconds_mean": summary["turn_seconds_mean"],
+        "turn_seconds_p95": summary["turn_seconds_p95"],
+        "prompt_tokens_per_turn": summary["prompt_tokens_per_turn"],
+        "llm_calls_per_turn": summary["llm_calls_per_turn"],
+        "llm_calls_total": profile["llm_calls_total"],
+        "tokens_total": sum(tokens_by_kind.values()),
+        "tokens_by_kind": tokens_by_kind,
+        "calls_by_kind": {kind: stats["calls"] for kind, stats in profile["llm_calls_by_kind"].items()},
+        "stage_seconds": {
+            name: round(per_turn * turns, 4) for name, per_turn in summary["stage_seconds_per_turn"].items()
+        },
+        "heap_peak_mb": heap_peak_mb,
+    }
+
+
+def growth_exponents(xs: List[float], points: List[Dict[str, Any]]) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Fitted exponent of every component's run-total cost over a sweep.
+
+    Returns:
+        {"tokens": {kind: k}, "calls": {kind: k}, "seconds": {stage: k},
+         "totals": {"tokens", "calls", "wall_seconds", "heap_peak_mb"}}
+    """
+    def per_component(field: str) -> Dict[str, Optional[float]]:
+        names = sorted({name for p in points for name in p[field]})
+        return {name: fit_exponent(xs, [p[field].get(name, 0) for p in points]) for name in names}
+
+    return {
+        "tokens": per_component("tokens_by_kind"),
+        "calls": per_component("calls_by_kind"),
+        "seconds": per_component("stage_seconds"),
+        "totals": {
+            "tokens": fit_exponent(xs, [p["tokens_total"] for p in points]),
+            "calls": fit_exponent(xs, [p["llm_calls_total"] for p in points]),
+            "wall_seconds": fit_exponent(xs, [p["wall_seconds"] for p in points]),
+            "heap_peak_mb": fit_exponent(xs, [p["heap_peak_mb"] for p in points]),
+        },
+    }
+
+
+def superlinear_components(exponents: Dict[str, Dict[str, Optional[float]]], threshold: float) -> List[Dict[str, Any]]:
+    """Every (metric, component) whose fitted exponent exceeds threshold, steepest first."""
+    flagged = [
+        {"metric": metric, "component": name, "exponent": k}
+        for metric, by_name in exponents.items()
+        for name, k in by_name.items()
+        if k is not None and k > threshold
+    ]
+    return sorted(flagged, key=lambda f: -f["exponent"])
+
+
+async def _measure_point(personas: int, turns: int, workdir: str, latency: float, memory_mode: Optional[str]) -> Dict[str, Any]:
+    overrides = {**BASE_OVERRIDES, "personas_per_phase": personas, "max_turns_per_phase": turns}
+    if memory_mode:
+        overrides["memory_mode"] = memory_mode
+
+    profile = await profile_mode(BASE_MODE, os.path.join(workdir, "timing"), latency=latency, config_overrides=overrides)
+
+    # Heap pass: same run under tracemalloc (its overhead would distort the timings above)
+    tracemalloc.start()
+    try:
+        await profile_mode(BASE_MODE, os.path.join(workdir, "heap"), latency=0.0, config_overrides=overrides)
+        heap_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"personas": personas, "max_turns": turns, **_point_metrics(profile, round(heap_peak / (1024 * 1024), 2))}
+
+
+def run_sweep(
+    sweep: str,
+    values: List[int],
+    latency: float,
+    memory_mode: Optional[str] = None,
+    base_personas: int = BASE_PERSONAS,
+    base_turns: int = BASE_TURNS,
+    threshold: float = SUPERLINEAR_EXPONENT,
+) -> Dict[str, Any]:
+    """
+    Measure every value of one dimension, holding the other at its base.
+
+    Args:
+        sweep: "personas" or "turns"
+        values: Persona counts or max_turns values to measure
+        latency: Simulated seconds per LLM call
+        memory_mode: Override for the mode's memory_mode (None keeps it)
+        base_personas: Persona count while sweeping turns
+        base_turns: max_turns while sweeping personas
+        threshold: Exponent above which a component is flagged
+
+    Returns:
+        {"sweep", "values" (x axis), "points", "exponents", "superlinear"}
+    """
+    if sweep not in SWEEPS:
+        raise ValueError(f"Unknown sweep '{sweep}', expected one of {SWEEPS}")
+
+    points = []
+    for value in values:
+        personas, turns = (value, base_turns) if sweep == "personas" else (base_personas, value)
+        print(f"[Scaling] {sweep}: personas={personas} max_turns={turns}...")
+        with tempfile.TemporaryDirectory(prefix="scaling_") as workdir:
+            point = asyncio.run(_measure_point(personas, turns, workdir, latency, memory_mode))
+        print(
+            f"[Scaling]   {point['turns']} turns | {point['turn_seconds_mean']*1000:.1f} ms/turn | "
+            f"{point['tokens_total']:,} tokens | {point['llm_calls_total']} calls | heap {point['heap_peak_mb']:.1f} MB"
+        )
+        points.append(point)
+
+    # A meeting can run a turn past max_turns, so the turns sweep fits against turns actually taken
+    xs = values if sweep == "personas" else [p["turns"] for p in points]
+    exponents = growth_exponents(xs, points)
+    return {
+        "sweep": sweep,
+        "values": xs,
+        "points": points,
+        "exponents": exponents,
+        "superlinear": superlinear_components(exponents, threshold),
+    }
+
+
+# ---------------------------------------------------------------------------
+# HTML report
+# ---------------------------------------------------------------------------
+
+_COLORS = ["#2563eb", "#dc2626", "#16a34a", "#9333ea", "#ea580c", "#0891b2", "#ca8a04", "#db2777", "#4b5563"]
+
+
+def _svg_line_chart(title: str, x_label: str, xs: List[float], series: Dict[str, List[float]], width: int = 460, height: int = 260) -> str:
+    """Inline SVG line chart (no plotting dependency)."""
+    left, right, top, bottom = 56, 130, 28, 40
+    plot_w, plot_h = width - left - right, height - top - bottom
+    y_max = max([max(ys) for ys in series.values() if ys] + [0]) or 1
+    x_min, x_max = min(xs), max(xs)
+    x_span = (x_max - x_min) or 1
+
+    def sx(x: float) -> float:
+        return left + (x - x_min) / x_span * plot_w
+
+    def sy(y: float) -> float:
+        return top + plot_h - y / y_max * plot_h
+
+    parts = [
+        f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg" font-family="sans-serif" font-size="11">',
+        f'<text x="{left}" y="16" font-size="13" font-weight="bold">{html.escape(title)}</text>',
+        f'<line x1="{left}" y1="{top + plot_h}" x2="{left + plot_w}" y2="{top + plot_h}" stroke="#999"/>',
+        f'<line x1="{left}" y1="{top}" x2="{left}" y2="{top + plot_h}" stroke="#999"/>',
+        f'<text x="{left - 6}" y="{top + 4}" text-anchor="end">{y_max:,.3g}</text>',
+        f'<text x="{left - 6}" y="{top + plot_h}" text-anchor="end">0</text>',
+        f'<text x="{left + plot_w / 2}" y="{height - 6}" text-anchor="middle">{html.escape(x_label)}</text>',
+    ]
+    for x in xs:
+        parts.append(f'<text x="{sx(x):.1f}" y="{top + plot_h + 14}" text-anchor="middle">{x}</text>')
+    for index, (name, ys) in enumerate(series.items()):
+        color = _COLORS[index % len(_COLORS)]
+        coords = " ".join(f"{sx(x):.1f},{sy(y):.1f}" for x, y in zip(xs, ys))
+        parts.append(f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{coords}"/>')
+        for x, y in zip(xs, ys):
+            parts.append(f'<circle cx="{sx(x):.1f}" cy="{sy(y):.1f}" r="2.5" fill="{color}"/>')
+        legend_y = top + 12 + index * 14
+        parts.append(f'<rect x="{left + plot_w + 10}" y="{legend_y - 8}" width="10" height="3" fill="{color}"/>')
+        parts.append(f'<text x="{left + plot_w + 24}" y="{legend_y - 4}">{html.escape(name)}</text>')
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def _sweep_section(result: Dict[str, Any]) -> str:
+    sweep, xs, points = result["sweep"], result["values"], result["points"]
+    x_label = "personas per phase" if sweep == "personas" else "max turns"
+    kinds = sorted({k for p in points for k in p["tokens_by_kind"]}, key=lambda k: -points[-1]["tokens_by_kind"].get(k, 0))
+    charts = [
+        _svg_line_chart("Turn latency (ms)", x_label, xs, {
+            "mean": [p["turn_seconds_mean"] * 1000 for p in points],
+            "p95": [p["turn_seconds_p95"] * 1000 for p in points],
+        }),
+        _svg_line_chart("Tokens per run by component", x_label, xs, {
+            kind: [p["tokens_by_kind"].get(kind, 0) for p in points] for kind in kinds[:8]
+        }),
+        _svg_line_chart("Prompt tokens per turn", x_label, xs, {"prompt tokens": [p["prompt_tokens_per_turn"] for p in points]}),
+        _svg_line_chart("Peak heap (MB)", x_label, xs, {"heap": [p["heap_peak_mb"] for p in points]}),
+    ]
+    rows = "".join(
+        f"<tr><td>{html.escape(metric)}</td><td>{html.escape(name)}</td><td>{k if k is not None else '-'}</td>"
+        f"<td>{'SUPERLINEAR' if k is not None and k > SUPERLINEAR_EXPONENT else ''}</td></tr>"
+        for metric, by_name in result["exponents"].items()
+        for name, k in by_name.items()
+    )
+    return f"""
+    <h2>Sweep: {html.escape(x_label)}</h2>
+    <div class="charts">{''.join(charts)}</div>
+    <table>
+        <tr><th>Metric</th><th>Component</th><th>Exponent k (cost ~ x^k)</th><th></th></tr>
+        {rows}
+    </table>"""
+
+
+def write_html_report(results: Dict[str, Any], output_path: str) -> None:
+    """Save the growth curves and fitted exponents as a standalone HTML page."""
+    config = results["benchmark_config"]
+    sections = "".join(_sweep_section(result) for result in results["sweeps"].values())
+    page = f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Assembly Scaling Benchmark</title>
+    <style>
+        body {{ font-family: sans-serif; margin: 24px; color: #1f2937; }}
+        .charts {{ display: flex; flex-wrap: wrap; gap: 16px; }}
+        table {{ border-collapse: collapse; margin-top: 12px; font-size: 13px; }}
+        th, td {{ border: 1px solid #e5e7eb; padding: 4px 10px; text-align: left; }}
+        td:last-child {{ color: #dc2626; font-weight: bold; }}
+    </style>
+</head>
+<body>
+    <h1>Assembly Scaling Benchmark</h1>
+    <p>{html.escape(results['timestamp'])} | base mode {html.escape(config['base_mode'])} |
+       memory mode {html.escape(str(config['memory_mode'] or 'mode default'))} |
+       simulated latency {config['latency_ms']:g} ms/call |
+       superlinear threshold k &gt; {config['superlinear_exponent']}</p>
+    {sections}
+</body>
+</html>"""
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(page)
+
+
+def run_scaling_benchmark(
+    sweeps: Optional[List[str]] = None,
+    persona_counts: Optional[List[int]] = None,
+    turn_counts: Optional[List[int]] = None,
+    latency_ms: float = 5.0,
+    memory_mode: Optional[str] = None,
+    output_dir: str = "benchmarks/performance/results",
+) -> Dict[str, Any]:
+    """
+    Run the persona and/or turn sweeps and save the JSON and HTML report.
+
+    Args:
+        sweeps: Any of "personas", "turns" (default: both)
+        persona_counts: Persona counts for the personas sweep
+        turn_counts: max_turns values for the turns sweep
+        latency_ms: Simulated milliseconds per LLM call
+        memory_mode: "structured" or "full_history" (None: the base mode's)
+        output_dir: Directory to save results
+
+    Returns:
+        Results dict ({"timestamp", "benchmark_config", "sweeps", "superlinear"})
+    """
+    sweeps = sweeps or list(SWEEPS)
+    values = {"personas": persona_counts or PERSONA_COUNTS, "turns": turn_counts or TURN_COUNTS}
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"\n{'='*60}")
+    print(f"SCALING BENCHMARK: {', '.join(sweeps)} | simulated latency {latency_ms:g} ms/call")
+    print(f"{'='*60}\n")
+
+    results_by_sweep = {sweep: run_sweep(sweep, values[sweep], latency_ms / 1000, memory_mode) for sweep in sweeps}
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results = {
+        "timestamp": timestamp,
+        "benchmark_config": {
+            "sweeps": sweeps,
+            "persona_counts": values["personas"],
+            "turn_counts": values["turns"],
+            "base_personas": BASE_PERSONAS,
+            "base_turns": BASE_TURNS,
+            "base_mode": BASE_MODE,
+            "memory_mode": memory_mode,
+            "latency_ms": latency_ms,
+            "superlinear_exponent": SUPERLINEAR_EXPONENT,
+            "timestamp": timestamp,
+        },
+        "sweeps": results_by_sweep,
+        "superlinear": {sweep: result["superlinear"] for sweep, result in results_by_sweep.items()},
+    }
+
+    print(f"\n{'='*60}")
+    print(f"SUPERLINEAR COMPONENTS (k > {SUPERLINEAR_EXPONENT})")
+    print(f"{'='*60}")
+    for sweep, flagged in results["superlinear"].items():
+        if not flagged:
+            print(f"  {sweep}: none")
+        for flag in flagged:
+            print(f"  {sweep}: {flag['metric']} of {flag['component']} grows ~ x^{flag['exponent']}")
+
+    output_file = os.path.join(output_dir, f"scaling_benchmark_{timestamp}.json")
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    report_file = output_file.replace(".json", ".html")
+    write_html_report(results, report_file)
+    print(f"\n[OK] Results saved to: {output_file}")
+    print(f"[OK] Growth curves: {report_file}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Sweep persona count and turn count against a simulated LLM backend"
+    )
+    parser.add_argument(
+        "--sweeps",
+        nargs="+",
+        choices=list(SWEEPS),
+        default=list(SWEEPS),
+        help="Dimensions to sweep (default: both)"
+    )
+    parser.add_argument(
+        "--personas",
+        nargs="+",
+        type=int,
+        default=PERSONA_COUNTS,
+        help=f"Persona counts to measure (default: {PERSONA_COUNTS})"
+    )
+    parser.add_argument(
+        "--turns",
+        nargs="+",
+        type=int,
+        default=TURN_COUNTS,
+        help=f"max_turns values to measure (default: {TURN_COUNTS})"
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=5.0,
+        help="Simulated latency per LLM call in ms (default: 5)"
+    )
+    parser.add_argument(
+        "--memory-mode",
+        choices=["structured", "full_history"],
+        help="Memory mode to measure (default: the medium mode's)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="benchmarks/performance/results",
+        help="Directory to save results (default: benchmarks/performance/results)"
+    )
+
+    args = parser.parse_args()
+
+    run_scaling_benchmark(
+        sweeps=args.sweeps,
+        persona_counts=args.personas,
+        turn_counts=args.turns,
+        latency_ms=args.latency_ms,
+        memory_mode=args.memory_mode,
+        output_dir=args.output_dir,
+    )
@@ -0,0 +1,283 @@
+# simulated_llm.py
+# Deterministic stand-in for the OpenAI API, used by the performance benchmark
+#
+# Every OpenAI()/AsyncOpenAI() the pipeline creates is swapped for a simulated
+# client while simulated_openai() is active. Replies are chosen by recognising
+# the prompt (persona generation, next-speaker decision, summary update, ...)
+# and filled with text seeded from a hash of the prompt, so the same run always
+# produces the same conversation. Latency is a fixed per-call delay plus a
+# per-output-token delay; token counts use the repo's len(text) // 4 estimate.
+
+import asyncio
+import importlib
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Modules that construct their own OpenAI clients
+OPENAI_CLIENT_MODULES = (
+    "framework.persona",
+    "framework.mediator_persona",
+    "framework.facilitator",
+    "framework.generators",
+    "src.idea_generation.idea_tracker",
+    "src.idea_generation.memory",
+    "src.idea_generation.extraction",
+    "src.idea_generation.convergence",
+)
+
+_WORDS = (
+    "users", "pricing", "onboarding", "retention", "workflow", "budget", "trust",
+    "integration", "segment", "churn", "margin", "latency", "compliance", "pilot",
+    "distribution", "habit", "signal", "friction", "subscription", "dashboard",
+    "freelancers", "invoices", "forecast", "risk", "evidence", "channel", "cohort",
+)
+
+_TITLES = (
+    "LedgerLoop", "CashCompass", "PayPilot", "BudgetBuddy", "InvoiceIQ",
+    "SpendSense", "TaxTrail", "RunwayRadar",
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (same len // 4 estimate as framework/analytics.py)."""
+    return max(1, len(text) // 4)
+
+
+def _prompt_text(messages: List[Dict[str, str]]) -> str:
+    return "\n".join(str(m.get("content", "")) for m in messages)
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _prose(rng: random.Random, words: int) -> str:
+    sentences = []
+    while words > 0:
+        length = min(words, rng.randint(8, 16))
+        sentences.append(_sentence(rng, length))
+        words -= length
+    return " ".join(sentences)
+
+
+class SimulatedLLM:
+    """
+    Shared reply generator, latency model and call log for simulated clients.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        per_token_latency: float = 0.0,
+        response_words: int = 150,
+        on_call: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """
+        Args:
+            latency: Seconds before the first token of every call
+            per_token_latency: Additional seconds per completion token
+            response_words: Length of persona responses (other replies scale from it)
+            on_call: Called with {"kind", "prompt_tokens", "completion_tokens",
+                "seconds"} after every call, from whichever thread made it
+        """
+        self.latency = latency
+        self.per_token_latency = per_token_latency
+        self.response_words = response_words
+        self.on_call = on_call
+        self.calls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Replies
+    # ------------------------------------------------------------------
+
+    def reply(self, messages: List[Dict[str, str]]) -> Tuple[str, str]:
+        """
+        Pick a reply for a chat request.
+
+        Returns:
+            (kind, content) — kind names the pipeline step that made the call
+        """
+        system = next((m["content"] for m in messages if m.get("role") == "system"), "")
+        prompt = _prompt_text(messages)
+        rng = random.Random(zlib.crc32(prompt.encode("utf-8")))
+
+        if "logic-role agents" in system:
+            return "persona_generation", self._personas(prompt)
+        if '"next_speaker"' in prompt:
+            return "next_speaker", self._next_speaker(prompt)
+        if "summary updater" in system:
+            return "summary_update", json.dumps({
+                "new_objective_facts": [_sentence(rng, 10)],
+                "new_subjective_notes": {"key_concerns": [_sentence(rng, 6)]},
+            })
+        if "belief state updater" in system:
+            return "belief_update", json.dumps({
+                "position": _sentence(rng, 12),
+                "confidence": round(rng.uniform(0.4, 0.9), 2),
+                "new_uncertainties": [_sentence(rng, 8)],
+            })
+        if "Extract the startup idea/solution" in prompt:
+            match = re.search(r"I propose (\w+)", prompt)
+            if not match:
+                return "idea_extraction", json.dumps({"title": None})
+            return "idea_extraction", json.dumps({
+                "title": match.group(1),
+                "overview": _prose(rng, 24),
+                "why_it_works": _sentence(rng, 12),
+                "why_it_might_fail": _sentence(rng, 12),
+                "example": _sentence(rng, 18),
+            })
+        if "Is the speaker rejecting" in prompt:
+            return "rejection_detection", json.dumps({"rejected": False})
+        if '"selected_personas"' in prompt:
+            return "persona_selection", json.dumps({"selected_personas": [], "reasoning": "all"})
+        if "memory keeper" in system:
+            return "shared_memory", "\n".join(f"- {_sentence(rng, 12)}" for _ in range(6))
+        if "phase summaries" in system:
+            return "phase_summary", _prose(rng, self.response_words)
+        if "Socratic Mediator" in system:
+            return "mediator", _prose(rng, self.response_words // 2)
+        if "Respond ONLY with" in prompt or "JSON" in system:
+            return "other_json", "{}"
+
+        text = _prose(rng, self.response_words)
+        if rng.random() < 0.4:
+            # Make some turns detailed proposals so idea tracking runs
+            text = f"I propose {rng.choice(_TITLES)}: this would work by {text}"
+        return "persona_response", text
+
+    def _personas(self, prompt: str) -> str:
+        count = int(re.search(r"Generate (\d+) logic-role", prompt).group(1))
+        phase = re.search(r"PHASE: (.*)", prompt).group(1).strip()
+        rng = random.Random(zlib.crc32(phase.encode("utf-8")))
+        personas = []
+        for index in range(count):
+            role = f"{rng.choice(_WORDS).title()} {rng.choice(_WORDS).title()} Analyst {index + 1}"
+            personas.append({
+                "Name": role,
+                "Archetype": _sentence(rng, 4),
+                "Purpose": _sentence(rng, 14),
+                "Deliverables": _sentence(rng, 10),
+                "Strengths": _sentence(rng, 10),
+                "Watch-out": _sentence(rng, 12),
+                "Conversation_Style": "N/A",
+            })
+        return json.dumps({"personas": personas})
+
+    @staticmethod
+    def _next_speaker(prompt: str) -> str:
+        names = re.search(r"choose from: (.*)", prompt).group(1).split(", ")
+        turn = int(re.search(r"Turns so far: (\d+)", prompt).group(1))
+        return json.dumps({
+            "phase_complete": False,
+            "next_speaker": names[turn % len(names)],
+            "reasoning": "Rotate speakers",
+        })
+
+    # ------------------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------------------
+
+    def complete(self, request: Dict[str, Any]) -> Tuple[str, str, Dict[str, int]]:
+        """Reply to a request: (kind, content, usage)."""
+        kind, content = self.reply(request.get("messages", []))
+        usage = {
+            "prompt_tokens": estimate_tokens(_prompt_text(request.get("messages", []))),
+            "completion_tokens": estimate_tokens(content),
+        }
+        return kind, content, usage
+
+    def delay(self, completion_tokens: int) -> float:
+        return self.latency + completion_tokens * self.per_token_latency
+
+    def record(self, kind: str, usage: Dict[str, int], seconds: float) -> None:
+        call = {"kind": kind, **usage, "seconds": seconds}
+        with self._lock:
+            self.calls.append(call)
+        if self.on_call:
+            self.on_call(call)
+
+
+def _completion(content: str, usage: Dict[str, int]) -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+        usage=SimpleNamespace(**usage),
+    )
+
+
+def _chunk(content: Optional[str] = None, usage: Optional[Dict[str, int]] = None) -> SimpleNamespace:
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content is not None else []
+    return SimpleNamespace(choices=choices, usage=SimpleNamespace(**usage) if usage else None)
+
+
+class _SyncCompletions:
+    def __init__(self, backend: SimulatedLLM):
+        self.backend = backend
+
+    def create(self, stream: bool = False, **request):
+        start = time.perf_counter()
+        kind, content, usage = self.backend.complete(request)
+        if stream:
+            return self._stream(start, kind, content, usage)
+        time.sleep(self.backend.delay(usage["completion_tokens"]))
+        self.backend.record(kind, usage, time.perf_counter() - start)
+        return _completion(content, usage)
+
+    def _stream(self, start: float, kind: str, content: str, usage: Dict[str, int]) -> Iterator[SimpleNamespace]:
+        time.sleep(self.backend.latency)
+        words = content.split(" ")
+        for index, word in enumerate(words):
+            text = word if index == len(words) - 1 else word + " "
+            time.sleep(estimate_tokens(text) * self.backend.per_token_latency)
+            yield _chunk(text)
+        yield _chunk(usage=usage)
+        self.backend.record(kind, usage, time.perf_counter() - start)
+
+
+class _AsyncCompletions:
+    def __init__(self, backend: SimulatedLLM):
+        self.backend = backend
+
+    async def create(self, **request):
+        start = time.perf_counter()
+        kind, content, usage = self.backend.complete(request)
+        await asyncio.sleep(self.backend.delay(usage["completion_tokens"]))
+        self.backend.record(kind, usage, time.perf_counter() - start)
+        return _completion(content, usage)
+
+
+def _client_factory(backend: SimulatedLLM, completions_cls) -> Callable[..., SimpleNamespace]:
+    def factory(*args, **kwargs) -> SimpleNamespace:
+        return SimpleNamespace(chat=SimpleNamespace(completions=completions_cls(backend)))
+    return factory
+
+
+@contextmanager
+def simulated_openai(backend: SimulatedLLM):
+    """
+    Route every OpenAI client created inside the block to the simulated backend.
+
+    Args:
+        backend: SimulatedLLM answering the calls
+    """
+    originals = []
+    for module_name in OPENAI_CLIENT_MODULES:
+        module = importlib.import_module(module_name)
+        for attr, completions_cls in (("OpenAI", _SyncCompletions), ("AsyncOpenAI", _AsyncCompletions)):
+            if hasattr(module, attr):
+                originals.append((module, attr, getattr(module, attr)))
+                setattr(module, attr, _client_factory(backend, completions_cls))
+    try:
+        yield backend
+    finally:
+        for module, attr, original in originals:
+            setattr(module, attr, original)
@@ -22,6 +22,7 @@ load_dotenv()
 MODEL_NAME = "gpt-5.1"
 NUM_RUNS = 3
 MODE = "fast"  # "fast", "medium", "standard", "deep"
+MAX_WORKERS = 3  # Runs executed concurrently (see benchmarks/harness.py)
 
 INSPIRATION = """
 Goal: Create a startup that helps young professionals learn to invest.
@@ -85,6 +86,7 @@ if __name__ == "__main__":
         num_runs=NUM_RUNS,
         mode=MODE,
         output_dir=OUTPUT_DIR,
+        max_workers=MAX_WORKERS,
     )
     phase_results["reliability"] = reliability_results
 
@@ -1,9 +1,9 @@
 # test_end_to_end_reliability.py
 # Phase 1 Benchmark: Verify system completes runs consistently
 
-import json
 import os
 import sys
+import traceback
 from datetime import datetime
 from typing import Optional
 
@@ -13,7 +13,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 from dotenv import load_dotenv
 load_dotenv()
 
-from src.idea_generation.generator import multiple_llm_idea_generator
+from framework import ConversationLogger
+from src.idea_generation.generator import run_assembly
+from benchmarks.harness import cell_key, cell_session_name, results_path_for, run_cells, write_results
 
 
 def validate_idea_structure(idea: dict) -> tuple[bool, list[str]]:
@@ -37,22 +39,80 @@ def validate_idea_structure(idea: dict) -> tuple[bool, list[str]]:
     return len(missing) == 0, missing
 
 
+async def _run_reliability_cell(cell: dict) -> dict:
+    """Run Assembly once (one repetition) and record completion and structure."""
+    run_num = cell["run_number"]
+    print(f"\n--- Run {run_num}/{cell['num_runs']} ---")
+    run_result = {
+        "run_number": run_num,
+        "success": False,
+        "error": None,
+        "ideas_generated": 0,
+        "structure_valid": False,
+        "missing_fields": [],
+        "idea_titles": [],
+    }
+
+    try:
+        ideas = await run_assembly(
+            inspiration=cell["inspiration"],
+            number_of_ideas=1,
+            mode=cell["mode"],
+            logger=ConversationLogger(session_name=cell_session_name(cell["key"])),
+        )
+
+        if ideas and isinstance(ideas, list):
+            run_result["success"] = True
+            run_result["ideas_generated"] = len(ideas)
+            run_result["idea_titles"] = [
+                idea.get("title", "Untitled") for idea in ideas
+            ]
+
+            # Validate structure of first idea
+            is_valid, missing = validate_idea_structure(ideas[0])
+            run_result["structure_valid"] = is_valid
+            run_result["missing_fields"] = missing
+
+            print(f"[OK] Run {run_num} completed successfully")
+            print(f"     Ideas: {run_result['idea_titles']}")
+        else:
+            run_result["error"] = "No ideas returned or invalid format"
+            print(f"[FAIL] Run {run_num}: No ideas returned")
+
+    except Exception as e:
+        run_result["error"] = str(e)
+        print(f"[FAIL] Run {run_num}: {e}")
+        traceback.print_exc()
+
+    return run_result
+
+
 def run_reliability_test(
     inspiration: str,
     model_name: str = "gpt-4o-mini",
     num_runs: int = 10,
     mode: str = "medium",
     output_dir: Optional[str] = None,
+    max_workers: int = 4,
+    pool: str = "async",
+    resume: Optional[str] = None,
 ) -> dict:
     """
     Run multiple identical prompts and check for consistent completion.
 
+    Runs are independent, so up to max_workers of them run at once (see
+    benchmarks/harness.py). Each finished run is checkpointed to the results
+    file; pass that file as `resume` to finish an interrupted test.
+
     Args:
         inspiration: The prompt to test with
         model_name: Model to use (note: mode config may override)
         num_runs: Number of identical runs
         mode: Run mode ("fast", "medium", "standard", "deep")
         output_dir: Directory to save results (optional)
+        max_workers: Maximum runs in flight at once
+        pool: "async" or "process"
+        resume: Results file of an interrupted test to continue
 
     Returns:
         Dictionary with test results
@@ -82,58 +142,39 @@ def run_reliability_test(
         },
     }
 
-    for run_num in range(1, num_runs + 1):
-        print(f"\n--- Run {run_num}/{num_runs} ---")
-        run_result = {
+    output_file = results_path_for(output_dir, "reliability_test", resume)
+    cells = [
+        {
+            "key": cell_key("run", run_num),
             "run_number": run_num,
-            "success": False,
-            "error": None,
-            "ideas_generated": 0,
-            "structure_valid": False,
-            "missing_fields": [],
-            "idea_titles": [],
+            "num_runs": num_runs,
+            "inspiration": inspiration,
+            "mode": mode,
         }
+        for run_num in range(1, num_runs + 1)
+    ]
+    cell_results = run_cells(
+        cells,
+        _run_reliability_cell,
+        results_path=output_file,
+        header={key: results[key] for key in ("test_name", "timestamp", "config")},
+        max_workers=max_workers,
+        pool=pool,
+    )
 
-        try:
-            import traceback
-            ideas = multiple_llm_idea_generator(
-                inspiration=inspiration,
-                number_of_ideas=1,
-                mode=mode,
-            )
-
-            if ideas and isinstance(ideas, list):
-                run_result["success"] = True
-                run_result["ideas_generated"] = len(ideas)
-                run_result["idea_titles"] = [
-                    idea.get("title", "Untitled") for idea in ideas
-                ]
-
-                # Validate structure of first idea
-                if ideas:
-                    is_valid, missing = validate_idea_structure(ideas[0])
-                    run_result["structure_valid"] = is_valid
-                    run_result["missing_fields"] = missing
-
-                    if is_valid:
-                        results["summary"]["valid_structure"] += 1
-                    else:
-                        results["summary"]["invalid_structure"] += 1
-
-                results["summary"]["successful"] += 1
-                print(f"[OK] Run {run_num} completed successfully")
-                print(f"     Ideas: {run_result['idea_titles']}")
+    for cell in cells:
+        run_result = cell_results[cell["key"]]
+        if "run_number" not in run_result:
+            # The cell itself crashed (not just the Assembly run)
+            run_result = {"run_number": cell["run_number"], "success": False, **run_result}
+        if run_result["success"]:
+            results["summary"]["successful"] += 1
+            if run_result["structure_valid"]:
+                results["summary"]["valid_structure"] += 1
             else:
-                run_result["error"] = "No ideas returned or invalid format"
-                results["summary"]["failed"] += 1
-                print(f"[FAIL] Run {run_num}: No ideas returned")
-
-        except Exception as e:
-            run_result["error"] = str(e)
+                results["summary"]["invalid_structure"] += 1
+        else:
             results["summary"]["failed"] += 1
-            print(f"[FAIL] Run {run_num}: {e}")
-            traceback.print_exc()
-
         results["runs"].append(run_result)
 
     # Calculate success rate
@@ -164,15 +205,9 @@ def run_reliability_test(
         if structure_rate < 90:
             print(f"       - Structure validity {structure_rate:.1f}% < 90%")
 
-    # Save results if output directory specified
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-        output_file = os.path.join(
-            output_dir,
-            f"reliability_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        )
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2)
+    # Save results if output directory specified (cells kept for --resume)
+    if output_file:
+        write_results(output_file, {**results, "status": "complete", "cells": cell_results})
         print(f"\nResults saved to: {output_file}")
 
     return results
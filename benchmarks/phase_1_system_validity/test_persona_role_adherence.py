@@ -17,6 +17,8 @@ load_dotenv()
 
 from openai import OpenAI
 
+from benchmarks.judge_cache import cached_judge
+
 
 # Role adherence keywords/patterns for common personas
 # Note: Dynamic personas may have names like "Need Identifier", "Fear Assessor", etc.
@@ -75,9 +77,13 @@ PERSONA_INDICATORS = {
 }
 
 
+ROLE_ADHERENCE_SYSTEM = "You analyze AI persona role adherence. Return valid JSON only."
+
+
 def analyze_role_adherence_with_llm(
     exchange: dict,
     model_name: str = "gpt-4o-mini",
+    cache_dir: Optional[str] = None,
 ) -> dict:
     """
     Use LLM to analyze whether a persona stayed in role.
@@ -85,12 +91,11 @@ def analyze_role_adherence_with_llm(
     Args:
         exchange: Single conversation exchange with persona and content
         model_name: Model to use for analysis
+        cache_dir: Directory holding the judge cache (None: always call the judge)
 
     Returns:
         Dictionary with analysis results
     """
-    client = OpenAI()
-
     # Support both "persona" and "speaker" field names
     persona = exchange.get("persona") or exchange.get("speaker", "Unknown")
     archetype = exchange.get("archetype", "")
@@ -121,18 +126,22 @@ Respond in JSON format:
 }}
 """
 
-    try:
+    def judge() -> dict:
+        client = OpenAI()
         response = client.chat.completions.create(
             model=model_name,
             messages=[
-                {"role": "system", "content": "You analyze AI persona role adherence. Return valid JSON only."},
+                {"role": "system", "content": ROLE_ADHERENCE_SYSTEM},
                 {"role": "user", "content": analysis_prompt},
             ],
             response_format={"type": "json_object"},
             temperature=0.3,
         )
+        return json.loads(response.choices[0].message.content)
 
-        result = json.loads(response.choices[0].message.content)
+    try:
+        # The filled-in prompt carries both the rubric and the exchange
+        result = cached_judge(cache_dir, model_name, ROLE_ADHERENCE_SYSTEM, analysis_prompt, judge)
         return {
             "persona": persona,
             "phase": phase,
@@ -222,7 +231,7 @@ def run_role_adherence_test(
         logs_path: Path to meeting_logs.txt or conversation log JSON
         use_llm: Whether to use LLM for analysis (more accurate but costly)
         model_name: Model to use if use_llm=True
-        output_dir: Directory to save results
+        output_dir: Directory to save results (LLM verdicts are cached there too)
 
     Returns:
         Dictionary with test results
@@ -301,7 +310,7 @@ def run_role_adherence_test(
         print(f"Analyzing exchange {i+1}: {speaker} ({exchange.get('phase', 'unknown')})")
 
         if use_llm:
-            analysis = analyze_func(exchange, model_name=model_name)
+            analysis = analyze_func(exchange, model_name=model_name, cache_dir=output_dir)
         else:
             analysis = analyze_func(exchange)
 
@@ -59,6 +59,16 @@ if __name__ == "__main__":
         default=DEFAULT_ASSEMBLY_MODE,
         help=f"Assembly mode (default: {DEFAULT_ASSEMBLY_MODE})"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum (prompt, approach) cells running at once (default: 4)"
+    )
+    parser.add_argument(
+        "--resume",
+        help="Results file of an interrupted run to continue"
+    )
     args = parser.parse_args()
 
     from prompts import BENCHMARK_PROMPTS
@@ -100,6 +110,8 @@ if __name__ == "__main__":
             mode=args.assembly_mode,
             output_dir=OUTPUT_DIR,
             anonymize=ANONYMIZE,
+            max_workers=args.workers,
+            resume=args.resume,
         )
 
         # Print next steps for 3-way
@@ -140,6 +152,8 @@ Scoring criteria (1-5 each):
             mode=args.assembly_mode,
             output_dir=OUTPUT_DIR,
             anonymize=ANONYMIZE,
+            max_workers=args.workers,
+            resume=args.resume,
         )
 
         # Print next steps
@@ -188,6 +188,7 @@ def run_formal_benchmark(
                         idea=scoreable,
                         inspiration=inspiration,
                         model=judge_model,
+                        cache_dir=output_dir,
                     )
                     scores[approach] = score
                     print(f"    Novelty={score.novelty} Feasibility={score.feasibility} "
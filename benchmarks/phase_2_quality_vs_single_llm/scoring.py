@@ -2,15 +2,22 @@
 # Evaluation criteria and scoring functions for Phase 2 benchmark
 
 import json
+import os
 import re
+import sys
 from dataclasses import dataclass
 from typing import Optional, Dict
 
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
 from dotenv import load_dotenv
 load_dotenv()
 
 from openai import OpenAI
 
+from benchmarks.judge_cache import cached_judge
+
 
 @dataclass
 class IdeaScore:
@@ -206,57 +213,75 @@ Score this idea. Be rigorous and honest. Respond ONLY with valid JSON:
 }}"""
 
 
+LLM_JUDGE_SYSTEM = "You are a rigorous startup evaluator. Score ideas honestly using the provided rubric. Output only valid JSON."
+
+
 def score_idea_llm(
     idea: dict,
     inspiration: str,
     model: str = "gpt-5.1",
+    cache_dir: Optional[str] = None,
 ) -> IdeaScore:
     """
     Score an idea using an LLM as judge.
 
+    With a cache_dir, verdicts are memoized by idea, inspiration, rubric and
+    model, so scoring the same idea again is free.
+
     Args:
         idea: The idea dictionary to score
         inspiration: Original domain/context for the idea
         model: Model to use for scoring
+        cache_dir: Directory holding the judge cache, normally the benchmark's
+            results directory (None: always call the judge)
 
     Returns:
         IdeaScore with LLM-provided scores
     """
-    client = OpenAI()
-
     idea_text = json.dumps(idea, indent=2) if isinstance(idea, dict) else str(idea)
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {
-                "role": "system",
-                "content": "You are a rigorous startup evaluator. Score ideas honestly using the provided rubric. Output only valid JSON."
-            },
-            {
-                "role": "user",
-                "content": LLM_JUDGE_PROMPT.format(
-                    inspiration=inspiration,
-                    idea=idea_text
-                )
-            }
-        ],
-        temperature=0.3,
-    )
-
-    content = response.choices[0].message.content
+    def judge() -> dict:
+        client = OpenAI()
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": LLM_JUDGE_SYSTEM
+                },
+                {
+                    "role": "user",
+                    "content": LLM_JUDGE_PROMPT.format(
+                        inspiration=inspiration,
+                        idea=idea_text
+                    )
+                }
+            ],
+            temperature=0.3,
+        )
+
+        content = response.choices[0].message.content
+
+        # Extract JSON from response
+        try:
+            start = content.find('{')
+            end = content.rfind('}')
+            if start != -1 and end != -1:
+                return json.loads(content[start:end+1])
+            raise ValueError("No JSON found in response")
+        except (json.JSONDecodeError, ValueError) as e:
+            raise ValueError(f"{e}\n    Raw response: {content[:200]}") from e
 
-    # Extract JSON from response
     try:
-        start = content.find('{')
-        end = content.rfind('}')
-        if start != -1 and end != -1:
-            scores = json.loads(content[start:end+1])
-        else:
-            raise ValueError("No JSON found in response")
-    except (json.JSONDecodeError, ValueError) as e:
+        scores = cached_judge(
+            cache_dir,
+            model,
+            rubric=LLM_JUDGE_SYSTEM + "\n" + LLM_JUDGE_PROMPT,
+            content={"inspiration": inspiration, "idea": idea_text},
+            judge=judge,
+        )
+    except ValueError as e:
         print(f"[!] Failed to parse LLM judge response: {e}")
-        print(f"    Raw response: {content[:200]}")
         # Default to middle scores
         scores = {"novelty": 3, "feasibility": 3, "specificity": 3, "commercial_clarity": 3, "notes": "Parse error - default scores"}
 
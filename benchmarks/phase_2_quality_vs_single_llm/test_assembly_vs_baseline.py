@@ -1,7 +1,7 @@
 # test_assembly_vs_baseline.py
 # Phase 2 Benchmark: Compare Assembly output to single LLM baseline
 
-import json
+import asyncio
 import os
 import random
 import sys
@@ -14,11 +14,145 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 from dotenv import load_dotenv
 load_dotenv()
 
-from src.idea_generation.generator import multiple_llm_idea_generator
+from framework import ConversationLogger
+from src.idea_generation.generator import run_assembly
+from benchmarks.harness import cell_key, cell_session_name, results_path_for, run_cells, write_results
 from benchmarks.phase_2_quality_vs_single_llm.baseline_single_llm import generate_idea_single_llm
 from benchmarks.phase_2_quality_vs_single_llm.iterative_single_llm import generate_idea_iterative
 
 
+# ---------------------------------------------------------------------------
+# One approach on one prompt
+# ---------------------------------------------------------------------------
+
+def _generate_single_shot(inspiration: str, model: str, label: str = "Baseline") -> dict:
+    """Single LLM call (team-of-experts prompt)."""
+    entry = {"success": False, "idea": None, "error": None, "tokens_used": None}
+    try:
+        single_result = generate_idea_single_llm(
+            inspiration=inspiration,
+            model=model,
+        )
+        if single_result.get("idea"):
+            entry["success"] = True
+            entry["idea"] = single_result["idea"]
+            entry["tokens_used"] = single_result.get("tokens_used")
+            print(f"      {label} idea: {single_result['idea'].get('title', 'Untitled')}")
+        else:
+            entry["error"] = single_result.get("error", "No idea extracted")
+            print(f"      {label} failed: {entry['error']}")
+    except Exception as e:
+        entry["error"] = str(e)
+        print(f"      {label} error: {e}")
+    return entry
+
+
+def _generate_iterative(inspiration: str, model: str) -> dict:
+    """4-turn iterative self-refinement with the same model."""
+    entry = {"success": False, "idea": None, "error": None, "tokens_used": None}
+    try:
+        iterative_result = generate_idea_iterative(
+            inspiration=inspiration,
+            model=model,
+        )
+        if iterative_result.get("idea"):
+            entry["success"] = True
+            entry["idea"] = iterative_result["idea"]
+            entry["tokens_used"] = iterative_result.get("total_tokens")
+            entry["turns"] = iterative_result.get("turns", [])
+            print(f"      Iterative idea: {iterative_result['idea'].get('title', 'Untitled')}")
+        else:
+            entry["error"] = iterative_result.get("error", "No idea extracted")
+            print(f"      Iterative failed: {entry['error']}")
+    except Exception as e:
+        entry["error"] = str(e)
+        print(f"      Iterative error: {e}")
+    return entry
+
+
+async def _generate_assembly(inspiration: str, mode: str, session_name: Optional[str] = None) -> dict:
+    """Assembly (multi-persona, plus convergence when the mode enables it)."""
+    entry = {"success": False, "idea": None, "error": None, "tokens_used": None}
+    try:
+        output = await run_assembly(
+            inspiration=inspiration,
+            number_of_ideas=1,
+            mode=mode,
+            logger=ConversationLogger(session_name=session_name) if session_name else None,
+        )
+        # Handle both return formats: dict (convergence enabled) or list (convergence disabled)
+        if isinstance(output, dict):
+            ideas = output.get("ideas", [])
+            convergence = output.get("convergence")
+        else:
+            ideas = output if output else []
+            convergence = None
+
+        if ideas and len(ideas) > 0:
+            entry["success"] = True
+            entry["idea"] = ideas[0]
+            entry["convergence"] = convergence
+            title = convergence.get("product_name", ideas[0].get("title", "Untitled")) if convergence else ideas[0].get("title", "Untitled")
+            print(f"      Assembly idea: {title}")
+        else:
+            entry["error"] = "No ideas returned"
+            print(f"      Assembly failed: No ideas returned")
+    except Exception as e:
+        entry["error"] = str(e)
+        print(f"      Assembly error: {e}")
+    return entry
+
+
+async def _run_approach_cell(cell: dict) -> dict:
+    """Harness cell: one approach on one prompt."""
+    approach = cell["approach"]
+    print(f"\n[{cell['key']}] Generating {approach}...")
+    if approach == "assembly":
+        return await _generate_assembly(cell["inspiration"], cell["mode"], cell_session_name(cell["key"]))
+    if approach == "iterative":
+        return await asyncio.to_thread(_generate_iterative, cell["inspiration"], cell["model"])
+    label = "Single-shot" if approach == "single_shot" else "Baseline"
+    return await asyncio.to_thread(_generate_single_shot, cell["inspiration"], cell["model"], label)
+
+
+def _run_prompt_grid(
+    prompts: list[dict],
+    approaches: list[str],
+    model: str,
+    mode: str,
+    output_file: Optional[str],
+    header: dict,
+    max_workers: int,
+    pool: str,
+) -> tuple[dict, dict]:
+    """
+    Fan out every (prompt, approach) cell through the harness.
+
+    Returns:
+        ({prompt_id: {approach: entry}}, raw cell results for the results file)
+    """
+    cells = [
+        {
+            "key": cell_key(prompt["id"], approach),
+            "prompt_id": prompt["id"],
+            "approach": approach,
+            "inspiration": prompt["inspiration"],
+            "model": model,
+            "mode": mode,
+        }
+        for prompt in prompts
+        for approach in approaches
+    ]
+    cell_results = run_cells(cells, _run_approach_cell, output_file, header, max_workers, pool)
+
+    by_prompt: dict = {}
+    for cell in cells:
+        entry = {"success": False, "idea": None, "error": None, "tokens_used": None}
+        entry.update(cell_results[cell["key"]])
+        by_prompt.setdefault(cell["prompt_id"], {})[cell["approach"]] = entry
+    return by_prompt, cell_results
+
+
 def run_single_comparison(
     inspiration: str,
     prompt_id: str,
@@ -41,53 +175,21 @@ def run_single_comparison(
     print(f"Running comparison for: {prompt_id}")
     print(f"{'='*50}")
 
-    result = {
-        "prompt_id": prompt_id,
-        "inspiration": inspiration,
-        "timestamp": datetime.now().isoformat(),
-        "assembly": {"success": False, "idea": None, "error": None},
-        "baseline": {"success": False, "idea": None, "error": None},
-    }
-
     # Generate with baseline (single LLM)
     print("\n[1/2] Generating baseline (single LLM)...")
-    try:
-        baseline_result = generate_idea_single_llm(
-            inspiration=inspiration,
-            model=model,
-        )
-        if baseline_result.get("idea"):
-            result["baseline"]["success"] = True
-            result["baseline"]["idea"] = baseline_result["idea"]
-            result["baseline"]["tokens_used"] = baseline_result.get("tokens_used")
-            print(f"      Baseline idea: {baseline_result['idea'].get('title', 'Untitled')}")
-        else:
-            result["baseline"]["error"] = baseline_result.get("error", "No idea extracted")
-            print(f"      Baseline failed: {result['baseline']['error']}")
-    except Exception as e:
-        result["baseline"]["error"] = str(e)
-        print(f"      Baseline error: {e}")
+    baseline = _generate_single_shot(inspiration, model, "Baseline")
 
     # Generate with Assembly (multi-persona)
     print("\n[2/2] Generating with Assembly (multi-persona)...")
-    try:
-        ideas = multiple_llm_idea_generator(
-            inspiration=inspiration,
-            number_of_ideas=1,
-            mode=mode,
-        )
-        if ideas and len(ideas) > 0:
-            result["assembly"]["success"] = True
-            result["assembly"]["idea"] = ideas[0]
-            print(f"      Assembly idea: {ideas[0].get('title', 'Untitled')}")
-        else:
-            result["assembly"]["error"] = "No ideas returned"
-            print(f"      Assembly failed: No ideas returned")
-    except Exception as e:
-        result["assembly"]["error"] = str(e)
-        print(f"      Assembly error: {e}")
+    assembly = asyncio.run(_generate_assembly(inspiration, mode))
 
-    return result
+    return {
+        "prompt_id": prompt_id,
+        "inspiration": inspiration,
+        "timestamp": datetime.now().isoformat(),
+        "assembly": assembly,
+        "baseline": baseline,
+    }
 
 
 def run_comparison(
@@ -96,16 +198,26 @@ def run_comparison(
     mode: str = "medium",
     output_dir: str = "results",
     anonymize: bool = True,
+    max_workers: int = 4,
+    pool: str = "async",
+    resume: Optional[str] = None,
 ) -> dict:
     """
     Run comparison test across multiple prompts.
 
+    Every (prompt, approach) pair is an independent cell; up to max_workers
+    run at once and each is checkpointed to the results file as it finishes
+    (see benchmarks/harness.py).
+
     Args:
         prompts: List of prompt dictionaries with 'id' and 'inspiration'
         model: Model to use
         mode: Assembly mode
         output_dir: Directory to save results
         anonymize: Whether to randomize A/B order for blind scoring
+        max_workers: Maximum cells in flight at once
+        pool: "async" or "process"
+        resume: Results file of an interrupted comparison to continue
 
     Returns:
         Aggregated results dictionary
@@ -137,15 +249,19 @@ def run_comparison(
         },
     }
 
-    for i, prompt in enumerate(prompts):
-        print(f"\n--- Prompt {i+1}/{len(prompts)} ---")
+    output_file = results_path_for(output_dir, "comparison_results", resume)
+    by_prompt, cell_results = _run_prompt_grid(
+        prompts, ["baseline", "assembly"], model, mode, output_file,
+        {key: results[key] for key in ("test_name", "timestamp", "config")}, max_workers, pool,
+    )
 
-        comparison = run_single_comparison(
-            inspiration=prompt["inspiration"],
-            prompt_id=prompt["id"],
-            model=model,
-            mode=mode,
-        )
+    for prompt in prompts:
+        comparison = {
+            "prompt_id": prompt["id"],
+            "inspiration": prompt["inspiration"],
+            "timestamp": datetime.now().isoformat(),
+            **by_prompt[prompt["id"]],
+        }
 
         # Track success rates
         assembly_ok = comparison["assembly"]["success"]
@@ -196,14 +312,8 @@ def run_comparison(
     print(f"Assembly success rate: {results['summary']['assembly_success_rate']:.1f}%")
     print(f"Baseline success rate: {results['summary']['baseline_success_rate']:.1f}%")
 
-    # Save results
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(
-        output_dir,
-        f"comparison_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    )
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    # Save results (cells kept for --resume)
+    write_results(output_file, {**results, "status": "complete", "cells": cell_results})
     print(f"\nResults saved to: {output_file}")
     print("\nNext step: Use scoring.py to evaluate the anonymized pairs")
 
@@ -232,84 +342,26 @@ def run_single_three_way_comparison(
     print(f"Running 3-way comparison for: {prompt_id}")
     print(f"{'='*50}")
 
-    result = {
-        "prompt_id": prompt_id,
-        "inspiration": inspiration,
-        "timestamp": datetime.now().isoformat(),
-        "assembly": {"success": False, "idea": None, "error": None, "tokens_used": None},
-        "single_shot": {"success": False, "idea": None, "error": None, "tokens_used": None},
-        "iterative": {"success": False, "idea": None, "error": None, "tokens_used": None},
-    }
-
     # Generate with single-shot (team-of-experts prompt)
     print("\n[1/3] Generating single-shot (team-of-experts)...")
-    try:
-        single_shot_result = generate_idea_single_llm(
-            inspiration=inspiration,
-            model=model,
-        )
-        if single_shot_result.get("idea"):
-            result["single_shot"]["success"] = True
-            result["single_shot"]["idea"] = single_shot_result["idea"]
-            result["single_shot"]["tokens_used"] = single_shot_result.get("tokens_used")
-            print(f"      Single-shot idea: {single_shot_result['idea'].get('title', 'Untitled')}")
-        else:
-            result["single_shot"]["error"] = single_shot_result.get("error", "No idea extracted")
-            print(f"      Single-shot failed: {result['single_shot']['error']}")
-    except Exception as e:
-        result["single_shot"]["error"] = str(e)
-        print(f"      Single-shot error: {e}")
+    single_shot = _generate_single_shot(inspiration, model, "Single-shot")
 
     # Generate with iterative refinement
     print("\n[2/3] Generating iterative (4-turn refinement)...")
-    try:
-        iterative_result = generate_idea_iterative(
-            inspiration=inspiration,
-            model=model,
-        )
-        if iterative_result.get("idea"):
-            result["iterative"]["success"] = True
-            result["iterative"]["idea"] = iterative_result["idea"]
-            result["iterative"]["tokens_used"] = iterative_result.get("total_tokens")
-            result["iterative"]["turns"] = iterative_result.get("turns", [])
-            print(f"      Iterative idea: {iterative_result['idea'].get('title', 'Untitled')}")
-        else:
-            result["iterative"]["error"] = iterative_result.get("error", "No idea extracted")
-            print(f"      Iterative failed: {result['iterative']['error']}")
-    except Exception as e:
-        result["iterative"]["error"] = str(e)
-        print(f"      Iterative error: {e}")
+    iterative = _generate_iterative(inspiration, model)
 
     # Generate with Assembly (multi-persona + convergence)
     print("\n[3/3] Generating with Assembly (multi-persona + convergence)...")
-    try:
-        output = multiple_llm_idea_generator(
-            inspiration=inspiration,
-            number_of_ideas=1,
-            mode=mode,
-        )
-        # Handle both return formats: dict (convergence enabled) or list (convergence disabled)
-        if isinstance(output, dict):
-            ideas = output.get("ideas", [])
-            convergence = output.get("convergence")
-        else:
-            ideas = output if output else []
-            convergence = None
+    assembly = asyncio.run(_generate_assembly(inspiration, mode))
 
-        if ideas and len(ideas) > 0:
-            result["assembly"]["success"] = True
-            result["assembly"]["idea"] = ideas[0]
-            result["assembly"]["convergence"] = convergence
-            title = convergence.get("product_name", ideas[0].get("title", "Untitled")) if convergence else ideas[0].get("title", "Untitled")
-            print(f"      Assembly idea: {title}")
-        else:
-            result["assembly"]["error"] = "No ideas returned"
-            print(f"      Assembly failed: No ideas returned")
-    except Exception as e:
-        result["assembly"]["error"] = str(e)
-        print(f"      Assembly error: {e}")
-
-    return result
+    return {
+        "prompt_id": prompt_id,
+        "inspiration": inspiration,
+        "timestamp": datetime.now().isoformat(),
+        "assembly": assembly,
+        "single_shot": single_shot,
+        "iterative": iterative,
+    }
 
 
 def run_three_way_comparison(
@@ -318,6 +370,9 @@ def run_three_way_comparison(
     mode: str = "medium",
     output_dir: str = "results",
     anonymize: bool = True,
+    max_workers: int = 4,
+    pool: str = "async",
+    resume: Optional[str] = None,
 ) -> dict:
     """
     Run 3-way comparison test across multiple prompts.
@@ -333,6 +388,9 @@ def run_three_way_comparison(
         mode: Assembly mode
         output_dir: Directory to save results
         anonymize: Whether to randomize A/B/C order for blind scoring
+        max_workers: Maximum (prompt, approach) cells in flight at once
+        pool: "async" or "process"
+        resume: Results file of an interrupted comparison to continue
 
     Returns:
         Aggregated results dictionary
@@ -364,15 +422,19 @@ def run_three_way_comparison(
         },
     }
 
-    for i, prompt in enumerate(prompts):
-        print(f"\n--- Prompt {i+1}/{len(prompts)} ---")
+    output_file = results_path_for(output_dir, "three_way_comparison", resume)
+    by_prompt, cell_results = _run_prompt_grid(
+        prompts, ["single_shot", "iterative", "assembly"], model, mode, output_file,
+        {key: results[key] for key in ("test_name", "timestamp", "config")}, max_workers, pool,
+    )
 
-        comparison = run_single_three_way_comparison(
-            inspiration=prompt["inspiration"],
-            prompt_id=prompt["id"],
-            model=model,
-            mode=mode,
-        )
+    for prompt in prompts:
+        comparison = {
+            "prompt_id": prompt["id"],
+            "inspiration": prompt["inspiration"],
+            "timestamp": datetime.now().isoformat(),
+            **by_prompt[prompt["id"]],
+        }
 
         # Track success rates
         assembly_ok = comparison["assembly"]["success"]
@@ -431,14 +493,8 @@ def run_three_way_comparison(
     print(f"Single-shot success rate: {results['summary']['single_shot_success_rate']:.1f}%")
     print(f"Iterative success rate: {results['summary']['iterative_success_rate']:.1f}%")
 
-    # Save results
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(
-        output_dir,
-        f"three_way_comparison_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    )
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    # Save results (cells kept for --resume)
+    write_results(output_file, {**results, "status": "complete", "cells": cell_results})
     print(f"\nResults saved to: {output_file}")
     print("\nNext step: Use scoring.py to evaluate the anonymized A/B/C ideas")
 
@@ -468,6 +524,22 @@ if __name__ == "__main__":
         default="fast",
         help="Assembly mode (default: fast)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum (prompt, approach) cells running at once (default: 4)"
+    )
+    parser.add_argument(
+        "--pool",
+        choices=["async", "process"],
+        default="async",
+        help="Run cells as tasks on one event loop or in separate processes (default: async)"
+    )
+    parser.add_argument(
+        "--resume",
+        help="Results file of an interrupted run to continue"
+    )
     args = parser.parse_args()
 
     if args.mode == "three_way":
@@ -475,10 +547,16 @@ if __name__ == "__main__":
             prompts=BENCHMARK_PROMPTS[:args.prompts],
             mode=args.assembly_mode,
             output_dir="results",
+            max_workers=args.workers,
+            pool=args.pool,
+            resume=args.resume,
         )
     else:
         run_comparison(
             prompts=BENCHMARK_PROMPTS[:args.prompts],
             mode=args.assembly_mode,
             output_dir="results",
+            max_workers=args.workers,
+            pool=args.pool,
+            resume=args.resume,
         )
@@ -4,7 +4,7 @@
 import json
 import os
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import List, Dict, Any, Optional
 
 # Add project root to path
@@ -15,6 +15,13 @@ load_dotenv()
 
 from openai import OpenAI
 
+from benchmarks.harness import run_cells
+
+# Turns scored per request in batched mode (1 = one request per turn)
+DEFAULT_BATCH_SIZE = 10
+
+VALUE_EXTRACTION_SYSTEM = "You are a conversation analyst extracting value signals. Be strict - only mark True when clearly evident."
+
 
 @dataclass
 class TurnValueScore:
@@ -136,11 +143,89 @@ Respond with a JSON object:
 }}"""
 
 
+# Prompt for extracting value signals from a window of consecutive turns
+VALUE_BATCH_EXTRACTION_PROMPT = """Analyze each of these consecutive conversation turns for value signals.
+
+PRIOR TURNS (for context):
+{prior_turns}
+
+EXISTING CONCEPTS INTRODUCED SO FAR:
+{existing_concepts}
+
+TURNS TO ANALYZE (in order):
+{turns}
+
+Judge each turn in order, as if it were the current turn:
+- Only earlier turns count as prior turns (the prior turns above, then earlier turns in this list)
+- A concept introduced by an earlier turn in this list counts as existing for the turns after it
+
+For each turn, answer these questions:
+
+1. NEW_CONCEPT: Does this turn introduce a genuinely new idea, mechanism, or approach that wasn't mentioned before?
+   - Must be substantively different from existing concepts
+   - Not just rephrasing or minor variation
+
+2. BUILDS_ON_PRIOR: Does this turn explicitly reference, extend, or build upon something said in a prior turn?
+   - Look for: "building on X's point", "that reminds me", "to extend that idea"
+   - Must reference specific prior content, not just general agreement
+
+3. CONCRETE_ARTIFACT: Does this turn provide a specific, actionable artifact?
+   - Examples: specific feature name, concrete metric, detailed example, user scenario, pricing point
+   - Not just abstract concepts or general statements
+
+4. CHALLENGES_ASSUMPTION: Does this turn question, critique, or push back on a prior claim or assumption?
+   - Must actively challenge, not just offer alternative
+   - Look for: "but have we considered", "I'm not sure that", "the risk with that is"
+
+Respond with a JSON object holding one entry per turn, in the same order:
+{{
+    "turns": [
+        {{
+            "index": <the turn's [index] above>,
+            "new_concept": true/false,
+            "new_concept_description": "brief description if true, else null",
+            "builds_on_prior": true/false,
+            "builds_on_prior_reference": "what it builds on if true, else null",
+            "concrete_artifact": true/false,
+            "concrete_artifact_description": "the artifact if true, else null",
+            "challenges_assumption": true/false,
+            "challenges_assumption_target": "what it challenges if true, else null"
+        }}
+    ]
+}}"""
+
+
+def _format_prior_turns(prior_turns: List[Dict[str, Any]]) -> str:
+    return "\n".join([
+        f"Turn {t.get('turn', '?')} - {t.get('speaker', 'Unknown')}: {t.get('content', '')[:300]}..."
+        for t in prior_turns[-5:]  # Last 5 turns for context
+    ]) if prior_turns else "(First turn - no prior context)"
+
+
+def _format_concepts(existing_concepts: List[str]) -> str:
+    return "\n".join([
+        f"- {concept}" for concept in existing_concepts[-10:]  # Last 10 concepts
+    ]) if existing_concepts else "(None yet)"
+
+
+def _turn_value_score(turn: Dict[str, Any], result: Dict[str, Any]) -> TurnValueScore:
+    return TurnValueScore(
+        turn=turn.get("turn", 0),
+        speaker=turn.get("speaker", "Unknown"),
+        new_concept=result.get("new_concept", False),
+        builds_on_prior=result.get("builds_on_prior", False),
+        concrete_artifact=result.get("concrete_artifact", False),
+        challenges_assumption=result.get("challenges_assumption", False),
+        raw_extraction=result,
+    )
+
+
 def extract_turn_value(
     turn: Dict[str, Any],
     prior_turns: List[Dict[str, Any]],
     existing_concepts: List[str],
     model: str = "gpt-4o-mini",
+    client: Optional[OpenAI] = None,
 ) -> TurnValueScore:
     """
     LLM-based extraction of value signals from a single turn.
@@ -150,26 +235,16 @@ def extract_turn_value(
         prior_turns: List of previous turn dicts
         existing_concepts: List of concepts already introduced
         model: LLM model to use
+        client: OpenAI client to reuse (a new one is created if omitted)
 
     Returns:
         TurnValueScore with extracted value signals
     """
-    client = OpenAI()
-
-    # Format prior turns
-    prior_formatted = "\n".join([
-        f"Turn {t.get('turn', '?')} - {t.get('speaker', 'Unknown')}: {t.get('content', '')[:300]}..."
-        for t in prior_turns[-5:]  # Last 5 turns for context
-    ]) if prior_turns else "(First turn - no prior context)"
-
-    # Format existing concepts
-    concepts_formatted = "\n".join([
-        f"- {concept}" for concept in existing_concepts[-10:]  # Last 10 concepts
-    ]) if existing_concepts else "(None yet)"
+    client = client or OpenAI()
 
     prompt = VALUE_EXTRACTION_PROMPT.format(
-        prior_turns=prior_formatted,
-        existing_concepts=concepts_formatted,
+        prior_turns=_format_prior_turns(prior_turns),
+        existing_concepts=_format_concepts(existing_concepts),
         speaker=turn.get("speaker", "Unknown"),
         content=turn.get("content", ""),
     )
@@ -180,7 +255,7 @@ def extract_turn_value(
             messages=[
                 {
                     "role": "system",
-                    "content": "You are a conversation analyst extracting value signals. Be strict - only mark True when clearly evident."
+                    "content": VALUE_EXTRACTION_SYSTEM
                 },
                 {
                     "role": "user",
@@ -192,42 +267,109 @@ def extract_turn_value(
         )
 
         result = json.loads(response.choices[0].message.content)
-
-        return TurnValueScore(
-            turn=turn.get("turn", 0),
-            speaker=turn.get("speaker", "Unknown"),
-            new_concept=result.get("new_concept", False),
-            builds_on_prior=result.get("builds_on_prior", False),
-            concrete_artifact=result.get("concrete_artifact", False),
-            challenges_assumption=result.get("challenges_assumption", False),
-            raw_extraction=result,
-        )
+        return _turn_value_score(turn, result)
 
     except Exception as e:
         print(f"[!] Error extracting value from turn {turn.get('turn', '?')}: {e}")
-        return TurnValueScore(
-            turn=turn.get("turn", 0),
-            speaker=turn.get("speaker", "Unknown"),
-            new_concept=False,
-            builds_on_prior=False,
-            concrete_artifact=False,
-            challenges_assumption=False,
-            raw_extraction={"error": str(e)},
+        return _turn_value_score(turn, {"error": str(e)})
+
+
+def extract_window_value(
+    window: List[Dict[str, Any]],
+    prior_turns: List[Dict[str, Any]],
+    existing_concepts: List[str],
+    model: str = "gpt-4o-mini",
+    client: Optional[OpenAI] = None,
+) -> List[TurnValueScore]:
+    """
+    LLM-based extraction of value signals from consecutive turns in one request.
+
+    The judge is told to treat earlier turns of the window as prior turns and
+    their new concepts as existing, matching turn-by-turn extraction. Turns
+    missing from the response (or a failed request) fall back to
+    extract_turn_value().
+
+    Args:
+        window: Consecutive turn dicts to score, in order
+        prior_turns: List of turn dicts before the window
+        existing_concepts: List of concepts introduced before the window
+        model: LLM model to use
+        client: OpenAI client to reuse (a new one is created if omitted)
+
+    Returns:
+        One TurnValueScore per turn in the window, in order
+    """
+    client = client or OpenAI()
+
+    turns_formatted = "\n\n".join(
+        f"[{index}] Turn {t.get('turn', '?')} - Speaker: {t.get('speaker', 'Unknown')}\nContent: {t.get('content', '')}"
+        for index, t in enumerate(window)
+    )
+    prompt = VALUE_BATCH_EXTRACTION_PROMPT.format(
+        prior_turns=_format_prior_turns(prior_turns),
+        existing_concepts=_format_concepts(existing_concepts),
+        turns=turns_formatted,
+    )
+
+    results: Dict[int, Dict[str, Any]] = {}
+    try:
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": VALUE_EXTRACTION_SYSTEM},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.1,
         )
+        for position, entry in enumerate(json.loads(response.choices[0].message.content).get("turns", [])):
+            if isinstance(entry, dict):
+                index = entry.get("index", position)
+                if isinstance(index, int) and 0 <= index < len(window):
+                    results.setdefault(index, entry)
+    except Exception as e:
+        print(f"[!] Error extracting value from turns {window[0].get('turn', '?')}-{window[-1].get('turn', '?')}: {e}")
+
+    # Score turn by turn where the batch came back incomplete, keeping the running context
+    scores = []
+    prior = list(prior_turns)
+    concepts = list(existing_concepts)
+    for index, turn in enumerate(window):
+        if index in results:
+            score = _turn_value_score(turn, results[index])
+        else:
+            score = extract_turn_value(turn, prior, concepts, model=model, client=client)
+        scores.append(score)
+        _track_concept(score, concepts, len(prior))
+        prior.append(turn)
+    return scores
+
+
+def _track_concept(score: TurnValueScore, existing_concepts: List[str], position: int) -> None:
+    """Append a turn's new concept to the running list (in place)."""
+    if score.new_concept:
+        concept_desc = score.raw_extraction.get("new_concept_description", f"Concept from turn {position}")
+        if concept_desc:
+            existing_concepts.append(concept_desc)
 
 
 def analyze_session_value(
     conversation_log_path: str,
     model: str = "gpt-4o-mini",
     verbose: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> SessionValueMetrics:
     """
     Process full conversation log and extract per-turn value metrics.
 
+    Turns are scored batch_size at a time, one request per window; the
+    running list of existing concepts carries over between windows.
+
     Args:
         conversation_log_path: Path to conversation log JSON file or directory
         model: LLM model to use for extraction
         verbose: If True, print progress
+        batch_size: Turns per request (1 = one request per turn)
 
     Returns:
         SessionValueMetrics with all turn scores and aggregates
@@ -257,31 +399,40 @@ def analyze_session_value(
     if verbose:
         print(f"Analyzing {len(exchanges)} turns from session {session_id}...")
 
-    # Process each turn
+    # Process turns window by window, one client for the whole session
+    client = OpenAI()
+    batch_size = max(1, batch_size)
     turn_scores = []
     existing_concepts = []
     prior_turns = []
 
-    for i, exchange in enumerate(exchanges):
+    for start in range(0, len(exchanges), batch_size):
+        window = exchanges[start:start + batch_size]
         if verbose:
-            print(f"  Turn {i+1}/{len(exchanges)}: {exchange.get('speaker', 'Unknown')}")
-
-        score = extract_turn_value(
-            turn=exchange,
-            prior_turns=prior_turns,
-            existing_concepts=existing_concepts,
-            model=model,
-        )
-
-        turn_scores.append(score)
+            print(f"  Turns {start+1}-{start+len(window)}/{len(exchanges)}")
+
+        if len(window) == 1:
+            scores = [extract_turn_value(
+                turn=window[0],
+                prior_turns=prior_turns,
+                existing_concepts=existing_concepts,
+                model=model,
+                client=client,
+            )]
+        else:
+            scores = extract_window_value(
+                window=window,
+                prior_turns=prior_turns,
+                existing_concepts=existing_concepts,
+                model=model,
+                client=client,
+            )
 
         # Track new concepts for future turns
-        if score.new_concept:
-            concept_desc = score.raw_extraction.get("new_concept_description", f"Concept from turn {i}")
-            if concept_desc:
-                existing_concepts.append(concept_desc)
-
-        prior_turns.append(exchange)
+        for score, exchange in zip(scores, window):
+            turn_scores.append(score)
+            _track_concept(score, existing_concepts, len(prior_turns))
+            prior_turns.append(exchange)
 
     # Build metrics
     metrics = SessionValueMetrics(
@@ -293,6 +444,43 @@ def analyze_session_value(
     return metrics
 
 
+def analyze_sessions_value(
+    conversation_log_paths: List[str],
+    model: str = "gpt-4o-mini",
+    verbose: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_workers: int = 4,
+) -> List[SessionValueMetrics]:
+    """
+    Run analyze_session_value() on independent sessions concurrently.
+
+    Args:
+        conversation_log_paths: Conversation log files or session directories
+        model: LLM model to use for extraction
+        verbose: If True, print progress
+        batch_size: Turns per request (1 = one request per turn)
+        max_workers: Maximum sessions analyzed at once
+
+    Returns:
+        SessionValueMetrics per path, in the order given
+    """
+    cells = [{"key": str(index), "path": path} for index, path in enumerate(conversation_log_paths)]
+    results = run_cells(
+        cells,
+        lambda cell: asdict(analyze_session_value(cell["path"], model=model, verbose=verbose, batch_size=batch_size)),
+        max_workers=max_workers,
+    )
+
+    sessions = []
+    for cell in cells:
+        result = results[cell["key"]]
+        if "error" in result:
+            raise RuntimeError(f"Value analysis failed for {cell['path']}: {result['error']}")
+        turn_scores = [TurnValueScore(**score) for score in result.pop("turn_scores")]
+        sessions.append(SessionValueMetrics(turn_scores=turn_scores, **result))
+    return sessions
+
+
 def compare_value_accumulation(
     assembly_metrics: SessionValueMetrics,
     baseline_metrics: SessionValueMetrics,
@@ -381,11 +569,24 @@ if __name__ == "__main__":
         action="store_true",
         help="Print progress during analysis"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Turns scored per request (default: {DEFAULT_BATCH_SIZE}; 1 = one request per turn)"
+    )
     args = parser.parse_args()
 
     if args.conversation_log:
         print(f"Analyzing: {args.conversation_log}")
-        metrics = analyze_session_value(args.conversation_log, verbose=args.verbose)
+        if args.compare:
+            # Both sessions are independent, so analyze them side by side
+            print(f"Comparing with baseline: {args.compare}")
+            metrics, baseline_metrics = analyze_sessions_value(
+                [args.conversation_log, args.compare], verbose=args.verbose, batch_size=args.batch_size,
+            )
+        else:
+            metrics = analyze_session_value(args.conversation_log, verbose=args.verbose, batch_size=args.batch_size)
 
         print(f"\n{'='*60}")
         print("VALUE ACCUMULATION METRICS")
@@ -399,9 +600,6 @@ if __name__ == "__main__":
         print(f"\nCumulative concept curve: {metrics.cumulative_concepts}")
 
         if args.compare:
-            print(f"\nComparing with baseline: {args.compare}")
-            baseline_metrics = analyze_session_value(args.compare, verbose=args.verbose)
-
             comparison = compare_value_accumulation(metrics, baseline_metrics)
 
             print(f"\n{'='*60}")
@@ -0,0 +1,205 @@
+# usage_meter.py
+# Real token, call and latency accounting for benchmark runs
+#
+# The pipeline makes LLM calls from many modules, most of them outside the
+# meeting loop's on_llm_call hook (memory updates, belief updates, idea
+# tracking, extraction, ...). While metered_openai() is active, every
+# OpenAI()/AsyncOpenAI() client those modules create reports each request's
+# API-reported usage and latency to the UsageMeter of the code that made it.
+#
+# The current meter is a ContextVar, so concurrent benchmark cells (tasks and
+# the worker threads they start) each count only their own calls. Clients
+# created with no meter active behave exactly like the originals.
+#
+# Usage:
+#   with metered_openai(), UsageMeter() as meter:
+#       await run_assembly(...)
+#   meter.summary()
+
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from benchmarks.performance.simulated_llm import OPENAI_CLIENT_MODULES
+
+_current_meter: ContextVar[Optional["UsageMeter"]] = ContextVar("usage_meter", default=None)
+
+
+class UsageMeter:
+    """
+    Totals of the LLM requests made inside a `with UsageMeter():` block.
+    """
+
+    def __init__(self):
+        self.calls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._token = None
+
+    def __enter__(self) -> "UsageMeter":
+        self._token = _current_meter.set(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _current_meter.reset(self._token)
+
+    def record(self, source: str, usage: Any, seconds: float, ok: bool = True) -> None:
+        """
+        Add one request.
+
+        Args:
+            source: Module whose client made the request
+            usage: The response's usage object (None if not reported)
+            seconds: Wall-clock latency, including reading a stream to the end
+            ok: False if the request raised
+        """
+        call = {
+            "source": source,
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+            "seconds": seconds,
+            "ok": ok,
+        }
+        with self._lock:
+            self.calls.append(call)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns:
+            {"llm_calls", "errors", "prompt_tokens", "completion_tokens",
+            "total_tokens", "llm_seconds", "by_source": {source: same totals}}
+        """
+        def totals(calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+            prompt = sum(c["prompt_tokens"] for c in calls)
+            completion = sum(c["completion_tokens"] for c in calls)
+            return {
+                "llm_calls": len(calls),
+                "errors": sum(1 for c in calls if not c["ok"]),
+                "prompt_tokens": prompt,
+                "completion_tokens": completion,
+                "total_tokens": prompt + completion,
+                "llm_seconds": round(sum(c["seconds"] for c in calls), 3),
+            }
+
+        with self._lock:
+            calls = list(self.calls)
+        by_source: Dict[str, List[Dict[str, Any]]] = {}
+        for call in calls:
+            by_source.setdefault(call["source"], []).append(call)
+        return {**totals(calls), "by_source": {source: totals(c) for source, c in sorted(by_source.items())}}
+
+
+# ---------------------------------------------------------------------------
+# Client wrappers
+# ---------------------------------------------------------------------------
+
+class _MeteredCompletions:
+    def __init__(self, completions, source: str):
+        self._completions = completions
+        self._source = source
+
+    def __getattr__(self, name):
+        return getattr(self._completions, name)
+
+    def create(self, *args, **kwargs):
+        meter = _current_meter.get()
+        if meter is None:
+            return self._completions.create(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = self._completions.create(*args, **kwargs)
+        except Exception:
+            meter.record(self._source, None, time.perf_counter() - start, ok=False)
+            raise
+        if kwargs.get("stream"):
+            return self._stream(meter, response, start)
+        meter.record(self._source, getattr(response, "usage", None), time.perf_counter() - start)
+        return response
+
+    def _stream(self, meter: UsageMeter, stream, start: float):
+        usage = None
+        try:
+            for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                yield chunk
+        finally:
+            meter.record(self._source, usage, time.perf_counter() - start)
+
+
+class _AsyncMeteredCompletions(_MeteredCompletions):
+    async def create(self, *args, **kwargs):
+        meter = _current_meter.get()
+        if meter is None:
+            return await self._completions.create(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = await self._completions.create(*args, **kwargs)
+        except Exception:
+            meter.record(self._source, None, time.perf_counter() - start, ok=False)
+            raise
+        meter.record(self._source, getattr(response, "usage", None), time.perf_counter() - start)
+        return response
+
+
+class _MeteredClient:
+    """Delegates to a real client, with chat.completions metered."""
+
+    def __init__(self, client, completions_cls, source: str):
+        self._client = client
+        self.chat = _Namespace(client.chat, completions=completions_cls(client.chat.completions, source))
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class _Namespace:
+    def __init__(self, wrapped, **overrides):
+        self._wrapped = wrapped
+        self.__dict__.update(overrides)
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped, name)
+
+
+def _metered_factory(original, completions_cls, source: str):
+    def factory(*args, **kwargs):
+        return _MeteredClient(original(*args, **kwargs), completions_cls, source)
+    return factory
+
+
+_patch_lock = threading.Lock()
+_patch_depth = 0
+_originals: List[tuple] = []
+
+
+@contextmanager
+def metered_openai():
+    """
+    Meter every OpenAI client the pipeline creates inside the block.
+
+    Re-entrant: concurrent cells may each enter it; the client classes are
+    restored when the last one leaves.
+    """
+    global _patch_depth
+    with _patch_lock:
+        if _patch_depth == 0:
+            for module_name in OPENAI_CLIENT_MODULES:
+                module = importlib.import_module(module_name)
+                for attr, completions_cls in (("OpenAI", _MeteredCompletions), ("AsyncOpenAI", _AsyncMeteredCompletions)):
+                    if hasattr(module, attr):
+                        original = getattr(module, attr)
+                        _originals.append((module, attr, original))
+                        setattr(module, attr, _metered_factory(original, completions_cls, module_name))
+        _patch_depth += 1
+    try:
+        yield
+    finally:
+        with _patch_lock:
+            _patch_depth -= 1
+            if _patch_depth == 0:
+                for module, attr, original in reversed(_originals):
+                    setattr(module, attr, original)
+                _originals.clear()
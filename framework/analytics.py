@@ -6,6 +6,9 @@ Analyzes completed conversations to provide insights on:
 - Idea diversity and uniqueness
 - Phase efficiency (time, cost, turns)
 - Facilitator decision patterns
+
+For metrics across many sessions at once, see BatchAnalytics
+(framework/batch_analytics.py).
 """
 
 import json
@@ -15,6 +18,8 @@ from pathlib import Path
 from datetime import datetime
 from collections import Counter
 
+from framework.session_catalog import session_file
+
 
 class ConversationAnalytics:
     """
@@ -63,7 +68,7 @@ class ConversationAnalytics:
 
     def _load_json(self, filename: str) -> Any:
         """Load JSON file from session directory."""
-        file_path = self.session_path / filename
+        file_path = session_file(self.session_path, filename)
         if not file_path.exists():
             return {}  # Return empty dict if file doesn't exist
 
@@ -139,17 +144,20 @@ class ConversationAnalytics:
         ideas_by_phase = {}
         all_mentioned_ideas = set()
 
+        # Lowercase titles once rather than per exchange
+        lowered_titles = [(title, title.lower()) for title in final_idea_titles]
+
         for exchange in self.exchanges:
             phase = exchange.get("phase", "unknown")
-            content = exchange.get("content", "")
+            content = exchange.get("content", "").lower()
 
             if phase not in ideas_by_phase:
                 ideas_by_phase[phase] = set()
 
             # Simple heuristic: look for capitalized words that might be idea names
             # Better: use the ideas_discussed from shared_context if available
-            for title in final_idea_titles:
-                if title.lower() in content.lower():
+            for title, title_lower in lowered_titles:
+                if title_lower in content:
                     ideas_by_phase[phase].add(title)
                     all_mentioned_ideas.add(title)
 
@@ -221,25 +229,30 @@ class ConversationAnalytics:
 
         return phases
 
-    def cost_analysis(self, cost_per_1k_tokens: float = 0.002) -> Dict[str, Any]:
+    def cost_analysis(
+        self,
+        cost_per_1k_tokens: float = 0.002,
+        phase_data: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
         """
         Analyze total cost and cost breakdown.
 
         Args:
             cost_per_1k_tokens: Cost per 1000 tokens (default: $0.002 for gpt-4o-mini)
+            phase_data: Precomputed phase_metrics() result to avoid recomputing
 
         Returns:
             Dict with cost metrics
         """
-        # Calculate total tokens (rough estimate)
-        total_tokens = sum(
-            len(ex.get("content", "")) // 4
-            for ex in self.exchanges
-        )
+        if phase_data is None:
+            phase_data = self.phase_metrics()
+
+        # Every exchange belongs to exactly one phase, so phase totals add up
+        total_tokens = sum(m["tokens_estimated"] for m in phase_data.values())
 
         # Tokens by phase
         phase_costs = {}
-        for phase_id, metrics in self.phase_metrics().items():
+        for phase_id, metrics in phase_data.items():
             tokens = metrics["tokens_estimated"]
             cost = (tokens / 1000.0) * cost_per_1k_tokens
             phase_costs[phase_id] = {
@@ -306,7 +319,7 @@ class ConversationAnalytics:
         """
         contributions = self.persona_contributions()
         phase_data = self.phase_metrics()
-        cost_data = self.cost_analysis()
+        cost_data = self.cost_analysis(phase_data=phase_data)
         idea_data = self.idea_diversity()
 
         # Calculate session duration
@@ -360,7 +373,7 @@ class ConversationAnalytics:
         summary = self.summary_stats()
         contributions = self.persona_contributions()
         phases = self.phase_metrics()
-        costs = self.cost_analysis()
+        costs = self.cost_analysis(phase_data=phases)
         ideas = self.idea_diversity()
         facilitator = self.facilitator_analysis()
 
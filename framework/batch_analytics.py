@@ -0,0 +1,533 @@
+"""
+BatchAnalytics - Columnar analytics across many conversation sessions
+
+ConversationAnalytics answers questions about one session at a time. This
+module loads every session under conversation_logs/ into flat NumPy columns
+(one row per exchange / facilitator decision, with speakers, phases and
+models dictionary-encoded as integer codes) and computes the same metrics
+across thousands of sessions with vectorized group-bys:
+- persona_contributions()
+- phase_metrics()
+- facilitator_analysis()
+- cost_analysis()
+
+Parsed columns are cached in <logs_dir>/analytics_cache.npz together with a
+per-session fingerprint manifest. On the next run only new or modified
+sessions are parsed; everything else is read straight from the cache.
+
+    python -m framework.batch_analytics --logs-dir conversation_logs
+"""
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from framework.session_catalog import session_file
+
+
+CACHE_FILENAME = "analytics_cache.npz"
+CACHE_VERSION = 1
+
+# Files whose mtimes decide whether a cached session is still valid
+_SOURCE_FILES = ("full_conversation.json", "facilitator_decisions.json", "session_metadata.json")
+
+_DECISION_TYPES = ("persona_selection", "speaker_choice")
+
+
+def _fingerprint(session_dir: Path) -> float:
+    mtimes = [
+        path.stat().st_mtime
+        for path in (session_file(session_dir, name) for name in _SOURCE_FILES)
+        if path.exists()
+    ]
+    return max(mtimes, default=0.0)
+
+
+def _load(session_dir: Path, filename: str, default: Any) -> Any:
+    path = session_file(session_dir, filename)
+    if not path.exists():
+        return default
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _epoch(timestamp: Optional[str]) -> float:
+    if not timestamp:
+        return np.nan
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class _Vocab:
+    """String <-> integer code mapping used to dictionary-encode columns."""
+
+    def __init__(self, values: Sequence[str] = ()):
+        self.values: List[str] = list(values)
+        self._codes = {v: i for i, v in enumerate(self.values)}
+
+    def code(self, value: Optional[str]) -> int:
+        value = "" if value is None else str(value)
+        if value not in self._codes:
+            self._codes[value] = len(self.values)
+            self.values.append(value)
+        return self._codes[value]
+
+    def array(self) -> np.ndarray:
+        return np.array(self.values, dtype=str)
+
+
+class BatchAnalytics:
+    """
+    Vectorized analytics over many sessions at once.
+
+    Tables (all NumPy arrays, one entry per row):
+        sessions:  session_ids, session_mode, session_model, fingerprints
+        exchanges: ex_session, ex_speaker, ex_phase, ex_tokens, ex_time
+        decisions: dec_session, dec_type, dec_phase, dec_speaker, dec_count
+
+    Speakers, phases, modes and models are stored as codes into the
+    corresponding vocab arrays (speakers, phases, modes, models).
+
+    Example:
+        >>> batch = BatchAnalytics.from_logs_dir("conversation_logs")
+        >>> batch.persona_contributions()["Founder"]["turns"]
+        >>> batch.cost_analysis()["by_model"]
+    """
+
+    def __init__(self, tables: Dict[str, np.ndarray]):
+        """
+        Initialize from already-built columnar tables.
+
+        Use from_logs_dir() to load sessions from disk.
+        """
+        for name, column in tables.items():
+            setattr(self, name, column)
+        self._phase_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    @classmethod
+    def from_logs_dir(
+        cls,
+        logs_dir: str = "conversation_logs",
+        use_cache: bool = True,
+        cache_path: Optional[str] = None,
+    ) -> 'BatchAnalytics':
+        """
+        Load every session folder under logs_dir into columnar tables.
+
+        Args:
+            logs_dir: Folder containing session folders
+            use_cache: Reuse and refresh the on-disk column cache
+            cache_path: Cache file (default: <logs_dir>/analytics_cache.npz)
+
+        Returns:
+            BatchAnalytics instance
+        """
+        root = Path(logs_dir)
+        cache_file = Path(cache_path) if cache_path else root / CACHE_FILENAME
+
+        current: Dict[str, Tuple[Path, float]] = {}
+        if root.exists():
+            for session_dir in sorted(root.iterdir()):
+                if session_dir.is_dir() and session_file(session_dir, "session_metadata.json").exists():
+                    current[session_dir.name] = (session_dir, _fingerprint(session_dir))
+
+        cached = cls._read_cache(cache_file) if use_cache else None
+        tables, reused = cls._reuse_cached(cached, current) if cached else (None, set())
+
+        to_parse = [(sid, d, fp) for sid, (d, fp) in current.items() if sid not in reused]
+        tables = cls._parse_sessions(to_parse, base=tables)
+
+        if use_cache and (to_parse or cached is None or len(reused) != len(cached["session_ids"])):
+            cls._write_cache(cache_file, tables)
+
+        return cls(tables)
+
+    @staticmethod
+    def _read_cache(cache_file: Path) -> Optional[Dict[str, np.ndarray]]:
+        if not cache_file.exists():
+            return None
+        try:
+            with np.load(cache_file, allow_pickle=False) as data:
+                tables = {name: data[name] for name in data.files}
+            if int(tables.pop("version", -1)) != CACHE_VERSION:
+                return None
+            return tables
+        except Exception as e:
+            print(f"[!] Ignoring unreadable analytics cache {cache_file}: {e}")
+            return None
+
+    @staticmethod
+    def _write_cache(cache_file: Path, tables: Dict[str, np.ndarray]) -> None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(".tmp.npz")
+            np.savez(tmp, version=np.array(CACHE_VERSION), **tables)
+            tmp.replace(cache_file)
+        except Exception as e:
+            print(f"[!] Failed to write analytics cache: {e}")
+
+    @staticmethod
+    def _reuse_cached(
+        cached: Dict[str, np.ndarray],
+        current: Dict[str, Tuple[Path, float]],
+    ) -> Tuple[Dict[str, np.ndarray], set]:
+        """Keep cached rows for sessions whose fingerprint is unchanged."""
+        ids = cached["session_ids"]
+        keep = np.array(
+            [sid in current and current[sid][1] == fp for sid, fp in zip(ids, cached["fingerprints"])],
+            dtype=bool,
+        )
+
+        # Old session index -> new session index (-1 = dropped)
+        remap = np.full(len(ids), -1, dtype=np.int64)
+        remap[keep] = np.arange(int(keep.sum()))
+
+        tables = dict(cached)
+        for column in ("session_ids", "session_mode", "session_model", "fingerprints"):
+            tables[column] = cached[column][keep]
+        for prefix, columns in (("ex", ("speaker", "phase", "tokens", "time")),
+                                ("dec", ("type", "phase", "speaker", "count"))):
+            row_keep = keep[cached[f"{prefix}_session"]] if len(ids) else np.zeros(0, dtype=bool)
+            tables[f"{prefix}_session"] = remap[cached[f"{prefix}_session"][row_keep]]
+            for column in columns:
+                tables[f"{prefix}_{column}"] = cached[f"{prefix}_{column}"][row_keep]
+
+        return tables, {str(sid) for sid in ids[keep]}
+
+    @staticmethod
+    def _parse_sessions(
+        to_parse: List[Tuple[str, Path, float]],
+        base: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Parse session JSON into columns and append them to base tables."""
+        speakers = _Vocab(base["speakers"] if base else ())
+        archetypes = list(base["archetypes"]) if base else []
+        phases = _Vocab(base["phases"] if base else ())
+        modes = _Vocab(base["modes"] if base else ())
+        models = _Vocab(base["models"] if base else ())
+        types = _Vocab(base["decision_types"] if base else _DECISION_TYPES)
+        offset = len(base["session_ids"]) if base else 0
+
+        s_ids, s_mode, s_model, s_fp = [], [], [], []
+        ex_session, ex_speaker, ex_phase, ex_tokens, ex_time = [], [], [], [], []
+        dec_session, dec_type, dec_phase, dec_speaker, dec_count = [], [], [], [], []
+
+        for session_id, session_dir, fingerprint in to_parse:
+            try:
+                metadata = _load(session_dir, "session_metadata.json", {})
+                exchanges = _load(session_dir, "full_conversation.json", [])
+                decisions = _load(session_dir, "facilitator_decisions.json", [])
+            except Exception as e:
+                print(f"[!] Skipping {session_id}: {e}")
+                continue
+
+            s_ids.append(session_id)
+            s_mode.append(modes.code(metadata.get("mode", "unknown")))
+            s_model.append(models.code(metadata.get("model", "unknown")))
+            s_fp.append(fingerprint)
+            i = offset + len(s_ids) - 1
+
+            for ex in exchanges:
+                code = speakers.code(ex.get("speaker", "Unknown"))
+                if code == len(archetypes):
+                    archetypes.append(str(ex.get("archetype", "")))
+                ex_session.append(i)
+                ex_speaker.append(code)
+                ex_phase.append(phases.code(ex.get("phase", "unknown")))
+                ex_tokens.append(len(ex.get("content", "")) // 4)
+                ex_time.append(_epoch(ex.get("timestamp")))
+
+            for decision in decisions if isinstance(decisions, list) else []:
+                decision_type = decision.get("type", "unknown")
+                value = decision.get("decision")
+                dec_session.append(i)
+                dec_type.append(types.code(decision_type))
+                dec_phase.append(phases.code(decision.get("phase", "unknown")))
+                if decision_type == "speaker_choice" and value:
+                    code = speakers.code(value)
+                    if code == len(archetypes):
+                        archetypes.append("")
+                    dec_speaker.append(code)
+                else:
+                    dec_speaker.append(-1)
+                dec_count.append(len(value) if isinstance(value, list) else 0)
+
+        def column(values: list, dtype, name: str) -> np.ndarray:
+            new = np.asarray(values, dtype=dtype)
+            return np.concatenate([base[name].astype(dtype), new]) if base else new
+
+        return {
+            "session_ids": column(s_ids, str, "session_ids"),
+            "session_mode": column(s_mode, np.int32, "session_mode"),
+            "session_model": column(s_model, np.int32, "session_model"),
+            "fingerprints": column(s_fp, np.float64, "fingerprints"),
+            "ex_session": column(ex_session, np.int64, "ex_session"),
+            "ex_speaker": column(ex_speaker, np.int32, "ex_speaker"),
+            "ex_phase": column(ex_phase, np.int32, "ex_phase"),
+            "ex_tokens": column(ex_tokens, np.int64, "ex_tokens"),
+            "ex_time": column(ex_time, np.float64, "ex_time"),
+            "dec_session": column(dec_session, np.int64, "dec_session"),
+            "dec_type": column(dec_type, np.int32, "dec_type"),
+            "dec_phase": column(dec_phase, np.int32, "dec_phase"),
+            "dec_speaker": column(dec_speaker, np.int32, "dec_speaker"),
+            "dec_count": column(dec_count, np.int32, "dec_count"),
+            "speakers": speakers.array(),
+            "archetypes": np.array(archetypes, dtype=str),
+            "phases": phases.array(),
+            "modes": modes.array(),
+            "models": models.array(),
+            "decision_types": types.array(),
+        }
+
+    # =========================================================================
+    # Metrics
+    # =========================================================================
+
+    @property
+    def session_count(self) -> int:
+        return len(self.session_ids)
+
+    def persona_contributions(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate persona participation across all sessions.
+
+        Returns:
+            Dict mapping persona names to:
+            {
+                "turns": int,
+                "tokens_estimated": int,
+                "participation_pct": float,
+                "phases": List[str],
+                "sessions": int,
+                "archetype": str
+            }
+        """
+        n_speakers = len(self.speakers)
+        turns = np.bincount(self.ex_speaker, minlength=n_speakers)
+        tokens = np.bincount(self.ex_speaker, weights=self.ex_tokens, minlength=n_speakers)
+        total_turns = len(self.ex_speaker)
+        pct = turns / total_turns * 100 if total_turns else np.zeros(n_speakers)
+
+        speaker_phases = self._pairs(self.ex_speaker, self.ex_phase, len(self.phases))
+        speaker_sessions = self._pairs(self.ex_speaker, self.ex_session, self.session_count)
+        sessions_per_speaker = np.bincount(speaker_sessions[:, 0], minlength=n_speakers)
+
+        contributions = {}
+        for code in np.flatnonzero(turns):
+            phase_codes = speaker_phases[speaker_phases[:, 0] == code, 1]
+            contributions[str(self.speakers[code])] = {
+                "turns": int(turns[code]),
+                "tokens_estimated": int(tokens[code]),
+                "participation_pct": float(pct[code]),
+                "phases": sorted(str(p) for p in self.phases[phase_codes]),
+                "sessions": int(sessions_per_speaker[code]),
+                "archetype": str(self.archetypes[code]),
+            }
+        return contributions
+
+    def phase_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate phase efficiency across all sessions.
+
+        duration_seconds is the sum of each session's phase duration (last
+        minus first exchange timestamp within the phase).
+
+        Returns:
+            Dict mapping phase IDs to:
+            {
+                "turns": int,
+                "tokens_estimated": int,
+                "duration_seconds": float,
+                "personas_active": List[str],
+                "sessions": int,
+                "mean_turns_per_session": float
+            }
+        """
+        if self._phase_cache is not None:
+            return self._phase_cache
+
+        n_phases = len(self.phases)
+        turns = np.bincount(self.ex_phase, minlength=n_phases)
+        tokens = np.bincount(self.ex_phase, weights=self.ex_tokens, minlength=n_phases)
+
+        # Per (session, phase) duration via grouped min/max over timestamps
+        group = self.ex_session * n_phases + self.ex_phase
+        keys, inverse = np.unique(group, return_inverse=True)
+        start = np.full(len(keys), np.inf)
+        end = np.full(len(keys), -np.inf)
+        valid = ~np.isnan(self.ex_time)
+        np.minimum.at(start, inverse[valid], self.ex_time[valid])
+        np.maximum.at(end, inverse[valid], self.ex_time[valid])
+        durations = np.where(np.isfinite(start), end - start, 0.0)
+        group_phase = keys % n_phases if n_phases else keys
+        duration_by_phase = np.bincount(group_phase, weights=durations, minlength=n_phases)
+        sessions_by_phase = np.bincount(group_phase, minlength=n_phases)
+
+        phase_speakers = self._pairs(self.ex_phase, self.ex_speaker, len(self.speakers))
+
+        metrics = {}
+        for code in np.flatnonzero(turns):
+            speaker_codes = phase_speakers[phase_speakers[:, 0] == code, 1]
+            metrics[str(self.phases[code])] = {
+                "turns": int(turns[code]),
+                "tokens_estimated": int(tokens[code]),
+                "duration_seconds": float(duration_by_phase[code]),
+                "personas_active": sorted(str(s) for s in self.speakers[speaker_codes]),
+                "sessions": int(sessions_by_phase[code]),
+                "mean_turns_per_session": float(turns[code] / sessions_by_phase[code]),
+            }
+
+        self._phase_cache = metrics
+        return metrics
+
+    def facilitator_analysis(self) -> Dict[str, Any]:
+        """
+        Aggregate facilitator decision patterns across all sessions.
+
+        Returns:
+            Dict with total_decisions, speaker_frequency,
+            selections_by_phase ({phase: {"count", "mean_personas"}}) and
+            mean_decisions_per_session
+        """
+        n_speakers = len(self.speakers)
+        n_phases = len(self.phases)
+
+        is_choice = (self.dec_type == self._type_code("speaker_choice")) & (self.dec_speaker >= 0)
+        frequency = np.bincount(self.dec_speaker[is_choice], minlength=n_speakers)
+
+        is_selection = self.dec_type == self._type_code("persona_selection")
+        sel_phase = self.dec_phase[is_selection]
+        sel_count = np.bincount(sel_phase, minlength=n_phases)
+        sel_personas = np.bincount(sel_phase, weights=self.dec_count[is_selection], minlength=n_phases)
+
+        return {
+            "total_decisions": int(len(self.dec_type)),
+            "speaker_frequency": {
+                str(self.speakers[code]): int(frequency[code]) for code in np.flatnonzero(frequency)
+            },
+            "selections_by_phase": {
+                str(self.phases[code]): {
+                    "count": int(sel_count[code]),
+                    "mean_personas": float(sel_personas[code] / sel_count[code]),
+                }
+                for code in np.flatnonzero(sel_count)
+            },
+            "mean_decisions_per_session": (
+                float(len(self.dec_type) / self.session_count) if self.session_count else 0.0
+            ),
+        }
+
+    def cost_analysis(
+        self,
+        cost_per_1k_tokens: float = 0.002,
+        phase_data: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Estimate cost across all sessions.
+
+        Args:
+            cost_per_1k_tokens: Cost per 1000 tokens (default: $0.002 for gpt-4o-mini)
+            phase_data: Precomputed phase_metrics() result to avoid recomputing
+
+        Returns:
+            Dict with total_tokens, total_cost, by_phase, by_model and
+            per-session cost percentiles
+        """
+        phase_data = phase_data if phase_data is not None else self.phase_metrics()
+        rate = cost_per_1k_tokens / 1000.0
+
+        session_tokens = np.bincount(self.ex_session, weights=self.ex_tokens, minlength=self.session_count)
+        model_tokens = np.bincount(self.session_model, weights=session_tokens, minlength=len(self.models))
+        session_cost = session_tokens * rate
+
+        total_tokens = int(self.ex_tokens.sum())
+        return {
+            "total_tokens": total_tokens,
+            "total_cost": total_tokens * rate,
+            "cost_per_1k_tokens": cost_per_1k_tokens,
+            "by_phase": {
+                phase_id: {"tokens": m["tokens_estimated"], "cost": m["tokens_estimated"] * rate}
+                for phase_id, m in phase_data.items()
+            },
+            "by_model": {
+                str(self.models[code]): {"tokens": int(model_tokens[code]), "cost": float(model_tokens[code] * rate)}
+                for code in np.flatnonzero(np.bincount(self.session_model, minlength=len(self.models)))
+            },
+            "per_session": {
+                "mean": float(session_cost.mean()) if self.session_count else 0.0,
+                "p50": float(np.percentile(session_cost, 50)) if self.session_count else 0.0,
+                "p95": float(np.percentile(session_cost, 95)) if self.session_count else 0.0,
+            },
+        }
+
+    def summary_stats(self) -> Dict[str, Any]:
+        """High-level totals across all loaded sessions."""
+        phase_data = self.phase_metrics()
+        cost_data = self.cost_analysis(phase_data=phase_data)
+        return {
+            "sessions": self.session_count,
+            "total_turns": int(len(self.ex_session)),
+            "total_personas": int(len(np.unique(self.ex_speaker))),
+            "total_phases": len(phase_data),
+            "total_tokens": cost_data["total_tokens"],
+            "total_cost": cost_data["total_cost"],
+            "sessions_by_mode": {
+                str(self.modes[code]): int(n)
+                for code, n in enumerate(np.bincount(self.session_mode, minlength=len(self.modes))) if n
+            },
+        }
+
+    # -------------------------------------------------------------------------
+
+    def _type_code(self, decision_type: str) -> int:
+        matches = np.flatnonzero(self.decision_types == decision_type)
+        return int(matches[0]) if len(matches) else -1
+
+    @staticmethod
+    def _pairs(a: np.ndarray, b: np.ndarray, b_size: int) -> np.ndarray:
+        """Unique (a, b) code pairs as an (n, 2) array."""
+        if len(a) == 0:
+            return np.zeros((0, 2), dtype=np.int64)
+        combined = np.unique(a.astype(np.int64) * max(b_size, 1) + b)
+        return np.stack([combined // max(b_size, 1), combined % max(b_size, 1)], axis=1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Analytics across all logged sessions")
+    parser.add_argument("--logs-dir", default="conversation_logs", help="Session logs folder")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and don't update the column cache")
+    parser.add_argument("--output", default=None, help="Write full results as JSON to this path")
+    args = parser.parse_args()
+
+    batch = BatchAnalytics.from_logs_dir(args.logs_dir, use_cache=not args.no_cache)
+    phase_data = batch.phase_metrics()
+    results = {
+        "summary": batch.summary_stats(),
+        "persona_contributions": batch.persona_contributions(),
+        "phase_metrics": phase_data,
+        "facilitator_analysis": batch.facilitator_analysis(),
+        "cost_analysis": batch.cost_analysis(phase_data=phase_data),
+    }
+
+    summary = results["summary"]
+    print(f"[OK] {summary['sessions']} session(s), {summary['total_turns']} turns, "
+          f"{summary['total_tokens']:,} tokens, ${summary['total_cost']:.4f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"[OK] Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+CancellationToken - Cooperative cancellation and wall-clock deadlines
+
+A token is shared between whoever may stop a run (dashboard, CLI signal
+handler, deadline) and the code doing the work. The work side checks it:
+- between turns and phases via check(), and
+- while waiting on LLM calls via guard() / run_sync() / call(), which stop
+  waiting as soon as the token trips. Blocking SDK calls are moved to a
+  worker thread so they can be abandoned; their late result is discarded.
+
+When the token trips, RunCancelled is raised with reason "cancelled" or
+"deadline_exceeded". Callers are expected to flush partial logs and re-raise.
+
+Example:
+    >>> token = CancellationToken(timeout=600)
+    >>> token.check()                                   # between turns
+    >>> reply = await token.run_sync(persona.response, ctx)
+    >>> token.cancel()                                  # from another thread
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, MutableMapping, Optional
+
+# How often in-flight waits re-check the token (seconds)
+POLL_INTERVAL = 0.25
+
+# Threads for guarded blocking calls; abandoned calls finish here in the background
+_call_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cancellable-call")
+
+
+class RunCancelled(Exception):
+    """
+    Raised when a run is cancelled or exceeds its deadline.
+
+    Attributes:
+        reason: "cancelled" or "deadline_exceeded"
+        partial: Optional dict of partial results attached by the code that
+            flushed the run (e.g. ideas found so far, session_dir)
+    """
+
+    def __init__(self, reason: str = "cancelled", message: Optional[str] = None):
+        super().__init__(reason, message)
+        self.reason = reason
+        self.message = message or ("Run exceeded its deadline" if reason == "deadline_exceeded" else "Run cancelled")
+        self.partial: dict = {}
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self):
+        # Keep `partial` when the exception crosses a process boundary
+        return self.__class__, (self.reason, self.message), {"partial": self.partial}
+
+
+class CancellationToken:
+    """
+    Thread- and process-safe cancellation flag with an optional deadline.
+
+    Args:
+        timeout: Seconds from now until the deadline (None = no deadline)
+        deadline: Absolute time.time() deadline (overrides timeout)
+        event: Flag object with set()/is_set(); pass a multiprocessing
+            Manager Event to cancel across processes (default: threading.Event)
+        shared_reason: Mapping the cancel reason is stored in under "reason";
+            pass a Manager dict alongside a Manager Event so whoever sets the
+            event in another process can say why
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        event: Any = None,
+        shared_reason: Optional[MutableMapping[str, str]] = None,
+    ):
+        self._event = event if event is not None else threading.Event()
+        self._shared_reason = shared_reason if shared_reason is not None else {}
+        if deadline is None and timeout is not None:
+            deadline = time.time() + timeout
+        self.deadline = deadline
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Trip the token. Safe to call from any thread."""
+        self._shared_reason.setdefault("reason", reason)
+        self._event.set()
+
+    @property
+    def reason(self) -> Optional[str]:
+        """Why the token tripped, or None if it hasn't."""
+        if self._event.is_set():
+            return self._shared_reason.get("reason") or "cancelled"
+        if self.deadline is not None and time.time() >= self.deadline:
+            return "deadline_exceeded"
+        return None
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds until the deadline (None if there is no deadline)."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.time())
+
+    def check(self) -> None:
+        """Raise RunCancelled if the token has tripped."""
+        reason = self.reason
+        if reason is not None:
+            raise RunCancelled(reason)
+
+    # =========================================================================
+    # Guarded waits
+    # =========================================================================
+
+    async def guard(self, awaitable: Awaitable) -> Any:
+        """
+        Await `awaitable`, abandoning it as soon as the token trips.
+
+        Raises:
+            RunCancelled: If the token trips before the awaitable completes
+        """
+        self.check()
+        task = asyncio.ensure_future(awaitable)
+        try:
+            while True:
+                timeout = POLL_INTERVAL
+                remaining = self.remaining()
+                if remaining is not None:
+                    timeout = min(timeout, remaining)
+                done, _ = await asyncio.wait({task}, timeout=timeout)
+                if done:
+                    return task.result()
+                self.check()
+        finally:
+            if not task.done():
+                task.cancel()
+
+    async def run_sync(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call in a worker thread under guard()."""
+        loop = asyncio.get_running_loop()
+        # Carry context variables (e.g. output routing) into the worker thread
+        ctx = contextvars.copy_context()
+        return await self.guard(loop.run_in_executor(_call_executor, lambda: ctx.run(fn, *args, **kwargs)))
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Synchronous counterpart of run_sync() for code outside an event loop.
+
+        Raises:
+            RunCancelled: If the token trips before fn returns
+        """
+        self.check()
+        future = _call_executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+        while True:
+            timeout = POLL_INTERVAL
+            remaining = self.remaining()
+            if remaining is not None:
+                timeout = min(timeout, remaining)
+            try:
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                self.check()
@@ -0,0 +1,111 @@
+"""
+RunCheckpoint - Resumable snapshots of a long-running conversation
+
+meeting_facilitator writes a checkpoint into the session folder at every phase
+boundary (and optionally every K turns). A checkpoint holds everything needed
+to continue without repeating completed LLM work:
+- run: inspiration, mode, domain, config overrides and the selected phases
+- position: index of the next phase to run, plus in-phase progress (turn
+  count, exchanges and the active personas' state) for mid-phase checkpoints
+- shared_context, facilitator speaker_history, mediator mediation_log
+- logger state (exchanges, decisions, prompts, summaries, metadata)
+
+Writes are atomic (temp file + rename), so a crash mid-save leaves the
+previous checkpoint intact.
+
+Example:
+    >>> checkpoint = RunCheckpoint(logger.session_dir, every_turns=5)
+    >>> checkpoint.run = {"inspiration": ..., "phases": phases}
+    >>> await meeting_facilitator(..., checkpoint=checkpoint)
+    >>> # Later, after a crash:
+    >>> checkpoint = RunCheckpoint.load("conversation_logs/session_20250101_120000")
+    >>> checkpoint.position["phase_index"]
+    3
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+CHECKPOINT_FILENAME = "checkpoint.json"
+CHECKPOINT_VERSION = 1
+
+
+class RunCheckpoint:
+    """
+    Checkpoint file for one session folder.
+
+    Attributes:
+        session_dir: Session folder holding checkpoint.json
+        every_turns: Also checkpoint every this many turns within a phase (0 = phase boundaries only)
+        run: Run parameters needed to restart the run (set by the caller)
+        state: Loaded checkpoint when resuming, else None
+    """
+
+    def __init__(self, session_dir: Union[str, Path], every_turns: int = 0, state: Optional[Dict[str, Any]] = None):
+        self.session_dir = Path(session_dir)
+        self.every_turns = max(0, int(every_turns or 0))
+        self.state = state
+        self.run: Dict[str, Any] = dict(state.get("run", {})) if state else {}
+
+    @classmethod
+    def load(cls, session_dir: Union[str, Path], every_turns: int = 0) -> "RunCheckpoint":
+        """
+        Load the checkpoint of an existing session.
+
+        Raises:
+            FileNotFoundError: If the session has no checkpoint
+            ValueError: If the checkpoint was written by an incompatible version
+        """
+        path = Path(session_dir) / CHECKPOINT_FILENAME
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {state.get('version')!r} in {path}")
+        return cls(session_dir, every_turns=every_turns, state=state)
+
+    @staticmethod
+    def exists(session_dir: Union[str, Path]) -> bool:
+        return (Path(session_dir) / CHECKPOINT_FILENAME).is_file()
+
+    @property
+    def path(self) -> Path:
+        return self.session_dir / CHECKPOINT_FILENAME
+
+    @property
+    def position(self) -> Dict[str, Any]:
+        """Where a resumed run continues: {"phase_index": int, "saved_at": iso}."""
+        return (self.state or {}).get("position", {"phase_index": 0})
+
+    def due(self, turns_since_save: int) -> bool:
+        """True when a mid-phase checkpoint should be written."""
+        return self.every_turns > 0 and turns_since_save >= self.every_turns
+
+    def save(self, **sections: Any) -> None:
+        """
+        Atomically write a checkpoint made of `sections` plus the run parameters.
+
+        Args:
+            **sections: JSON-serializable parts (position, shared_context, ...)
+        """
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "saved_at": datetime.now().isoformat(),
+            "run": self.run,
+            **sections,
+        }
+        self.session_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", suffix=".tmp", dir=self.session_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
@@ -7,7 +7,7 @@ tailored to specific problem domains and conversation contexts.
 
 import json
 from typing import Dict, List, Any, Optional
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 
 
 def sanitize_for_console(text: str) -> str:
@@ -67,36 +67,13 @@ _COMMERCIAL_VALIDATOR_PERSONA = {
 }
 
 
-def generate_personas_for_context(
+def _persona_generation_messages(
     inspiration: str,
     phase_info: Dict[str, Any],
     existing_personas: List[str],
-    count: int = 4,
-    model_name: str = "gpt-4o-mini",
-    domain: str = "product",
-) -> List[Dict[str, Any]]:
-    """
-    Generate domain-specific personas based on problem context.
-
-    Args:
-        inspiration: User's problem domain and context
-        phase_info: Current phase information (phase_id, goal, desired_outcome)
-        existing_personas: List of persona names already generated
-        count: Number of personas to generate (default: 4)
-        model_name: LLM model to use
-
-    Returns:
-        List of persona definition dicts with keys:
-        - Name: Persona name and role
-        - Archetype: Character archetype and inspiration
-        - Purpose: Why this persona exists
-        - Deliverables: What they produce
-        - Strengths: Core competencies
-        - Watch-out: Potential blind spots
-        - Conversation_Style: How they interact
-    """
-    client = OpenAI()
-
+    count: int,
+) -> List[Dict[str, str]]:
+    """Chat messages asking for `count` logic-role personas for a phase."""
     # Build context about existing personas to avoid duplication
     existing_context = ""
     if existing_personas:
@@ -142,52 +119,123 @@ Respond ONLY with JSON (map new fields to old schema):
   ]
 }}"""
 
+    return [
+        {
+            "role": "system",
+            "content": "You generate logic-role agents. Each agent is a reasoning function with an objective and belief structure. No personality."
+        },
+        {
+            "role": "user",
+            "content": generation_prompt
+        }
+    ]
+
+
+def _parse_generated_personas(content: str, phase_info: Dict[str, Any], domain: str) -> List[Dict[str, Any]]:
+    """Persona definitions from a generation response (raises on malformed JSON)."""
+    # Parse JSON - handle both array and object formats
+    parsed = json.loads(content.strip())
+
+    if isinstance(parsed, dict):
+        # Check if this dict looks like a single persona (has "Name" key)
+        if "Name" in parsed or "name" in parsed:
+            personas = [parsed]
+        else:
+            # LLM wrapped array in object - try multiple possible keys
+            personas = parsed.get("personas", parsed.get("persona_list", parsed.get("Personas", parsed.get("PersonaList", []))))
+    elif isinstance(parsed, list):
+        personas = parsed
+    else:
+        personas = []
+
+    # Inject Commercial Validator into debate phases for product domains only.
+    # Technical and general domains don't benefit from monetization challenge questions.
+    phase_type = phase_info.get("phase_type", "debate")
+    if phase_type == "debate" and domain == "product":
+        personas.append(_COMMERCIAL_VALIDATOR_PERSONA.copy())
+
+    print(f"[OK] Generated {len(personas)} personas for {phase_info.get('phase_id', 'phase')}")
+    return personas
+
+
+def is_injected_persona(persona_def: Dict[str, Any]) -> bool:
+    """True for fixed personas added to every phase (e.g. the Commercial Validator)."""
+    return persona_def.get("Name") == _COMMERCIAL_VALIDATOR_PERSONA["Name"]
+
+
+def generate_personas_for_context(
+    inspiration: str,
+    phase_info: Dict[str, Any],
+    existing_personas: List[str],
+    count: int = 4,
+    model_name: str = "gpt-4o-mini",
+    domain: str = "product",
+) -> List[Dict[str, Any]]:
+    """
+    Generate domain-specific personas based on problem context.
+
+    Args:
+        inspiration: User's problem domain and context
+        phase_info: Current phase information (phase_id, goal, desired_outcome)
+        existing_personas: List of persona names already generated
+        count: Number of personas to generate (default: 4)
+        model_name: LLM model to use
+
+    Returns:
+        List of persona definition dicts with keys:
+        - Name: Persona name and role
+        - Archetype: Character archetype and inspiration
+        - Purpose: Why this persona exists
+        - Deliverables: What they produce
+        - Strengths: Core competencies
+        - Watch-out: Potential blind spots
+        - Conversation_Style: How they interact
+    """
+    client = OpenAI()
+
     try:
         response = client.chat.completions.create(
             model=model_name,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You generate logic-role agents. Each agent is a reasoning function with an objective and belief structure. No personality."
-                },
-                {
-                    "role": "user",
-                    "content": generation_prompt
-                }
-            ],
+            messages=_persona_generation_messages(inspiration, phase_info, existing_personas, count),
             response_format={"type": "json_object"},
             temperature=0.8
         )
+        return _parse_generated_personas(response.choices[0].message.content, phase_info, domain)
 
-        content = response.choices[0].message.content.strip()
+    except Exception as e:
+        print(f"[!] Failed to generate personas: {e}")
+        # Return empty list - caller should handle fallback
+        return []
 
-        # Parse JSON - handle both array and object formats
-        parsed = json.loads(content)
 
-        if isinstance(parsed, dict):
-            # Check if this dict looks like a single persona (has "Name" key)
-            if "Name" in parsed or "name" in parsed:
-                personas = [parsed]
-            else:
-                # LLM wrapped array in object - try multiple possible keys
-                personas = parsed.get("personas", parsed.get("persona_list", parsed.get("Personas", parsed.get("PersonaList", []))))
-        elif isinstance(parsed, list):
-            personas = parsed
-        else:
-            personas = []
+async def generate_personas_for_context_async(
+    inspiration: str,
+    phase_info: Dict[str, Any],
+    existing_personas: List[str],
+    count: int = 4,
+    model_name: str = "gpt-4o-mini",
+    domain: str = "product",
+) -> List[Dict[str, Any]]:
+    """
+    Async version of generate_personas_for_context, so several phases can be
+    generated concurrently on one event loop.
 
-        # Inject Commercial Validator into debate phases for product domains only.
-        # Technical and general domains don't benefit from monetization challenge questions.
-        phase_type = phase_info.get("phase_type", "debate")
-        if phase_type == "debate" and domain == "product":
-            personas.append(_COMMERCIAL_VALIDATOR_PERSONA.copy())
+    Returns:
+        List of persona definition dicts (empty on failure)
+    """
+    client = AsyncOpenAI()
 
-        print(f"[OK] Generated {len(personas)} personas for {phase_info.get('phase_id', 'phase')}")
-        return personas
+    try:
+        response = await client.chat.completions.create(
+            model=model_name,
+            messages=_persona_generation_messages(inspiration, phase_info, existing_personas, count),
+            response_format={"type": "json_object"},
+            temperature=0.8
+        )
+        return _parse_generated_personas(response.choices[0].message.content, phase_info, domain)
 
     except Exception as e:
         print(f"[!] Failed to generate personas: {e}")
-        # Return empty list - caller should handle fallback
         return []
 
 
@@ -8,7 +8,10 @@ import json
 import textwrap
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+from framework.search_index import SearchIndex
+from framework.session_catalog import SessionCatalog, build_session_record
 
 
 class ConversationLogger:
@@ -22,21 +25,38 @@ class ConversationLogger:
     - metadata/persona_summaries.json: Persona summaries at each phase
     - metadata/facilitator_decisions.json: Persona selections and speaker decisions
     - metadata/session_metadata.json: Session info, inspiration, phases, results
+    - metadata/prompt_inputs.json: Full prompt inputs for each turn
+    - metadata/phase_summaries.json: Facilitator summary of each phase
+
+    On save the session is also upserted into the SessionCatalog stored in
+    base_dir/catalog.db and the SearchIndex stored in base_dir/search_index.db.
     """
 
-    def __init__(self, base_dir: str = "conversation_logs"):
+    def __init__(
+        self,
+        base_dir: str = "conversation_logs",
+        catalog: Optional[SessionCatalog] = None,
+        search_index: Optional[SearchIndex] = None,
+        session_name: Optional[str] = None,
+    ):
         """
         Initialize a new conversation logging session.
 
         Args:
             base_dir: Base directory for all conversation logs
+            catalog: Session catalog to update on save (default: base_dir/catalog.db)
+            search_index: Search index to update on save (default: base_dir/search_index.db)
+            session_name: Reuse this existing session folder (e.g. when resuming
+                from a checkpoint) instead of creating a timestamped one
         """
         self.base_dir = Path(base_dir)
+        self.catalog = catalog
+        self.search_index = search_index
         self.base_dir.mkdir(exist_ok=True)
 
         # Create timestamped session folder
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.session_dir = self.base_dir / f"session_{timestamp}"
+        self.session_dir = self.base_dir / (session_name or f"session_{timestamp}")
         self.session_dir.mkdir(exist_ok=True)
 
         # Create metadata subdirectory for JSON files
@@ -56,6 +76,31 @@ class ConversationLogger:
 
         print(f"\n[Logger] Session folder: {self.session_dir}")
 
+    def export_state(self) -> Dict[str, Any]:
+        """Snapshot everything logged so far (for checkpoints)."""
+        return {
+            "exchanges": self.exchanges,
+            "persona_summaries": self.persona_summaries,
+            "phase_summaries": self.phase_summaries,
+            "facilitator_decisions": self.facilitator_decisions,
+            "prompt_inputs": self.prompt_inputs,
+            "metadata": self.metadata,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Replace logged data with a snapshot from export_state().
+
+        Args:
+            state: Snapshot to restore; missing keys keep their current value
+        """
+        self.exchanges = list(state.get("exchanges", self.exchanges))
+        self.persona_summaries = dict(state.get("persona_summaries", self.persona_summaries))
+        self.phase_summaries = dict(state.get("phase_summaries", self.phase_summaries))
+        self.facilitator_decisions = list(state.get("facilitator_decisions", self.facilitator_decisions))
+        self.prompt_inputs = list(state.get("prompt_inputs", self.prompt_inputs))
+        self.metadata = {**self.metadata, **state.get("metadata", {})}
+
     def log_metadata(self, key: str, value: Any) -> None:
         """
         Add metadata about the session.
@@ -209,15 +254,51 @@ class ConversationLogger:
             description="Session metadata"
         )
 
+        # Save prompt inputs and phase summaries (searchable across sessions)
+        self._save_json(
+            "prompt_inputs.json",
+            self.prompt_inputs,
+            description="Prompt inputs for each turn"
+        )
+        self._save_json(
+            "phase_summaries.json",
+            self.phase_summaries,
+            description="Facilitator phase summaries"
+        )
+
         # Generate readable transcript
         self._generate_transcript()
 
         # Generate extended transcript with prompt inputs
         self._generate_extended_transcript()
 
+        # Keep the session catalog and search index in sync
+        self._update_catalog()
+        self._update_search_index()
+
         print(f"\n[Logger] All logs saved to: {self.session_dir}")
         print(f"[Logger] Total exchanges: {len(self.exchanges)}")
 
+    def _update_catalog(self) -> None:
+        """Upsert this session into the session catalog (never fatal)."""
+        try:
+            if self.catalog is None:
+                self.catalog = SessionCatalog.for_logs_dir(str(self.base_dir))
+            self.catalog.upsert(build_session_record(
+                self.session_dir.name, self.session_dir, self.metadata, self.exchanges
+            ))
+        except Exception as e:
+            print(f"[!] Failed to update session catalog: {e}")
+
+    def _update_search_index(self) -> None:
+        """Index this session's documents for cross-session search (never fatal)."""
+        try:
+            if self.search_index is None:
+                self.search_index = SearchIndex.for_logs_dir(str(self.base_dir))
+            self.search_index.index_session(self.session_dir)
+        except Exception as e:
+            print(f"[!] Failed to update search index: {e}")
+
     def _save_json(self, filename: str, data: Any, description: str = "") -> None:
         """Save data as JSON file to metadata directory."""
         filepath = self.metadata_dir / filename
@@ -2,9 +2,9 @@
 # Neutral meta-level facilitator for guiding philosophical debates
 
 import json
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from openai import OpenAI, AsyncOpenAI
-from framework.persona import Persona
+from framework.persona import Persona, completion_usage, stream_chat_completion
 
 
 class MediatorPersona(Persona):
@@ -58,7 +58,12 @@ class MediatorPersona(Persona):
         }
         return cls(definition, model_name=model_name)
 
-    def mediate(self, ctx: Dict[str, Any], prompt_logger=None) -> Dict[str, Any]:
+    def mediate(
+        self,
+        ctx: Dict[str, Any],
+        prompt_logger=None,
+        on_delta: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
         """
         Generate mediator intervention (QUESTION/DETECT/BRIDGE).
 
@@ -71,6 +76,9 @@ class MediatorPersona(Persona):
                 - shared_context: Topic, current focus
                 - turn_count: Current turn number
                 - stagnation_detected: bool
+            prompt_logger: Optional callback to log the full prompt input
+            on_delta: Optional callback; when given the completion is streamed
+                and each text chunk is passed to it as it arrives
 
         Returns:
             Dict with persona, archetype, and response (QUESTION/DETECT/BRIDGE format)
@@ -153,13 +161,16 @@ CRITICAL: {self.watchouts}"""
             except Exception:
                 pass
 
-        # Call LLM
-        completion = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=messages
-        )
-
-        content = completion.choices[0].message.content.strip()
+        # Call LLM (streamed when the caller wants chunks as they arrive)
+        if on_delta is not None:
+            streamed = stream_chat_completion(self.client, on_delta, model=self.model_name, messages=messages)
+            content, usage, ttft = streamed["content"].strip(), streamed["usage"], streamed["ttft"]
+        else:
+            completion = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=messages
+            )
+            content, usage, ttft = completion.choices[0].message.content.strip(), completion_usage(completion), None
 
         # Log intervention
         self._log_intervention(content, ctx)
@@ -175,7 +186,9 @@ CRITICAL: {self.watchouts}"""
             "persona": self.name,
             "archetype": self.archetype,
             "response": content,
-            "scenarios": scenarios  # None if no scenarios presented, else list of scenario dicts
+            "scenarios": scenarios,  # None if no scenarios presented, else list of scenario dicts
+            "usage": usage,
+            "ttft": ttft,
         }
 
     def _log_intervention(self, content: str, ctx: Dict[str, Any]) -> None:
@@ -64,6 +64,9 @@ class ConversationMonitor:
         self.recent_exchanges: List[Dict[str, str]] = []
         self.max_recent_exchanges = 3
 
+        # LLM calls per call site: {site: {calls, errors, seconds, tokens, streamed, ttft_seconds}}
+        self.llm_calls: Dict[str, Dict[str, float]] = {}
+
     def on_phase_start(self, phase_id: str, goal: str) -> None:
         """
         Called when a new phase begins.
@@ -145,6 +148,39 @@ class ConversationMonitor:
         if len(self.recent_exchanges) > self.max_recent_exchanges:
             self.recent_exchanges.pop(0)
 
+    def on_llm_call(
+        self,
+        site: str,
+        seconds: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        ok: bool = True,
+        ttft: Optional[float] = None
+    ) -> None:
+        """
+        Called after every LLM request made by the meeting loop.
+
+        Args:
+            site: Call site (e.g. "persona_response", "facilitator_next_speaker")
+            seconds: Wall-clock latency of the request
+            prompt_tokens: Input tokens reported by the API (0 if unknown)
+            completion_tokens: Output tokens reported by the API (0 if unknown)
+            ok: False if the request raised
+            ttft: Seconds to the first streamed token (None if not streamed)
+        """
+        stats = self.llm_calls.setdefault(site, {
+            "calls": 0, "errors": 0, "seconds": 0.0, "prompt_tokens": 0, "completion_tokens": 0,
+            "streamed": 0, "ttft_seconds": 0.0,
+        })
+        stats["calls"] += 1
+        stats["errors"] += 0 if ok else 1
+        stats["seconds"] += seconds
+        stats["prompt_tokens"] += prompt_tokens
+        stats["completion_tokens"] += completion_tokens
+        if ttft is not None:
+            stats["streamed"] += 1
+            stats["ttft_seconds"] += ttft
+
     def on_phase_complete(
         self,
         phase_id: str,
@@ -278,12 +314,20 @@ class ConversationMonitor:
         """Called when a coverage-gap nudge is computed. Override in subclasses."""
         pass
 
+    def on_turn_delta(self, speaker: str, delta: str, phase_id: Optional[str] = None, turn: Optional[int] = None) -> None:
+        """
+        Called with each streamed chunk of a turn while it is generated (may be
+        called from a worker thread). The complete text still arrives through
+        the logger once the turn finishes. Override in subclasses.
+        """
+        pass
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get current session statistics as a dictionary.
 
         Returns:
-            Dictionary with tokens, turns, time, cost, phases
+            Dictionary with tokens, turns, time, cost, phases, LLM calls per site
         """
         total_time = time.time() - self.session_start_time
 
@@ -293,5 +337,6 @@ class ConversationMonitor:
             "phases_completed": self.phases_completed,
             "total_time_seconds": total_time,
             "estimated_cost": self._estimate_cost(),
-            "phase_history": self.phase_history
+            "phase_history": self.phase_history,
+            "llm_calls": self.llm_calls,
         }
@@ -2,7 +2,8 @@
 import json
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from typing import Callable, Dict, Any, Optional, List
 from openai import OpenAI, AsyncOpenAI
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,59 @@ def extract_last_claim(last_turn: Dict) -> str:
     return " ".join(words) if words else "the previous point"
 
 
+def completion_usage(completion) -> Dict[str, int]:
+    """
+    Token counts of a chat completion ({} if the API did not report usage).
+
+    Returns:
+        {"prompt_tokens": int, "completion_tokens": int}
+    """
+    usage = getattr(completion, "usage", None)
+    if usage is None:
+        return {}
+    return {
+        "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+        "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+    }
+
+
+def stream_chat_completion(client, on_delta: Optional[Callable[[str], None]] = None, **request) -> Dict[str, Any]:
+    """
+    Run a chat completion with stream=True, passing each text chunk to on_delta.
+
+    An exception raised by on_delta (e.g. RunCancelled) stops reading the
+    stream and propagates to the caller.
+
+    Args:
+        client: OpenAI client
+        on_delta: Called with every non-empty content chunk as it arrives
+        **request: chat.completions.create() arguments (model, messages, ...)
+
+    Returns:
+        {"content": full text, "usage": completion_usage dict, "ttft": seconds
+        to the first content chunk (None if the response was empty)}
+    """
+    start = time.perf_counter()
+    stream = client.chat.completions.create(stream=True, stream_options={"include_usage": True}, **request)
+    parts: List[str] = []
+    usage: Dict[str, int] = {}
+    ttft = None
+    for chunk in stream:
+        if getattr(chunk, "usage", None):
+            usage = completion_usage(chunk)
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        if ttft is None:
+            ttft = time.perf_counter() - start
+        parts.append(delta)
+        if on_delta:
+            on_delta(delta)
+    return {"content": "".join(parts), "usage": usage, "ttft": ttft}
+
+
 def count_words(text: str) -> int:
     """Count words in text."""
     return len(text.split())
@@ -91,6 +145,46 @@ class Persona:
             definition = json.load(f)
         return cls(definition, model_name=model_name)
 
+    def to_definition(self) -> Dict[str, Any]:
+        """Return the JSON definition this persona was created from."""
+        return {
+            "Name": self.name,
+            "Archetype": self.archetype,
+            "Purpose": self.purpose,
+            "Deliverables": self.deliverables,
+            "Strengths": self.strengths,
+            "Watch-out": self.watchouts,
+            "Conversation_Style": self.conversation_style,
+        }
+
+    def export_state(self) -> Dict[str, Any]:
+        """
+        Snapshot the persona for checkpointing.
+
+        Returns:
+            JSON-serializable dict accepted by from_state()
+        """
+        return {
+            "definition": self.to_definition(),
+            "model_name": self.model_name,
+            "summary": self.summary,
+            "belief_state": self.belief_state,
+            "memory": self.memory,
+            "domain": self._domain,
+            "conversation_history": self.conversation_history,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]):
+        """Recreate a persona (definition + accumulated state) from export_state()."""
+        persona = cls(state["definition"], model_name=state.get("model_name", "gpt-3.5-turbo"))
+        persona.summary = state.get("summary", persona.summary)
+        persona.belief_state = state.get("belief_state")
+        persona.memory = state.get("memory", persona.memory)
+        persona._domain = state.get("domain")
+        persona.conversation_history = state.get("conversation_history", [])
+        return persona
+
     def _initialize_belief_state(self, domain: str, phase_info: Dict[str, Any]) -> Dict[str, Any]:
         """
         Initialize domain-adapted belief state on first turn with delta-based tracking.
@@ -138,7 +232,13 @@ class Persona:
                 "deltas": []
             }
 
-    def response(self, ctx: Dict[str, Any], prompt_key: Optional[str] = None, prompt_logger: Optional[callable] = None) -> Dict[str, Any]:
+    def response(
+        self,
+        ctx: Dict[str, Any],
+        prompt_key: Optional[str] = None,
+        prompt_logger: Optional[callable] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
         """
         Generate a persona response using native OpenAI conversation threading.
         Each persona maintains their own conversation history with proper message roles.
@@ -150,9 +250,12 @@ class Persona:
                 - turn_count: Current turn number in phase
                 - phase: Phase information (for belief state)
             prompt_logger: Optional callback to log the full prompt input before LLM call
+            on_delta: Optional callback; when given the completion is streamed
+                and each text chunk is passed to it as it arrives
 
         Returns:
-            Dict with persona, archetype, and response
+            Dict with persona, archetype, response, usage and (when streamed)
+            ttft — seconds to the first token
         """
         # Extract context
         initial_prompt = ctx.get("initial_prompt", "")
@@ -249,20 +352,25 @@ CRITICAL CONSTRAINTS:
             except Exception as e:
                 logger.warning("Failed to log prompt input: %s", e)
 
-        # Call LLM
-        completion = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=messages
-        )
-
-        content = completion.choices[0].message.content.strip()
+        # Call LLM (streamed when the caller wants chunks as they arrive)
+        if on_delta is not None:
+            streamed = stream_chat_completion(self.client, on_delta, model=self.model_name, messages=messages)
+            content, usage, ttft = streamed["content"].strip(), streamed["usage"], streamed["ttft"]
+        else:
+            completion = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=messages
+            )
+            content, usage, ttft = completion.choices[0].message.content.strip(), completion_usage(completion), None
 
         # No longer append to conversation history - we rebuild full context each turn
 
         return {
             "persona": self.name,
             "archetype": self.archetype,
-            "response": content
+            "response": content,
+            "usage": usage,
+            "ttft": ttft,
         }
 
     def _format_summary(self) -> str:
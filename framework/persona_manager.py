@@ -2,19 +2,81 @@
 PersonaManager - Manages the lifecycle of dynamically generated personas
 
 Handles:
-- On-demand persona generation
-- Memory and file-based caching
+- On-demand persona generation, or concurrent prefetch for every phase of a run
+- Memory and file-based caching (manifest-indexed, with an LRU of parsed definitions)
 - Saving generated personas for reuse
 - Promotion of effective personas to static archive
 - Fallback to archived personas when generation fails
 """
 
+import asyncio
 import json
 import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, List, Any
+from typing import Dict, Iterator, Optional, List, Any
 from framework.persona import Persona
-from framework.generators import generate_personas_for_context
+from framework.generators import (
+    generate_personas_for_context,
+    generate_personas_for_context_async,
+    is_injected_persona,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_LOCK_NAME = "manifest.lock"
+MANIFEST_VERSION = 1
+DEFAULT_LRU_SIZE = 32
+
+# Serializes manifest read-merge-write between managers in this process;
+# _file_lock does the same across processes (dashboard workers, benchmarks)
+_manifest_lock = threading.Lock()
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive OS lock on `path` (created if missing) for the block."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON via a temp file + rename so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.stem}-", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 class PersonaManager:
@@ -23,7 +85,11 @@ class PersonaManager:
 
     Architecture:
     - Memory cache: Active personas for current session
-    - File cache: Generated personas saved to dynamic_personas/ for reuse
+    - File cache: Generated personas saved to dynamic_personas/<domain>/<phase_id>/
+      for reuse, indexed by dynamic_personas/manifest.json on the full
+      (domain, phase_id, count)
+    - Definition LRU: Parsed persona definitions per manifest entry, so repeat
+      phases don't re-read and re-parse their files
     - Archive: Proven personas in personas_archive/ for fallback
     """
 
@@ -31,7 +97,8 @@ class PersonaManager:
         self,
         cache_dir: str = "dynamic_personas",
         archive_dir: str = "personas_archive",
-        model_name: str = "gpt-4o-mini"
+        model_name: str = "gpt-4o-mini",
+        lru_size: int = DEFAULT_LRU_SIZE,
     ):
         """
         Initialize the PersonaManager.
@@ -40,6 +107,7 @@ class PersonaManager:
             cache_dir: Directory for dynamically generated persona files
             archive_dir: Directory for static/archived personas (fallback)
             model_name: LLM model to use for generation
+            lru_size: Manifest entries whose parsed definitions stay in memory
         """
         self.cache_dir = Path(cache_dir)
         self.archive_dir = Path(archive_dir)
@@ -51,9 +119,22 @@ class PersonaManager:
         # Track generated personas per session
         self.generated_personas: List[str] = []
 
+        # Parsed definitions: manifest key → list of persona definition dicts
+        self.lru_size = lru_size
+        self._definition_lru: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._lru_hits = 0
+        self._lru_misses = 0
+
         # Ensure directories exist
         self.cache_dir.mkdir(exist_ok=True, parents=True)
 
+        # Prefetched generations: phase_id → (count, task returning persona definitions)
+        self._prefetch_tasks: Dict[str, tuple] = {}
+
+        self.manifest_path = self.cache_dir / MANIFEST_NAME
+        self._manifest_mtime: Optional[float] = None
+        self.manifest: Dict[str, Dict[str, Any]] = self._load_manifest()
+
         print(f"[PersonaManager] Initialized")
         print(f"  Cache: {self.cache_dir}")
         print(f"  Archive: {self.archive_dir}")
@@ -80,13 +161,12 @@ class PersonaManager:
         """
         print(f"\n[PersonaManager] Requesting {count} personas for phase '{phase_info.get('phase_id')}'")
 
-        # Generate cache key based on domain and phase
+        # Cache entries are keyed by the full domain, phase and count
         domain = self._extract_domain(inspiration)
         phase_id = phase_info.get("phase_id", "unknown")
-        cache_key = f"{domain}_{phase_id}"
 
         # Check if we've already cached personas for this domain/phase
-        cached_personas = self._load_from_file_cache(cache_key, count)
+        cached_personas = self._load_from_file_cache(domain, phase_id, count)
         if cached_personas:
             print(f"[PersonaManager] Using {len(cached_personas)} cached personas from file")
             return cached_personas
@@ -106,6 +186,166 @@ class PersonaManager:
             print("[!] Persona generation failed, falling back to archive")
             return self._fallback_to_archive(count)
 
+        return self._personas_from_definitions(persona_defs, domain, phase_id, count)
+
+    def prefetch_personas(
+        self,
+        inspiration: str,
+        phases: List[Dict[str, Any]],
+        count: int = 4,
+        domain: str = "product",
+    ) -> None:
+        """
+        Start generating personas for every phase concurrently.
+
+        Call from a running event loop as soon as the phases are known;
+        request_personas_for_phase_async then awaits each phase's generation
+        instead of starting it at the phase boundary. Phases already in the
+        file cache are skipped (they load from disk on request).
+
+        Args:
+            inspiration: Problem domain context
+            phases: Phase dicts of the run, in order
+            count: Number of personas per phase
+            domain: Domain type (overridden by the inspiration's domain, as in
+                request_personas_for_phase)
+        """
+        loop = asyncio.get_running_loop()
+        domain = self._extract_domain(inspiration)
+        started = 0
+        for phase in phases:
+            phase_id = phase.get("phase_id", "unknown")
+            if phase_id in self._prefetch_tasks:
+                continue
+            if self._lookup_manifest(self._manifest_key(domain, phase_id, count)) is not None:
+                continue
+            task = loop.create_task(generate_personas_for_context_async(
+                inspiration=inspiration,
+                phase_info=phase,
+                existing_personas=list(self.generated_personas),
+                count=count,
+                model_name=self.model_name,
+                domain=domain,
+            ))
+            self._prefetch_tasks[phase_id] = (count, task)
+            started += 1
+        if started:
+            print(f"[PersonaManager] Prefetching personas for {started} phase(s) concurrently")
+
+    def cancel_prefetch(self) -> None:
+        """Cancel prefetched generations that have not been requested yet."""
+        for _, task in self._prefetch_tasks.values():
+            task.cancel()
+        self._prefetch_tasks.clear()
+
+    def persona_source(self, inspiration: str, phase_info: Dict[str, Any], count: int = 4) -> str:
+        """
+        Where the next request for this phase's personas will come from.
+
+        Returns:
+            "prefetch" (awaits a prefetched generation), "cache" (file cache,
+            no LLM call) or "generate"
+        """
+        phase_id = phase_info.get("phase_id", "unknown")
+        prefetch = self._prefetch_tasks.get(phase_id)
+        if prefetch is not None and prefetch[0] == count:
+            return "prefetch"
+        key = self._manifest_key(self._extract_domain(inspiration), phase_id, count)
+        if self._lookup_manifest(key) is not None:
+            return "cache"
+        return "generate"
+
+    async def request_personas_for_phase_async(
+        self,
+        inspiration: str,
+        phase_info: Dict[str, Any],
+        count: int = 4,
+        domain: str = "product",
+    ) -> Dict[str, Persona]:
+        """
+        Async request_personas_for_phase: awaits the phase's prefetched
+        generation if there is one, else runs the blocking request in a thread.
+
+        Returns:
+            Dict mapping persona keys to Persona instances
+        """
+        phase_id = phase_info.get("phase_id", "unknown")
+        prefetch = self._prefetch_tasks.pop(phase_id, None)
+        if prefetch is not None and prefetch[0] != count:
+            prefetch[1].cancel()
+            prefetch = None
+        if prefetch is None:
+            return await asyncio.to_thread(self.request_personas_for_phase, inspiration, phase_info, count, domain)
+
+        print(f"\n[PersonaManager] Using prefetched personas for phase '{phase_id}'")
+        domain = self._extract_domain(inspiration)
+        persona_defs = await prefetch[1]
+        if not persona_defs:
+            print("[!] Persona generation failed, falling back to archive")
+            return self._fallback_to_archive(count)
+
+        persona_defs = await self._reconcile_with_earlier_phases(persona_defs, inspiration, phase_info, domain)
+        return await asyncio.to_thread(self._personas_from_definitions, persona_defs, domain, phase_id, count)
+
+    async def _reconcile_with_earlier_phases(
+        self,
+        persona_defs: List[Dict[str, Any]],
+        inspiration: str,
+        phase_info: Dict[str, Any],
+        domain: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Replace prefetched personas that duplicate ones earlier phases already use.
+
+        Prefetched phases are generated without seeing each other's personas,
+        so the existing_personas constraint is applied here instead: the
+        duplicates are regenerated in one call that excludes every name in use.
+        If that call can't supply enough new personas the originals are kept.
+
+        Returns:
+            Persona definitions for the phase
+        """
+        taken = {self._create_persona_key(name) for name in self.generated_personas}
+        kept = [d for d in persona_defs if is_injected_persona(d) or self._create_persona_key(d.get("Name", "")) not in taken]
+        duplicates = len(persona_defs) - len(kept)
+        if not duplicates:
+            return persona_defs
+
+        print(f"[PersonaManager] Regenerating {duplicates} persona(s) already used in earlier phases")
+        in_use = list(self.generated_personas) + [d.get("Name", "") for d in kept]
+        replacements = await generate_personas_for_context_async(
+            inspiration=inspiration,
+            phase_info=phase_info,
+            existing_personas=in_use,
+            count=duplicates,
+            model_name=self.model_name,
+            domain=domain,
+        )
+        in_use_keys = {self._create_persona_key(name) for name in in_use}
+        replacements = [
+            d for d in replacements
+            if not is_injected_persona(d) and self._create_persona_key(d.get("Name", "")) not in in_use_keys
+        ][:duplicates]
+        if len(replacements) < duplicates:
+            return persona_defs
+
+        generated = [d for d in kept if not is_injected_persona(d)]
+        injected = [d for d in kept if is_injected_persona(d)]
+        return generated + replacements + injected
+
+    def _personas_from_definitions(
+        self,
+        persona_defs: List[Dict[str, Any]],
+        domain: str,
+        phase_id: str,
+        count: int
+    ) -> Dict[str, Persona]:
+        """
+        Build Persona instances for newly generated definitions and cache them.
+
+        Returns:
+            Dict mapping persona keys to Persona instances
+        """
         # Convert to Persona instances
         personas = {}
         for persona_def in persona_defs:
@@ -116,8 +356,8 @@ class PersonaManager:
             self.memory_cache[persona_key] = persona
             self.generated_personas.append(persona.name)
 
-            # Save to file cache
-            self._save_persona_to_cache(persona, domain, phase_id)
+        # Save to file cache
+        self._save_personas_to_cache(list(personas.values()), domain, phase_id, count)
 
         print(f"[PersonaManager] Generated and cached {len(personas)} new personas")
         return personas
@@ -187,76 +427,155 @@ class PersonaManager:
 
         return key.strip("_")
 
-    def _load_from_file_cache(
-        self,
-        cache_key: str,
-        count: int
-    ) -> Optional[Dict[str, Persona]]:
-        """
-        Load personas from file cache for a given domain/phase.
+    @staticmethod
+    def _manifest_key(domain: str, phase_id: str, count: int) -> str:
+        """Manifest key for the full (domain, phase_id, count)."""
+        return f"{domain}/{phase_id}/{count}"
 
-        Args:
-            cache_key: Domain + phase identifier
-            count: Number of personas needed
+    def _read_manifest_file(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Entries of the on-disk manifest, or None if there isn't a readable one."""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._manifest_mtime = self.manifest_path.stat().st_mtime
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+        return data.get("entries", {})
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the manifest, indexing pre-manifest cache files if there is none.
 
         Returns:
-            Dict of personas or None if not enough cached
+            Dict mapping manifest keys to entries
+        """
+        entries = self._read_manifest_file()
+        if entries is not None:
+            return entries
+
+        # One-time migration: persona files saved before the manifest existed
+        # carry their domain and phase in _metadata; index them as one entry each
+        entries = {}
+        groups: Dict[tuple, List[str]] = {}
+        for persona_file in sorted(self.cache_dir.glob("*/*.json")):
+            try:
+                with open(persona_file, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f).get("_metadata", {})
+            except (OSError, json.JSONDecodeError):
+                continue
+            if metadata.get("domain") and metadata.get("phase_generated"):
+                group = (metadata["domain"], metadata["phase_generated"])
+                groups.setdefault(group, []).append(persona_file.relative_to(self.cache_dir).as_posix())
+
+        for (domain, phase_id), files in groups.items():
+            key = self._manifest_key(domain, phase_id, len(files))
+            entries[key] = {"domain": domain, "phase_id": phase_id, "count": len(files), "files": files}
+        if entries:
+            self._write_manifest(entries)
+            print(f"[PersonaManager] Indexed {len(entries)} cached persona sets into {MANIFEST_NAME}")
+        return entries
+
+    def _write_manifest(self, new_entries: Dict[str, Dict[str, Any]]) -> None:
         """
-        # Create domain-specific subdirectory
-        domain = cache_key.split("_")[0] if "_" in cache_key else cache_key
-        domain_dir = self.cache_dir / domain
+        Merge entries into the on-disk manifest and write it atomically.
 
-        if not domain_dir.exists():
+        Re-reads the file first, under a lock shared with managers in other
+        processes, so entries another manager wrote since this one loaded it
+        are kept.
+        """
+        with _manifest_lock, _file_lock(self.cache_dir / MANIFEST_LOCK_NAME):
+            entries = self._read_manifest_file() or {}
+            entries.update(new_entries)
+            _write_json_atomic(self.manifest_path, {"version": MANIFEST_VERSION, "entries": entries})
+            self._manifest_mtime = self.manifest_path.stat().st_mtime
+            self.manifest = entries
+
+    def _lookup_manifest(self, key: str) -> Optional[Dict[str, Any]]:
+        """Manifest entry for key, reloading the manifest if another manager changed it."""
+        entry = self.manifest.get(key)
+        if entry is not None:
+            return entry
+        try:
+            mtime = self.manifest_path.stat().st_mtime
+        except OSError:
             return None
+        if mtime != self._manifest_mtime:
+            self.manifest = self._read_manifest_file() or self.manifest
+        return self.manifest.get(key)
 
-        # Load all persona files in this domain
-        persona_files = list(domain_dir.glob("*.json"))
-        if len(persona_files) < count:
-            return None  # Not enough cached personas
-
-        personas = {}
-        for persona_file in persona_files[:count]:
-            try:
-                with open(persona_file, 'r', encoding='utf-8') as f:
-                    persona_def = json.load(f)
+    def _cached_definitions(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parsed persona definitions for a manifest entry, via the LRU.
 
-                persona = Persona(persona_def, model_name=self.model_name)
-                persona_key = self._create_persona_key(persona.name)
+        Returns:
+            List of definition dicts, or None if the entry or any of its
+            files is missing or unreadable
+        """
+        definitions = self._definition_lru.get(key)
+        if definitions is not None:
+            self._definition_lru.move_to_end(key)
+            self._lru_hits += 1
+            return definitions
+        self._lru_misses += 1
+
+        entry = self._lookup_manifest(key)
+        if entry is None:
+            return None
 
-                personas[persona_key] = persona
-                self.memory_cache[persona_key] = persona
+        definitions = []
+        for relative_path in entry["files"]:
+            try:
+                with open(self.cache_dir / relative_path, 'r', encoding='utf-8') as f:
+                    definitions.append(json.load(f))
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"[!] Failed to load cached persona {relative_path}: {e}")
+                return None
 
-            except Exception as e:
-                print(f"[!] Failed to load cached persona {persona_file.name}: {e}")
-                continue
+        self._remember_definitions(key, definitions)
+        return definitions
 
-        return personas if len(personas) >= count else None
+    def _remember_definitions(self, key: str, definitions: List[Dict[str, Any]]) -> None:
+        self._definition_lru[key] = definitions
+        self._definition_lru.move_to_end(key)
+        while len(self._definition_lru) > self.lru_size:
+            self._definition_lru.popitem(last=False)
 
-    def _save_persona_to_cache(
+    def _load_from_file_cache(
         self,
-        persona: Persona,
         domain: str,
-        phase_id: str
-    ) -> None:
+        phase_id: str,
+        count: int
+    ) -> Optional[Dict[str, Persona]]:
         """
-        Save a persona to file cache.
+        Load personas from file cache for a given domain/phase/count.
 
         Args:
-            persona: Persona instance to save
             domain: Domain identifier
             phase_id: Phase identifier
+            count: Number of personas needed
+
+        Returns:
+            Dict of personas or None if no complete set is cached
         """
-        # Create domain-specific subdirectory
-        domain_dir = self.cache_dir / domain
-        domain_dir.mkdir(exist_ok=True, parents=True)
+        definitions = self._cached_definitions(self._manifest_key(domain, phase_id, count))
+        if not definitions:
+            return None
 
-        # Create filename from persona name
-        persona_key = self._create_persona_key(persona.name)
-        filename = f"{persona_key}.json"
-        filepath = domain_dir / filename
+        personas = {}
+        for persona_def in definitions:
+            persona = Persona(persona_def, model_name=self.model_name)
+            persona_key = self._create_persona_key(persona.name)
 
-        # Create persona definition dict
-        persona_def = {
+            personas[persona_key] = persona
+            self.memory_cache[persona_key] = persona
+
+        return personas if len(personas) >= count else None
+
+    def _persona_to_definition(self, persona: Persona) -> Dict[str, Any]:
+        """Persona fields in the JSON definition format."""
+        return {
             "Name": persona.name,
             "Archetype": persona.archetype,
             "Purpose": persona.purpose,
@@ -264,19 +583,62 @@ class PersonaManager:
             "Strengths": persona.strengths,
             "Watch-out": persona.watchouts,
             "Conversation_Style": persona.conversation_style,
-            "_metadata": {
-                "domain": domain,
-                "phase_generated": phase_id,
-                "model": self.model_name
-            }
         }
 
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(persona_def, f, indent=2, ensure_ascii=False)
+    def _save_personas_to_cache(
+        self,
+        personas: List[Persona],
+        domain: str,
+        phase_id: str,
+        count: int
+    ) -> None:
+        """
+        Save a phase's personas to the file cache and record them in the manifest.
+
+        Args:
+            personas: Persona instances to save
+            domain: Domain identifier
+            phase_id: Phase identifier
+            count: Number of personas requested (part of the manifest key)
+        """
+        phase_dir = self.cache_dir / domain / phase_id
+        files = []
+        definitions = []
+
+        for persona in personas:
+            persona_def = {
+                **self._persona_to_definition(persona),
+                "_metadata": {
+                    "domain": domain,
+                    "phase_generated": phase_id,
+                    "model": self.model_name
+                }
+            }
+            filepath = phase_dir / f"{self._create_persona_key(persona.name)}.json"
+            try:
+                _write_json_atomic(filepath, persona_def)
+            except Exception as e:
+                print(f"[!] Failed to save persona to cache: {e}")
+                return
+            files.append(filepath.relative_to(self.cache_dir).as_posix())
+            definitions.append(persona_def)
             print(f"[PersonaManager] Saved persona to cache: {filepath.name}")
+
+        key = self._manifest_key(domain, phase_id, count)
+        entry = {
+            "domain": domain,
+            "phase_id": phase_id,
+            "count": count,
+            "files": files,
+            "model": self.model_name,
+            "saved_at": datetime.now().isoformat(),
+        }
+        try:
+            self._write_manifest({key: entry})
         except Exception as e:
-            print(f"[!] Failed to save persona to cache: {e}")
+            print(f"[!] Failed to update persona cache manifest: {e}")
+            return
+        self._remember_definitions(key, definitions)
 
     def _fallback_to_archive(self, count: int) -> Dict[str, Persona]:
         """
@@ -342,13 +704,7 @@ class PersonaManager:
         filepath = self.archive_dir / filename
 
         persona_def = {
-            "Name": persona.name,
-            "Archetype": persona.archetype,
-            "Purpose": persona.purpose,
-            "Deliverables": persona.deliverables,
-            "Strengths": persona.strengths,
-            "Watch-out": persona.watchouts,
-            "Conversation_Style": persona.conversation_style,
+            **self._persona_to_definition(persona),
             "_archive_metadata": {
                 "promoted_reason": reason,
                 "original_model": self.model_name
@@ -369,6 +725,7 @@ class PersonaManager:
         """Clear the in-memory persona cache."""
         self.memory_cache.clear()
         self.generated_personas.clear()
+        self._definition_lru.clear()
         print("[PersonaManager] Memory cache cleared")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -378,12 +735,16 @@ class PersonaManager:
         Returns:
             Dict with cache statistics
         """
-        file_count = len(list(self.cache_dir.rglob("*.json")))
+        file_count = len({path for entry in self.manifest.values() for path in entry["files"]})
         archive_count = len(list(self.archive_dir.glob("*.json"))) if self.archive_dir.exists() else 0
 
         return {
             "memory_cache_size": len(self.memory_cache),
             "file_cache_personas": file_count,
+            "file_cache_sets": len(self.manifest),
+            "definition_lru_size": len(self._definition_lru),
+            "definition_lru_hits": self._lru_hits,
+            "definition_lru_misses": self._lru_misses,
             "archive_personas": archive_count,
             "generated_this_session": len(self.generated_personas)
         }
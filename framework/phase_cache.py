@@ -0,0 +1,89 @@
+"""
+PhasePlanCache - File cache for generated workflow phases
+
+generate_phases_for_domain() is one LLM call per run, and runs repeat the
+same inspiration constantly (benchmarks, re-runs after tweaks). Plans are
+saved to phase_plans/<key>.json, where the key hashes the normalized
+inspiration (case and whitespace ignored) with number_of_ideas and the model,
+and reused while younger than the freshness limit.
+"""
+
+import copy
+import hashlib
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from framework.persona_manager import _write_json_atomic
+
+DEFAULT_MAX_AGE_DAYS = 30
+
+
+def normalize_inspiration(inspiration: str) -> str:
+    """Lowercase and collapse whitespace, so re-indented or re-wrapped text matches."""
+    return " ".join(inspiration.lower().split())
+
+
+class PhasePlanCache:
+    """
+    Phase plans keyed by (normalized inspiration, number_of_ideas, model).
+
+    Freshness policy: a plan older than max_age_days is ignored (and replaced
+    by the next put); max_age_days=None keeps plans forever, 0 disables reuse.
+    """
+
+    def __init__(self, cache_dir: str = "phase_plans", max_age_days: Optional[float] = DEFAULT_MAX_AGE_DAYS):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for phase plan files
+            max_age_days: Oldest plan to reuse, in days (None: no limit)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_age_days = max_age_days
+
+    @staticmethod
+    def cache_key(inspiration: str, number_of_ideas: int, model_name: str) -> str:
+        """Hash of the normalized inspiration, number_of_ideas and model."""
+        payload = json.dumps([normalize_inspiration(inspiration), number_of_ideas, model_name])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, inspiration: str, number_of_ideas: int, model_name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Cached phases for this inspiration, if present and fresh.
+
+        Returns:
+            A copy of the phase list, or None on a miss
+        """
+        if self.max_age_days == 0:
+            return None
+        try:
+            with open(self._path(self.cache_key(inspiration, number_of_ideas, model_name)), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            saved_at = datetime.fromisoformat(entry["saved_at"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+        if self.max_age_days is not None and datetime.now() - saved_at > timedelta(days=self.max_age_days):
+            return None
+        return copy.deepcopy(entry.get("phases")) or None
+
+    def put(self, inspiration: str, number_of_ideas: int, model_name: str, phases: List[Dict[str, Any]]) -> None:
+        """Save a generated phase plan (failures are reported, not raised)."""
+        key = self.cache_key(inspiration, number_of_ideas, model_name)
+        entry = {
+            "key": key,
+            "number_of_ideas": number_of_ideas,
+            "model": model_name,
+            "saved_at": datetime.now().isoformat(),
+            "phases": phases,
+        }
+        try:
+            _write_json_atomic(self._path(key), entry)
+        except Exception as e:
+            print(f"[!] Failed to save phase plan to cache: {e}")
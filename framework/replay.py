@@ -7,12 +7,16 @@ inspection of:
 - Persona states and summaries at any point
 - Facilitator decisions and reasoning
 - Shared context evolution
+
+Cross-session search is served by SearchIndex (see search_sessions()).
 """
 
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence
 from pathlib import Path
 
+from framework.search_index import SearchIndex
+
 
 class ConversationReplayer:
     """
@@ -400,6 +404,41 @@ class ConversationReplayer:
 
         return results
 
+    @staticmethod
+    def search_sessions(
+        query: str,
+        logs_dir: str = "conversation_logs",
+        limit: int = 20,
+        kinds: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Ranked full-text search across every logged session.
+
+        Syncs the SearchIndex stored in logs_dir first (only new or changed
+        sessions are re-read), then queries it.
+
+        Args:
+            query: Search terms (AND-ed; "term*" for prefix matches)
+            logs_dir: Folder containing session folders
+            limit: Maximum hits to return
+            kinds: Restrict to document kinds ("exchange", "prompt", "idea", "phase_summary")
+
+        Returns:
+            List of hits with session_id, kind, phase, speaker, turn, snippet, score
+        """
+        index = SearchIndex.for_logs_dir(logs_dir)
+        index.update(logs_dir)
+        results = index.search(query, limit=limit, kinds=kinds)
+
+        if results:
+            print(f"\n[Found {len(results)} matches for '{query}' across sessions]:")
+            for result in results:
+                print(f"  {result['session_id']} [{result['kind']}] {result['phase'] or ''} - {result['speaker'] or ''}")
+        else:
+            print(f"[!] No matches found for '{query}'")
+
+        return results
+
     # =========================================================================
     # Summary Methods
     # =========================================================================
@@ -0,0 +1,391 @@
+"""
+SearchIndex - Cross-session full-text search over conversation logs
+
+Maintains a SQLite FTS5 index of every searchable document in
+conversation_logs/:
+- exchange: each persona turn (full_conversation.json)
+- prompt: system message + context passed for each turn (prompt_inputs.json)
+- idea: each final idea (session_metadata.json "ideas")
+- phase_summary: facilitator phase summaries (phase_summaries.json, or the
+  legacy phase_summaries.txt)
+
+The index is incremental: each session's source files are fingerprinted by
+mtime, and update() only re-reads sessions that are new or changed. Results
+are ranked with bm25 and returned with highlighted snippets.
+
+Rebuild or query from the command line with:
+
+    python -m framework.search_index update --logs-dir conversation_logs
+    python -m framework.search_index search "pricing model"
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from framework.session_catalog import session_file
+
+
+SEARCH_INDEX_FILENAME = "search_index.db"
+
+DOCUMENT_KINDS = ("exchange", "prompt", "idea", "phase_summary")
+
+# Files whose mtimes make up a session's fingerprint
+_SOURCE_FILES = (
+    "full_conversation.json",
+    "prompt_inputs.json",
+    "session_metadata.json",
+    "phase_summaries.json",
+    "phase_summaries.txt",
+)
+
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5(
+    content,
+    session_id UNINDEXED,
+    kind UNINDEXED,
+    phase UNINDEXED,
+    speaker UNINDEXED,
+    turn UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+CREATE TABLE IF NOT EXISTS indexed_sessions (
+    id          TEXT PRIMARY KEY,
+    fingerprint REAL NOT NULL,
+    doc_count   INTEGER NOT NULL
+);
+"""
+
+
+def _load(session_dir: Path, filename: str, default: Any) -> Any:
+    path = session_file(session_dir, filename)
+    if not path.exists():
+        return default
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _parse_phase_summaries_txt(path: Path) -> Dict[str, str]:
+    """Parse the legacy phase_summaries.txt format into {phase_id: text}."""
+    summaries: Dict[str, str] = {}
+    current = None
+    lines: List[str] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        match = re.match(r"^Phase: (.+)$", line)
+        if match:
+            if current:
+                summaries[current] = " ".join(lines).strip()
+            current, lines = match.group(1).strip().lower(), []
+        elif current and line and not set(line) <= {"-", "="}:
+            lines.append(line.strip())
+    if current:
+        summaries[current] = " ".join(lines).strip()
+    return summaries
+
+
+def extract_documents(session_dir: Path) -> List[Dict[str, Any]]:
+    """
+    Collect every searchable document from a session folder.
+
+    Args:
+        session_dir: Path to a session folder (either log layout)
+
+    Returns:
+        List of dicts with content, kind, phase, speaker and turn
+    """
+    session_dir = Path(session_dir)
+    docs: List[Dict[str, Any]] = []
+
+    for ex in _load(session_dir, "full_conversation.json", []):
+        docs.append({
+            "content": ex.get("content", ""),
+            "kind": "exchange",
+            "phase": ex.get("phase"),
+            "speaker": ex.get("speaker"),
+            "turn": ex.get("turn"),
+        })
+
+    for prompt in _load(session_dir, "prompt_inputs.json", []):
+        docs.append({
+            "content": f"{prompt.get('system_message', '')}\n\n{prompt.get('enhanced_prompt', '')}",
+            "kind": "prompt",
+            "phase": prompt.get("phase"),
+            "speaker": prompt.get("speaker"),
+            "turn": prompt.get("turn"),
+        })
+
+    ideas = _load(session_dir, "session_metadata.json", {}).get("ideas") or []
+    for i, idea in enumerate(ideas if isinstance(ideas, list) else []):
+        if isinstance(idea, dict):
+            text = "\n".join(str(v) for v in idea.values() if isinstance(v, (str, int, float)))
+            title = idea.get("title")
+        else:
+            text, title = str(idea), None
+        docs.append({"content": text, "kind": "idea", "phase": None, "speaker": title, "turn": i})
+
+    summaries = _load(session_dir, "phase_summaries.json", None)
+    if summaries is None:
+        legacy = session_file(session_dir, "phase_summaries.txt")
+        summaries = _parse_phase_summaries_txt(legacy) if legacy.exists() else {}
+    for phase_id, text in summaries.items():
+        docs.append({"content": str(text), "kind": "phase_summary", "phase": phase_id, "speaker": None, "turn": None})
+
+    return [d for d in docs if d["content"].strip()]
+
+
+def session_fingerprint(session_dir: Path) -> float:
+    """Return the newest mtime among a session's source files (0.0 if none)."""
+    mtimes = [
+        path.stat().st_mtime
+        for path in (session_file(Path(session_dir), name) for name in _SOURCE_FILES)
+        if path.exists()
+    ]
+    return max(mtimes, default=0.0)
+
+
+def to_match_query(query: str) -> str:
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Each whitespace-separated term is quoted (so punctuation can't break the
+    query syntax) and terms are implicitly AND-ed. A trailing "*" on a term
+    is kept as a prefix search.
+    """
+    terms = []
+    for term in query.split():
+        prefix = term.endswith("*") and len(term) > 1
+        term = term.rstrip("*").replace('"', '""')
+        if term:
+            terms.append(f'"{term}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """
+    SQLite FTS5 index over all logged sessions.
+
+    Example:
+        >>> index = SearchIndex.for_logs_dir("conversation_logs")
+        >>> index.update()
+        >>> hits = index.search("subscription pricing", kinds=["idea"])
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the index, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_logs_dir(cls, logs_dir: str = "conversation_logs") -> 'SearchIndex':
+        """Create the index stored alongside a conversation_logs/ folder."""
+        return cls(str(Path(logs_dir) / SEARCH_INDEX_FILENAME))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    # =========================================================================
+    # Indexing
+    # =========================================================================
+
+    def index_session(self, session_dir: Path, force: bool = False) -> bool:
+        """
+        (Re)index one session folder if it changed since it was last indexed.
+
+        Args:
+            session_dir: Path to a session folder
+            force: Re-read the session even if its fingerprint is unchanged
+
+        Returns:
+            True if the session was (re)indexed, False if skipped
+        """
+        session_dir = Path(session_dir)
+        session_id = session_dir.name
+        fingerprint = session_fingerprint(session_dir)
+        if fingerprint == 0.0:
+            return False
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT fingerprint FROM indexed_sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+            if row and row["fingerprint"] == fingerprint and not force:
+                return False
+
+        docs = extract_documents(session_dir)
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM documents WHERE session_id = ?", (session_id,))
+            conn.executemany(
+                "INSERT INTO documents (content, session_id, kind, phase, speaker, turn) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(d["content"], session_id, d["kind"], d["phase"], d["speaker"], d["turn"]) for d in docs],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO indexed_sessions (id, fingerprint, doc_count) VALUES (?, ?, ?)",
+                (session_id, fingerprint, len(docs)),
+            )
+        return True
+
+    def remove_session(self, session_id: str) -> None:
+        """Drop every document belonging to a session."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM documents WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM indexed_sessions WHERE id = ?", (session_id,))
+
+    def update(self, logs_dir: Optional[str] = None) -> Dict[str, int]:
+        """
+        Incrementally sync the index with the session folders on disk.
+
+        Only new or modified sessions are re-read; sessions whose folder was
+        deleted are removed from the index.
+
+        Args:
+            logs_dir: Folder containing session folders (defaults to the
+                folder holding the index database)
+
+        Returns:
+            {"indexed": n, "removed": n, "unchanged": n}
+        """
+        root = Path(logs_dir) if logs_dir else self.db_path.parent
+        stats = {"indexed": 0, "removed": 0, "unchanged": 0}
+        if not root.exists():
+            return stats
+
+        on_disk = set()
+        for session_dir in sorted(root.iterdir()):
+            if not session_dir.is_dir():
+                continue
+            on_disk.add(session_dir.name)
+            try:
+                if self.index_session(session_dir):
+                    stats["indexed"] += 1
+                else:
+                    stats["unchanged"] += 1
+            except Exception as e:
+                print(f"[!] Failed to index {session_dir.name}: {e}")
+
+        with self._connect() as conn:
+            known = [row["id"] for row in conn.execute("SELECT id FROM indexed_sessions")]
+        for session_id in known:
+            if session_id not in on_disk:
+                self.remove_session(session_id)
+                stats["removed"] += 1
+
+        return stats
+
+    def rebuild(self, logs_dir: Optional[str] = None) -> Dict[str, int]:
+        """Drop the whole index and re-read every session."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM documents")
+            conn.execute("DELETE FROM indexed_sessions")
+        return self.update(logs_dir)
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        kinds: Optional[Sequence[str]] = None,
+        session_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Ranked full-text search across all indexed sessions.
+
+        Args:
+            query: Free-text query (terms are AND-ed; "term*" for prefix)
+            limit: Maximum hits to return
+            offset: Hits to skip
+            kinds: Restrict to these document kinds (see DOCUMENT_KINDS)
+            session_id: Restrict to a single session
+
+        Returns:
+            List of hits, best first, each with session_id, kind, phase,
+            speaker, turn, snippet and score (lower bm25 = better match)
+        """
+        match = to_match_query(query)
+        if not match:
+            return []
+
+        clauses = ["documents MATCH ?"]
+        params: List[Any] = [match]
+        if kinds:
+            clauses.append(f"kind IN ({', '.join('?' for _ in kinds)})")
+            params.extend(kinds)
+        if session_id:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT session_id, kind, phase, speaker, turn, "
+                "snippet(documents, 0, '[', ']', '...', 16) AS snippet, "
+                "bm25(documents) AS score "
+                f"FROM documents WHERE {' AND '.join(clauses)} "
+                "ORDER BY score LIMIT ? OFFSET ?",
+                params + [int(limit), int(offset)],
+            ).fetchall()
+
+        return [dict(row) for row in rows]
+
+    def document_count(self) -> int:
+        """Return the number of indexed documents."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cross-session full-text search index")
+    parser.add_argument("--logs-dir", default="conversation_logs", help="Session logs folder")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("update", help="Index new or changed sessions")
+    subparsers.add_parser("rebuild", help="Drop and rebuild the whole index")
+    search_parser = subparsers.add_parser("search", help="Search all sessions")
+    search_parser.add_argument("query", help="Search terms")
+    search_parser.add_argument("--limit", type=int, default=20)
+    search_parser.add_argument("--kind", action="append", choices=DOCUMENT_KINDS, help="Restrict to a document kind")
+
+    args = parser.parse_args()
+    index = SearchIndex.for_logs_dir(args.logs_dir)
+
+    if args.command == "rebuild":
+        stats = index.rebuild(args.logs_dir)
+        print(f"[OK] Rebuilt index: {stats['indexed']} session(s), {index.document_count()} document(s)")
+    elif args.command == "update":
+        stats = index.update(args.logs_dir)
+        print(f"[OK] Indexed {stats['indexed']}, removed {stats['removed']}, unchanged {stats['unchanged']}")
+    elif args.command == "search":
+        index.update(args.logs_dir)
+        hits = index.search(args.query, limit=args.limit, kinds=args.kind)
+        if not hits:
+            print(f"[!] No matches found for '{args.query}'")
+        for hit in hits:
+            where = " / ".join(str(x) for x in (hit["phase"], hit["speaker"]) if x)
+            print(f"  {hit['session_id']} [{hit['kind']}] {where}")
+            print(f"    {hit['snippet']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""
+SessionCatalog - SQLite index of every logged conversation session
+
+Keeps one row per session folder under conversation_logs/ so that listing,
+filtering and paginating past sessions does not require opening every
+session_metadata.json on each request.
+
+The catalog is updated by ConversationLogger.save_all() at the end of every
+run. Sessions logged before the catalog existed can be backfilled with:
+
+    python -m framework.session_catalog reindex --logs-dir conversation_logs
+"""
+
+import argparse
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+CATALOG_FILENAME = "catalog.db"
+
+# Columns that may be used for ORDER BY (whitelist — never interpolate user input)
+SORTABLE_COLUMNS = ("timestamp", "mode", "model", "turn_count", "token_count", "idea_count")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id              TEXT PRIMARY KEY,
+    timestamp       TEXT,
+    session_start   TEXT,
+    session_end     TEXT,
+    mode            TEXT,
+    model           TEXT,
+    domain          TEXT,
+    inspiration     TEXT,
+    number_of_ideas INTEGER,
+    turn_count      INTEGER NOT NULL DEFAULT 0,
+    token_count     INTEGER NOT NULL DEFAULT 0,
+    idea_count      INTEGER NOT NULL DEFAULT 0,
+    outcome         TEXT,
+    session_dir     TEXT,
+    indexed_at      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_timestamp ON sessions (timestamp);
+CREATE INDEX IF NOT EXISTS idx_sessions_mode ON sessions (mode);
+CREATE INDEX IF NOT EXISTS idx_sessions_model ON sessions (model);
+CREATE INDEX IF NOT EXISTS idx_sessions_outcome ON sessions (outcome);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def session_file(session_dir: Path, filename: str) -> Path:
+    """
+    Locate a session log file, supporting both folder layouts.
+
+    Current sessions keep JSON files under metadata/; older sessions wrote
+    them directly into the session folder.
+    """
+    nested = session_dir / "metadata" / filename
+    if nested.exists():
+        return nested
+    return session_dir / filename
+
+
+def session_outcome(metadata: Dict[str, Any]) -> str:
+    """
+    Derive a coarse outcome label from session metadata.
+
+    Returns one of: the explicit "outcome" metadata value if set, "error",
+    "complete", "no_ideas" or "incomplete".
+    """
+    if metadata.get("outcome"):
+        return str(metadata["outcome"])
+    if metadata.get("convergence_error"):
+        return "error"
+    if metadata.get("ideas"):
+        return "complete"
+    if "ideas" in metadata:
+        return "no_ideas"
+    return "incomplete"
+
+
+def build_session_record(
+    session_id: str,
+    session_dir: Path,
+    metadata: Dict[str, Any],
+    exchanges: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Build a catalog row from in-memory session data.
+
+    Token counts use the same ~4 chars/token estimate as ConversationAnalytics.
+
+    Args:
+        session_id: Session folder name (e.g., "session_20251028_201033")
+        session_dir: Path to the session folder
+        metadata: Contents of session_metadata.json
+        exchanges: Contents of full_conversation.json
+
+    Returns:
+        Dict with one value per catalog column
+    """
+    ideas = metadata.get("ideas") or []
+    return {
+        "id": session_id,
+        "timestamp": metadata.get("timestamp"),
+        "session_start": metadata.get("session_start"),
+        "session_end": metadata.get("session_end"),
+        "mode": metadata.get("mode"),
+        "model": metadata.get("model"),
+        "domain": metadata.get("domain"),
+        "inspiration": str(metadata.get("inspiration", "")),
+        "number_of_ideas": metadata.get("number_of_ideas"),
+        "turn_count": len(exchanges),
+        "token_count": sum(len(ex.get("content", "")) // 4 for ex in exchanges),
+        "idea_count": len(ideas) if isinstance(ideas, list) else 0,
+        "outcome": session_outcome(metadata),
+        "session_dir": str(session_dir),
+        "indexed_at": datetime.now().isoformat(),
+    }
+
+
+class SessionCatalog:
+    """
+    SQLite-backed catalog of logged sessions.
+
+    Each call opens its own short-lived connection, so a single catalog can be
+    shared between the dashboard event loop, worker threads and the logger.
+
+    Example:
+        >>> catalog = SessionCatalog.for_logs_dir("conversation_logs")
+        >>> catalog.reindex()
+        >>> page = catalog.query(limit=20, mode="medium", sort="turn_count")
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the catalog, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_logs_dir(cls, logs_dir: str = "conversation_logs") -> 'SessionCatalog':
+        """Create the catalog stored alongside a conversation_logs/ folder."""
+        return cls(str(Path(logs_dir) / CATALOG_FILENAME))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def upsert(self, record: Dict[str, Any]) -> None:
+        """
+        Insert or replace a single session row.
+
+        Args:
+            record: Dict produced by build_session_record()
+        """
+        columns = list(record.keys())
+        placeholders = ", ".join("?" for _ in columns)
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO sessions ({', '.join(columns)}) VALUES ({placeholders})",
+                [record[c] for c in columns],
+            )
+
+    def index_session_dir(self, session_dir: Path) -> bool:
+        """
+        Read a session folder from disk and upsert its catalog row.
+
+        Args:
+            session_dir: Path to a session folder
+
+        Returns:
+            True if the folder contained session metadata and was indexed
+        """
+        session_dir = Path(session_dir)
+        meta_file = session_file(session_dir, "session_metadata.json")
+        if not meta_file.exists():
+            return False
+
+        with open(meta_file, encoding="utf-8") as f:
+            metadata = json.load(f)
+
+        exchanges: List[Dict[str, Any]] = []
+        conv_file = session_file(session_dir, "full_conversation.json")
+        if conv_file.exists():
+            with open(conv_file, encoding="utf-8") as f:
+                exchanges = json.load(f)
+
+        self.upsert(build_session_record(session_dir.name, session_dir, metadata, exchanges))
+        return True
+
+    def reindex(self, logs_dir: Optional[str] = None, prune: bool = True) -> int:
+        """
+        Backfill the catalog from every session folder on disk.
+
+        Args:
+            logs_dir: Folder containing session folders (defaults to the
+                folder holding the catalog database)
+            prune: If True, remove rows whose session folder no longer exists
+
+        Returns:
+            Number of sessions indexed
+        """
+        root = Path(logs_dir) if logs_dir else self.db_path.parent
+        if not root.exists():
+            return 0
+
+        indexed = 0
+        seen = set()
+        for session_dir in sorted(root.iterdir()):
+            if not session_dir.is_dir():
+                continue
+            try:
+                if self.index_session_dir(session_dir):
+                    indexed += 1
+                    seen.add(session_dir.name)
+            except Exception as e:
+                print(f"[!] Failed to index {session_dir.name}: {e}")
+
+        with self._connect() as conn:
+            if prune:
+                stale = [
+                    row["id"] for row in conn.execute("SELECT id FROM sessions")
+                    if row["id"] not in seen
+                ]
+                conn.executemany("DELETE FROM sessions WHERE id = ?", [(s,) for s in stale])
+            conn.execute(
+                "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('backfilled_at', ?)",
+                (datetime.now().isoformat(),),
+            )
+
+        return indexed
+
+    def delete(self, session_id: str) -> None:
+        """Remove a session row."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return one session row as a dict, or None."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return dict(row) if row else None
+
+    def query(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        mode: Optional[str] = None,
+        model: Optional[str] = None,
+        domain: Optional[str] = None,
+        outcome: Optional[str] = None,
+        q: Optional[str] = None,
+        sort: str = "timestamp",
+        order: str = "desc",
+    ) -> Dict[str, Any]:
+        """
+        Return one page of sessions matching the given filters.
+
+        Args:
+            limit: Maximum rows to return
+            offset: Rows to skip
+            mode: Exact run mode filter
+            model: Exact model filter
+            domain: Exact domain filter
+            outcome: Exact outcome filter
+            q: Case-insensitive substring filter on inspiration
+            sort: Column to sort by (see SORTABLE_COLUMNS)
+            order: "asc" or "desc"
+
+        Returns:
+            {"sessions": [...], "total": int, "limit": int, "offset": int}
+        """
+        if sort not in SORTABLE_COLUMNS:
+            raise ValueError(f"Unknown sort column '{sort}'. Valid: {list(SORTABLE_COLUMNS)}")
+        direction = "ASC" if str(order).lower() == "asc" else "DESC"
+
+        clauses = []
+        params: List[Any] = []
+        for column, value in (("mode", mode), ("model", model), ("domain", domain), ("outcome", outcome)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if q:
+            clauses.append("LOWER(inspiration) LIKE ?")
+            params.append(f"%{q.lower()}%")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM sessions {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT * FROM sessions {where} ORDER BY {sort} {direction}, id {direction} "
+                f"LIMIT ? OFFSET ?",
+                params + [int(limit), int(offset)],
+            ).fetchall()
+
+        return {
+            "sessions": [dict(row) for row in rows],
+            "total": total,
+            "limit": int(limit),
+            "offset": int(offset),
+        }
+
+    def is_backfilled(self) -> bool:
+        """
+        Whether reindex() has ever run on this catalog.
+
+        The logger creates the database when it saves its first session, so
+        the file existing does not mean older sessions were indexed.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'backfilled_at'").fetchone()
+        return row is not None
+
+    def count(self) -> int:
+        """Return the number of catalogued sessions."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage the conversation session catalog")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reindex_parser = subparsers.add_parser("reindex", help="Backfill the catalog from session folders")
+    reindex_parser.add_argument("--logs-dir", default="conversation_logs", help="Session logs folder")
+    reindex_parser.add_argument("--db", default=None, help="Catalog database path (default: <logs-dir>/catalog.db)")
+
+    args = parser.parse_args()
+
+    if args.command == "reindex":
+        catalog = SessionCatalog(args.db) if args.db else SessionCatalog.for_logs_dir(args.logs_dir)
+        indexed = catalog.reindex(args.logs_dir)
+        print(f"[OK] Indexed {indexed} session(s) into {catalog.db_path}")
+
+
+if __name__ == "__main__":
+    main()
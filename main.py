@@ -3,6 +3,7 @@ from pprint import pprint
 import json
 import argparse
 import os
+import signal
 import sys
 
 # Force UTF-8 stdout to prevent charmap encoding errors on Windows
@@ -13,6 +14,8 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+from framework.cancellation import CancellationToken, RunCancelled
+from framework.checkpoint import RunCheckpoint
 from src.idea_generation.generator import multiple_llm_idea_generator
 from src.stages.spec_generation import make_initial_prompt
 # from src.stages.design_generation import create_initial_design  # Stage 3 not needed for this test
@@ -96,6 +99,12 @@ Examples:
   python main.py --mode fast       # Run in fast mode
   python main.py --mode standard   # Run in standard mode
   python main.py --mode deep       # Run in deep mode
+  python main.py --deadline 600    # Stop after 10 minutes, keeping partial logs
+  python main.py --resume session_20250101_120000   # Continue from the last checkpoint
+  python main.py --checkpoint-every 5               # Also checkpoint every 5 turns
+  python main.py --fresh-phases                     # Regenerate the cached phase plan
+
+Press Ctrl-C once to stop gracefully (partial logs are saved), twice to abort.
         """
     )
     parser.add_argument(
@@ -105,14 +114,72 @@ Examples:
         choices=["fast", "medium", "standard", "deep"],
         help="Run mode (can also be set via ASSEMBLY_MODE env var)"
     )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Wall-clock limit for the run; partial results and logs are saved when it expires"
+    )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="SESSION_ID",
+        help="Continue a stopped or crashed run from its last checkpoint (folder name under conversation_logs/)"
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=None,
+        metavar="TURNS",
+        help="Checkpoint every N turns within a phase (phase boundaries are always checkpointed)"
+    )
+    parser.add_argument(
+        "--fresh-phases",
+        action="store_true",
+        help="Generate a new phase plan instead of reusing the one cached for this inspiration"
+    )
     args = parser.parse_args()
 
+    if args.resume and not RunCheckpoint.exists(os.path.join("conversation_logs", args.resume)):
+        print(f"[!] No checkpoint found for session '{args.resume}' in conversation_logs/")
+        return
+
+    cancel_token = CancellationToken(timeout=args.deadline)
+
+    def request_stop(signum, frame):
+        # First Ctrl-C stops cooperatively; a second one aborts immediately
+        print("\n[!] Stopping after the current step (Ctrl-C again to abort)...")
+        cancel_token.cancel()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    signal.signal(signal.SIGINT, request_stop)
+
     print(f"\n{'='*60}")
     print(f"ASSEMBLY - AI-Powered Startup Idea Generator")
-    print(f"Mode: {args.mode.upper()}")
+    if args.resume:
+        print(f"Resuming: {args.resume}")
+    else:
+        print(f"Mode: {args.mode.upper()}")
+    if args.deadline:
+        print(f"Deadline: {args.deadline:.0f}s")
     print(f"{'='*60}\n")
 
-    ideas = multiple_llm_idea_generator(INSPIRATION, number_of_ideas=3, mode=args.mode)
+    try:
+        ideas = multiple_llm_idea_generator(
+            INSPIRATION, number_of_ideas=3, mode=args.mode, cancel_token=cancel_token,
+            resume_session=args.resume, checkpoint_every=args.checkpoint_every,
+            fresh_phases=args.fresh_phases,
+        )
+    except RunCancelled as exc:
+        print(f"\n[!] {exc} after {exc.partial.get('turns', 0)} exchanges")
+        print(f"    Partial logs: {exc.partial.get('session_dir') or 'meeting_logs.txt'}")
+        if exc.partial.get("resumable_session"):
+            print(f"    Resume with: python main.py --resume {exc.partial['resumable_session']}")
+        print("\n--- PARTIAL IDEAS ---")
+        pprint(exc.partial.get("ideas", []))
+        return
 
     print("\n--- IDEAS ---")
     pprint(ideas)
@@ -4,12 +4,12 @@ Assembly Dashboard — Benchmark registry and runner.
 BENCHMARKS   : metadata list describing every benchmark (id, name, params, …)
 get_benchmark_results(id) : load the most-recent saved result file, or None
 run_benchmark(id, queue, loop, params) : execute in the calling thread (use
-    run_in_executor), streaming print() output to the asyncio queue.
+    run_in_executor), streaming print() and logging output to the asyncio
+    queue. Output is routed per job (see output_routing.py), so any number of
+    benchmarks can run side by side.
 """
 
-import contextlib
 import glob
-import io
 import json
 import time
 import traceback
@@ -18,6 +18,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 import asyncio
 
+from benchmarks.harness import cell_key
+from src.dashboard.output_routing import OutputRoute, route_output
+
 
 # ---------------------------------------------------------------------------
 # Registry
@@ -53,6 +56,7 @@ BENCHMARKS: List[Dict[str, Any]] = [
                 "default": "fast",
                 "label": "Assembly mode",
             },
+            "parallel": {"type": "int", "default": 3, "label": "Parallel cells", "min": 1, "max": 8},
         },
         "results_dir": "benchmarks/phase_1_system_validity/results",
         "results_pattern": "reliability_test_*.json",
@@ -121,6 +125,7 @@ BENCHMARKS: List[Dict[str, Any]] = [
                 "default": "fast",
                 "label": "Assembly mode",
             },
+            "parallel": {"type": "int", "default": 3, "label": "Parallel cells", "min": 1, "max": 8},
         },
         "results_dir": "benchmarks/phase_2_quality_vs_single_llm/results",
         "results_pattern": "comparison_results_*_scored.json",
@@ -155,6 +160,7 @@ BENCHMARKS: List[Dict[str, Any]] = [
                 "default": "fast",
                 "label": "Assembly mode",
             },
+            "parallel": {"type": "int", "default": 3, "label": "Parallel cells", "min": 1, "max": 8},
         },
         "results_dir": "benchmarks/phase_2_quality_vs_single_llm/results",
         "results_pattern": "three_way_comparison_*_scored.json",
@@ -185,7 +191,10 @@ BENCHMARKS: List[Dict[str, Any]] = [
             "same idea surfaces without development), dead-end recovery (how often "
             "the conversation escapes stuck or circular patterns), and concept density "
             "(unique concepts introduced per turn — higher means the conversation is "
-            "covering more ground per token spent)."
+            "covering more ground per token spent). Every LLM request of each run is "
+            "metered for real prompt/completion tokens, call count and per-turn "
+            "latency, and the configs are placed on a quality-vs-tokens Pareto "
+            "frontier with a budget and a quality tier."
         ),
         "params": {
             "domains": {
@@ -200,10 +209,83 @@ BENCHMARKS: List[Dict[str, Any]] = [
                 "default": "medium",
                 "label": "Assembly mode",
             },
+            "parallel": {"type": "int", "default": 3, "label": "Parallel cells", "min": 1, "max": 8},
         },
         "results_dir": "benchmarks/memory_system/results",
         "results_pattern": "memory_benchmark_*.json",
     },
+    {
+        "id": "performance",
+        "name": "Pipeline Performance",
+        "category": "Performance",
+        "description": (
+            "The other benchmarks measure whether Assembly's output is good; this one "
+            "measures what it costs to produce. A run makes dozens of LLM calls per "
+            "phase, and overhead between them — prompt building, summary and belief "
+            "updates, idea tracking, logging — adds up as modes get deeper. Knowing "
+            "where each turn's time and tokens go shows which optimisations matter and "
+            "catches regressions before they reach real (paid, slow) API runs."
+        ),
+        "how_it_runs": (
+            "Runs the real meeting loop once per selected mode with every OpenAI client "
+            "replaced by a deterministic simulated backend (fixed latency per call, "
+            "replies seeded from the prompt), so runs are free and repeatable. Each "
+            "turn's wall time is split by stage (facilitator decision, persona response, "
+            "mediator, shared memory, everything else), and LLM calls and prompt tokens "
+            "are counted per turn. Peak RSS and event-loop blocking time (how late a "
+            "probe task sleeping in 5 ms steps wakes up) are reported per mode."
+        ),
+        "params": {
+            "modes": {
+                "type": "multiselect",
+                "options": ["fast", "medium", "standard", "deep"],
+                "default": ["fast", "medium"],
+                "label": "Modes",
+            },
+            "latency_ms": {"type": "int", "default": 20, "label": "Simulated latency per call (ms)", "min": 0, "max": 2000},
+        },
+        "results_dir": "benchmarks/performance/results",
+        "results_pattern": "performance_benchmark_*.json",
+    },
+    {
+        "id": "scaling",
+        "name": "Persona & Turn Scaling",
+        "category": "Performance",
+        "description": (
+            "Per-turn work grows with the number of personas (one summary update "
+            "each, every belief state in the mediator prompt) and with meeting length "
+            "(history and shared context get longer every turn). This benchmark shows "
+            "how latency, tokens and memory grow along each dimension and flags any "
+            "component whose cost grows faster than linearly, before deeper modes or "
+            "larger panels make it expensive."
+        ),
+        "how_it_runs": (
+            "Runs a single medium-mode debate phase on the simulated backend, sweeping "
+            "personas per phase (2 → 10 at 10 turns) and max turns (3 → 30 at 4 "
+            "personas). Each point records turn latency, tokens and calls per LLM call "
+            "kind and stage time, plus peak Python heap from a separate tracemalloc "
+            "pass. Each component's run total is fitted as cost ~ x^k; k above 1.2 is "
+            "flagged as superlinear. An HTML report with the growth curves is saved "
+            "next to the JSON."
+        ),
+        "params": {
+            "sweeps": {
+                "type": "multiselect",
+                "options": ["personas", "turns"],
+                "default": ["personas", "turns"],
+                "label": "Sweeps",
+            },
+            "memory_mode": {
+                "type": "select",
+                "options": ["structured", "full_history"],
+                "default": "structured",
+                "label": "Memory mode",
+            },
+            "latency_ms": {"type": "int", "default": 5, "label": "Simulated latency per call (ms)", "min": 0, "max": 2000},
+        },
+        "results_dir": "benchmarks/performance/results",
+        "results_pattern": "scaling_benchmark_*.json",
+    },
 ]
 
 
@@ -217,13 +299,15 @@ def get_benchmark_results(benchmark_id: str) -> Optional[Dict[str, Any]]:
     if not bm:
         return None
     pattern = str(Path(bm["results_dir"]) / bm["results_pattern"])
-    files = sorted(glob.glob(pattern))
-    if not files:
-        return None
-    with open(files[-1], encoding="utf-8") as f:
-        data = json.load(f)
-    data["_result_file"] = files[-1]
-    return data
+    for path in sorted(glob.glob(pattern), reverse=True):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        # Checkpoint of a benchmark that is still running (or was interrupted)
+        if data.get("status") == "in_progress":
+            continue
+        data["_result_file"] = path
+        return data
+    return None
 
 
 def list_all_results(benchmark_id: str) -> List[Dict[str, Any]]:
@@ -249,28 +333,16 @@ def list_all_results(benchmark_id: str) -> List[Dict[str, Any]]:
 
 
 # ---------------------------------------------------------------------------
-# Queue writer — thread-safe stdout redirect
+# Queue route — this job's print()/logging output as benchmark_log events
 # ---------------------------------------------------------------------------
 
-class _QueueWriter(io.TextIOBase):
-    def __init__(self, queue: asyncio.Queue, loop: asyncio.AbstractEventLoop):
-        self._q = queue
-        self._loop = loop
-
-    def write(self, s: str) -> int:
-        stripped = s.rstrip("\n")
-        if stripped:
-            try:
-                self._loop.call_soon_threadsafe(
-                    self._q.put_nowait,
-                    {"type": "benchmark_log", "line": stripped, "ts": time.time()},
-                )
-            except Exception:
-                pass
-        return len(s)
-
-    def flush(self):
-        pass
+def _queue_route(queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> OutputRoute:
+    def emit_line(line: str) -> None:
+        loop.call_soon_threadsafe(
+            queue.put_nowait,
+            {"type": "benchmark_log", "line": line, "ts": time.time()},
+        )
+    return OutputRoute(emit_line)
 
 
 # ---------------------------------------------------------------------------
@@ -282,13 +354,16 @@ def run_benchmark(
     queue: asyncio.Queue,
     loop: asyncio.AbstractEventLoop,
     params: Dict[str, Any],
-) -> None:
+) -> Optional[Dict[str, Any]]:
     """
     Execute the requested benchmark in the calling thread (intended for
-    loop.run_in_executor).  Streams print() output to *queue* and emits a
-    benchmark_complete or benchmark_error event when done.
+    loop.run_in_executor).  Streams this job's print() and logging output to
+    *queue* and emits a benchmark_complete or benchmark_error event when done.
+
+    Returns:
+        The benchmark result, or None if it failed (reported as benchmark_error)
     """
-    writer = _QueueWriter(queue, loop)
+    route = _queue_route(queue, loop)
 
     def emit(event: Dict[str, Any]) -> None:
         try:
@@ -299,12 +374,13 @@ def run_benchmark(
     bm = next((b for b in BENCHMARKS if b["id"] == benchmark_id), None)
     if not bm:
         emit({"type": "benchmark_error", "message": f"Unknown benchmark '{benchmark_id}'"})
-        return
+        return None
 
     try:
-        with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
+        with route_output(route):
             result = _dispatch(benchmark_id, params)
         emit({"type": "benchmark_complete", "result": result, "ts": time.time()})
+        return result
     except Exception as exc:
         emit({
             "type": "benchmark_error",
@@ -312,6 +388,7 @@ def run_benchmark(
             "detail": traceback.format_exc(),
             "ts": time.time(),
         })
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -329,6 +406,10 @@ def _dispatch(benchmark_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
         return _run_phase2_three_way(params)
     if benchmark_id == "memory_benchmark":
         return _run_memory_benchmark(params)
+    if benchmark_id == "performance":
+        return _run_performance(params)
+    if benchmark_id == "scaling":
+        return _run_scaling(params)
     raise ValueError(f"Unknown benchmark id: {benchmark_id}")
 
 
@@ -344,6 +425,39 @@ def _model_for_mode(mode: str) -> str:
         return "gpt-5.1"
 
 
+def _score_ideas(
+    comparisons: List[Dict[str, Any]], approaches, model: str, max_workers: int, cache_dir: str,
+) -> Dict[str, Any]:
+    """
+    Judge every (comparison, approach) idea, max_workers judge calls at a time.
+    Verdicts are cached in cache_dir (the results directory).
+
+    Returns:
+        {cell_key(comparison index, approach): IdeaScore}
+    """
+    from benchmarks.harness import run_cells
+    from benchmarks.phase_2_quality_vs_single_llm.scoring import score_idea_llm
+
+    cells = [
+        {
+            "key": cell_key(index, approach),
+            "idea": (comp.get(approach) or {}).get("idea") or {},
+            "inspiration": comp.get("inspiration", ""),
+        }
+        for index, comp in enumerate(comparisons)
+        for approach in approaches
+    ]
+    scores = run_cells(
+        cells,
+        lambda cell: score_idea_llm(cell["idea"], cell["inspiration"], model, cache_dir=cache_dir),
+        max_workers=max_workers,
+    )
+    failed = [key for key, score in scores.items() if isinstance(score, dict)]
+    if failed:
+        raise RuntimeError(f"Judge failed for {len(failed)} idea(s): {scores[failed[0]]['error']}")
+    return scores
+
+
 def _run_phase1_reliability(params: Dict[str, Any]) -> Dict[str, Any]:
     from benchmarks.phase_1_system_validity.test_end_to_end_reliability import run_reliability_test
     from benchmarks.phase_1_system_validity.prompts import STANDARD_INSPIRATION
@@ -356,6 +470,7 @@ def _run_phase1_reliability(params: Dict[str, Any]) -> Dict[str, Any]:
         num_runs=int(params.get("num_runs", 3)),
         mode=mode,
         output_dir="benchmarks/phase_1_system_validity/results",
+        max_workers=int(params.get("parallel", 3)),
     )
 
 
@@ -395,12 +510,13 @@ def _run_phase2_two_way(params: Dict[str, Any]) -> Dict[str, Any]:
     from benchmarks.phase_2_quality_vs_single_llm.test_assembly_vs_baseline import run_comparison
     from benchmarks.phase_2_quality_vs_single_llm.prompts import BENCHMARK_PROMPTS
     from benchmarks.phase_2_quality_vs_single_llm.scoring import (
-        score_idea_llm, compare_scores, aggregate_results, check_phase2_gate,
+        compare_scores, aggregate_results, check_phase2_gate,
     )
 
     mode = params.get("assembly_mode", "fast")
     model = _model_for_mode(mode)
     num_prompts = int(params.get("num_prompts", 3))
+    parallel = int(params.get("parallel", 3))
     selected = BENCHMARK_PROMPTS[:num_prompts]
 
     output_dir = "benchmarks/phase_2_quality_vs_single_llm/results"
@@ -413,16 +529,16 @@ def _run_phase2_two_way(params: Dict[str, Any]) -> Dict[str, Any]:
         mode=mode,
         output_dir=output_dir,
         anonymize=True,
+        max_workers=parallel,
     )
 
     print("Scoring with LLM judge…")
+    comparisons = results.get("comparisons", [])
+    scores = _score_ideas(comparisons, ("assembly", "baseline"), model, parallel, cache_dir=output_dir)
     scored_comparisons = []
-    for comp in results.get("comparisons", []):
-        insp = comp.get("inspiration", "")
-        assembly_idea = (comp.get("assembly") or {}).get("idea") or {}
-        baseline_idea = (comp.get("baseline") or {}).get("idea") or {}
-        score_assembly = score_idea_llm(assembly_idea, insp, model)
-        score_baseline = score_idea_llm(baseline_idea, insp, model)
+    for index, comp in enumerate(comparisons):
+        score_assembly = scores[cell_key(index, "assembly")]
+        score_baseline = scores[cell_key(index, "baseline")]
         comparison = compare_scores(score_assembly, score_baseline)
         scored_comparisons.append({
             **comp,
@@ -452,12 +568,13 @@ def _run_phase2_three_way(params: Dict[str, Any]) -> Dict[str, Any]:
     from benchmarks.phase_2_quality_vs_single_llm.test_assembly_vs_baseline import run_three_way_comparison
     from benchmarks.phase_2_quality_vs_single_llm.prompts import BENCHMARK_PROMPTS
     from benchmarks.phase_2_quality_vs_single_llm.scoring import (
-        score_idea_llm, compare_n_scores, aggregate_n_way_results,
+        compare_n_scores, aggregate_n_way_results,
     )
 
     mode = params.get("assembly_mode", "fast")
     model = _model_for_mode(mode)
     num_prompts = int(params.get("num_prompts", 3))
+    parallel = int(params.get("parallel", 3))
     selected = BENCHMARK_PROMPTS[:num_prompts]
 
     output_dir = "benchmarks/phase_2_quality_vs_single_llm/results"
@@ -470,18 +587,17 @@ def _run_phase2_three_way(params: Dict[str, Any]) -> Dict[str, Any]:
         mode=mode,
         output_dir=output_dir,
         anonymize=True,
+        max_workers=parallel,
     )
 
     print("Scoring with LLM judge…")
     approach_mapping = {"assembly": "Assembly", "single_shot": "Single-shot GPT", "iterative": "Iterative GPT"}
+    comparisons = results.get("comparisons", [])
+    approaches = ("assembly", "single_shot", "iterative")
+    all_scores = _score_ideas(comparisons, approaches, model, parallel, cache_dir=output_dir)
     scored_comparisons = []
-    for comp in results.get("comparisons", []):
-        insp = comp.get("inspiration", "")
-        scores = {}
-        for key in ("assembly", "single_shot", "iterative"):
-            idea = (comp.get(key) or {}).get("idea") or {}
-            s = score_idea_llm(idea, insp, model)
-            scores[key] = s
+    for index, comp in enumerate(comparisons):
+        scores = {key: all_scores[cell_key(index, key)] for key in approaches}
         n_comp = compare_n_scores(scores)
         scored_comparisons.append({**comp, "n_way_scores": n_comp})
 
@@ -513,4 +629,42 @@ def _run_memory_benchmark(params: Dict[str, Any]) -> Dict[str, Any]:
         assembly_mode=mode,
         judge_model=_model_for_mode(mode),
         output_dir=output_dir,
+        max_workers=int(params.get("parallel", 3)),
+    )
+
+
+def _run_performance(params: Dict[str, Any]) -> Dict[str, Any]:
+    from benchmarks.performance.run_performance_benchmark import run_performance_benchmark
+
+    modes = params.get("modes", ["fast", "medium"])
+    if isinstance(modes, str):
+        modes = [modes]
+
+    output_dir = "benchmarks/performance/results"
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    print(f"Profiling modes: {modes} against the simulated LLM backend…")
+    return run_performance_benchmark(
+        modes=modes,
+        latency_ms=float(params.get("latency_ms", 20)),
+        output_dir=output_dir,
+    )
+
+
+def _run_scaling(params: Dict[str, Any]) -> Dict[str, Any]:
+    from benchmarks.performance.run_scaling_benchmark import run_scaling_benchmark
+
+    sweeps = params.get("sweeps", ["personas", "turns"])
+    if isinstance(sweeps, str):
+        sweeps = [sweeps]
+
+    output_dir = "benchmarks/performance/results"
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    print(f"Sweeping {sweeps} against the simulated LLM backend…")
+    return run_scaling_benchmark(
+        sweeps=sweeps,
+        latency_ms=float(params.get("latency_ms", 5)),
+        memory_mode=params.get("memory_mode"),
+        output_dir=output_dir,
     )
@@ -0,0 +1,162 @@
+"""
+Delta encoding for dashboard snapshot events.
+
+Some monitor hooks (persona states, nuances, mediator log) resend their whole
+state every turn, so bandwidth and browser work grow quadratically over a
+long run. DeltaEncoder remembers the last document sent on each stream and
+returns a JSON-patch-style diff instead (RFC 6902 subset: add / remove /
+replace). It sends a full keyframe on the first event, every
+`keyframe_interval` events, and whenever the patch would be bigger than the
+document. Keyframes let late joiners and clients that missed a base resync.
+
+Each encoded event carries a per-stream `version`; deltas also carry
+`base_version`, and a client that doesn't hold that version ignores deltas
+until the next keyframe.
+
+Example:
+    >>> encoder = DeltaEncoder(keyframe_interval=20)
+    >>> encoder.encode("nuances", ["a"])
+    {'keyframe': True, 'version': 1, 'state': ['a']}
+    >>> encoder.encode("nuances", ["a", "b"])
+    {'keyframe': False, 'version': 2, 'base_version': 1, 'patch': [{'op': 'add', 'path': '/-', 'value': 'b'}]}
+"""
+
+import json
+import os
+from typing import Any, Dict, List
+
+Patch = List[Dict[str, Any]]
+
+
+def _escape(token: str) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff(old: Any, new: Any, path: str = "") -> Patch:
+    """
+    JSON-patch operations that turn `old` into `new`.
+
+    Dicts are diffed per key, lists per index (appends use the "-" index),
+    anything else is replaced when unequal.
+    """
+    if old == new and type(old) is type(new):  # True == 1, but not in JSON
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: Patch = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff(old[key], value, child))
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        shared = min(len(old), len(new))
+        for index in range(shared):
+            ops.extend(diff(old[index], new[index], f"{path}/{index}"))
+        for value in new[shared:]:
+            ops.append({"op": "add", "path": f"{path}/-", "value": value})
+        # Remove from the end so earlier indexes stay valid
+        for index in range(len(old) - 1, shared - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+        return ops
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, patch: Patch) -> Any:
+    """
+    Apply JSON-patch operations (mutating containers in place).
+
+    Returns:
+        The patched document (a new object if the root was replaced)
+    """
+    for op in patch:
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        if not tokens:
+            document = op.get("value")  # Root replace
+            continue
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            if op["op"] == "remove":
+                del parent[int(last)]
+            elif last == "-":
+                parent.append(op["value"])
+            elif op["op"] == "add":
+                parent.insert(int(last), op["value"])
+            else:
+                parent[int(last)] = op["value"]
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return document
+
+
+class DeltaEncoder:
+    """Per-stream keyframe/delta encoder (one per run)."""
+
+    def __init__(self, keyframe_interval: int = 20):
+        """
+        Args:
+            keyframe_interval: Send a full keyframe at least every N events
+                per stream (1 = always send full snapshots)
+        """
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._last: Dict[str, Any] = {}
+        self._version: Dict[str, int] = {}
+        self._since_keyframe: Dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls) -> 'DeltaEncoder':
+        """Build an encoder from DASHBOARD_KEYFRAME_INTERVAL (default 20)."""
+        return cls(keyframe_interval=int(os.getenv("DASHBOARD_KEYFRAME_INTERVAL", "20")))
+
+    @staticmethod
+    def snapshot(document: Any) -> Any:
+        """
+        Deep copy through JSON: callers may mutate the live objects later,
+        and the client sees JSON types anyway.
+        """
+        return json.loads(json.dumps(document, default=str))
+
+    def encode(self, stream: str, document: Any, copy: bool = True) -> Dict[str, Any]:
+        """
+        Encode the latest `document` for `stream`.
+
+        Args:
+            stream: Stream name (versions are tracked per stream)
+            document: The full current state
+            copy: Snapshot the document first (pass False if it already is one)
+
+        Returns:
+            {"keyframe": True, "version", "state"} or
+            {"keyframe": False, "version", "base_version", "patch"}
+        """
+        if copy:
+            document = self.snapshot(document)
+        version = self._version.get(stream, 0) + 1
+        self._version[stream] = version
+
+        previous = self._last.get(stream)
+        self._last[stream] = document
+        since = self._since_keyframe.get(stream, 0) + 1
+
+        if previous is not None and since < self.keyframe_interval:
+            patch = diff(previous, document)
+            if len(json.dumps(patch)) < len(json.dumps(document)):
+                self._since_keyframe[stream] = since
+                return {"keyframe": False, "version": version, "base_version": version - 1, "patch": patch}
+
+        self._since_keyframe[stream] = 0
+        return {"keyframe": True, "version": version, "state": document}
@@ -7,16 +7,159 @@ JSON events onto a per-session asyncio.Queue (thread-safe via call_soon_threadsa
 DashboardLogger — ConversationLogger subclass that also pushes `message` and
 `prompt_input` events onto the same queue.
 
-Both are instantiated per-session by the FastAPI server and injected into
-multiple_llm_idea_generator().
+Both are instantiated per-session and injected into
+multiple_llm_idea_generator(). Events go to a "sink" callable: by default a
+thread-safe push onto the session queue, or, when the run executes in a
+scheduler worker process, a put onto the scheduler's cross-process event
+queue (see scheduler.py). The dashboard server appends scheduler events to a
+per-session SessionEventLog (see event_log.py) that WebSocket clients read
+from a cursor.
+
+Snapshot hooks (persona states, nuances, mediator log) are delta-encoded (see
+delta.py): a full keyframe event is followed by `<type>_delta` events that
+carry only a JSON patch against the previous version.
+
+Streamed turns arrive as `turn_delta` events (text chunks of the turn being
+generated) before the turn's complete `message` event.
+
+EventBatcher — a sink wrapper shared by the emitter and logger of a run. It
+collects events for a short window (or up to N events), keeps only the latest
+snapshot per stream within the window, and delivers one
+{"type": "batch", "events": [...]} item per window, so a busy run makes one
+cross-thread/process hop and one WebSocket frame per window instead of one per
+event.
 """
 
 import asyncio
+import os
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from framework.monitor import ConversationMonitor
 from framework.logger import ConversationLogger
+from src.dashboard.delta import DeltaEncoder
+
+EventSink = Callable[[Dict[str, Any]], None]
+
+
+def queue_sink(queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> EventSink:
+    """Build a sink that pushes events onto an asyncio.Queue owned by `loop`."""
+    def _sink(event: Dict[str, Any]) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, event)
+    return _sink
+
+
+class EventBatcher:
+    """
+    Thread-safe sink that delivers events to `sink` in batches.
+
+    Items are event dicts or zero-argument callables that build one (or return
+    None to skip); callables run at flush time on the flusher thread, in
+    submission order. Items added
+    with a `key` replace any earlier item with the same key in the window
+    (superseded snapshots), taking the later position.
+
+    Example:
+        >>> batcher = EventBatcher(emit, window=0.05, max_events=64)
+        >>> emitter = DashboardEventEmitter(sink=batcher)
+        >>> ...
+        >>> batcher.close()  # flush what's left
+    """
+
+    def __init__(self, sink: EventSink, window: float = 0.05, max_events: int = 64):
+        """
+        Args:
+            sink: Downstream sink; receives single events or batch events
+            window: Seconds to collect after the first event of a batch
+            max_events: Flush early once this many events are waiting
+        """
+        self.sink = sink
+        self.window = window
+        self.max_events = max(1, max_events)
+        self.stats = {"events": 0, "coalesced": 0, "frames": 0}
+
+        self._cond = threading.Condition()
+        self._items: Dict[Any, Union[Dict[str, Any], Callable[[], Dict[str, Any]]]] = {}
+        self._counter = 0
+        self._first_at = 0.0
+        self._closed = False
+        self._flusher = threading.Thread(target=self._run, name="event-batcher", daemon=True)
+        self._flusher.start()
+
+    @classmethod
+    def from_env(cls, sink: EventSink) -> 'EventBatcher':
+        """Build a batcher from DASHBOARD_BATCH_WINDOW_MS / DASHBOARD_BATCH_MAX_EVENTS."""
+        return cls(
+            sink,
+            window=float(os.getenv("DASHBOARD_BATCH_WINDOW_MS", "50")) / 1000.0,
+            max_events=int(os.getenv("DASHBOARD_BATCH_MAX_EVENTS", "64")),
+        )
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        self.add(event)
+
+    def add(self, item: Union[Dict[str, Any], Callable[[], Dict[str, Any]]], key: Optional[str] = None) -> None:
+        """Queue an event (or event factory); `key` coalesces superseded items."""
+        with self._cond:
+            if self._closed:
+                return
+            if not self._items:
+                self._first_at = time.monotonic()
+            self.stats["events"] += 1
+            if key is not None and ("key", key) in self._items:
+                del self._items[("key", key)]  # Re-insert at the end
+                self.stats["coalesced"] += 1
+            self._counter += 1
+            self._items[("key", key) if key is not None else self._counter] = item
+            if len(self._items) >= self.max_events:
+                self._cond.notify()
+            elif len(self._items) == 1:
+                self._cond.notify()
+
+    def close(self) -> None:
+        """Flush pending events and stop the flusher thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._flusher.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._items and not self._closed:
+                    self._cond.wait()
+                while not self._closed and len(self._items) < self.max_events:
+                    remaining = self._first_at + self.window - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                items, self._items = list(self._items.values()), {}
+                done = self._closed
+            if items:
+                self._deliver(items)
+            if done:
+                return
+
+    def _deliver(self, items: List[Any]) -> None:
+        events = []
+        for item in items:
+            try:
+                event = item() if callable(item) else item
+            except Exception:
+                continue  # A broken snapshot must not drop the rest of the batch
+            if event is not None:
+                events.append(event)
+        if not events:
+            return
+        self.stats["frames"] += 1
+        try:
+            if len(events) == 1:
+                self.sink(events[0])
+            else:
+                self.sink({"type": "batch", "events": events, "ts": time.time()})
+        except Exception:
+            pass  # Never let emission errors crash the generator
 
 
 class DashboardEventEmitter(ConversationMonitor):
@@ -25,26 +168,65 @@ class DashboardEventEmitter(ConversationMonitor):
     asyncio.Queue shared with the WebSocket handler.
 
     Because Assembly's generator runs inside asyncio.run() (a separate event
-    loop in a ThreadPoolExecutor thread), _emit() uses call_soon_threadsafe to
-    cross the thread boundary safely.
+    loop in another thread or process), events are handed to a sink rather
+    than put on the queue directly. Pass either queue + loop (thread-safe
+    call_soon_threadsafe push) or an explicit sink.
     """
 
-    def __init__(self, queue: asyncio.Queue, loop: asyncio.AbstractEventLoop):
+    def __init__(
+        self,
+        queue: Optional[asyncio.Queue] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        sink: Optional[EventSink] = None,
+    ):
         super().__init__(enable_display=False)  # silent — no console output
         self.queue = queue
         self.loop = loop
+        self.sink = sink or queue_sink(queue, loop)
+        self.deltas = DeltaEncoder.from_env()
+        # Streamed text not yet flushed by the batcher: key -> chunks
+        self._pending_deltas: Dict[str, List[str]] = {}
+        self._delta_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _emit(self, event: Dict[str, Any]) -> None:
-        """Thread-safe push to the asyncio queue living in the FastAPI loop."""
+        """Hand an event to the sink (never raises)."""
         try:
-            self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+            self.sink(event)
         except Exception:
             pass  # Never let emission errors crash the generator
 
+    def _emit_snapshot(self, event_type: str, state: Dict[str, Any], **fields: Any) -> None:
+        """
+        Emit a snapshot stream as a keyframe (`event_type` with the full state)
+        or as `<event_type>_delta` with a patch against the previous version.
+
+        With an EventBatcher sink only the latest snapshot per window is
+        encoded (at flush time), so the delta chain never skips a version.
+        """
+        state = self.deltas.snapshot(state)
+        ts = time.time()
+
+        def build() -> Dict[str, Any]:
+            encoded = self.deltas.encode(event_type, state, copy=False)
+            event: Dict[str, Any] = {"type": event_type, **fields, "version": encoded["version"]}
+            if encoded["keyframe"]:
+                event.update(encoded["state"])
+            else:
+                event["type"] = f"{event_type}_delta"
+                event["base_version"] = encoded["base_version"]
+                event["patch"] = encoded["patch"]
+            event["ts"] = ts
+            return event
+
+        if isinstance(self.sink, EventBatcher):
+            self.sink.add(build, key=event_type)
+        else:
+            self._emit(build())
+
     # ------------------------------------------------------------------
     # Existing ConversationMonitor hooks — emit events + keep base tracking
     # ------------------------------------------------------------------
@@ -84,6 +266,27 @@ class DashboardEventEmitter(ConversationMonitor):
             "ts": time.time(),
         })
 
+    def on_llm_call(
+        self,
+        site: str,
+        seconds: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        ok: bool = True,
+        ttft: Optional[float] = None,
+    ) -> None:
+        # Telemetry for the server's /metrics; not forwarded to browsers
+        super().on_llm_call(site, seconds, prompt_tokens, completion_tokens, ok, ttft)
+        self._emit({
+            "type": "llm_call",
+            "site": site,
+            "seconds": seconds,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "ok": ok,
+            "ttft": ttft,
+        })
+
     def on_phase_complete(
         self,
         phase_id: str,
@@ -145,11 +348,15 @@ class DashboardEventEmitter(ConversationMonitor):
         })
 
     def on_memory_update(self, shared_memory: str) -> None:
-        self._emit({
+        event = {
             "type": "memory_update",
             "shared_memory": shared_memory,
             "ts": time.time(),
-        })
+        }
+        if isinstance(self.sink, EventBatcher):
+            self.sink.add(event, key="memory_update")  # Only the latest per window matters
+        else:
+            self._emit(event)
 
     def on_idea_tracked(
         self,
@@ -180,50 +387,67 @@ class DashboardEventEmitter(ConversationMonitor):
             "ts": time.time(),
         })
 
+    def on_turn_delta(self, speaker: str, delta: str, phase_id: Optional[str] = None, turn: Optional[int] = None) -> None:
+        # With a batcher, chunks of one turn arriving within a window are
+        # merged into a single turn_delta event (built at flush time)
+        key = f"turn_delta:{phase_id}:{turn}:{speaker}"
+        if not isinstance(self.sink, EventBatcher):
+            self._emit({
+                "type": "turn_delta", "speaker": speaker, "phase_id": phase_id, "turn": turn,
+                "delta": delta, "ts": time.time(),
+            })
+            return
+
+        with self._delta_lock:
+            self._pending_deltas.setdefault(key, []).append(delta)
+
+        def build() -> Optional[Dict[str, Any]]:
+            with self._delta_lock:
+                text = "".join(self._pending_deltas.pop(key, []))
+            if not text:
+                return None  # Already sent by an earlier flush
+            return {
+                "type": "turn_delta", "speaker": speaker, "phase_id": phase_id, "turn": turn,
+                "delta": text, "ts": time.time(),
+            }
+
+        self.sink.add(build, key=key)
+
     def on_persona_states_update(self, phase_id: str, turn: int, personas: List[Dict]) -> None:
-        self._emit({
-            "type": "persona_states",
-            "phase_id": phase_id,
-            "turn": turn,
-            "personas": personas,
-            "ts": time.time(),
-        })
+        self._emit_snapshot("persona_states", {"personas": personas}, phase_id=phase_id, turn=turn)
 
     def on_nuances_update(self, nuances: List[str]) -> None:
-        self._emit({
-            "type": "nuances_update",
-            "nuances": nuances,
-            "ts": time.time(),
-        })
+        self._emit_snapshot("nuances_update", {"nuances": nuances})
 
     def on_mediator_log_update(self, mediation_log: Dict, scenario_history: List) -> None:
-        self._emit({
-            "type": "mediator_log",
+        self._emit_snapshot("mediator_log", {
             "mediation_log": mediation_log,
             "scenario_history": scenario_history,
-            "ts": time.time(),
         })
 
 
 class DashboardLogger(ConversationLogger):
     """
     Subclass of ConversationLogger that additionally pushes `message` and
-    `prompt_input` events onto the same per-session asyncio.Queue.
+    `prompt_input` events to the same sink as DashboardEventEmitter.
     """
 
     def __init__(
         self,
-        queue: asyncio.Queue,
-        loop: asyncio.AbstractEventLoop,
+        queue: Optional[asyncio.Queue] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
         base_dir: str = "conversation_logs",
+        sink: Optional[EventSink] = None,
+        session_name: Optional[str] = None,
     ):
-        super().__init__(base_dir=base_dir)
+        super().__init__(base_dir=base_dir, session_name=session_name)
         self.queue = queue
         self.loop = loop
+        self.sink = sink or queue_sink(queue, loop)
 
     def _emit(self, event: Dict[str, Any]) -> None:
         try:
-            self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+            self.sink(event)
         except Exception:
             pass
 
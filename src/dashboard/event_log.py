@@ -0,0 +1,397 @@
+"""
+Per-session append-only event log for the dashboard.
+
+Every event a run produces is appended to a SessionEventLog and stamped with
+a monotonically increasing `seq`. WebSocket clients subscribe from a cursor
+(the last seq they saw), so a reconnecting browser resumes where it left off
+and any number of tabs can read the same run at once.
+
+The log keeps the newest `capacity` events in memory. When the ring is full
+and an event would be evicted before every subscriber has read it, the
+backpressure policy decides what happens:
+
+  block     publish() waits until the slowest subscriber catches up (up to
+            block_timeout seconds; subscribers still behind after that see a
+            `gap` event and skip ahead)
+  coalesce  Drop the oldest snapshot event (persona_states, memory_update, ...)
+            or `<type>_delta` that a newer keyframe of the same stream
+            supersedes; fall back to evicting the oldest event, reported to
+            laggards as a `gap`
+  spill     Append evicted events to a JSONL file and serve old cursors from
+            disk, so nothing is ever lost (default)
+
+With a journal_path every event is also appended to a JSONL journal as it is
+published, so the log can be rebuilt with SessionEventLog.from_journal()
+after a server restart and clients can reattach with their cursor. The spill
+policy then serves evicted events straight from the journal.
+
+The log lives on the server's event loop; it is not thread-safe.
+
+Configuration (environment variables):
+  DASHBOARD_EVENT_RING_SIZE     Events kept in memory per session (default 1000)
+  DASHBOARD_EVENT_BACKPRESSURE  block | coalesce | spill (default spill)
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+BACKPRESSURE_POLICIES = ("block", "coalesce", "spill")
+
+# Snapshot streams: a keyframe of one of these types fully supersedes every
+# earlier keyframe and `<type>_delta` of the same stream
+SNAPSHOT_EVENT_TYPES = frozenset({"persona_states", "nuances_update", "mediator_log", "memory_update"})
+
+
+def _snapshot_stream(event: Dict[str, Any]) -> Optional[str]:
+    """The snapshot stream an event belongs to, or None for other events."""
+    kind = event.get("type") or ""
+    stream = kind[:-len("_delta")] if kind.endswith("_delta") else kind
+    return stream if stream in SNAPSHOT_EVENT_TYPES else None
+
+
+def _is_keyframe(event: Dict[str, Any]) -> bool:
+    """True for a snapshot carrying the full state (not a patch against a base)."""
+    return not event["type"].endswith("_delta") and event.get("keyframe", True) is not False
+
+
+class _Subscriber:
+    def __init__(self, cursor: int):
+        self.cursor = cursor  # Last seq delivered
+
+
+class SessionEventLog:
+    """
+    Append-only, sequence-numbered event ring with cursor-based subscribers.
+
+    Example:
+        >>> log = SessionEventLog(capacity=1000, policy="spill", spill_path=path)
+        >>> await log.publish({"type": "turn_start", ...})
+        >>> async for event in log.subscribe(cursor=0):
+        ...     await ws.send_json(event)
+    """
+
+    # Max events a subscriber reads per step (bounds reads from the spill file)
+    READ_PAGE = 500
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        policy: str = "spill",
+        spill_path: Optional[str] = None,
+        block_timeout: float = 30.0,
+        journal_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            capacity: Events kept in memory
+            policy: Backpressure policy — "block", "coalesce" or "spill"
+            spill_path: JSONL file for evicted events (required for "spill"
+                unless journal_path is set)
+            block_timeout: Longest publish() waits for a slow subscriber ("block")
+            journal_path: JSONL file every event is appended to (durable log)
+        """
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}'. Valid: {BACKPRESSURE_POLICIES}")
+        if policy == "spill" and spill_path is None and journal_path is None:
+            raise ValueError("spill policy requires spill_path or journal_path")
+
+        self.capacity = max(1, capacity)
+        self.policy = policy
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.block_timeout = block_timeout
+
+        self._ring: Deque[Dict[str, Any]] = deque()
+        self._last_seq = 0
+        self._lost_through = 0  # Highest seq evicted without being spilled
+        self._closed = False
+        self._subscribers: List[_Subscriber] = []
+        self._wakeup = asyncio.Event()  # Replaced on every change; waiters hold the old one
+
+        # Spill bookkeeping: seq range on disk and byte offset of each line
+        self._spilled_offsets: List[int] = []
+        self._spill_first_seq = 1
+
+        # Journal: every event on disk; with spill, evicted events are read back from it
+        self.journal_path = Path(journal_path) if journal_path else None
+        self._journal = None
+        self._journal_offsets: Dict[int, int] = {}  # seq -> byte offset, for events still in the ring
+        if self.journal_path is not None and policy == "spill":
+            self.spill_path = self.journal_path
+        self.stats = {"published": 0, "coalesced": 0, "evicted": 0, "spilled": 0, "blocked_seconds": 0.0}
+
+    @classmethod
+    def from_env(cls, spill_path: Optional[str] = None, journal_path: Optional[str] = None) -> 'SessionEventLog':
+        """Build a log from DASHBOARD_EVENT_* environment variables."""
+        return cls(
+            capacity=int(os.getenv("DASHBOARD_EVENT_RING_SIZE", "1000")),
+            policy=os.getenv("DASHBOARD_EVENT_BACKPRESSURE", "spill"),
+            spill_path=spill_path,
+            journal_path=journal_path,
+        )
+
+    @classmethod
+    def from_journal(cls, journal_path: str, **kwargs) -> 'SessionEventLog':
+        """
+        Rebuild a log from its journal (e.g. after a server restart).
+
+        Events keep their original seq numbers and new events continue the
+        journal. A torn last line (crash mid-write) is truncated.
+
+        Args:
+            journal_path: Journal written by an earlier log
+            **kwargs: Constructor arguments (capacity, policy, ...)
+        """
+        log = cls(journal_path=journal_path, **kwargs)
+        path = Path(journal_path)
+        if not path.exists():
+            return log
+        with open(path, "rb+") as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    f.truncate(offset)
+                    break
+                log._last_seq = event["seq"]
+                log._journal_offsets[event["seq"]] = offset
+                log._ring.append(event)
+                while len(log._ring) > log.capacity:
+                    log._make_room()
+        return log
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def publish(self, event: Dict[str, Any]) -> int:
+        """
+        Append an event, applying the backpressure policy if the ring is full.
+
+        Returns:
+            The event's sequence number
+        """
+        if self.policy == "block" and len(self._ring) >= self.capacity:
+            await self._wait_for_room()
+        return self.append(event)
+
+    def append(self, event: Dict[str, Any]) -> int:
+        """
+        Append without waiting (the "block" policy degrades to evicting the
+        oldest event). Use publish() from async code.
+        """
+        self._last_seq += 1
+        event = dict(event, seq=self._last_seq)
+        if self.journal_path is not None:
+            self._write_journal(event)
+        self._ring.append(event)
+        self.stats["published"] += 1
+
+        while len(self._ring) > self.capacity:
+            self._make_room()
+
+        self._notify()
+        return self._last_seq
+
+    def close(self) -> None:
+        """Mark the log finished; subscribers exit after draining it."""
+        self._closed = True
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self._notify()
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+
+    def read(self, cursor: int, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Events with seq > cursor, oldest first.
+
+        If events after the cursor were evicted, the result starts with a
+        {"type": "gap", "from_seq", "to_seq"} marker covering the lost range.
+        Coalesced snapshots and deltas are skipped silently — a newer keyframe
+        of the same stream follows.
+        """
+        events: List[Dict[str, Any]] = []
+        if cursor < self._lost_through:
+            events.append({
+                "type": "gap", "from_seq": cursor + 1, "to_seq": self._lost_through, "seq": self._lost_through,
+            })
+            cursor = self._lost_through
+
+        if self._spilled_offsets and cursor + 1 < self._ring_first_seq():
+            events.extend(self._read_spilled(cursor, limit))
+
+        events.extend(e for e in self._ring if e["seq"] > cursor)
+        return events[:limit] if limit else events
+
+    async def subscribe(self, cursor: int = 0, heartbeat: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield events after `cursor` as they arrive until the log is closed.
+
+        Args:
+            cursor: Last seq the client has seen (0 = from the beginning)
+            heartbeat: If set, yield {"type": "heartbeat"} after this many
+                idle seconds
+        """
+        async for batch in self.subscribe_batches(cursor, heartbeat):
+            for event in batch:
+                yield event
+
+    async def subscribe_batches(
+        self,
+        cursor: int = 0,
+        heartbeat: Optional[float] = None,
+        max_batch: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Like subscribe(), but yield every event available at once as a list,
+        so a caller can send them in one frame.
+
+        Args:
+            cursor: Last seq the client has seen (0 = from the beginning)
+            heartbeat: If set, yield [{"type": "heartbeat"}] after this many
+                idle seconds
+            max_batch: Largest list to yield (default READ_PAGE)
+        """
+        subscriber = _Subscriber(cursor)
+        self._subscribers.append(subscriber)
+        try:
+            while True:
+                waiter = self._wakeup
+                batch = self.read(subscriber.cursor, limit=max_batch or self.READ_PAGE)
+                if batch:
+                    yield batch
+                    subscriber.cursor = max(subscriber.cursor, batch[-1]["seq"])
+                    self._notify()  # A blocked publisher may now have room
+                    continue
+                if self._closed:
+                    return
+                try:
+                    await asyncio.wait_for(waiter.wait(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield [{"type": "heartbeat", "ts": time.time()}]
+        finally:
+            self._subscribers.remove(subscriber)
+            self._notify()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _notify(self) -> None:
+        self._wakeup.set()
+        self._wakeup = asyncio.Event()
+
+    def _ring_first_seq(self) -> int:
+        return self._ring[0]["seq"] if self._ring else self._last_seq + 1
+
+    def _slowest_cursor(self) -> Optional[int]:
+        return min((s.cursor for s in self._subscribers), default=None)
+
+    async def _wait_for_room(self) -> None:
+        """Block until evicting the oldest event loses nothing for any subscriber."""
+        started = time.monotonic()
+        deadline = started + self.block_timeout
+        while True:
+            slowest = self._slowest_cursor()
+            if slowest is None or slowest >= self._ring_first_seq():
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break  # Laggards will see a gap
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+        self.stats["blocked_seconds"] += time.monotonic() - started
+
+    def _make_room(self) -> None:
+        if self.policy == "coalesce":
+            # Only events behind a newer keyframe are safe to drop: deltas
+            # after the latest keyframe still need it (and each other).
+            # Once the oldest is gone the rest of its chain is useless too,
+            # so the whole superseded run of that stream goes at once.
+            latest_keyframe: Dict[str, int] = {}
+            for event in self._ring:
+                stream = _snapshot_stream(event)
+                if stream and _is_keyframe(event):
+                    latest_keyframe[stream] = event["seq"]
+            for event in self._ring:
+                stream = _snapshot_stream(event)
+                if stream and event["seq"] < latest_keyframe.get(stream, 0):
+                    superseded = [e for e in self._ring
+                                  if _snapshot_stream(e) == stream and e["seq"] < latest_keyframe[stream]]
+                    for dropped in superseded:
+                        self._ring.remove(dropped)
+                        self._journal_offsets.pop(dropped["seq"], None)
+                    self.stats["coalesced"] += len(superseded)
+                    return
+
+        evicted = self._ring.popleft()
+        offset = self._journal_offsets.pop(evicted["seq"], None)
+        if self.policy == "spill" and offset is not None:
+            # Already on disk in the journal — just remember where
+            if not self._spilled_offsets:
+                self._spill_first_seq = evicted["seq"]
+            self._spilled_offsets.append(offset)
+            self.stats["spilled"] += 1
+        elif self.policy == "spill":
+            self._spill(evicted)
+        else:
+            self._lost_through = evicted["seq"]
+            self.stats["evicted"] += 1
+
+    def _write_journal(self, event: Dict[str, Any]) -> None:
+        if self._journal is None:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_path, "ab")
+        self._journal_offsets[event["seq"]] = self._journal.tell()
+        self._journal.write(json.dumps(event, default=str).encode("utf-8") + b"\n")
+        self._journal.flush()
+
+    def _spill(self, event: Dict[str, Any]) -> None:
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spill_path, "ab") as f:
+            if not self._spilled_offsets:
+                self._spill_first_seq = event["seq"]
+            self._spilled_offsets.append(f.tell())
+            f.write(json.dumps(event, default=str).encode("utf-8") + b"\n")
+        self.stats["spilled"] += 1
+
+    def _read_spilled(self, cursor: int, limit: Optional[int]) -> List[Dict[str, Any]]:
+        """Read spilled events with seq > cursor (seqs on disk are contiguous)."""
+        start = max(0, cursor + 1 - self._spill_first_seq)
+        if start >= len(self._spilled_offsets):
+            return []
+        count = len(self._spilled_offsets) - start
+        if limit:
+            count = min(count, limit)
+        events = []
+        with open(self.spill_path, "rb") as f:
+            f.seek(self._spilled_offsets[start])
+            for _ in range(count):
+                events.append(json.loads(f.readline()))
+        return events
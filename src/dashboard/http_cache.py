@@ -0,0 +1,129 @@
+"""
+HTTP caching and compression helpers for dashboard JSON payloads.
+
+Session payloads are derived from files on disk, so their validators come
+from the files' mtimes and sizes: a conditional request (If-None-Match /
+If-Modified-Since) for an unchanged session is answered with 304 after a
+stat() — no JSON is read, built or sent.
+
+Bodies are compressed with brotli when the client accepts it and the
+optional `brotli` package is installed, otherwise gzip. encode_json_body()
+does the CPU work (serializing and compressing), so run it in a worker thread
+together with building the payload; json_body_response() only wraps the bytes.
+
+Example:
+    >>> etag, modified = file_validators([conv_file, meta_file], variant=request.url.query)
+    >>> if is_not_modified(request, etag, modified):
+    ...     return not_modified_response(etag, modified)
+    >>> accept = request.headers.get("accept-encoding", "")
+    >>> body, encoding = await asyncio.to_thread(lambda: encode_json_body(build(), accept))
+    >>> return json_body_response(body, encoding, etag, modified)
+"""
+
+import gzip
+import hashlib
+import json
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # Optional — gzip is always available
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed
+MIN_COMPRESS_BYTES = 1024
+
+# Clients may cache but must revalidate (runs can still be writing the files)
+CACHE_CONTROL = "private, no-cache"
+
+
+def file_validators(paths: Iterable[Path], variant: str = "") -> Tuple[str, float]:
+    """
+    ETag and Last-Modified time for a payload built from `paths`.
+
+    Args:
+        paths: Source files (missing files are skipped)
+        variant: Anything else the payload depends on (e.g. the query string)
+
+    Returns:
+        (weak ETag, newest mtime as a POSIX timestamp)
+    """
+    digest = hashlib.sha1(variant.encode("utf-8"))
+    newest = 0.0
+    for path in paths:
+        try:
+            st = Path(path).stat()
+        except FileNotFoundError:
+            continue
+        digest.update(f"{Path(path).name}:{st.st_mtime_ns}:{st.st_size};".encode("utf-8"))
+        newest = max(newest, st.st_mtime)
+    # Weak: the same resource may be sent with different Content-Encodings
+    return f'W/"{digest.hexdigest()[:24]}"', newest
+
+
+def is_not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    """Evaluate If-None-Match (preferred) or If-Modified-Since against the validators."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since
+    return False
+
+
+def _validator_headers(etag: str, last_modified: float) -> Dict[str, str]:
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+
+
+def not_modified_response(etag: str, last_modified: float) -> Response:
+    return Response(status_code=304, headers=_validator_headers(etag, last_modified))
+
+
+def encode_json_body(payload: Any, accept_encoding: str = "") -> Tuple[bytes, Optional[str]]:
+    """
+    Serialize a payload and compress it according to an Accept-Encoding header.
+
+    CPU-bound for large payloads — call it off the event loop.
+
+    Returns:
+        (body, Content-Encoding or None if uncompressed)
+    """
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    if len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+
+    accepted = {
+        part.split(";")[0].strip().lower()
+        for part in accept_encoding.split(",")
+        if "q=0" not in part.replace(" ", "").split(";")[1:]
+    }
+    if brotli is not None and "br" in accepted:
+        return brotli.compress(body, quality=5), "br"
+    if "gzip" in accepted:
+        return gzip.compress(body, compresslevel=6), "gzip"
+    return body, None
+
+
+def json_body_response(body: bytes, content_encoding: Optional[str], etag: str, last_modified: float) -> Response:
+    """JSON response with validators for a body from encode_json_body()."""
+    headers = _validator_headers(etag, last_modified)
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    return Response(content=body, media_type="application/json", headers=headers)
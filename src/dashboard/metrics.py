@@ -0,0 +1,199 @@
+"""
+Prometheus-compatible metrics for the dashboard server, without dependencies.
+
+Counters and histograms are updated as things happen (LLM calls reported by
+runs, WebSocket connects, ...). Gauges that describe current state (active
+runs, queue depths, executor utilization, subscribers) are read at scrape time
+by collector callbacks, so nothing has to be kept in sync. render() produces
+the Prometheus text exposition format (version 0.0.4) served at /metrics.
+
+Example:
+    >>> registry = MetricsRegistry()
+    >>> calls = registry.counter("llm_requests_total", "LLM requests", ("site",))
+    >>> calls.inc(site="persona_response")
+    >>> registry.collector(lambda: [("active_runs", "gauge", "Runs", {}, 2)])
+    >>> print(registry.render())
+"""
+
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Latency buckets (seconds) sized for LLM requests
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0)
+
+# (name, type, help, labels, value) rows produced by a collector
+Sample = Tuple[str, str, str, Dict[str, str], float]
+
+LabelKey = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelKey:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _labels(self, key: LabelKey) -> Dict[str, str]:
+        return dict(zip(self.label_names, key))
+
+    def lines(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        super().__init__(name, help_text, label_names)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, List[float]] = {}  # bucket counts..., sum, count
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, **labels: str) -> float:
+        series = self._series.get(self._key(labels))
+        return series[-1] if series else 0.0
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        lines = []
+        for key, series in items:
+            labels = self._labels(key)
+            for bound, bucket_count in zip(self.buckets + (math.inf,), series[:-2] + [series[-1]]):
+                bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+                lines.append(f"{self.name}_bucket{bucket_labels} {_format_value(bucket_count)}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {_format_value(series[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Named metrics plus scrape-time collectors, rendered as Prometheus text.
+    """
+
+    def __init__(self, prefix: str = ""):
+        """
+        Args:
+            prefix: Prepended to every metric name (e.g. "assembly_")
+        """
+        self.prefix = prefix
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(self.prefix + name, help_text, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(self.prefix + name, help_text, label_names, buckets))
+
+    def collector(self, collect: Callable[[], Iterable[Sample]]) -> None:
+        """
+        Register a callback returning (name, type, help, labels, value) samples
+        read at scrape time. Names are prefixed like registered metrics.
+        """
+        self._collectors.append(collect)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(self.prefix + name)
+
+    def render(self) -> str:
+        """Prometheus text exposition of every metric and collector sample."""
+        out: List[str] = []
+        for metric in self._metrics.values():
+            out.append(f"# HELP {metric.name} {metric.help}")
+            out.append(f"# TYPE {metric.name} {metric.kind}")
+            out.extend(metric.lines())
+
+        # Group collector samples by name so HELP/TYPE appear once per family
+        families: Dict[str, Tuple[str, str, List[str]]] = {}
+        for collect in self._collectors:
+            for name, kind, help_text, labels, value in collect():
+                name = self.prefix + name
+                family = families.setdefault(name, (kind, help_text, []))
+                family[2].append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for name, (kind, help_text, lines) in families.items():
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} {kind}")
+            out.extend(lines)
+
+        return "\n".join(out) + "\n"
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
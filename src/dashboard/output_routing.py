@@ -0,0 +1,156 @@
+"""
+Context-local routing of print() and logging output.
+
+contextlib.redirect_stdout swaps the process-global sys.stdout, so two jobs
+running in different threads capture each other's output. Instead, install()
+replaces sys.stdout / sys.stderr once with proxies that look up the current
+OutputRoute in a ContextVar: inside `with route_output(route):` writes from
+that thread (and from asyncio tasks / guarded calls started there) go to the
+route; everywhere else they reach the real stream unchanged.
+
+A RouteLogHandler on the root logger does the same for logging records, and
+the existing console handlers skip records that belong to a route, so each
+line lands exactly once.
+
+Example:
+    >>> route = OutputRoute(lambda line: queue_put({"type": "benchmark_log", "line": line}))
+    >>> with route_output(route):
+    ...     run_benchmark_body()   # print() and log.info() go to this job only
+"""
+
+import contextlib
+import contextvars
+import io
+import logging
+import sys
+import threading
+from typing import Callable, Iterator, Optional
+
+_active_route: contextvars.ContextVar[Optional['OutputRoute']] = contextvars.ContextVar(
+    "assembly_output_route", default=None
+)
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+class OutputRoute:
+    """Line-buffered destination for one job's output."""
+
+    def __init__(self, emit_line: Callable[[str], None]):
+        """
+        Args:
+            emit_line: Called with each complete line (without the newline);
+                must be thread-safe
+        """
+        self._emit_line = emit_line
+        self._buffer = ""
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            self._buffer += text
+            *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self.emit(line)
+        return len(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            rest, self._buffer = self._buffer, ""
+        if rest:
+            self.emit(rest)
+
+    def emit(self, line: str) -> None:
+        line = line.rstrip("\r")
+        if line.strip():
+            try:
+                self._emit_line(line)
+            except Exception:
+                pass  # Never let output routing crash the job
+
+
+class _RoutedStream(io.TextIOBase):
+    """sys.stdout / sys.stderr proxy that honours the current route."""
+
+    def __init__(self, original):
+        self._original = original
+
+    def write(self, text: str) -> int:
+        route = _active_route.get()
+        if route is None:
+            return self._original.write(text)
+        return route.write(text)
+
+    def flush(self) -> None:
+        if _active_route.get() is None:
+            self._original.flush()
+
+    def isatty(self) -> bool:
+        return _active_route.get() is None and self._original.isatty()
+
+    @property
+    def encoding(self):
+        return getattr(self._original, "encoding", "utf-8")
+
+    def fileno(self) -> int:
+        return self._original.fileno()
+
+
+class RouteLogHandler(logging.Handler):
+    """Root-logger handler that sends records to the current route (if any)."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        route = _active_route.get()
+        if route is None:
+            return
+        try:
+            route.emit(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+def _outside_routes(record: logging.LogRecord) -> bool:
+    return _active_route.get() is None
+
+
+def install() -> None:
+    """
+    Install the stdout/stderr proxies and the logging handler (idempotent).
+
+    Existing root console handlers get a filter so routed records aren't
+    also printed to the server console. The stream proxies are re-applied if
+    something else has replaced sys.stdout / sys.stderr since.
+    """
+    global _installed
+    with _install_lock:
+        if not isinstance(sys.stdout, _RoutedStream):
+            sys.stdout = _RoutedStream(sys.stdout)
+        if not isinstance(sys.stderr, _RoutedStream):
+            sys.stderr = _RoutedStream(sys.stderr)
+        if _installed:
+            return
+        root = logging.getLogger()
+        for handler in root.handlers:
+            if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
+                handler.addFilter(_outside_routes)
+        route_handler = RouteLogHandler()
+        route_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+        root.addHandler(route_handler)
+        _installed = True
+
+
+def current_route() -> Optional[OutputRoute]:
+    return _active_route.get()
+
+
+@contextlib.contextmanager
+def route_output(route: OutputRoute) -> Iterator[OutputRoute]:
+    """Send this context's print() and logging output to `route`."""
+    install()
+    token = _active_route.set(route)
+    try:
+        yield route
+    finally:
+        route.flush()
+        _active_route.reset(token)
@@ -0,0 +1,174 @@
+"""
+RunStore - SQLite record of dashboard runs and benchmark jobs
+
+The dashboard keeps live run state in memory; this store mirrors what is
+needed to survive a restart or deploy: status, request params, the kwargs the
+run was started with, the conversation_logs session folder it writes to
+(for checkpoint resume), the event journal path (for reattaching clients) and
+the final result or error.
+
+On startup the server calls unfinished() and reconciles each interrupted run:
+resume it from its checkpoint, re-queue it if it never started, or mark it
+failed.
+
+Configuration (environment variables):
+  DASHBOARD_STATE_DB  Database path (default: <DASHBOARD_RUNS_DIR>/runs.db)
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+RUN_STORE_FILENAME = "runs.db"
+
+# Statuses that mean the run/job was still in flight
+UNFINISHED_STATUSES = ("queued", "starting", "running", "cancelling")
+
+# Columns stored as JSON text
+_JSON_COLUMNS = ("params", "run_kwargs", "result")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          TEXT PRIMARY KEY,
+    kind        TEXT NOT NULL,
+    user        TEXT,
+    status      TEXT NOT NULL,
+    params      TEXT,
+    run_kwargs  TEXT,
+    log_session TEXT,
+    event_log   TEXT,
+    last_seq    INTEGER NOT NULL DEFAULT 0,
+    result      TEXT,
+    error       TEXT,
+    created_at  REAL,
+    updated_at  REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs (status);
+"""
+
+_COLUMNS = (
+    "id", "kind", "user", "status", "params", "run_kwargs", "log_session",
+    "event_log", "last_seq", "result", "error", "created_at", "updated_at",
+)
+
+
+class RunStore:
+    """
+    SQLite-backed store of dashboard run/job state.
+
+    Like SessionCatalog, each call opens its own short-lived connection.
+
+    Example:
+        >>> store = RunStore.from_env()
+        >>> store.create("abc", "assembly", status="queued", params={...})
+        >>> store.update("abc", status="complete", result=ideas)
+        >>> store.unfinished("assembly")
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> 'RunStore':
+        """Open the store named by DASHBOARD_STATE_DB (next to the run dirs by default)."""
+        default = Path(os.getenv("DASHBOARD_RUNS_DIR", "dashboard_runs")) / RUN_STORE_FILENAME
+        return cls(os.getenv("DASHBOARD_STATE_DB", str(default)))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def create(self, run_id: str, kind: str, status: str, **fields: Any) -> None:
+        """
+        Insert a run record (replacing any previous record with the same id).
+
+        Args:
+            run_id: Dashboard session id or benchmark job id
+            kind: "assembly" or "benchmark"
+            status: Initial status
+            **fields: Other columns (params, run_kwargs, user, event_log, ...)
+        """
+        now = time.time()
+        record = {"id": run_id, "kind": kind, "status": status, "created_at": now, "updated_at": now, **fields}
+        columns = [c for c in _COLUMNS if c in record]
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO runs ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                [_encode(c, record[c]) for c in columns],
+            )
+
+    def update(self, run_id: str, **fields: Any) -> None:
+        """Update columns of an existing record."""
+        fields["updated_at"] = time.time()
+        unknown = set(fields) - set(_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown run store columns: {sorted(unknown)}")
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE runs SET {assignments} WHERE id = ?",
+                [_encode(c, v) for c, v in fields.items()] + [run_id],
+            )
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Return one record with JSON columns decoded, or None."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return _decode(row) if row else None
+
+    def list(self, kind: Optional[str] = None, statuses: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Records of one kind and/or status set, oldest first."""
+        clauses, args = [], []
+        if kind:
+            clauses.append("kind = ?")
+            args.append(kind)
+        if statuses:
+            clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            args.extend(statuses)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT * FROM runs {where} ORDER BY created_at", args).fetchall()
+        return [_decode(row) for row in rows]
+
+    def unfinished(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Records left in flight by a previous server process."""
+        return self.list(kind=kind, statuses=UNFINISHED_STATUSES)
+
+
+def _encode(column: str, value: Any) -> Any:
+    if column in _JSON_COLUMNS and value is not None:
+        return json.dumps(value, default=str)
+    return value
+
+
+def _decode(row: sqlite3.Row) -> Dict[str, Any]:
+    record = dict(row)
+    for column in _JSON_COLUMNS:
+        if record.get(column) is not None:
+            record[column] = json.loads(record[column])
+    return record
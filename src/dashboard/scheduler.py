@@ -0,0 +1,476 @@
+"""
+Dashboard run scheduler.
+
+RunScheduler admits assembly runs into a bounded pool of worker processes:
+
+- Global cap: at most `max_workers` runs execute at once (the pool size).
+- Per-user cap: at most `max_per_user` of those belong to the same user.
+- Queue: further runs wait in FIFO order (skipping users already at their
+  cap). Each waiting run receives a `run_queued` event with its 1-based
+  position whenever that position changes, and `run_dispatched` once it
+  starts executing.
+- Isolation: every run executes in its own working directory
+  (<runs_dir>/<run_id>/) with stdout/stderr captured to run.log, so
+  CWD-relative writes such as meeting_logs.txt and print() output never
+  collide between concurrent runs.
+- Cancellation: cancel() drops a queued run or trips the running run's
+  CancellationToken (shared across processes via a Manager Event, with the
+  reason in a Manager dict). A run's `timeout` becomes the token's
+  wall-clock deadline.
+
+Workers stream events back over a multiprocessing queue; a pump thread in the
+server process forwards them to the owning run's event callback on the
+FastAPI event loop.
+
+Configuration (environment variables):
+  DASHBOARD_RUN_WORKERS        Worker processes = global concurrent runs (default 4)
+  DASHBOARD_MAX_RUNS_PER_USER  Concurrent runs per user (default 2)
+  DASHBOARD_MAX_QUEUED_RUNS    Waiting runs before new runs are refused (default 50)
+  DASHBOARD_RUNS_DIR           Root of per-run working directories (default dashboard_runs)
+"""
+
+import asyncio
+import contextlib
+import functools
+import multiprocessing
+import os
+import queue as queue_module
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Optional
+
+from framework.cancellation import CancellationToken, RunCancelled
+from src.dashboard.event_emitter import DashboardEventEmitter, DashboardLogger, EventBatcher, EventSink
+from src.idea_generation.generator import multiple_llm_idea_generator
+
+# Sent by a worker after its last event so the server can finish the run
+# only once every event has been forwarded.
+_END_MARKER = "__run_end__"
+
+
+class QueueFullError(Exception):
+    """Raised when a run cannot start now and the wait queue is full."""
+
+
+# ---------------------------------------------------------------------------
+# Worker side (runs inside pool processes)
+# ---------------------------------------------------------------------------
+
+_worker_events = None  # set per worker by _init_worker
+
+
+def _init_worker(event_queue) -> None:
+    global _worker_events
+    _worker_events = event_queue
+
+
+def _emit_from_worker(run_id: str, event: Dict[str, Any]) -> None:
+    _worker_events.put((run_id, event))
+
+
+def _worker_entry(
+    run_id: str,
+    target: Callable[..., Any],
+    kwargs: Dict[str, Any],
+    work_dir: Optional[str],
+    cancel_event: Any = None,
+    timeout: Optional[float] = None,
+    cancel_reason: Any = None,
+) -> Any:
+    """
+    Execute one run inside a worker.
+
+    When work_dir is given the run is isolated: the worker chdirs into it and
+    stdout/stderr are captured to work_dir/run.log for the duration. The
+    target receives a CancellationToken built from cancel_event, cancel_reason
+    and timeout.
+    """
+    emit = functools.partial(_emit_from_worker, run_id)
+    token = CancellationToken(timeout=timeout, event=cancel_event, shared_reason=cancel_reason)
+    kwargs = dict(kwargs, cancel_token=token)
+    try:
+        if work_dir is None:
+            return target(emit=emit, **kwargs)
+
+        path = Path(work_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        previous_cwd = os.getcwd()
+        with open(path / "run.log", "w", encoding="utf-8") as log_file, \
+                contextlib.redirect_stdout(log_file), contextlib.redirect_stderr(log_file):
+            os.chdir(path)
+            try:
+                return target(emit=emit, **kwargs)
+            finally:
+                os.chdir(previous_cwd)
+    finally:
+        _worker_events.put((run_id, _END_MARKER))
+
+
+def execute_assembly_run(
+    emit: EventSink,
+    logs_dir: str,
+    cancel_token: Optional[CancellationToken] = None,
+    **generator_kwargs,
+) -> Any:
+    """
+    Worker target for a dashboard assembly run.
+
+    Args:
+        emit: Event sink provided by the scheduler
+        logs_dir: Absolute conversation_logs/ path (the worker's CWD is its
+            private work dir, so a relative path would land there)
+        cancel_token: Token provided by the scheduler (cancel() / deadline)
+        **generator_kwargs: Passed through to multiple_llm_idea_generator();
+            with resume_session the logger reopens that session folder. Give
+            persona_cache_dir, persona_archive_dir and phase_cache_dir as
+            absolute paths too, or every run starts from empty caches (and
+            no persona archive) in its own work dir.
+
+    Returns:
+        The generator's result (ideas list or ideas + convergence dict)
+    """
+    # One batcher for both so events keep their order and share frames
+    batcher = EventBatcher.from_env(emit)
+    emitter = DashboardEventEmitter(sink=batcher)
+    dash_logger = DashboardLogger(
+        base_dir=logs_dir, sink=batcher, session_name=generator_kwargs.get("resume_session")
+    )
+    # Lets the server find this run's checkpoint after a restart
+    batcher({"type": "log_session", "log_session": dash_logger.session_dir.name, "ts": time.time()})
+    try:
+        return multiple_llm_idea_generator(
+            monitor=emitter, logger=dash_logger, cancel_token=cancel_token, **generator_kwargs
+        )
+    finally:
+        batcher.close()  # Flush before the scheduler's end marker
+
+
+# ---------------------------------------------------------------------------
+# Server side
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Run:
+    run_id: str
+    user: str
+    target: Callable[..., Any]
+    kwargs: Dict[str, Any]
+    on_event: EventSink
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    timeout: Optional[float] = None
+    cancel_event: Any = None
+    cancel_reason: Any = None
+    enqueued_at: float = field(default_factory=time.time)
+    position: int = 0
+    outcome: Optional[Future] = None
+    drained: bool = False
+
+
+class RunScheduler:
+    """
+    Admission control + worker pool for dashboard runs.
+
+    Example:
+        >>> scheduler = RunScheduler.from_env()
+        >>> result = await scheduler.run(run_id, user, execute_assembly_run, kwargs, on_event)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_per_user: int = 2,
+        max_queued: int = 50,
+        runs_dir: str = "dashboard_runs",
+        use_processes: bool = True,
+        isolate: bool = True,
+    ):
+        """
+        Args:
+            max_workers: Pool size — the global cap on concurrently executing runs
+            max_per_user: Concurrent runs allowed per user
+            max_queued: Runs allowed to wait before run() raises QueueFullError
+            runs_dir: Root folder for per-run working directories
+            use_processes: Use a process pool (False = threads, for tests/dev)
+            isolate: Give each run its own CWD + run.log (processes only)
+        """
+        self.max_workers = max_workers
+        self.max_per_user = max_per_user
+        self.max_queued = max_queued
+        self.runs_dir = Path(runs_dir).resolve()
+        self.use_processes = use_processes
+        self.isolate = isolate and use_processes
+
+        self._lock = threading.RLock()
+        self._pending: Deque[_Run] = deque()
+        self._running: Dict[str, _Run] = {}
+        self._executor: Optional[Executor] = None
+        self._events = None
+        self._pump: Optional[threading.Thread] = None
+        self._manager = None
+
+    @classmethod
+    def from_env(cls) -> 'RunScheduler':
+        """Build a scheduler from DASHBOARD_* environment variables."""
+        return cls(
+            max_workers=int(os.getenv("DASHBOARD_RUN_WORKERS", "4")),
+            max_per_user=int(os.getenv("DASHBOARD_MAX_RUNS_PER_USER", "2")),
+            max_queued=int(os.getenv("DASHBOARD_MAX_QUEUED_RUNS", "50")),
+            runs_dir=os.getenv("DASHBOARD_RUNS_DIR", "dashboard_runs"),
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def run(
+        self,
+        run_id: str,
+        user: str,
+        target: Callable[..., Any],
+        kwargs: Dict[str, Any],
+        on_event: EventSink,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Queue a run and wait for its result.
+
+        Args:
+            run_id: Unique run identifier (also names the work dir)
+            user: Key that per-user caps are counted against
+            target: Top-level callable executed in a worker as target(emit=..., **kwargs)
+            kwargs: Picklable keyword arguments for target
+            on_event: Called on the caller's event loop for every event the
+                run emits, plus scheduler events (run_queued / run_dispatched)
+            timeout: Wall-clock seconds the run may execute before its token
+                trips with "deadline_exceeded" (None = no deadline)
+
+        Returns:
+            Whatever target returns
+
+        Raises:
+            QueueFullError: If the run can't start now and the queue is full
+            RunCancelled: If the run was cancelled or exceeded its deadline
+        """
+        loop = asyncio.get_running_loop()
+        run = _Run(run_id, user, target, kwargs, on_event, loop, loop.create_future(), timeout=timeout)
+
+        with self._lock:
+            self._ensure_started()
+            if not self._can_start(user) and len(self._pending) >= self.max_queued:
+                raise QueueFullError(f"Run queue is full ({self.max_queued} waiting)")
+            self._pending.append(run)
+            self._dispatch()
+
+        try:
+            return await run.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if run in self._pending:
+                    self._pending.remove(run)
+                    self._announce_positions()
+            raise
+
+    def cancel(self, run_id: str, reason: str = "cancelled") -> bool:
+        """
+        Cancel a queued or running run.
+
+        A queued run is removed and its run() raises RunCancelled at once. A
+        running run has its token tripped; the target flushes partial logs and
+        raises RunCancelled at its next check.
+
+        Returns:
+            True if the run was found, False if it is unknown or finished
+        """
+        with self._lock:
+            for run in self._pending:
+                if run.run_id == run_id:
+                    self._pending.remove(run)
+                    self._announce_positions()
+                    run.loop.call_soon_threadsafe(_reject, run.future, RunCancelled(reason))
+                    return True
+            run = self._running.get(run_id)
+            if run is None:
+                return False
+            run.cancel_reason.setdefault("reason", reason)
+            run.cancel_event.set()
+            return True
+
+    def is_full(self, user: str) -> bool:
+        """True if a new run for `user` would be refused right now."""
+        with self._lock:
+            return not self._can_start(user) and len(self._pending) >= self.max_queued
+
+    def position(self, run_id: str) -> Optional[int]:
+        """1-based queue position, 0 if running, None if unknown/finished."""
+        with self._lock:
+            if run_id in self._running:
+                return 0
+            for index, run in enumerate(self._pending):
+                if run.run_id == run_id:
+                    return index + 1
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Current load and limits."""
+        with self._lock:
+            return {
+                "running": len(self._running),
+                "queued": len(self._pending),
+                "max_workers": self.max_workers,
+                "max_per_user": self.max_per_user,
+                "max_queued": self.max_queued,
+                "workers": "processes" if self.use_processes else "threads",
+            }
+
+    def shutdown(self) -> None:
+        """Stop the pool and the event pump."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            with self._lock:
+                for run in self._running.values():
+                    run.cancel_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._events.put(None)
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    # ------------------------------------------------------------------
+    # Internals (call with self._lock held)
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if self._executor is not None:
+            return
+        if self.use_processes:
+            ctx = multiprocessing.get_context("spawn")
+            self._events = ctx.Queue()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=ctx,
+                initializer=_init_worker, initargs=(self._events,),
+            )
+        else:
+            self._events = queue_module.Queue()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker, initargs=(self._events,),
+            )
+        self._pump = threading.Thread(target=self._pump_events, name="run-scheduler-pump", daemon=True)
+        self._pump.start()
+
+    def _running_for(self, user: str) -> int:
+        return sum(1 for run in self._running.values() if run.user == user)
+
+    def _can_start(self, user: str) -> bool:
+        return len(self._running) < self.max_workers and self._running_for(user) < self.max_per_user
+
+    def _dispatch(self) -> None:
+        """Start every pending run that fits under the caps, oldest first."""
+        for run in list(self._pending):
+            if len(self._running) >= self.max_workers:
+                break
+            if self._running_for(run.user) >= self.max_per_user:
+                continue
+            run.cancel_event, run.cancel_reason = self._new_cancel_state()
+            self._pending.remove(run)
+            self._running[run.run_id] = run
+
+            work_dir = str(self.runs_dir / run.run_id) if self.isolate else None
+            self._send(run, {
+                "type": "run_dispatched",
+                "waited": time.time() - run.enqueued_at,
+                "ts": time.time(),
+            })
+            outcome = self._executor.submit(
+                _worker_entry, run.run_id, run.target, run.kwargs, work_dir,
+                run.cancel_event, run.timeout, run.cancel_reason,
+            )
+            outcome.add_done_callback(functools.partial(self._on_done, run))
+
+        self._announce_positions()
+
+    def _new_cancel_state(self) -> tuple:
+        """(event, reason dict) for a run's token, shared with its worker."""
+        if not self.use_processes:
+            return threading.Event(), {}
+        if self._manager is None:
+            self._manager = multiprocessing.get_context("spawn").Manager()
+        return self._manager.Event(), self._manager.dict()
+
+    def _announce_positions(self) -> None:
+        for index, run in enumerate(self._pending):
+            if run.position != index + 1:
+                run.position = index + 1
+                self._send(run, {
+                    "type": "run_queued",
+                    "position": run.position,
+                    "queued": len(self._pending),
+                    "ts": time.time(),
+                })
+
+    def _send(self, run: _Run, event: Dict[str, Any]) -> None:
+        try:
+            run.loop.call_soon_threadsafe(run.on_event, event)
+        except RuntimeError:
+            pass  # Caller's loop is gone
+
+    def _on_done(self, run: _Run, outcome: Future) -> None:
+        with self._lock:
+            run.outcome = outcome
+            # _worker_entry always sends its end marker, even when the target
+            # raises; only a run that never started or whose worker process
+            # died can't, so only those finish without waiting for it
+            if outcome.cancelled() or isinstance(outcome.exception(), BrokenProcessPool):
+                run.drained = True
+            self._maybe_finish(run)
+
+    def _pump_events(self) -> None:
+        """Forward worker events to their runs (daemon thread)."""
+        while True:
+            item = self._events.get()
+            if item is None:
+                return
+            run_id, event = item
+            with self._lock:
+                run = self._running.get(run_id)
+                if run is None:
+                    continue
+                if event == _END_MARKER:
+                    run.drained = True
+                    self._maybe_finish(run)
+                else:
+                    self._send(run, event)
+
+    def _maybe_finish(self, run: _Run) -> None:
+        """Resolve a run once its worker finished and its events are flushed."""
+        if run.outcome is None or not run.drained or self._running.get(run.run_id) is not run:
+            return
+        del self._running[run.run_id]
+        try:
+            run.loop.call_soon_threadsafe(_resolve, run.future, run.outcome)
+        except RuntimeError:
+            pass
+        self._dispatch()
+
+
+def _reject(future: asyncio.Future, exc: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exc)
+
+
+def _resolve(future: asyncio.Future, outcome: Future) -> None:
+    if future.done():
+        return
+    if outcome.cancelled():
+        future.cancel()
+    elif outcome.exception() is not None:
+        future.set_exception(outcome.exception())
+    else:
+        future.set_result(outcome.result())
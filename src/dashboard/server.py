@@ -3,16 +3,37 @@ Assembly Dashboard — FastAPI server.
 
 Endpoints:
   GET  /                          Serve index.html
-  POST /api/run                   Validate params, start assembly run, return session_id
-  WS   /ws/{session_id}           Stream events from asyncio.Queue to browser
-  GET  /api/sessions              List past sessions from conversation_logs/
-  GET  /api/sessions/{id}         Return stored session JSON for replay
+  POST /api/run                   Validate params, queue assembly run, return session_id
+  GET  /api/run/{session_id}      Run status + queue position
+  DELETE /api/run/{session_id}    Cancel a queued or running run (partial logs are kept)
+  GET  /api/scheduler             Run scheduler load and limits
+  GET  /metrics                   Prometheus metrics (runs, queues, event drops, LLM calls, tokens, TTFT)
+  WS   /ws/{session_id}?cursor=N  Stream run events after seq N (resumable, many subscribers)
+  GET  /api/sessions              List past sessions (paginated, from the session catalog)
+  GET  /api/sessions/{id}         Stored session JSON for replay (phase/turn ranges, paging, ETag, gzip)
+  POST /api/sessions/{id}/resume  Continue a stopped/crashed session from its last checkpoint
+  GET  /api/search?q=...          Ranked full-text search across all sessions
 
   GET  /api/benchmarks            List all benchmark definitions + latest saved results
   GET  /api/benchmarks/{id}/results  Return latest saved results for one benchmark
   POST /api/benchmarks/{id}/run   Start a benchmark run, return job_id
   WS   /ws/benchmarks/{job_id}    Stream benchmark log lines + completion event
 
+Runs are cancelled automatically when no browser has been watching them for
+DASHBOARD_ABANDON_GRACE_SECONDS (default 120), and time out after
+deadline_seconds (request field, default DASHBOARD_RUN_DEADLINE_SECONDS).
+
+Run and benchmark job state is mirrored to a RunStore (SQLite) and every run
+event is journaled, so after a restart clients can reattach to any run with
+their cursor. Runs interrupted by the restart are resumed from their last
+checkpoint, re-queued if they never started, or marked failed
+(DASHBOARD_RESUME_INTERRUPTED=0 always marks them failed).
+
+Sessions are logged to and served from DASHBOARD_LOGS_DIR (default
+conversation_logs). Each session is added to the search index when it is
+saved; sessions written by other processes are picked up at startup and every
+DASHBOARD_SEARCH_REINDEX_SECONDS (default 300, 0 = startup only).
+
 Run with:
   python -m uvicorn src.dashboard.server:app --reload --port 8000
 """
@@ -28,18 +49,29 @@ import time
 import traceback
 from base64 import b64decode
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, asynccontextmanager
+from functools import lru_cache
 from http.cookies import SimpleCookie
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 from uuid import uuid4
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from pydantic import BaseModel, Field
 
+from framework.cancellation import RunCancelled
+from framework.checkpoint import RunCheckpoint
+from framework.search_index import DOCUMENT_KINDS, SearchIndex
+from framework.session_catalog import SORTABLE_COLUMNS, SessionCatalog, session_file
 from src.idea_generation.config import MODE_CONFIGS
-from src.idea_generation.generator import multiple_llm_idea_generator
-from src.dashboard.event_emitter import DashboardEventEmitter, DashboardLogger
+from src.dashboard.event_log import SessionEventLog
+from src.dashboard.metrics import MetricsRegistry, Sample
+from src.dashboard.http_cache import (
+    encode_json_body, file_validators, is_not_modified, json_body_response, not_modified_response,
+)
+from src.dashboard.run_store import RunStore
+from src.dashboard.scheduler import RunScheduler, execute_assembly_run
 from src.dashboard.benchmarks_runner import (
     BENCHMARKS, get_benchmark_results, run_benchmark,
 )
@@ -169,20 +201,86 @@ class AuthMiddleware:
 # App setup
 # ---------------------------------------------------------------------------
 
-app = FastAPI(title="Assembly Dashboard")
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    _reconcile_interrupted()
+    refresher = asyncio.create_task(_refresh_search_index())
+    yield
+    refresher.cancel()
+    if scheduler is not None:
+        scheduler.shutdown()
+
+
+app = FastAPI(title="Assembly Dashboard", lifespan=_lifespan)
 app.add_middleware(AuthMiddleware)
 
 STATIC_DIR = Path(__file__).parent / "static"
-LOGS_DIR = Path("conversation_logs")
+LOGS_DIR = Path(os.getenv("DASHBOARD_LOGS_DIR", "conversation_logs"))
 
-# Per-session state: {session_id: {queue, status, params, result, error}}
+# Shared by every run; passed to workers as absolute paths since each one
+# runs in its own working directory
+PERSONA_CACHE_DIR = Path("dynamic_personas")
+PERSONA_ARCHIVE_DIR = Path("personas_archive")
+PHASE_PLANS_DIR = Path("phase_plans")
+
+# Per-session state: {session_id: {events, inbox, status, params, result, error}}
 sessions: Dict[str, Dict[str, Any]] = {}
 
 # Per-benchmark-job state: {job_id: {queue, status, benchmark_id, result, error}}
 benchmark_jobs: Dict[str, Dict[str, Any]] = {}
 
-# Thread pool for running the (blocking) generator and benchmarks
-_executor = ThreadPoolExecutor(max_workers=4)
+# Assembly runs: worker process pool with queueing + per-user/global caps
+# (created on first use, see _get_scheduler)
+scheduler: Optional[RunScheduler] = None
+
+# Durable run/job state (survives restarts; see _reconcile_interrupted)
+run_store: Optional[RunStore] = None
+RESUME_INTERRUPTED = os.getenv("DASHBOARD_RESUME_INTERRUPTED", "1") != "0"
+
+
+def _get_scheduler() -> RunScheduler:
+    """The run scheduler, created on first use so importing the app touches no files."""
+    global scheduler
+    if scheduler is None:
+        scheduler = RunScheduler.from_env()
+    return scheduler
+
+
+def _get_run_store() -> RunStore:
+    """The run store, created on first use (see _get_scheduler)."""
+    global run_store
+    if run_store is None:
+        run_store = RunStore.from_env()
+    return run_store
+
+
+# Thread pool for running the (blocking) benchmarks; each job's output is
+# routed to its own queue, so jobs can run side by side
+BENCHMARK_WORKERS = int(os.getenv("DASHBOARD_BENCHMARK_WORKERS", "4"))
+_executor = ThreadPoolExecutor(max_workers=BENCHMARK_WORKERS)
+
+# Runs nobody has watched for this long are cancelled (0 disables)
+ABANDON_GRACE_SECONDS = float(os.getenv("DASHBOARD_ABANDON_GRACE_SECONDS", "120"))
+
+# Default wall-clock deadline for runs that don't set deadline_seconds
+_default_deadline = os.getenv("DASHBOARD_RUN_DEADLINE_SECONDS")
+DEFAULT_RUN_DEADLINE: Optional[int] = int(_default_deadline) if _default_deadline else None
+
+# Sessions are indexed for search when their logger saves them; this sweep
+# (at startup, then every N seconds; 0: startup only) picks up sessions
+# written elsewhere, e.g. by CLI runs or copied in
+SEARCH_REINDEX_SECONDS = float(os.getenv("DASHBOARD_SEARCH_REINDEX_SECONDS", "300"))
+
+_FINISHED_STATUSES = ("complete", "error", "cancelled")
+_TERMINAL_EVENTS = ("run_complete", "run_error", "run_cancelled")
+
+
+def _client_key(request: Request) -> str:
+    """Identify the caller for per-user caps: auth session cookie, else client host."""
+    token = request.cookies.get("assembly_session")
+    if token:
+        return f"session:{token}"
+    return f"host:{request.client.host if request.client else 'unknown'}"
 
 # ---------------------------------------------------------------------------
 # Request / response models
@@ -201,6 +299,17 @@ class RunParams(BaseModel):
     enable_convergence: Optional[bool] = None
     memory_mode: Optional[str] = None
     model: Optional[str] = None
+    # Wall-clock limit for the run once it starts executing
+    deadline_seconds: Optional[int] = Field(None, ge=1)
+    # Checkpoint every N turns as well as at phase boundaries
+    checkpoint_every_turns: Optional[int] = Field(None, ge=1)
+    # Regenerate the phase plan instead of reusing the one cached for this inspiration
+    fresh_phases: bool = False
+
+
+class ResumeParams(BaseModel):
+    deadline_seconds: Optional[int] = Field(None, ge=1)
+    checkpoint_every_turns: Optional[int] = Field(None, ge=1)
 
 # ---------------------------------------------------------------------------
 # Routes
@@ -220,7 +329,7 @@ async def serve_index():
 
 
 @app.post("/api/run")
-async def api_run(params: RunParams):
+async def api_run(params: RunParams, request: Request):
     if params.mode not in MODE_CONFIGS:
         return JSONResponse(
             {"error": f"Unknown mode '{params.mode}'. Valid: {list(MODE_CONFIGS.keys())}"},
@@ -232,56 +341,238 @@ async def api_run(params: RunParams):
             status_code=400,
         )
 
+    user = _client_key(request)
+    if _get_scheduler().is_full(user):
+        return JSONResponse(
+            {"error": "Too many runs queued — try again shortly", "scheduler": _get_scheduler().stats()},
+            status_code=429,
+        )
+
+    session_id = _start_run(
+        user, params.model_dump(), _generator_kwargs(params), params.deadline_seconds or DEFAULT_RUN_DEADLINE,
+    )
+    return JSONResponse({"session_id": session_id})
+
+
+def _generator_kwargs(params: RunParams) -> Dict[str, Any]:
+    """Map run params to multiple_llm_idea_generator() kwargs."""
+    # Build overrides dict from any non-None UI params
+    overrides = {}
+    if params.max_turns_per_phase is not None:
+        overrides["max_turns_per_phase"] = params.max_turns_per_phase
+    if params.personas_per_phase is not None:
+        overrides["personas_per_phase"] = params.personas_per_phase
+    if params.enable_mediator is not None:
+        overrides["enable_mediator"] = params.enable_mediator
+    if params.enable_convergence is not None:
+        overrides["enable_convergence_phase"] = params.enable_convergence
+    if params.memory_mode is not None:
+        overrides["memory_mode"] = params.memory_mode
+    if params.model is not None:
+        overrides["model"] = params.model
+    if params.checkpoint_every_turns is not None:
+        overrides["checkpoint_every_turns"] = params.checkpoint_every_turns
+
+    return {
+        "inspiration": params.inspiration,
+        "number_of_ideas": params.number_of_ideas,
+        "mode": params.mode,
+        "domain": params.domain,
+        "config_overrides": overrides or None,
+        "fresh_phases": params.fresh_phases,
+    }
+
+
+def _start_run(user: str, params: Dict[str, Any], generator_kwargs: Dict[str, Any], timeout: Optional[float]) -> str:
+    """Register a dashboard session and hand its run to the scheduler."""
     session_id = str(uuid4())
-    loop = asyncio.get_running_loop()
-    queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+    journal = _get_scheduler().runs_dir / session_id / "events.journal.jsonl"
 
     sessions[session_id] = {
-        "queue": queue,
-        "status": "starting",
-        "params": params.model_dump(),
+        # Sequence-numbered event log that WebSocket subscribers read from;
+        # events pass through the unbounded inbox so "block" backpressure
+        # can hold them back without stalling the scheduler.
+        "events": SessionEventLog.from_env(
+            spill_path=str(_get_scheduler().runs_dir / session_id / "events.jsonl"), journal_path=str(journal),
+        ),
+        "inbox": asyncio.Queue(),
+        "status": "queued",
+        "params": params,
+        "user": user,
         "start_time": time.time(),
         "result": None,
         "error": None,
+        "log_session": None,
     }
+    _get_run_store().create(
+        session_id, "assembly", status="queued", user=user, params=params,
+        run_kwargs={"generator_kwargs": generator_kwargs, "timeout": timeout}, event_log=str(journal),
+    )
 
-    # Kick off the generator in a background task
-    asyncio.create_task(_run_assembly(session_id, params, loop, queue))
+    # Hand the run to the scheduler in a background task
+    asyncio.create_task(_forward_events(session_id))
+    asyncio.create_task(_run_assembly(session_id, generator_kwargs, timeout))
+    _watch_abandonment(session_id)
+    return session_id
 
-    return JSONResponse({"session_id": session_id})
+
+def _set_status(session_id: str, status: str, **fields: Any) -> None:
+    """Update a run's status in memory and in the run store."""
+    session = sessions[session_id]
+    if status in _FINISHED_STATUSES and session["status"] != status:
+        _runs_finished.inc(status=status)
+    session["status"] = status
+    session.update(fields)
+    _get_run_store().update(session_id, status=status, last_seq=session["events"].last_seq, **fields)
+
+
+def _get_session(session_id: str) -> Optional[Dict[str, Any]]:
+    """Return a live session, rehydrating finished runs from the run store."""
+    session = sessions.get(session_id)
+    if session is not None:
+        return session
+    record = _get_run_store().get(session_id)
+    if record is None or record["kind"] != "assembly":
+        return None
+    session = _restore_session(record)
+    session["events"].close()  # Unfinished runs are reconciled at startup
+    sessions[session_id] = session
+    return session
+
+
+def _restore_session(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Session dict for a stored run, with its event log rebuilt from the journal."""
+    events = SessionEventLog.from_journal(
+        record["event_log"],
+        capacity=int(os.getenv("DASHBOARD_EVENT_RING_SIZE", "1000")),
+        policy=os.getenv("DASHBOARD_EVENT_BACKPRESSURE", "spill"),
+    )
+    return {
+        "events": events,
+        "inbox": asyncio.Queue(),
+        "status": record["status"],
+        "params": record["params"] or {},
+        "user": record["user"],
+        "start_time": record["created_at"],
+        "result": record["result"],
+        "error": record["error"],
+        "log_session": record["log_session"],
+    }
+
+
+def _reconcile_interrupted() -> None:
+    """
+    Deal with runs and jobs a previous server process left in flight.
+
+    Assembly runs with a checkpoint are resumed under the same session id, so
+    clients reattach with their cursor; runs that never started are queued
+    again; the rest get a terminal event and are marked failed. Benchmark
+    jobs are marked failed.
+    """
+    for record in _get_run_store().unfinished("benchmark"):
+        _get_run_store().update(record["id"], status="error", error="Interrupted by a server restart")
+
+    for record in _get_run_store().unfinished("assembly"):
+        session_id = record["id"]
+        sessions[session_id] = session = _restore_session(record)
+        publish = session["inbox"].put_nowait
+        asyncio.create_task(_forward_events(session_id))
+
+        run_kwargs = record["run_kwargs"] or {}
+        log_session = record["log_session"]
+        checkpointed = log_session and RunCheckpoint.exists(LOGS_DIR / log_session)
+
+        if record["status"] == "cancelling":
+            _set_status(session_id, "cancelled", error="Run cancelled")
+            publish({
+                "type": "run_cancelled", "reason": "cancelled", "message": "Run cancelled",
+                "ideas": [], "turns": 0, "resumable_session": log_session if checkpointed else None,
+                "total_time": time.time() - session["start_time"], "ts": time.time(),
+            })
+        elif RESUME_INTERRUPTED and (checkpointed or record["status"] == "queued"):
+            generator_kwargs = run_kwargs.get("generator_kwargs", {})
+            if checkpointed:
+                generator_kwargs = {
+                    "inspiration": None,
+                    "resume_session": log_session,
+                    "checkpoint_every": generator_kwargs.get("checkpoint_every"),
+                }
+            publish({"type": "run_resumed", "reason": "server_restart", "log_session": log_session, "ts": time.time()})
+            _set_status(session_id, "queued")
+            asyncio.create_task(_run_assembly(session_id, generator_kwargs, run_kwargs.get("timeout")))
+            _watch_abandonment(session_id)
+        else:
+            message = "Run interrupted by a server restart"
+            _set_status(session_id, "error", error=message)
+            publish({"type": "run_error", "message": message, "detail": "", "ts": time.time()})
+
+
+@app.get("/api/run/{session_id}")
+async def run_status(session_id: str):
+    """Return a run's status and, while it waits, its queue position."""
+    session = _get_session(session_id)
+    if session is None:
+        return JSONResponse({"error": "Unknown session"}, status_code=404)
+    return JSONResponse({
+        "session_id": session_id,
+        "status": session["status"],
+        "queue_position": _get_scheduler().position(session_id),
+        "last_seq": session["events"].last_seq,
+        "log_session": session["log_session"],
+        "error": session["error"],
+    })
+
+
+@app.delete("/api/run/{session_id}")
+async def cancel_run(session_id: str):
+    """Cancel a queued or running run. Partial results arrive as run_cancelled."""
+    session = _get_session(session_id)
+    if session is None:
+        return JSONResponse({"error": "Unknown session"}, status_code=404)
+    if session["status"] in _FINISHED_STATUSES or not _get_scheduler().cancel(session_id):
+        return JSONResponse({"error": f"Run already {session['status']}"}, status_code=409)
+    _set_status(session_id, "cancelling")
+    return JSONResponse({"session_id": session_id, "status": "cancelling"}, status_code=202)
+
+
+@app.get("/api/scheduler")
+async def scheduler_stats():
+    return JSONResponse(_get_scheduler().stats())
 
 
 @app.websocket("/ws/{session_id}")
-async def websocket_endpoint(ws: WebSocket, session_id: str):
+async def websocket_endpoint(ws: WebSocket, session_id: str, cursor: int = 0):
+    """Stream a run's events with seq > cursor; reconnect with the last seq seen."""
     await ws.accept()
+    _ws_connections.inc(endpoint="run")
 
-    if session_id not in sessions:
+    session = _get_session(session_id)
+    if session is None:
         await ws.send_json({"type": "run_error", "message": "Unknown session"})
         await ws.close()
         return
 
-    session = sessions[session_id]
-    queue: asyncio.Queue = session["queue"]
+    events: SessionEventLog = session["events"]
 
     try:
-        while True:
-            try:
-                event = await asyncio.wait_for(queue.get(), timeout=60.0)
-            except asyncio.TimeoutError:
-                # Send a heartbeat so the connection stays alive
-                await ws.send_json({"type": "heartbeat"})
-                continue
-
-            await ws.send_json(event)
-            queue.task_done()
-
-            # Terminal events — close after forwarding
-            if event["type"] in ("run_complete", "run_error"):
-                break
+        # Everything already available goes out as one frame; heartbeats keep
+        # idle connections alive
+        async with aclosing(events.subscribe_batches(max(0, cursor), heartbeat=60.0)) as stream:
+            async for batch in stream:
+                if len(batch) == 1:
+                    await ws.send_json(batch[0])
+                else:
+                    await ws.send_json({"type": "batch", "events": batch})
+
+                # Terminal events — close after forwarding
+                if batch[-1]["type"] in _TERMINAL_EVENTS:
+                    break
 
     except WebSocketDisconnect:
         pass
     finally:
+        if events.subscriber_count == 0:
+            _watch_abandonment(session_id)
         try:
             await ws.close()
         except Exception:
@@ -289,53 +580,216 @@ async def websocket_endpoint(ws: WebSocket, session_id: str):
 
 
 @app.get("/api/sessions")
-async def list_sessions():
-    """List all past sessions from conversation_logs/."""
+async def list_sessions(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    mode: Optional[str] = None,
+    model: Optional[str] = None,
+    domain: Optional[str] = None,
+    outcome: Optional[str] = None,
+    q: Optional[str] = None,
+    sort: str = "timestamp",
+    order: str = "desc",
+):
+    """List past sessions from the session catalog with pagination and filters."""
+    if sort not in SORTABLE_COLUMNS:
+        return JSONResponse(
+            {"error": f"Unknown sort '{sort}'. Valid: {list(SORTABLE_COLUMNS)}"},
+            status_code=400,
+        )
     if not LOGS_DIR.exists():
-        return JSONResponse([])
-
-    sessions_list = []
-    for session_dir in sorted(LOGS_DIR.iterdir(), reverse=True):
-        if not session_dir.is_dir():
-            continue
-        meta_file = session_dir / "metadata" / "session_metadata.json"
-        if meta_file.exists():
-            try:
-                with open(meta_file, encoding="utf-8") as f:
-                    meta = json.load(f)
-                sessions_list.append({
-                    "id": session_dir.name,
-                    "timestamp": meta.get("timestamp"),
-                    "inspiration": str(meta.get("inspiration", ""))[:80],
-                    "mode": meta.get("mode"),
-                    "model": meta.get("model"),
-                })
-            except Exception:
-                pass
+        return JSONResponse({"sessions": [], "total": 0, "limit": limit, "offset": offset})
 
-    return JSONResponse(sessions_list)
+    def _query() -> Dict[str, Any]:
+        catalog = _get_catalog()
+        page = catalog.query(
+            limit=limit, offset=offset, mode=mode, model=model, domain=domain,
+            outcome=outcome, q=q, sort=sort, order=order,
+        )
+        for row in page["sessions"]:
+            row["inspiration"] = row["inspiration"][:80] if row.get("inspiration") else ""
+        return page
+
+    # SQLite work happens off the event loop
+    return JSONResponse(await asyncio.to_thread(_query))
+
+
+def _get_catalog() -> SessionCatalog:
+    """Open the session catalog, backfilling it on first use."""
+    catalog = SessionCatalog.for_logs_dir(str(LOGS_DIR))
+    if not catalog.is_backfilled():
+        catalog.reindex(str(LOGS_DIR))
+    return catalog
+
+
+# ---------------------------------------------------------------------------
+# Session payloads — paginated, conditional, compressed
+# ---------------------------------------------------------------------------
+
+SESSION_PARTS = ("metadata", "exchanges")
+
+
+@lru_cache(maxsize=16)
+def _load_session_json(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a session JSON file; keyed by stat so rewritten files are re-read."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_session_json(path: Path) -> Any:
+    st = path.stat()
+    return _load_session_json(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _phase_index(exchanges: list) -> list:
+    """Per-phase exchange counts, turn ranges and offsets into the full list."""
+    phases: Dict[str, Dict[str, Any]] = {}
+    for index, exchange in enumerate(exchanges):
+        phase_id = exchange.get("phase")
+        turn = exchange.get("turn")
+        entry = phases.get(phase_id)
+        if entry is None:
+            entry = phases[phase_id] = {
+                "phase": phase_id, "offset": index, "count": 0, "first_turn": turn, "last_turn": turn,
+            }
+        entry["count"] += 1
+        entry["last_turn"] = turn
+    return list(phases.values())
 
 
 @app.get("/api/sessions/{session_id}")
-async def get_session(session_id: str):
-    """Return stored session data for replay."""
+async def get_session(
+    session_id: str,
+    request: Request,
+    phase: Optional[str] = None,
+    turn_from: Optional[int] = Query(None, ge=0),
+    turn_to: Optional[int] = Query(None, ge=0),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    include: str = ",".join(SESSION_PARTS),
+):
+    """
+    Return stored session data for replay.
+
+    Exchanges can be narrowed to one phase and/or a turn range and paged with
+    offset/limit; "page" reports the total and next_offset, and "phases" maps
+    each phase to its offset and turn range so clients can address ranges
+    directly. Responses carry ETag/Last-Modified (304 when unchanged) and are
+    gzip- or brotli-compressed when the client accepts it.
+    """
     session_dir = LOGS_DIR / session_id
-    if not session_dir.exists():
+    if Path(session_id).name != session_id or not session_dir.exists():
         return JSONResponse({"error": "Session not found"}, status_code=404)
+    parts = [part for part in include.split(",") if part]
+    if any(part not in SESSION_PARTS for part in parts):
+        return JSONResponse({"error": f"Unknown include. Valid: {list(SESSION_PARTS)}"}, status_code=400)
+
+    meta_file = session_file(session_dir, "session_metadata.json")
+    conv_file = session_file(session_dir, "full_conversation.json")
+
+    # Validators need only a stat(); unchanged sessions are never parsed
+    etag, last_modified = file_validators([meta_file, conv_file], variant=str(sorted(request.query_params.items())))
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
+    def _build() -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        if "metadata" in parts and meta_file.exists():
+            result["metadata"] = _read_session_json(meta_file)
+        if "exchanges" in parts and conv_file.exists():
+            exchanges = _read_session_json(conv_file)
+            selected = [
+                exchange for exchange in exchanges
+                if (phase is None or exchange.get("phase") == phase)
+                and (turn_from is None or (exchange.get("turn") or 0) >= turn_from)
+                and (turn_to is None or (exchange.get("turn") or 0) <= turn_to)
+            ]
+            end = len(selected) if limit is None else offset + limit
+            result["exchanges"] = selected[offset:end]
+            result["page"] = {
+                "offset": offset,
+                "limit": limit,
+                "total": len(selected),
+                "next_offset": end if end < len(selected) else None,
+            }
+            result["phases"] = _phase_index(exchanges)
+        return result
+
+    # Reading, serializing and compressing all happen in one worker thread
+    accept_encoding = request.headers.get("accept-encoding", "")
+    body, encoding = await asyncio.to_thread(lambda: encode_json_body(_build(), accept_encoding))
+    return json_body_response(body, encoding, etag, last_modified)
+
+
+@app.post("/api/sessions/{session_id}/resume")
+async def resume_session(session_id: str, request: Request, body: Optional[ResumeParams] = None):
+    """Start a new dashboard run that continues a stored session from its last checkpoint."""
+    body = body or ResumeParams()
+    if Path(session_id).name != session_id or not RunCheckpoint.exists(LOGS_DIR / session_id):
+        return JSONResponse({"error": "No checkpoint for this session"}, status_code=404)
+    for other_id, other in sessions.items():
+        if other["params"].get("resume_session") == session_id and other["status"] not in _FINISHED_STATUSES:
+            return JSONResponse(
+                {"error": "Session is already being resumed", "session_id": other_id}, status_code=409,
+            )
 
-    result: Dict[str, Any] = {}
+    user = _client_key(request)
+    if _get_scheduler().is_full(user):
+        return JSONResponse(
+            {"error": "Too many runs queued — try again shortly", "scheduler": _get_scheduler().stats()},
+            status_code=429,
+        )
+
+    run_id = _start_run(
+        user,
+        {"resume_session": session_id, **body.model_dump()},
+        {
+            "inspiration": None,  # Restored from the checkpoint
+            "resume_session": session_id,
+            "checkpoint_every": body.checkpoint_every_turns,
+        },
+        body.deadline_seconds or DEFAULT_RUN_DEADLINE,
+    )
+    return JSONResponse({"session_id": run_id, "resumed_from": session_id})
+
+
+@app.get("/api/search")
+async def search_sessions(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    kind: Optional[str] = None,
+    session_id: Optional[str] = None,
+):
+    """Ranked full-text search over exchanges, prompts, ideas and phase summaries."""
+    kinds = [k for k in kind.split(",") if k] if kind else None
+    if kinds and any(k not in DOCUMENT_KINDS for k in kinds):
+        return JSONResponse(
+            {"error": f"Unknown kind '{kind}'. Valid: {list(DOCUMENT_KINDS)}"},
+            status_code=400,
+        )
+    if not LOGS_DIR.exists():
+        return JSONResponse({"query": q, "results": []})
 
-    meta_file = session_dir / "metadata" / "session_metadata.json"
-    if meta_file.exists():
-        with open(meta_file, encoding="utf-8") as f:
-            result["metadata"] = json.load(f)
+    def _search():
+        # The index is kept current on session save and by _refresh_search_index
+        index = SearchIndex.for_logs_dir(str(LOGS_DIR))
+        return index.search(q, limit=limit, offset=offset, kinds=kinds, session_id=session_id)
 
-    conv_file = session_dir / "metadata" / "full_conversation.json"
-    if conv_file.exists():
-        with open(conv_file, encoding="utf-8") as f:
-            result["exchanges"] = json.load(f)
+    return JSONResponse({"query": q, "results": await asyncio.to_thread(_search)})
 
-    return JSONResponse(result)
+
+async def _refresh_search_index() -> None:
+    """Incrementally index new or changed sessions, every SEARCH_REINDEX_SECONDS."""
+    while True:
+        if LOGS_DIR.exists():
+            try:
+                await asyncio.to_thread(lambda: SearchIndex.for_logs_dir(str(LOGS_DIR)).update(str(LOGS_DIR)))
+            except Exception as e:
+                print(f"[!] Failed to refresh search index: {e}")
+        if SEARCH_REINDEX_SECONDS <= 0:
+            return
+        await asyncio.sleep(SEARCH_REINDEX_SECONDS)
 
 
 # ---------------------------------------------------------------------------
@@ -382,6 +836,7 @@ async def run_benchmark_endpoint(benchmark_id: str, body: BenchmarkRunParams):
         "result": None,
         "error": None,
     }
+    _get_run_store().create(job_id, "benchmark", status="starting", params={"benchmark_id": benchmark_id, "params": body.params})
 
     asyncio.create_task(_run_benchmark_task(job_id, benchmark_id, body.params, loop, queue))
     return JSONResponse({"job_id": job_id})
@@ -390,9 +845,17 @@ async def run_benchmark_endpoint(benchmark_id: str, body: BenchmarkRunParams):
 @app.websocket("/ws/benchmarks/{job_id}")
 async def benchmark_ws(ws: WebSocket, job_id: str):
     await ws.accept()
+    _ws_connections.inc(endpoint="benchmark")
 
     if job_id not in benchmark_jobs:
-        await ws.send_json({"type": "benchmark_error", "message": "Unknown job"})
+        # Finished before a restart: replay the outcome from the run store
+        record = _get_run_store().get(job_id)
+        if record is None or record["kind"] != "benchmark":
+            await ws.send_json({"type": "benchmark_error", "message": "Unknown job"})
+        elif record["status"] == "complete":
+            await ws.send_json({"type": "benchmark_complete", "result": record["result"], "ts": record["updated_at"]})
+        else:
+            await ws.send_json({"type": "benchmark_error", "message": record["error"] or "Benchmark failed"})
         await ws.close()
         return
 
@@ -430,6 +893,7 @@ async def _run_benchmark_task(
 ) -> None:
     job = benchmark_jobs[job_id]
     job["status"] = "running"
+    _get_run_store().update(job_id, status="running")
 
     queue.put_nowait({"type": "benchmark_started", "job_id": job_id, "benchmark_id": benchmark_id, "ts": time.time()})
 
@@ -438,11 +902,15 @@ async def _run_benchmark_task(
             _executor,
             lambda: run_benchmark(benchmark_id, queue, loop, params),
         )
-        job["status"] = "complete"
+        # run_benchmark reports its own failures as benchmark_error and returns None
+        job["status"] = "complete" if result is not None else "error"
         job["result"] = result
+        job["error"] = None if result is not None else "Benchmark failed (see job log)"
+        _get_run_store().update(job_id, status=job["status"], result=result, error=job["error"])
     except Exception as exc:
         job["status"] = "error"
         job["error"] = str(exc)
+        _get_run_store().update(job_id, status="error", error=str(exc))
         queue.put_nowait({
             "type": "benchmark_error",
             "message": str(exc),
@@ -451,69 +919,165 @@ async def _run_benchmark_task(
         })
 
 
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+metrics = MetricsRegistry(prefix="assembly_")
+_llm_requests = metrics.counter("llm_requests_total", "LLM requests made by runs", ("site", "outcome"))
+_llm_latency = metrics.histogram("llm_request_seconds", "LLM request latency in seconds", ("site",))
+_llm_ttft = metrics.histogram("llm_time_to_first_token_seconds", "Time to first streamed token", ("site",))
+_llm_tokens = metrics.counter("llm_tokens_total", "Tokens reported by the LLM API", ("site", "direction"))
+_runs_finished = metrics.counter("runs_finished_total", "Assembly runs by final status", ("status",))
+_ws_connections = metrics.counter("websocket_connections_total", "WebSocket connections accepted", ("endpoint",))
+
+
+def _record_llm_call(event: Dict[str, Any]) -> None:
+    """Fold an llm_call event (see ConversationMonitor.on_llm_call) into the metrics."""
+    site = event.get("site", "unknown")
+    _llm_requests.inc(site=site, outcome="ok" if event.get("ok", True) else "error")
+    _llm_latency.observe(event.get("seconds", 0.0), site=site)
+    if event.get("ttft") is not None:
+        _llm_ttft.observe(event["ttft"], site=site)
+    _llm_tokens.inc(event.get("prompt_tokens", 0), site=site, direction="in")
+    _llm_tokens.inc(event.get("completion_tokens", 0), site=site, direction="out")
+
+
+def _collect_state() -> Iterator[Sample]:
+    """Gauges read from live server state at scrape time."""
+    load = _get_scheduler().stats()
+    yield ("runs_active", "gauge", "Assembly runs executing", {}, load["running"])
+    yield ("runs_queued", "gauge", "Assembly runs waiting for a worker", {}, load["queued"])
+
+    running_jobs = sum(1 for job in benchmark_jobs.values() if job["status"] == "running")
+    busy_help = "Busy workers per executor"
+    max_help = "Worker capacity per executor"
+    yield ("executor_busy_workers", "gauge", busy_help, {"executor": "runs"}, load["running"])
+    yield ("executor_busy_workers", "gauge", busy_help, {"executor": "benchmarks"}, running_jobs)
+    yield ("executor_max_workers", "gauge", max_help, {"executor": "runs"}, load["max_workers"])
+    yield ("executor_max_workers", "gauge", max_help, {"executor": "benchmarks"}, BENCHMARK_WORKERS)
+
+    dropped = {"coalesced": 0, "evicted": 0}
+    spilled = subscribers = 0
+    for session_id, session in sessions.items():
+        events: SessionEventLog = session["events"]
+        for reason in dropped:
+            dropped[reason] += events.stats[reason]
+        spilled += events.stats["spilled"]
+        subscribers += events.subscriber_count
+        if session["status"] not in _FINISHED_STATUSES:
+            yield (
+                "session_inbox_depth", "gauge", "Events waiting to enter a run's event log",
+                {"session_id": session_id}, session["inbox"].qsize(),
+            )
+        if events.subscriber_count:
+            yield (
+                "session_subscribers", "gauge", "WebSocket subscribers per run",
+                {"session_id": session_id}, events.subscriber_count,
+            )
+    yield ("websocket_subscribers", "gauge", "WebSocket subscribers across all runs", {}, subscribers)
+    for reason, count in dropped.items():
+        yield (
+            "events_dropped_total", "counter", "Run events dropped from memory by backpressure",
+            {"reason": reason}, count,
+        )
+    yield ("events_spilled_total", "counter", "Run events moved from memory to disk", {}, spilled)
+
+
+metrics.collector(_collect_state)
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """
+    Prometheus text exposition of the metrics above.
+
+    Behind the same Basic Auth as every other route when DASHBOARD_PASS is
+    set — give the scrape job basic_auth credentials.
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Background runner
 # ---------------------------------------------------------------------------
 
-async def _run_assembly(
-    session_id: str,
-    params: RunParams,
-    loop: asyncio.AbstractEventLoop,
-    queue: asyncio.Queue,
-) -> None:
-    """Run the assembly generator in a thread pool and stream events via queue."""
+def _watch_abandonment(session_id: str) -> None:
+    """Cancel the run if no WebSocket subscribes within the grace period."""
+    if ABANDON_GRACE_SECONDS <= 0:
+        return
+
+    async def watch() -> None:
+        await asyncio.sleep(ABANDON_GRACE_SECONDS)
+        session = sessions.get(session_id)
+        if session and session["events"].subscriber_count == 0 and session["status"] in ("queued", "running"):
+            if _get_scheduler().cancel(session_id, reason="abandoned"):
+                _set_status(session_id, "cancelling")
+
+    asyncio.create_task(watch())
+
+
+async def _forward_events(session_id: str) -> None:
+    """Move a run's events from its inbox into its event log, in order."""
     session = sessions[session_id]
-    session["status"] = "running"
+    inbox: asyncio.Queue = session["inbox"]
+    events: SessionEventLog = session["events"]
+    while True:
+        event = await inbox.get()
+        await events.publish(event)
+        if event["type"] in _TERMINAL_EVENTS:
+            events.close()
+            _get_run_store().update(session_id, last_seq=events.last_seq)
+            return
 
-    # Build per-session emitter and logger
-    emitter = DashboardEventEmitter(queue=queue, loop=loop)
-    dash_logger = DashboardLogger(queue=queue, loop=loop, base_dir="conversation_logs")
 
-    # Announce the run (we're in the FastAPI event loop here, so direct put is fine)
-    queue.put_nowait({
+async def _run_assembly(session_id: str, generator_kwargs: Dict[str, Any], timeout: Optional[float]) -> None:
+    """Run the assembly generator through the scheduler and publish its events."""
+    session = sessions[session_id]
+    publish = session["inbox"].put_nowait
+
+    def on_event(event: Dict[str, Any]) -> None:
+        # Called on this event loop by the scheduler for every run event;
+        # batches from the run's EventBatcher are unpacked into the log
+        for item in event["events"] if event["type"] == "batch" else (event,):
+            if item["type"] == "run_dispatched":
+                _set_status(session_id, "running")
+            elif item["type"] == "log_session":
+                _set_status(session_id, session["status"], log_session=item["log_session"])
+            elif item["type"] == "llm_call":
+                _record_llm_call(item)
+                continue  # Telemetry only — not part of the replayable event stream
+            publish(item)
+
+    # Announce the run
+    publish({
         "type": "run_started",
         "session_id": session_id,
-        "params": params.model_dump(),
+        "params": session["params"],
         "ts": time.time(),
     })
 
-    # Build overrides dict from any non-None UI params
-    overrides = {}
-    if params.max_turns_per_phase is not None:
-        overrides["max_turns_per_phase"] = params.max_turns_per_phase
-    if params.personas_per_phase is not None:
-        overrides["personas_per_phase"] = params.personas_per_phase
-    if params.enable_mediator is not None:
-        overrides["enable_mediator"] = params.enable_mediator
-    if params.enable_convergence is not None:
-        overrides["enable_convergence_phase"] = params.enable_convergence
-    if params.memory_mode is not None:
-        overrides["memory_mode"] = params.memory_mode
-    if params.model is not None:
-        overrides["model"] = params.model
-
     try:
-        # Run the blocking generator in a thread so the FastAPI event loop
-        # stays free.  asyncio.run() inside the thread creates its own event
-        # loop — the emitter uses call_soon_threadsafe to bridge back.
-        result = await loop.run_in_executor(
-            _executor,
-            lambda: multiple_llm_idea_generator(
-                inspiration=params.inspiration,
-                number_of_ideas=params.number_of_ideas,
-                mode=params.mode,
-                domain=params.domain,
-                monitor=emitter,
-                logger=dash_logger,
-                config_overrides=overrides or None,
-            ),
+        # The generator runs in a scheduler worker process with its own
+        # working directory; events stream back through on_event.
+        result = await _get_scheduler().run(
+            session_id,
+            session["user"],
+            execute_assembly_run,
+            {
+                "logs_dir": str(LOGS_DIR.resolve()),
+                "persona_cache_dir": str(PERSONA_CACHE_DIR.resolve()),
+                "persona_archive_dir": str(PERSONA_ARCHIVE_DIR.resolve()),
+                "phase_cache_dir": str(PHASE_PLANS_DIR.resolve()),
+                **generator_kwargs,
+            },
+            on_event,
+            timeout=timeout,
         )
 
-        session["status"] = "complete"
-        session["result"] = result
+        _set_status(session_id, "complete", result=result)
 
-        # Back in the FastAPI event loop after await — direct put is fine
-        queue.put_nowait({
+        publish({
             "type": "run_complete",
             "ideas": result if isinstance(result, list) else result.get("ideas", []),
             "convergence": result.get("convergence") if isinstance(result, dict) else None,
@@ -521,11 +1085,24 @@ async def _run_assembly(
             "ts": time.time(),
         })
 
+    except RunCancelled as exc:
+        _set_status(session_id, "cancelled", error=str(exc), result=exc.partial or None)
+
+        publish({
+            "type": "run_cancelled",
+            "reason": exc.reason,
+            "message": str(exc),
+            "ideas": exc.partial.get("ideas", []),
+            "turns": exc.partial.get("turns", 0),
+            "resumable_session": exc.partial.get("resumable_session"),
+            "total_time": time.time() - session["start_time"],
+            "ts": time.time(),
+        })
+
     except Exception as exc:
-        session["status"] = "error"
-        session["error"] = str(exc)
+        _set_status(session_id, "error", error=str(exc))
 
-        queue.put_nowait({
+        publish({
             "type": "run_error",
             "message": str(exc),
             "detail": traceback.format_exc(),
@@ -0,0 +1,105 @@
+"""
+Async-iterator API over an assembly run.
+
+stream_assembly() runs run_assembly() as a task on the caller's event loop
+and yields the events its monitor and logger hooks produce — the same
+dictionaries the dashboard sends over /ws/{session_id} — followed by a final
+run_complete event. No thread or second event loop is needed per run, and
+the consumer reads at its own pace from an in-loop SessionEventLog.
+
+The buffer is bounded (buffer_size events) with the log's "coalesce" policy:
+a consumer that falls that far behind loses superseded snapshot events
+(persona_states, ...) first, then the oldest events, which it is told about
+with a {"type": "gap", "from_seq", "to_seq"} event. Every event carries the
+log's `seq`.
+
+Example:
+    >>> async with aclosing(stream_assembly("Tools for tiny teams", mode="fast")) as events:
+    ...     async for event in events:
+    ...         print(event["type"])
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+from framework.cancellation import CancellationToken
+from src.dashboard.event_emitter import DashboardEventEmitter, DashboardLogger
+from src.dashboard.event_log import SessionEventLog
+from src.idea_generation.generator import run_assembly
+
+DEFAULT_BUFFER_SIZE = 1000
+
+
+async def stream_assembly(
+    inspiration: Optional[str],
+    logs_dir: str = "conversation_logs",
+    cancel_token: Optional[CancellationToken] = None,
+    resume_session: Optional[str] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    **generator_kwargs: Any,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run an assembly on the current event loop, yielding its events as they happen.
+
+    Args:
+        inspiration: Passed to run_assembly() (None when resuming)
+        logs_dir: conversation_logs/ directory for the run's session folder
+        cancel_token: Optional CancellationToken; closing the iterator early
+            trips it so in-flight LLM calls are abandoned
+        resume_session: Session folder to continue from its checkpoint
+        buffer_size: Events held for a slow consumer before coalescing (see
+            the module docstring)
+        **generator_kwargs: Other run_assembly() arguments (mode, domain, ...)
+
+    Yields:
+        Event dicts (log_session first, run_complete last; gap if the
+        consumer fell more than buffer_size events behind)
+
+    Raises:
+        Whatever run_assembly() raises (e.g. RunCancelled), after every event
+        produced before the failure has been yielded
+    """
+    loop = asyncio.get_running_loop()
+    events = SessionEventLog(capacity=buffer_size, policy="coalesce")
+
+    def sink(event: Dict[str, Any]) -> None:
+        # Thread-safe: persona prompt logging runs inside worker threads
+        loop.call_soon_threadsafe(events.append, event)
+
+    emitter = DashboardEventEmitter(sink=sink)
+    dash_logger = DashboardLogger(base_dir=logs_dir, sink=sink, session_name=resume_session)
+    yield {"type": "log_session", "log_session": dash_logger.session_dir.name, "ts": time.time()}
+
+    start = time.time()
+    task = asyncio.create_task(run_assembly(
+        inspiration,
+        monitor=emitter,
+        logger=dash_logger,
+        cancel_token=cancel_token,
+        resume_session=resume_session,
+        **generator_kwargs,
+    ))
+    # Queued behind any events the run's threads handed to the loop before finishing
+    task.add_done_callback(lambda _: loop.call_soon_threadsafe(events.close))
+
+    try:
+        async for event in events.subscribe(cursor=0):
+            yield event
+
+        result = task.result()
+        yield {
+            "type": "run_complete",
+            "ideas": result if isinstance(result, list) else result.get("ideas", []),
+            "convergence": result.get("convergence") if isinstance(result, dict) else None,
+            "total_time": time.time() - start,
+            "ts": time.time(),
+        }
+    finally:
+        if not task.done():
+            if cancel_token is not None:
+                cancel_token.cancel()
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
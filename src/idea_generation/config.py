@@ -9,6 +9,12 @@ MODEL = "gpt-5.1"
 #   - "bookends_plus_middle": First phase + last phase + (n-2) middle phases
 #   - "first_n": First N phases (partial workflow, set via num_phases)
 #   - "all": All dynamically generated phases (full workflow)
+# Optional keys:
+#   - "stream_turns": Stream persona, mediator and convergence turns to the
+#     monitor's on_turn_delta hook as they are generated (default True)
+#   - "checkpoint_every_turns": Also checkpoint every N turns within a phase
+#   - "phase_cache_max_age_days": Reuse a cached phase plan for the same
+#     inspiration up to N days old (default 30; 0 always regenerates)
 MODE_CONFIGS = {
     "fast": {
         "phase_selection": "bookends",
@@ -8,10 +8,14 @@
 #   "general"   — anything else        → GeneralConvergenceOutput (decision summary)
 
 import json
-from typing import Dict, List, Any, Optional
+import time
+from typing import Callable, Dict, List, Any, Optional
 from dataclasses import dataclass, field, asdict
 from openai import OpenAI
 
+from framework.cancellation import CancellationToken, RunCancelled
+from framework.persona import completion_usage, stream_chat_completion
+
 
 @dataclass
 class ConvergenceOutput:
@@ -393,6 +397,10 @@ def format_ideas_discussed(ideas_discussed: List[Dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
+# on_llm_call site per convergence turn
+_CONVERGENCE_SITES = {1: "convergence_synthesis", 2: "convergence_critique", 3: "convergence_refinement"}
+
+
 def run_convergence_phase(
     inspiration: str,
     logs: List[Dict[str, Any]],
@@ -401,6 +409,9 @@ def run_convergence_phase(
     model: str = "gpt-4o-mini",
     verbose: bool = True,
     domain: str = "product",
+    cancel_token: Optional[CancellationToken] = None,
+    on_delta: Optional[Callable[[int, str], None]] = None,
+    on_llm_call: Optional[Callable[..., None]] = None,
 ) -> Dict[str, Any]:
     """
     Run the convergence phase: 3-turn iterative refinement to produce
@@ -414,11 +425,19 @@ def run_convergence_phase(
         model: Model to use
         verbose: Print progress
         domain: "product" | "technical" | "general"
+        cancel_token: Optional CancellationToken; each LLM turn is abandoned
+            (RunCancelled raised) as soon as it trips
+        on_delta: Optional callback (turn number, text chunk); when given each
+            turn is streamed and its chunks are passed on as they arrive
+        on_llm_call: Optional ConversationMonitor.on_llm_call hook; each turn
+            is reported as "convergence_synthesis", "convergence_critique" or
+            "convergence_refinement", with its time to first token if streamed
 
     Returns:
         Dict with convergence_output (domain-specific dataclass as dict),
         intermediate turns, success flag, and error.
     """
+
     # Select prompts and output builder for this domain
     if domain == "technical":
         synthesis_prompt = TECHNICAL_SYNTHESIS_PROMPT
@@ -452,6 +471,39 @@ def run_convergence_phase(
 
     client = OpenAI()
 
+    def complete(turn: int, **request) -> tuple:
+        """One convergence turn: (content, total tokens, seconds to first token or None)."""
+        if on_delta is None:
+            fn, kwargs = client.chat.completions.create, request
+        else:
+            fn = stream_chat_completion
+            kwargs = dict(request, client=client, on_delta=lambda delta: on_delta(turn, delta))
+
+        site = _CONVERGENCE_SITES[turn]
+        report = on_llm_call or (lambda **kw: None)
+        start = time.perf_counter()
+        try:
+            response = cancel_token.call(fn, **kwargs) if cancel_token is not None else fn(**kwargs)
+        except RunCancelled:
+            raise
+        except Exception:
+            report(site=site, seconds=time.perf_counter() - start, ok=False)
+            raise
+
+        if on_delta is None:
+            content, usage, ttft = response.choices[0].message.content, completion_usage(response), None
+        else:
+            content, usage, ttft = response["content"], response["usage"], response["ttft"]
+        prompt_tokens, completion_tokens = usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+        report(
+            site=site,
+            seconds=time.perf_counter() - start,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            ttft=ttft,
+        )
+        return content, prompt_tokens + completion_tokens, ttft
+
     result = {
         "convergence_output": None,
         "turns": [],
@@ -477,7 +529,8 @@ def run_convergence_phase(
         if verbose:
             print(f"\n[Convergence 1/3] Synthesizing conversation into draft {domain_label}...")
 
-        turn1_response = client.chat.completions.create(
+        draft_spec, tokens, ttft = complete(
+            1,
             model=model,
             messages=[
                 {"role": "system", "content": synthesis_system},
@@ -493,12 +546,12 @@ def run_convergence_phase(
             temperature=0.7,
         )
 
-        draft_spec = turn1_response.choices[0].message.content
         result["turns"].append({
             "turn": 1,
             "type": "synthesis",
             "content": draft_spec,
-            "tokens": turn1_response.usage.total_tokens if turn1_response.usage else 0,
+            "tokens": tokens,
+            "ttft": ttft,
         })
 
         if verbose:
@@ -508,7 +561,8 @@ def run_convergence_phase(
         if verbose:
             print("[Convergence 2/3] Running critique...")
 
-        turn2_response = client.chat.completions.create(
+        critiques, tokens, ttft = complete(
+            2,
             model=model,
             messages=[
                 {"role": "system", "content": critique_system},
@@ -517,12 +571,12 @@ def run_convergence_phase(
             temperature=0.7,
         )
 
-        critiques = turn2_response.choices[0].message.content
         result["turns"].append({
             "turn": 2,
             "type": "critique",
             "content": critiques,
-            "tokens": turn2_response.usage.total_tokens if turn2_response.usage else 0,
+            "tokens": tokens,
+            "ttft": ttft,
         })
 
         if verbose:
@@ -532,7 +586,8 @@ def run_convergence_phase(
         if verbose:
             print("[Convergence 3/3] Refining and producing final output...")
 
-        turn3_response = client.chat.completions.create(
+        final_json_str, tokens, ttft = complete(
+            3,
             model=model,
             messages=[
                 {"role": "system", "content": refinement_system},
@@ -547,12 +602,12 @@ def run_convergence_phase(
             temperature=0.3,
         )
 
-        final_json_str = turn3_response.choices[0].message.content
         result["turns"].append({
             "turn": 3,
             "type": "final_output",
             "content": final_json_str,
-            "tokens": turn3_response.usage.total_tokens if turn3_response.usage else 0,
+            "tokens": tokens,
+            "ttft": ttft,
         })
 
         # Parse JSON and build domain-specific output object
@@ -571,6 +626,8 @@ def run_convergence_phase(
             if verbose:
                 print("    [!] Failed to parse JSON output")
 
+    except RunCancelled:
+        raise
     except Exception as e:
         result["error"] = str(e)
         if verbose:
@@ -6,33 +6,180 @@ import logging
 import re
 import asyncio
 from framework import FacilitatorAgent, ConversationLogger, ConversationMonitor
+from framework.cancellation import RunCancelled
+from framework.checkpoint import RunCheckpoint
 
 log = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 from framework.helpers import load_personas_from_directory
 from framework.persona_manager import PersonaManager
+from framework.phase_cache import PhasePlanCache, DEFAULT_MAX_AGE_DAYS
 from framework.generators import generate_phases_for_domain
 from src.idea_generation.config import MODE_CONFIGS, MODEL
-from src.idea_generation.orchestration import meeting_facilitator
+from src.idea_generation.orchestration import _llm_call, meeting_facilitator
 from src.idea_generation.extraction import extract_ideas_with_llm
 from src.idea_generation.convergence import run_convergence_phase, format_convergence_output
 
 
-def multiple_llm_idea_generator(inspiration, number_of_ideas=1, mode="medium", monitor=None, logger=None, config_overrides=None, domain="product"):
+def _write_meeting_logs(logs):
+    """Save the raw exchange list to meeting_logs.txt (backwards compatibility)."""
+    with open("meeting_logs.txt", "w", encoding="utf-8") as f:
+        json.dump(logs, f, indent=2)
+
+
+async def _flush_cancelled_run(exc, logger, shared_context):
+    """
+    Persist whatever a cancelled run produced and attach it to the exception.
+
+    Writes meeting_logs.txt and the full session logs (outcome recorded as the
+    cancellation reason) so a cancelled or timed-out run is still replayable.
+    The writes (and the catalog and search index updates in save_all) run in a
+    worker thread, off the event loop.
+    """
+    logs = shared_context.get("logs", [])
+    ideas = shared_context.get("ideas", [])
+    ideas_discussed = shared_context.get("ideas_discussed", [])
+
+    logger.log_metadata("outcome", exc.reason)
+    logger.log_metadata("ideas", ideas)
+    logger.log_metadata("ideas_discussed", ideas_discussed)
+    await asyncio.to_thread(_write_meeting_logs, logs)
+    await asyncio.to_thread(logger.save_all)
+
+    session_dir = getattr(logger, "session_dir", None)
+    exc.partial = {
+        "ideas": ideas,
+        "ideas_discussed": ideas_discussed,
+        "turns": len(logs),
+        "session_dir": str(session_dir or ""),
+        # Pass to --resume / POST /api/sessions/{id}/resume to continue the run
+        "resumable_session": session_dir.name if session_dir and RunCheckpoint.exists(session_dir) else None,
+    }
+    log.warning("Run stopped (%s) after %d exchanges; partial logs saved", exc.reason, len(logs))
+
+
+def _convergence_deltas(monitor):
+    """Forward streamed convergence turns to monitor.on_turn_delta (phase "convergence")."""
+    on_turn_delta = getattr(monitor, 'on_turn_delta', lambda **kw: None)
+    return lambda turn, delta: on_turn_delta(speaker="Convergence", delta=delta, phase_id="convergence", turn=turn)
+
+
+def select_phases(all_phases, config):
+    """
+    Pick the phases a mode runs from the generated workflow.
+
+    Dynamically generated phases can have any names, so selection is positional
+    (see "phase_selection" in MODE_CONFIGS).
+
+    Args:
+        all_phases: Generated phase dicts, in workflow order
+        config: Mode configuration (phase_selection, num_phases)
+
+    Returns:
+        The selected phase dicts
+    """
+    selection_strategy = config.get("phase_selection", "all")
+
+    if selection_strategy == "bookends":
+        # Fast mode: Take first and last phase (exploring and deciding)
+        if len(all_phases) >= 2:
+            return [all_phases[0], all_phases[-1]]
+        return all_phases
+    if selection_strategy == "bookends_plus_middle":
+        # Medium mode: First + (n-2) middle + last (ensures decision phase is included)
+        n = config.get("num_phases", 4)
+        if len(all_phases) <= n:
+            # If we have fewer phases than requested, take all
+            return all_phases
+        if n <= 2:
+            # If n is 2 or less, just do bookends
+            return [all_phases[0], all_phases[-1]] if len(all_phases) >= 2 else all_phases
+        # Take first, (n-2) from middle, and last
+        middle_count = n - 2
+        middle_phases = all_phases[1:1+middle_count]  # Take first (n-2) after first phase
+        return [all_phases[0]] + middle_phases + [all_phases[-1]]
+    if selection_strategy == "first_n":
+        # Take first N phases (partial workflow)
+        n = config.get("num_phases", 3)
+        return all_phases[:n] if len(all_phases) >= n else all_phases
+    # "all" — Standard/deep mode: Use all generated phases (full workflow)
+    return all_phases
+
+
+def multiple_llm_idea_generator(inspiration, number_of_ideas=1, mode="medium", monitor=None, logger=None, config_overrides=None, domain="product", cancel_token=None, resume_session=None, checkpoint_every=None, fresh_phases=False, persona_cache_dir="dynamic_personas", persona_archive_dir="personas_archive", phase_cache_dir="phase_plans"):
+    """
+    Synchronous entry point: run_assembly() on a fresh event loop.
+
+    Use this from scripts and worker processes; async callers should await
+    run_assembly() directly. Arguments, return value and exceptions are those
+    of run_assembly().
+    """
+    return asyncio.run(run_assembly(
+        inspiration,
+        number_of_ideas=number_of_ideas,
+        mode=mode,
+        monitor=monitor,
+        logger=logger,
+        config_overrides=config_overrides,
+        domain=domain,
+        cancel_token=cancel_token,
+        resume_session=resume_session,
+        checkpoint_every=checkpoint_every,
+        fresh_phases=fresh_phases,
+        persona_cache_dir=persona_cache_dir,
+        persona_archive_dir=persona_archive_dir,
+        phase_cache_dir=phase_cache_dir,
+    ))
+
+
+async def run_assembly(inspiration, number_of_ideas=1, mode="medium", monitor=None, logger=None, config_overrides=None, domain="product", cancel_token=None, resume_session=None, checkpoint_every=None, fresh_phases=False, persona_cache_dir="dynamic_personas", persona_archive_dir="personas_archive", phase_cache_dir="phase_plans"):
     """
     Generate startup ideas using dynamic persona loading and facilitator-directed conversation.
 
     This function orchestrates a multi-persona conversation across multiple phases,
     using staged prompts that guide personas from problem discovery to solution synthesis.
 
+    Runs on the caller's event loop: blocking LLM calls are moved to worker
+    threads, so the loop stays free for other runs and I/O.
+
     Args:
         inspiration: User-provided inspiration for ideas
         number_of_ideas: How many ideas to generate
         mode: Run mode - "fast", "medium", "standard", or "deep" (default: "medium")
+        cancel_token: Optional CancellationToken (cancel request or deadline)
+        resume_session: Session folder name (under the logger's base_dir) to
+            continue from its last checkpoint. The run's inspiration, mode,
+            domain, overrides and phases are taken from the checkpoint.
+        checkpoint_every: Also checkpoint every N turns within a phase
+            (default: config "checkpoint_every_turns", else phase boundaries only)
+        fresh_phases: Generate a new phase plan even if one is cached for
+            this inspiration (the new plan replaces the cached one)
+        persona_cache_dir: PersonaManager cache of generated personas
+        persona_archive_dir: PersonaManager archive used when generation fails
+        phase_cache_dir: Folder of cached phase plans (see PhasePlanCache)
 
     Returns:
         List of business idea dictionaries with structured fields
+
+    Raises:
+        RunCancelled: If cancel_token trips. Partial logs are flushed first and
+            the partial result is attached as exc.partial.
+        FileNotFoundError: If resume_session has no checkpoint
     """
+    # Resuming: reopen the session folder and restore the run's parameters
+    checkpoint = None
+    if resume_session:
+        if logger is None:
+            logger = ConversationLogger(base_dir="conversation_logs", session_name=resume_session)
+        checkpoint = RunCheckpoint.load(logger.session_dir)
+        run = checkpoint.run
+        inspiration = run["inspiration"]
+        number_of_ideas = run["number_of_ideas"]
+        mode = run["mode"]
+        domain = run["domain"]
+        config_overrides = run.get("config_overrides")
+        log.info("Resuming session %s from its checkpoint (%s)", resume_session, checkpoint.state["saved_at"])
+
     # Get mode configuration
     if mode not in MODE_CONFIGS:
         log.warning("Unknown mode '%s', using 'medium'", mode)
@@ -41,14 +188,16 @@ def multiple_llm_idea_generator(inspiration, number_of_ideas=1, mode="medium", m
     config = dict(MODE_CONFIGS[mode])
     if config_overrides:
         config.update(config_overrides)
+    if checkpoint_every is None:
+        checkpoint_every = config.get("checkpoint_every_turns", 0)
     log.info("Running in %s mode: %s", mode.upper(), config["description"])
     log.info("Domain: %s", domain)
 
     # Initialize PersonaManager for dynamic generation
     log.info("Initializing PersonaManager for dynamic persona generation...")
     persona_manager = PersonaManager(
-        cache_dir="dynamic_personas",
-        archive_dir="personas_archive",
+        cache_dir=persona_cache_dir,
+        archive_dir=persona_archive_dir,
         model_name=config["model"]
     )
 
@@ -71,11 +220,35 @@ def multiple_llm_idea_generator(inspiration, number_of_ideas=1, mode="medium", m
 
     # Generate domain-specific phases using LLM
     log.info("Generating custom workflow phases for domain...")
-    all_phases = generate_phases_for_domain(
-        inspiration=inspiration,
-        number_of_ideas=number_of_ideas,
-        model_name=config["model"]
-    )
+    phase_kwargs = dict(inspiration=inspiration, number_of_ideas=number_of_ideas, model_name=config["model"])
+
+    # Initialize shared context up front so a cancelled run can still flush it
+    # (Pure Dynamic - no prompt template needed; phases generate their own prompts)
+    shared_context = {
+        "inspiration": inspiration,
+        "number_of_ideas": number_of_ideas,
+        "ideas": [],  # Will be populated during conversation (final structured ideas)
+        "ideas_discussed": [],  # Track ideas with full context (title, overview, example, status, rejection_reason)
+        "current_focus": None  # Most recently discussed idea title
+    }
+    try:
+        if checkpoint is not None:
+            all_phases = checkpoint.run["phases"]  # Already selected when the run started
+        else:
+            phase_cache = PhasePlanCache(
+                cache_dir=phase_cache_dir,
+                max_age_days=config.get("phase_cache_max_age_days", DEFAULT_MAX_AGE_DAYS),
+            )
+            all_phases = None if fresh_phases else phase_cache.get(**phase_kwargs)
+            if all_phases:
+                log.info("Reusing cached phase plan for this inspiration (use fresh_phases to regenerate)")
+            else:
+                all_phases = await _llm_call(cancel_token, generate_phases_for_domain, **phase_kwargs)
+                if all_phases:
+                    phase_cache.put(phases=all_phases, **phase_kwargs)
+    except RunCancelled as exc:
+        await _flush_cancelled_run(exc, logger, shared_context)
+        raise
 
     # Notify monitor that phases have been generated
     if monitor:
@@ -93,81 +266,74 @@ def multiple_llm_idea_generator(inspiration, number_of_ideas=1, mode="medium", m
         )
 
     # Select phases based on mode configuration strategy
-    # Dynamically generated phases can have any names, so we use positional selection
-    selection_strategy = config.get("phase_selection", "all")
-
-    if selection_strategy == "bookends":
-        # Fast mode: Take first and last phase (exploring and deciding)
-        if len(all_phases) >= 2:
-            phases = [all_phases[0], all_phases[-1]]
-        else:
-            phases = all_phases
-    elif selection_strategy == "bookends_plus_middle":
-        # Medium mode: First + (n-2) middle + last (ensures decision phase is included)
-        n = config.get("num_phases", 4)
-        if len(all_phases) <= n:
-            # If we have fewer phases than requested, take all
-            phases = all_phases
-        elif n <= 2:
-            # If n is 2 or less, just do bookends
-            phases = [all_phases[0], all_phases[-1]] if len(all_phases) >= 2 else all_phases
-        else:
-            # Take first, (n-2) from middle, and last
-            middle_count = n - 2
-            middle_phases = all_phases[1:1+middle_count]  # Take first (n-2) after first phase
-            phases = [all_phases[0]] + middle_phases + [all_phases[-1]]
-    elif selection_strategy == "first_n":
-        # Take first N phases (partial workflow)
-        n = config.get("num_phases", 3)
-        phases = all_phases[:n] if len(all_phases) >= n else all_phases
-    else:  # "all"
-        # Standard/deep mode: Use all generated phases (full workflow)
-        phases = all_phases
+    phases = all_phases if checkpoint is not None else select_phases(all_phases, config)
 
     # Ensure max_turns is set (use from config if not in phase)
     for phase in phases:
         if "max_turns" not in phase:
             phase["max_turns"] = config["max_turns_per_phase"]
 
+    # Generate every phase's personas concurrently now, rather than one
+    # blocking round-trip at each phase boundary (a resumed run restores its
+    # personas from the checkpoint and requests the rest on demand)
+    if checkpoint is None:
+        persona_manager.prefetch_personas(
+            inspiration=inspiration,
+            phases=phases,
+            count=config.get("personas_per_phase", 4),
+            domain=domain,
+        )
+
     log.info("Running %d phases: %s", len(phases), ", ".join(p["phase_id"] for p in phases))
     log.info("Max turns per phase: varies by phase")
 
     # Log phases to metadata
     logger.log_metadata("phases", phases)
 
-    # Initialize shared context (Pure Dynamic - no prompt template needed)
-    # Phases generate their own prompts based on their goals
-    shared_context = {
-        "inspiration": inspiration,
-        "number_of_ideas": number_of_ideas,
-        "ideas": [],  # Will be populated during conversation (final structured ideas)
-        "ideas_discussed": [],  # Track ideas with full context (title, overview, example, status, rejection_reason)
-        "current_focus": None  # Most recently discussed idea title
-    }
+    # Checkpoint at every phase boundary so a crashed run can be resumed
+    if checkpoint is None:
+        checkpoint = RunCheckpoint(logger.session_dir)
+        checkpoint.run = {
+            "inspiration": inspiration,
+            "number_of_ideas": number_of_ideas,
+            "mode": mode,
+            "domain": domain,
+            "config_overrides": config_overrides,
+            "phases": phases,
+        }
+    checkpoint.every_turns = max(0, int(checkpoint_every or 0))
 
     # Run the facilitator-directed meeting (async) with dynamic persona generation
     log.info("Starting facilitator-directed meeting with dynamic persona generation...")
-    final_context = asyncio.run(meeting_facilitator(
-        persona_manager=persona_manager,
-        inspiration=inspiration,
-        phases=phases,
-        shared_context=shared_context,
-        facilitator=facilitator,
-        logger=logger,
-        monitor=monitor,
-        enable_summary_updates=config["enable_summary_updates"],
-        use_async_updates=True,
-        model_name=config["model"],
-        personas_per_phase=config.get("personas_per_phase", 4),
-        enable_mediator=config.get("enable_mediator", True),
-        memory_mode=config.get("memory_mode", "structured"),
-        domain=domain,
-    ))
+    try:
+        final_context = await meeting_facilitator(
+            persona_manager=persona_manager,
+            inspiration=inspiration,
+            phases=phases,
+            shared_context=shared_context,
+            facilitator=facilitator,
+            logger=logger,
+            monitor=monitor,
+            enable_summary_updates=config["enable_summary_updates"],
+            use_async_updates=True,
+            model_name=config["model"],
+            personas_per_phase=config.get("personas_per_phase", 4),
+            enable_mediator=config.get("enable_mediator", True),
+            memory_mode=config.get("memory_mode", "structured"),
+            domain=domain,
+            cancel_token=cancel_token,
+            checkpoint=checkpoint,
+            stream_turns=config.get("stream_turns", True),
+        )
+    except RunCancelled as exc:
+        await _flush_cancelled_run(exc, logger, shared_context)
+        raise
+    finally:
+        persona_manager.cancel_prefetch()
 
     # Save basic logs (backwards compatibility)
     logs = final_context.get("logs", [])
-    with open("meeting_logs.txt", "w", encoding="utf-8") as f:
-        json.dump(logs, f, indent=2)
+    await asyncio.to_thread(_write_meeting_logs, logs)
     log.info("Meeting logs saved to meeting_logs.txt (%d exchanges)", len(logs))
 
     # Extract ideas from the final conversation
@@ -202,7 +368,9 @@ def multiple_llm_idea_generator(inspiration, number_of_ideas=1, mode="medium", m
     # LLM extraction fallback: If JSON extraction failed, use LLM to extract ideas
     if not business_ideas:
         log.info("JSON extraction failed, using LLM extraction fallback...")
-        business_ideas = extract_ideas_with_llm(
+        business_ideas = await _llm_call(
+            None,
+            extract_ideas_with_llm,
             logs=logs,
             number_of_ideas=number_of_ideas,
             model_name=config["model"]
@@ -219,15 +387,25 @@ def multiple_llm_idea_generator(inspiration, number_of_ideas=1, mode="medium", m
         log.info("CONVERGENCE PHASE: Refining into commercial spec...")
         log.info("=" * 60)
 
-        convergence_result = run_convergence_phase(
-            inspiration=inspiration,
-            logs=logs,
-            ideas_discussed=final_context.get("ideas_discussed", []),
-            raw_ideas=business_ideas,
-            model=config["model"],
-            verbose=True,
-            domain=domain,
-        )
+        try:
+            # Checks cancel_token itself between turns
+            convergence_result = await asyncio.to_thread(
+                run_convergence_phase,
+                inspiration=inspiration,
+                logs=logs,
+                ideas_discussed=final_context.get("ideas_discussed", []),
+                raw_ideas=business_ideas,
+                model=config["model"],
+                verbose=True,
+                domain=domain,
+                cancel_token=cancel_token,
+                on_delta=_convergence_deltas(monitor) if config.get("stream_turns", True) else None,
+                on_llm_call=getattr(monitor, 'on_llm_call', None),
+            )
+        except RunCancelled as exc:
+            shared_context["ideas"] = business_ideas
+            await _flush_cancelled_run(exc, logger, shared_context)
+            raise
 
         if convergence_result.get("success"):
             convergence_output = convergence_result.get("convergence_output", {})
@@ -244,8 +422,8 @@ def multiple_llm_idea_generator(inspiration, number_of_ideas=1, mode="medium", m
     else:
         log.info("Convergence phase disabled (enable with enable_convergence_phase=True)")
 
-    # Save all comprehensive logs
-    logger.save_all()
+    # Save all comprehensive logs (file writes and catalog/index updates, off the loop)
+    await asyncio.to_thread(logger.save_all)
 
     # Build final return value
     result = {
@@ -131,16 +131,13 @@ If pros/cons haven't been discussed yet, leave those fields empty ("").
 """
 
     try:
-        # Run in thread pool to not block async event loop
-        loop = asyncio.get_event_loop()
-        completion = await loop.run_in_executor(
-            None,
-            lambda: client.chat.completions.create(
-                model=model_name,
-                messages=[{"role": "user", "content": extraction_prompt}],
-                temperature=0.0,
-                max_tokens=500
-            )
+        # Run in a worker thread (with this task's context) to not block the event loop
+        completion = await asyncio.to_thread(
+            client.chat.completions.create,
+            model=model_name,
+            messages=[{"role": "user", "content": extraction_prompt}],
+            temperature=0.0,
+            max_tokens=500
         )
 
         result_text = completion.choices[0].message.content.strip()
@@ -295,15 +292,12 @@ If NO clear rejection, return: {{"rejected": false}}
 """
 
     try:
-        loop = asyncio.get_event_loop()
-        completion = await loop.run_in_executor(
-            None,
-            lambda: client.chat.completions.create(
-                model=model_name,
-                messages=[{"role": "user", "content": detection_prompt}],
-                temperature=0.0,
-                max_tokens=300
-            )
+        completion = await asyncio.to_thread(
+            client.chat.completions.create,
+            model=model_name,
+            messages=[{"role": "user", "content": detection_prompt}],
+            temperature=0.0,
+            max_tokens=300
         )
 
         result_text = completion.choices[0].message.content.strip()
@@ -6,6 +6,8 @@ import logging
 import time
 from typing import Dict, List, Any, Optional
 from framework import Persona, FacilitatorAgent, ConversationLogger
+from framework.cancellation import CancellationToken, RunCancelled
+from framework.checkpoint import RunCheckpoint
 from framework.monitor import ConversationMonitor
 from framework.mediator_persona import MediatorPersona
 from framework.mediator_triggers import (
@@ -28,6 +30,75 @@ from framework.facilitator import extract_key_phrases
 logger = logging.getLogger(__name__)
 
 
+async def _llm_call(cancel_token: Optional[CancellationToken], fn, *args, **kwargs):
+    """
+    Make a blocking LLM call in a worker thread, keeping the event loop free.
+
+    With a token the call is abandoned (RunCancelled) as soon as the token trips.
+    """
+    if cancel_token is None:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return await cancel_token.run_sync(fn, *args, **kwargs)
+
+
+async def _guarded(cancel_token: Optional[CancellationToken], awaitable):
+    """Await an async LLM call, abandoning it if the token trips."""
+    if cancel_token is None:
+        return await awaitable
+    return await cancel_token.guard(awaitable)
+
+
+async def _observed(monitor: Optional[ConversationMonitor], site: str, awaitable):
+    """
+    Await an LLM call and report it to the monitor's on_llm_call hook.
+
+    Latency is always reported; token counts and time-to-first-token come from
+    the returned "usage" / "ttft" fields when the call provides them.
+    Cancellation is not counted as an error.
+    """
+    start = time.perf_counter()
+    on_llm_call = getattr(monitor, 'on_llm_call', lambda **kw: None)
+    try:
+        result = await awaitable
+    except RunCancelled:
+        raise
+    except Exception:
+        on_llm_call(site=site, seconds=time.perf_counter() - start, ok=False)
+        raise
+    usage = (result.get("usage") if isinstance(result, dict) else None) or {}
+    on_llm_call(
+        site=site,
+        seconds=time.perf_counter() - start,
+        prompt_tokens=usage.get("prompt_tokens", 0),
+        completion_tokens=usage.get("completion_tokens", 0),
+        ttft=result.get("ttft") if isinstance(result, dict) else None,
+    )
+    return result
+
+
+def _delta_callback(monitor, cancel_token: Optional[CancellationToken], speaker: str, phase_id: str, turn: int):
+    """
+    on_delta for a streamed turn: forward chunks to monitor.on_turn_delta.
+
+    Runs in the LLM worker thread; raising RunCancelled once the token trips
+    stops reading the stream.
+    """
+    on_turn_delta = getattr(monitor, 'on_turn_delta', lambda **kw: None)
+
+    def on_delta(delta: str) -> None:
+        if cancel_token:
+            cancel_token.check()
+        on_turn_delta(speaker=speaker, delta=delta, phase_id=phase_id, turn=turn)
+
+    return on_delta
+
+
+def _turn_tokens(response_data: Dict[str, Any], estimate: int) -> int:
+    """Tokens used by a turn: reported usage, else a rough estimate."""
+    usage = response_data.get("usage") or {}
+    return (usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)) or estimate
+
+
 async def meeting_facilitator(
     persona_manager,
     inspiration: str,
@@ -44,6 +115,9 @@ async def meeting_facilitator(
     mediator: Optional[MediatorPersona] = None,
     memory_mode: str = "structured",
     domain: str = "product",
+    cancel_token: Optional[CancellationToken] = None,
+    checkpoint: Optional[RunCheckpoint] = None,
+    stream_turns: bool = False,
 ) -> Dict[str, Any]:
     """
     Facilitator-directed conversation with dynamic persona generation and novelty tracking.
@@ -67,12 +141,36 @@ async def meeting_facilitator(
         personas_per_phase: Number of personas to generate per phase (default: 4)
         enable_mediator: If True, enable neutral mediator interventions (default: True)
         mediator: Optional MediatorPersona instance (creates default if None)
+        cancel_token: Optional CancellationToken, checked between turns and
+            while waiting on LLM calls. When it trips RunCancelled is raised;
+            shared_context["logs"] already holds every exchange so far.
+        checkpoint: Optional RunCheckpoint. Written at every phase boundary
+            (and every checkpoint.every_turns turns); if it was loaded from
+            disk (checkpoint.state), the meeting resumes from it instead of
+            starting over.
+        stream_turns: If True, persona and mediator turns are streamed and
+            their chunks passed to monitor.on_turn_delta as they arrive
 
     Returns:
         final shared_context with logs and results
     """
-    logs = []
-    all_phase_summaries = []
+    resume = checkpoint.state if checkpoint is not None else None
+    if resume:
+        # Continue from the checkpoint: restore everything completed so far
+        shared_context.update(resume.get("shared_context", {}))
+        facilitator.speaker_history = resume.get("facilitator", {}).get("speaker_history", {})
+        if hasattr(persona_manager, "generated_personas"):
+            persona_manager.generated_personas = list(resume.get("generated_personas", []))
+        if logger and resume.get("logger"):
+            logger.restore_state(resume["logger"])
+            logger.log_metadata("resumed_at_phase", resume["position"]["phase_index"])
+
+    logs = list(shared_context.get("logs", [])) if resume else []
+    all_phase_summaries = list(shared_context.get("phase_summaries", [])) if resume else []
+
+    # Expose progress to the caller even if the run is cancelled part-way
+    shared_context["logs"] = logs
+    shared_context["phase_summaries"] = all_phase_summaries
 
     # Initialize novelty tracking in shared_context
     if "mentioned_nuances" not in shared_context:
@@ -94,8 +192,38 @@ async def meeting_facilitator(
     # Initialize mediator if enabled and not provided
     if enable_mediator and mediator is None:
         mediator = MediatorPersona.get_default_mediator(model_name=model_name)
+    if resume and mediator is not None and resume.get("mediator"):
+        mediator.mediation_log = resume["mediator"]["mediation_log"]
+
+    def save_checkpoint(phase_index: int, in_phase: Optional[Dict[str, Any]] = None) -> None:
+        """Write a checkpoint; phase_index is the first phase not yet complete."""
+        if checkpoint is None:
+            return
+        checkpoint.save(
+            position={"phase_index": phase_index},
+            phase=in_phase,
+            shared_context=shared_context,
+            facilitator={"speaker_history": facilitator.speaker_history},
+            mediator={"mediation_log": mediator.mediation_log} if mediator is not None else None,
+            logger=logger.export_state() if logger else None,
+            generated_personas=list(getattr(persona_manager, "generated_personas", [])),
+        )
+
+    start_phase = resume["position"]["phase_index"] if resume else 0
+    if resume:
+        print(f"[Checkpoint] Resuming at phase {start_phase + 1} of {len(phases)}")
+    else:
+        save_checkpoint(0)
+
+    for phase_index, phase in enumerate(phases):
+        if phase_index < start_phase:
+            continue  # Completed before the checkpoint
+        if cancel_token:
+            cancel_token.check()
+
+        # Mid-phase checkpoint to continue from (only for the first resumed phase)
+        in_phase = resume.get("phase") if resume and phase_index == start_phase else None
 
-    for phase in phases:
         # Track phase start time for monitor
         phase_start_time = time.time()
 
@@ -109,15 +237,32 @@ async def meeting_facilitator(
             logger.info("=== Phase: %s | Goal: %s ===", phase["phase_id"].upper(), phase.get("goal"))
 
         # Request personas from PersonaManager for this phase
-        active_personas = persona_manager.request_personas_for_phase(
-            inspiration=inspiration,
-            phase_info=phase,
-            count=personas_per_phase,
-            domain=domain,
-        )
+        if in_phase:
+            active_personas = {
+                key: Persona.from_state(state) for key, state in in_phase["personas"].items()
+            }
+        else:
+            # Awaits the phase's prefetched generation when the caller started one
+            source = persona_manager.persona_source(inspiration, phase, count=personas_per_phase)
+            request = _guarded(
+                cancel_token,
+                persona_manager.request_personas_for_phase_async(
+                    inspiration=inspiration,
+                    phase_info=phase,
+                    count=personas_per_phase,
+                    domain=domain,
+                ),
+            )
+            if source == "cache":
+                active_personas = await request  # Loaded from disk, no LLM call
+            else:
+                # A prefetch ran concurrently with earlier phases; only the
+                # remaining wait (and any duplicate regeneration) lands here
+                site = "persona_generation" if source == "generate" else "persona_prefetch_wait"
+                active_personas = await _observed(monitor, site, request)
 
         # Log persona generation
-        if logger:
+        if logger and not in_phase:
             persona_names = list(active_personas.keys())
             logger.log_facilitator_decision(
                 decision_type="persona_generation",
@@ -138,9 +283,10 @@ async def meeting_facilitator(
             continue
 
         # Phase-specific tracking
-        phase_exchanges = []
-        turn_count = 0
+        phase_exchanges = list(in_phase["phase_exchanges"]) if in_phase else []
+        turn_count = in_phase["turn_count"] if in_phase else 0
         max_turns = phase.get("max_turns", 15)
+        turns_since_checkpoint = 0
 
         # Track pending async extractions for this phase
         pending_extractions = []
@@ -161,24 +307,32 @@ async def meeting_facilitator(
             return result
 
         # Generate initial prompt from facilitator for this phase (used for native threading)
-        initial_prompt = generate_dynamic_prompt(
-            phase=phase,
-            turn_count=0,
-            phase_exchanges=[],
-            shared_context=shared_context
-        )
+        if in_phase:
+            initial_prompt = in_phase["initial_prompt"]
+        else:
+            initial_prompt = generate_dynamic_prompt(
+                phase=phase,
+                turn_count=0,
+                phase_exchanges=[],
+                shared_context=shared_context
+            )
 
         # Conversation loop for this phase
         while True:
+            if cancel_token:
+                cancel_token.check()
+
             # Facilitator decides who should speak next
-            next_speaker_name = facilitator.decide_next_speaker(
+            next_speaker_name = await _observed(monitor, "facilitator_next_speaker", _llm_call(
+                cancel_token,
+                facilitator.decide_next_speaker,
                 phase=phase,
                 active_personas=active_personas,
                 recent_exchanges=phase_exchanges,
                 shared_context=shared_context,
                 turn_count=turn_count,
                 max_turns=max_turns
-            )
+            ))
 
             # Log speaker decision
             if logger:
@@ -244,7 +398,14 @@ async def meeting_facilitator(
                     prompt_data=prompt_data
                 )
 
-            response_data = speaker_persona.response(ctx, prompt_logger=prompt_logger_callback)
+            response_kwargs = {"prompt_logger": prompt_logger_callback}
+            if stream_turns:
+                response_kwargs["on_delta"] = _delta_callback(
+                    monitor, cancel_token, speaker_persona.name, phase["phase_id"], turn_count
+                )
+            response_data = await _observed(monitor, "persona_response", _llm_call(
+                cancel_token, speaker_persona.response, ctx, **response_kwargs
+            ))
             response_content = response_data.get("response", "")
 
             # Check for repetition
@@ -272,11 +433,11 @@ async def meeting_facilitator(
             if not monitor:
                 logger.debug("%s: %.200s...", speaker_persona.name, response_content)
 
-            # Monitor: Turn complete (estimate ~500 tokens per response)
+            # Monitor: Turn complete (reported usage, else estimate ~500 tokens per response)
             if monitor:
                 monitor.on_turn_complete(
                     speaker=speaker_persona.name,
-                    tokens_used=500  # Rough estimate
+                    tokens_used=_turn_tokens(response_data, estimate=500)
                 )
 
             # Log this exchange
@@ -305,7 +466,7 @@ async def meeting_facilitator(
             if is_detailed_proposal(response_content):
                 # Kick off async extraction (non-blocking); notify monitor on completion
                 extraction_task = asyncio.create_task(
-                    _tracked_extraction(
+                    _tracked_extraction(_observed(monitor, "idea_extraction",
                         extract_idea_concept_async(
                             response=response_content,
                             shared_context=shared_context,
@@ -313,12 +474,12 @@ async def meeting_facilitator(
                             phase_id=phase["phase_id"],
                             model_name=model_name
                         )
-                    )
+                    ))
                 )
                 pending_extractions.append(extraction_task)
 
             # Also detect rejections asynchronously (always check, not just on proposals)
-            rejection_task = asyncio.create_task(
+            rejection_task = asyncio.create_task(_observed(monitor, "rejection_detection",
                 detect_rejections_async(
                     response=response_content,
                     shared_context=shared_context,
@@ -326,7 +487,7 @@ async def meeting_facilitator(
                     phase_id=phase["phase_id"],
                     model_name=model_name
                 )
-            )
+            ))
             pending_extractions.append(rejection_task)
 
             # All active personas update their summaries based on this exchange
@@ -345,12 +506,14 @@ async def meeting_facilitator(
                     # Update both summaries and belief states in parallel
                     update_tasks = []
                     for persona in active_personas.values():
-                        update_tasks.append(persona.update_summary_async(exchange_data))
+                        update_tasks.append(_observed(monitor, "persona_summary", persona.update_summary_async(exchange_data)))
                         # Also update belief state if initialized
                         if persona.belief_state is not None:
-                            update_tasks.append(persona.update_belief_state_async(exchange_data, turn_count))
+                            update_tasks.append(_observed(
+                                monitor, "belief_state", persona.update_belief_state_async(exchange_data, turn_count)
+                            ))
 
-                    await asyncio.gather(*update_tasks)
+                    await _guarded(cancel_token, asyncio.gather(*update_tasks))
 
                     if monitor:
                         persona_snapshots = []
@@ -372,10 +535,14 @@ async def meeting_facilitator(
                         logger.info("Updating summaries and belief states for all active personas (sequential)...")
 
                     for persona_name, persona in active_personas.items():
-                        persona.update_summary(exchange_data)
+                        await _observed(monitor, "persona_summary", _llm_call(
+                            cancel_token, persona.update_summary, exchange_data
+                        ))
                         # Also update belief state if initialized
                         if persona.belief_state is not None:
-                            persona.update_belief_state(exchange_data, turn_count)
+                            await _observed(monitor, "belief_state", _llm_call(
+                                cancel_token, persona.update_belief_state, exchange_data, turn_count
+                            ))
             else:
                 if not monitor:
                     logger.info("Fast mode: Skipping summary updates")
@@ -397,11 +564,11 @@ async def meeting_facilitator(
 
             # Update shared memory after each turn (structured mode only)
             if memory_mode == "structured":
-                updated_memory = await update_shared_memory_async(
+                updated_memory = await _observed(monitor, "shared_memory", _guarded(cancel_token, update_shared_memory_async(
                     current_memory=shared_context.get("shared_memory", ""),
                     new_exchange=exchange,
                     model=model_name,
-                )
+                )))
                 shared_context["shared_memory"] = updated_memory
                 if monitor:
                     getattr(monitor, 'on_memory_update', lambda **kw: None)(
@@ -474,7 +641,14 @@ async def meeting_facilitator(
                             archetype="Neutral Mediator",
                             prompt_data=prompt_data
                         )
-                    mediator_response_data = mediator.mediate(mediator_ctx, prompt_logger=mediator_prompt_logger)
+                    mediate_kwargs = {"prompt_logger": mediator_prompt_logger}
+                    if stream_turns:
+                        mediate_kwargs["on_delta"] = _delta_callback(
+                            monitor, cancel_token, mediator.name, phase["phase_id"], turn_count
+                        )
+                    mediator_response_data = await _observed(monitor, "mediator", _llm_call(
+                        cancel_token, mediator.mediate, mediator_ctx, **mediate_kwargs
+                    ))
                     mediator_content = mediator_response_data.get("response", "")
 
                     # Extract scenarios if mediator presented them
@@ -508,7 +682,7 @@ async def meeting_facilitator(
                     if monitor:
                         monitor.on_turn_complete(
                             speaker=mediator.name,
-                            tokens_used=300  # Mediator responses typically shorter
+                            tokens_used=_turn_tokens(mediator_response_data, estimate=300)  # Mediator responses typically shorter
                         )
 
                     # Log mediator exchange
@@ -543,8 +717,10 @@ async def meeting_facilitator(
                         if use_async_updates:
                             update_tasks = []
                             for persona in active_personas.values():
-                                update_tasks.append(persona.update_summary_async(mediator_exchange_data))
-                            await asyncio.gather(*update_tasks)
+                                update_tasks.append(_observed(
+                                    monitor, "persona_summary", persona.update_summary_async(mediator_exchange_data)
+                                ))
+                            await _guarded(cancel_token, asyncio.gather(*update_tasks))
 
                             if monitor:
                                 persona_snapshots = []
@@ -562,15 +738,32 @@ async def meeting_facilitator(
                                 )
                         else:
                             for persona in active_personas.values():
-                                persona.update_summary(mediator_exchange_data)
+                                await _observed(monitor, "persona_summary", _llm_call(
+                                    cancel_token, persona.update_summary, mediator_exchange_data
+                                ))
 
                     turn_count += 1  # Increment for mediator turn
 
+            # Optional mid-phase checkpoint every K turns
+            turns_since_checkpoint += 1
+            if checkpoint is not None and checkpoint.due(turns_since_checkpoint):
+                # Let in-flight idea tracking land so shared_context is complete
+                if pending_extractions:
+                    await _guarded(cancel_token, asyncio.gather(*pending_extractions, return_exceptions=True))
+                    pending_extractions.clear()
+                save_checkpoint(phase_index, {
+                    "turn_count": turn_count,
+                    "phase_exchanges": phase_exchanges,
+                    "initial_prompt": initial_prompt,
+                    "personas": {key: p.export_state() for key, p in active_personas.items()},
+                })
+                turns_since_checkpoint = 0
+
         # Phase complete - ensure all pending extractions are complete before moving to summary
         if pending_extractions:
             if not monitor:
                 logger.info("Waiting for %d pending idea extractions/rejection detections...", len(pending_extractions))
-            await asyncio.gather(*pending_extractions, return_exceptions=True)
+            await _guarded(cancel_token, asyncio.gather(*pending_extractions, return_exceptions=True))
 
         # Phase complete - create summary
         phase_elapsed_time = time.time() - phase_start_time
@@ -578,11 +771,13 @@ async def meeting_facilitator(
         if not monitor:
             logger.info("Phase '%s' complete after %d turns", phase["phase_id"], turn_count)
 
-        phase_summary = facilitator.summarize_phase(
+        phase_summary = await _observed(monitor, "phase_summary", _llm_call(
+            cancel_token,
+            facilitator.summarize_phase,
             phase=phase,
             exchanges=phase_exchanges,
             shared_context=shared_context
-        )
+        ))
 
         # Monitor: Phase complete
         if monitor:
@@ -610,6 +805,8 @@ async def meeting_facilitator(
             logger.log_persona_summaries(phase["phase_id"], active_personas)
             logger.log_phase_summary(phase["phase_id"], phase_summary)
 
+        save_checkpoint(phase_index + 1)
+
     # Store logs and summaries in shared context
     shared_context["logs"] = logs
     shared_context["phase_summaries"] = all_phase_summaries
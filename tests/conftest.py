@@ -0,0 +1,34 @@
+"""
+Fixtures shared by the test modules.
+
+- idle_persona_manager: run_assembly() gets a PersonaManager that never
+  generates personas, for tests that fake the meeting itself
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+class IdlePersonaManager:
+    """Stands in for PersonaManager when the meeting itself is faked."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def prefetch_personas(self, inspiration, phases, count, domain):
+        pass
+
+    def cancel_prefetch(self):
+        pass
+
+
+@pytest.fixture
+def idle_persona_manager(monkeypatch):
+    from src.idea_generation import generator
+
+    monkeypatch.setattr(generator, "PersonaManager", IdlePersonaManager)
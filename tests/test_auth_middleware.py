@@ -33,6 +33,14 @@ sys.path.insert(0, str(ROOT))
 # Helpers
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def isolated_state(monkeypatch, tmp_path):
+    """Keep run state and session logs of every reloaded server in tmp_path."""
+    monkeypatch.setenv("DASHBOARD_RUNS_DIR", str(tmp_path / "runs"))
+    monkeypatch.setenv("DASHBOARD_STATE_DB", str(tmp_path / "runs.db"))
+    monkeypatch.setenv("DASHBOARD_LOGS_DIR", str(tmp_path / "logs"))
+
+
 def basic_auth_header(username: str, password: str) -> str:
     encoded = base64.b64encode(f"{username}:{password}".encode()).decode()
     return f"Basic {encoded}"
@@ -0,0 +1,155 @@
+"""
+Tests for framework/batch_analytics.py.
+
+Verifies that:
+- Batch metrics over a single session match ConversationAnalytics
+- Metrics aggregate correctly across sessions (turns, tokens, durations, costs)
+- The column cache is reused for unchanged sessions and refreshed for
+  new / modified / deleted ones
+"""
+
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.analytics import ConversationAnalytics
+from framework.batch_analytics import CACHE_FILENAME, BatchAnalytics
+
+
+def write_session(logs_dir: Path, name: str, model: str, exchanges: list, decisions: list) -> Path:
+    meta_dir = logs_dir / name / "metadata"
+    meta_dir.mkdir(parents=True)
+    (meta_dir / "session_metadata.json").write_text(
+        json.dumps({"mode": "fast", "model": model, "ideas": [{"title": "Alpha"}]}), encoding="utf-8"
+    )
+    (meta_dir / "full_conversation.json").write_text(json.dumps(exchanges), encoding="utf-8")
+    (meta_dir / "facilitator_decisions.json").write_text(json.dumps(decisions), encoding="utf-8")
+    return logs_dir / name
+
+
+def exchange(phase: str, speaker: str, chars: int, second: int) -> dict:
+    return {
+        "phase": phase, "speaker": speaker, "archetype": f"{speaker} archetype",
+        "content": "x" * chars, "timestamp": f"2025-01-01T00:00:{second:02d}",
+    }
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    d = tmp_path / "conversation_logs"
+    write_session(d, "session_a", "gpt-4o-mini", [
+        exchange("ideation", "Alice", 40, 0),
+        exchange("ideation", "Bob", 80, 10),
+        exchange("research", "Alice", 400, 20),
+        exchange("research", "Alice", 4, 50),
+    ], [
+        {"type": "persona_selection", "phase": "ideation", "decision": ["Alice", "Bob"]},
+        {"type": "speaker_choice", "phase": "ideation", "decision": "Alice"},
+        {"type": "speaker_choice", "phase": "ideation", "decision": "Bob"},
+    ])
+    write_session(d, "session_b", "gpt-4o", [
+        exchange("ideation", "Cara", 1000, 0),
+        exchange("ideation", "Alice", 200, 5),
+    ], [
+        {"type": "persona_selection", "phase": "ideation", "decision": ["Alice", "Bob", "Cara"]},
+        {"type": "speaker_choice", "phase": "ideation", "decision": "Alice"},
+    ])
+    return d
+
+
+class TestParityWithSingleSession:
+
+    @pytest.fixture
+    def pair(self, logs_dir):
+        shutil.rmtree(logs_dir / "session_b")
+        return ConversationAnalytics(str(logs_dir / "session_a")), BatchAnalytics.from_logs_dir(str(logs_dir))
+
+    def test_persona_contributions(self, pair):
+        single, batch = pair
+        expected = single.persona_contributions()
+        actual = batch.persona_contributions()
+        for name, data in expected.items():
+            for key in ("turns", "tokens_estimated", "phases", "archetype"):
+                assert actual[name][key] == data[key]
+            assert actual[name]["participation_pct"] == pytest.approx(data["participation_pct"])
+
+    def test_phase_metrics(self, pair):
+        single, batch = pair
+        expected = single.phase_metrics()
+        actual = batch.phase_metrics()
+        for phase_id, data in expected.items():
+            for key in ("turns", "tokens_estimated", "duration_seconds", "personas_active"):
+                assert actual[phase_id][key] == data[key]
+
+    def test_cost_and_facilitator(self, pair):
+        single, batch = pair
+        assert batch.cost_analysis()["total_cost"] == pytest.approx(single.cost_analysis()["total_cost"])
+        assert batch.facilitator_analysis()["speaker_frequency"] == single.facilitator_analysis()["speaker_frequency"]
+
+
+class TestAggregation:
+
+    def test_across_sessions(self, logs_dir):
+        batch = BatchAnalytics.from_logs_dir(str(logs_dir))
+        contributions = batch.persona_contributions()
+        assert contributions["Alice"]["turns"] == 4
+        assert contributions["Alice"]["sessions"] == 2
+        assert contributions["Cara"]["tokens_estimated"] == 250
+
+        phases = batch.phase_metrics()
+        assert phases["ideation"]["sessions"] == 2
+        assert phases["ideation"]["duration_seconds"] == 15.0  # 10s + 5s
+        assert phases["research"]["duration_seconds"] == 30.0
+
+    def test_cost_by_model(self, logs_dir):
+        batch = BatchAnalytics.from_logs_dir(str(logs_dir))
+        costs = batch.cost_analysis(cost_per_1k_tokens=1.0)
+        assert costs["by_model"]["gpt-4o"]["tokens"] == 300
+        assert costs["by_model"]["gpt-4o-mini"]["tokens"] == 131
+        assert costs["total_cost"] == pytest.approx(0.431)
+
+    def test_facilitator(self, logs_dir):
+        analysis = BatchAnalytics.from_logs_dir(str(logs_dir)).facilitator_analysis()
+        assert analysis["total_decisions"] == 5
+        assert analysis["speaker_frequency"] == {"Alice": 2, "Bob": 1}
+        assert analysis["selections_by_phase"]["ideation"] == {"count": 2, "mean_personas": 2.5}
+
+
+class TestColumnCache:
+
+    def test_cache_written_and_reused(self, logs_dir, monkeypatch):
+        BatchAnalytics.from_logs_dir(str(logs_dir))
+        assert (logs_dir / CACHE_FILENAME).exists()
+
+        parsed = []
+        original = BatchAnalytics._parse_sessions
+
+        def spy(to_parse, base=None):
+            parsed.extend(sid for sid, _, _ in to_parse)
+            return original(to_parse, base=base)
+
+        monkeypatch.setattr(BatchAnalytics, "_parse_sessions", staticmethod(spy))
+        batch = BatchAnalytics.from_logs_dir(str(logs_dir))
+        assert parsed == []
+        assert batch.persona_contributions()["Alice"]["turns"] == 4
+
+    def test_cache_refreshes_changed_sessions(self, logs_dir):
+        BatchAnalytics.from_logs_dir(str(logs_dir))
+
+        conv = logs_dir / "session_b" / "metadata" / "full_conversation.json"
+        conv.write_text(json.dumps([exchange("ideation", "Dan", 40, 0)]), encoding="utf-8")
+        os.utime(conv, (time.time() + 5, time.time() + 5))
+        shutil.rmtree(logs_dir / "session_a")
+        write_session(logs_dir, "session_c", "gpt-4o", [exchange("decision", "Eve", 8, 0)], [])
+
+        batch = BatchAnalytics.from_logs_dir(str(logs_dir))
+        assert sorted(batch.session_ids) == ["session_b", "session_c"]
+        assert sorted(batch.persona_contributions()) == ["Dan", "Eve"]
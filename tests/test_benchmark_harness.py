@@ -0,0 +1,129 @@
+"""
+Tests for benchmarks/harness.py (parallel, resumable benchmark cells).
+
+Verifies that:
+- Cells run concurrently but never more than max_workers at once
+- The async pool accepts both plain and coroutine cell functions
+- Every finished cell is checkpointed to the results file
+- A resumed run skips finished cells and retries failed ones
+- run_comparison fans its (prompt, approach) grid through the harness and
+  still produces the comparisons the dashboard scores and aggregates
+- get_benchmark_results ignores checkpoints of unfinished runs
+
+No OpenAI key required — cell functions are local fakes.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.harness import cell_key, cell_session_name, run_cells
+from benchmarks.phase_2_quality_vs_single_llm import test_assembly_vs_baseline as comparison_module
+from src.dashboard import benchmarks_runner
+
+
+def _cells(n):
+    return [{"key": cell_key("prompt", i), "value": i} for i in range(n)]
+
+
+def test_async_pool_bounds_concurrency():
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def run_cell(cell):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.02)
+        with lock:
+            state["running"] -= 1
+        return {"double": cell["value"] * 2}
+
+    results = run_cells(_cells(6), run_cell, max_workers=2)
+    assert state["peak"] == 2
+    assert [r["double"] for r in results.values()] == [0, 2, 4, 6, 8, 10]
+
+
+def test_async_pool_awaits_coroutines():
+    async def run_cell(cell):
+        await asyncio.sleep(0.01)
+        return {"value": cell["value"]}
+
+    results = run_cells(_cells(3), run_cell, max_workers=3)
+    assert list(results) == ["prompt/0", "prompt/1", "prompt/2"]
+    assert results["prompt/2"] == {"value": 2}
+
+
+def test_checkpoint_and_resume(tmp_path):
+    path = str(tmp_path / "results.json")
+    calls = []
+
+    def flaky(cell):
+        calls.append(cell["key"])
+        if cell["value"] == 1:
+            raise RuntimeError("rate limited")
+        return {"value": cell["value"]}
+
+    results = run_cells(_cells(3), flaky, results_path=path, header={"test_name": "t"}, max_workers=1)
+    assert results["prompt/1"] == {"error": "rate limited"}
+
+    saved = json.loads(Path(path).read_text())
+    assert saved["status"] == "in_progress" and saved["test_name"] == "t"
+    assert set(saved["cells"]) == {"prompt/0", "prompt/2"}
+
+    calls.clear()
+    results = run_cells(_cells(3), lambda cell: {"value": cell["value"]}, results_path=path, max_workers=1)
+    assert results["prompt/1"] == {"value": 1}
+    assert set(json.loads(Path(path).read_text())["cells"]) == {"prompt/0", "prompt/1", "prompt/2"}
+    assert calls == []  # flaky() not used again; finished cells were not re-run
+
+
+def test_unknown_pool_rejected():
+    with pytest.raises(ValueError):
+        run_cells(_cells(1), lambda cell: {}, pool="threads")
+
+
+def test_cell_session_names_are_distinct():
+    names = {cell_session_name(cell_key("p", i, "assembly")) for i in range(3)}
+    assert len(names) == 3
+
+
+def test_run_comparison_through_harness(monkeypatch, tmp_path):
+    async def fake_assembly(inspiration, mode, session_name=None):
+        return {"success": True, "idea": {"title": f"A {inspiration}"}, "error": None}
+
+    def fake_single_shot(inspiration, model, label="Baseline"):
+        return {"success": True, "idea": {"title": f"B {inspiration}"}, "error": None, "tokens_used": 1}
+
+    monkeypatch.setattr(comparison_module, "_generate_assembly", fake_assembly)
+    monkeypatch.setattr(comparison_module, "_generate_single_shot", fake_single_shot)
+
+    prompts = [{"id": "p1", "inspiration": "x"}, {"id": "p2", "inspiration": "y"}]
+    results = comparison_module.run_comparison(prompts, output_dir=str(tmp_path), max_workers=4)
+
+    assert results["summary"]["both_successful"] == 2
+    assert [c["assembly"]["idea"]["title"] for c in results["comparisons"]] == ["A x", "A y"]
+    assert [c["baseline"]["idea"]["title"] for c in results["comparisons"]] == ["B x", "B y"]
+
+    saved = json.loads(next(tmp_path.glob("comparison_results_*.json")).read_text())
+    assert saved["status"] == "complete"
+    assert set(saved["cells"]) == {"p1/baseline", "p1/assembly", "p2/baseline", "p2/assembly"}
+
+
+def test_in_progress_results_are_skipped(monkeypatch, tmp_path):
+    bm = next(b for b in benchmarks_runner.BENCHMARKS if b["id"] == "memory_benchmark")
+    monkeypatch.setitem(bm, "results_dir", str(tmp_path))
+    (tmp_path / "memory_benchmark_20260101_000000.json").write_text(json.dumps({"status": "complete"}))
+    (tmp_path / "memory_benchmark_20260102_000000.json").write_text(json.dumps({"status": "in_progress"}))
+
+    data = benchmarks_runner.get_benchmark_results("memory_benchmark")
+    assert data["_result_file"].endswith("memory_benchmark_20260101_000000.json")
+    assert bm["params"]["parallel"]["default"] == 3
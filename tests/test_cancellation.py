@@ -0,0 +1,207 @@
+"""
+Tests for framework/cancellation.py and run cancellation in the dashboard.
+
+Verifies that:
+- Tokens trip on cancel() and on their deadline
+- guard() / call() abandon slow LLM waits once the token trips
+- RunCancelled keeps its partial result across pickling (process workers)
+- The scheduler cancels queued and running runs, and a running run (thread
+  or process worker) raises RunCancelled with the reason given to cancel()
+- DELETE /api/run/{id} stops a run and streams run_cancelled with partial ideas
+
+No OpenAI key required — the assembly generator is never called.
+"""
+
+import asyncio
+import os
+import pickle
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.cancellation import CancellationToken, RunCancelled
+from src.dashboard.scheduler import RunScheduler
+
+
+def cancellable_target(emit, started: threading.Event, cancel_token=None):
+    """Loop like meeting_facilitator does: check the token between turns."""
+    turns = 0
+    started.set()
+    try:
+        while True:
+            cancel_token.check()
+            turns += 1
+            time.sleep(0.01)
+    except RunCancelled as exc:
+        exc.partial = {"ideas": [{"title": "Half-baked"}], "turns": turns}
+        raise
+
+
+def patient_target(emit, cancel_token=None):
+    """Like cancellable_target, but picklable into a spawned worker process."""
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        cancel_token.check()
+        time.sleep(0.01)
+
+
+class TestCancellationToken:
+
+    def test_cancel_trips_check(self):
+        token = CancellationToken()
+        token.check()
+        token.cancel()
+        with pytest.raises(RunCancelled) as info:
+            token.check()
+        assert info.value.reason == "cancelled"
+
+    def test_deadline(self):
+        token = CancellationToken(timeout=0.05)
+        assert not token.cancelled
+        time.sleep(0.1)
+        assert token.reason == "deadline_exceeded"
+        assert token.remaining() == 0.0
+
+    def test_guard_abandons_slow_await(self):
+        async def scenario():
+            token = CancellationToken(timeout=0.1)
+            started = time.monotonic()
+            with pytest.raises(RunCancelled):
+                await token.guard(asyncio.sleep(10))
+            return time.monotonic() - started
+
+        assert asyncio.run(scenario()) < 2
+
+    def test_run_sync_returns_result(self):
+        async def scenario():
+            return await CancellationToken().run_sync(lambda x: x * 2, 21)
+
+        assert asyncio.run(scenario()) == 42
+
+    def test_call_abandons_slow_blocking_fn(self):
+        token = CancellationToken()
+        threading.Timer(0.1, token.cancel).start()
+        started = time.monotonic()
+        with pytest.raises(RunCancelled):
+            token.call(time.sleep, 5)
+        assert time.monotonic() - started < 2
+
+    def test_run_cancelled_pickles_with_partial(self):
+        exc = RunCancelled("deadline_exceeded")
+        exc.partial = {"turns": 3}
+        restored = pickle.loads(pickle.dumps(exc))
+        assert restored.reason == "deadline_exceeded"
+        assert restored.partial == {"turns": 3}
+        assert str(restored) == "Run exceeded its deadline"
+
+
+class TestSchedulerCancel:
+
+    def test_cancel_running_and_queued(self):
+        async def scenario():
+            scheduler = RunScheduler(use_processes=False, max_workers=1)
+            started = threading.Event()
+            noop = lambda event: None
+            running = asyncio.create_task(scheduler.run("a", "u", cancellable_target, {"started": started}, noop))
+            queued = asyncio.create_task(scheduler.run("b", "u", cancellable_target, {"started": threading.Event()}, noop))
+            while scheduler.position("b") != 1 or not started.is_set():
+                await asyncio.sleep(0.01)
+
+            assert scheduler.cancel("b")
+            with pytest.raises(RunCancelled):
+                await queued
+
+            assert scheduler.cancel("a", reason="abandoned")
+            with pytest.raises(RunCancelled) as info:
+                await running
+            assert info.value.partial["ideas"] == [{"title": "Half-baked"}]
+            assert info.value.reason == "abandoned"
+
+            assert not scheduler.cancel("a")
+            assert scheduler.stats()["running"] == 0
+            scheduler.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_timeout_becomes_deadline(self):
+        async def scenario():
+            scheduler = RunScheduler(use_processes=False)
+            with pytest.raises(RunCancelled) as info:
+                await scheduler.run(
+                    "a", "u", cancellable_target, {"started": threading.Event()}, lambda event: None, timeout=0.1,
+                )
+            scheduler.shutdown()
+            return info.value.reason
+
+        assert asyncio.run(scenario()) == "deadline_exceeded"
+
+    def test_process_worker_gets_cancel_reason(self, tmp_path):
+        async def scenario():
+            scheduler = RunScheduler(max_workers=1, runs_dir=str(tmp_path / "runs"))
+            running = asyncio.create_task(scheduler.run("a", "u", patient_target, {}, lambda event: None))
+            while scheduler.position("a") != 0:
+                await asyncio.sleep(0.01)
+            assert scheduler.cancel("a", reason="abandoned")
+            with pytest.raises(RunCancelled) as info:
+                await running
+            scheduler.shutdown()
+            return info.value.reason
+
+        assert asyncio.run(scenario()) == "abandoned"
+
+
+# ---------------------------------------------------------------------------
+# DELETE /api/run/{id}
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    os.environ["DASHBOARD_USER"] = "admin"
+    os.environ["DASHBOARD_PASS"] = ""
+    monkeypatch.setenv("DASHBOARD_STATE_DB", str(tmp_path / "runs.db"))
+
+    import importlib
+    import src.dashboard.server as server_module
+    importlib.reload(server_module)
+    monkeypatch.setattr(server_module, "scheduler", RunScheduler(use_processes=False, runs_dir=str(tmp_path / "runs")))
+    monkeypatch.setattr(server_module, "LOGS_DIR", tmp_path / "logs")
+    return server_module
+
+
+class TestCancelEndpoint:
+
+    def test_unknown_run_returns_404(self, server):
+        client = TestClient(server.app)
+        assert client.delete("/api/run/nope").status_code == 404
+
+    def test_cancel_streams_partial_result(self, server, monkeypatch):
+        started = threading.Event()
+
+        def target(emit, logs_dir, cancel_token=None, **kwargs):
+            return cancellable_target(emit, started, cancel_token=cancel_token)
+
+        monkeypatch.setattr(server, "execute_assembly_run", target)
+
+        with TestClient(server.app) as client:
+            session_id = client.post("/api/run", json={"inspiration": "A long enough inspiration"}).json()["session_id"]
+            assert started.wait(timeout=5)
+
+            resp = client.delete(f"/api/run/{session_id}")
+            assert resp.status_code == 202
+
+            with client.websocket_connect(f"/ws/{session_id}") as ws:
+                events = []
+                while not events or events[-1]["type"] != "run_cancelled":
+                    frame = ws.receive_json()
+                    events.extend(frame["events"] if frame["type"] == "batch" else [frame])
+
+            assert events[-1]["ideas"] == [{"title": "Half-baked"}]
+            assert client.get(f"/api/run/{session_id}").json()["status"] == "cancelled"
+            assert client.delete(f"/api/run/{session_id}").status_code == 409
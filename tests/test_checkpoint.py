@@ -0,0 +1,252 @@
+"""
+Tests for framework/checkpoint.py and checkpoint/resume of meeting_facilitator.
+
+Verifies that:
+- Checkpoints round-trip and are written atomically (no temp files left)
+- A meeting stopped mid-phase resumes from its last checkpoint without
+  re-running completed phases (no persona generation or summaries repeated)
+- Restored state (logger exchanges, speaker_history, shared_context) matches
+  an uninterrupted run
+- POST /api/sessions/{id}/resume starts a run that reopens the session
+
+No OpenAI key required — personas, facilitator and persona manager are fakes.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.cancellation import CancellationToken, RunCancelled
+from framework.checkpoint import CHECKPOINT_FILENAME, RunCheckpoint
+from framework.logger import ConversationLogger
+from src.dashboard.scheduler import RunScheduler
+from src.idea_generation import orchestration
+
+PHASES = [
+    {"phase_id": "explore", "goal": "Explore", "max_turns": 4},
+    {"phase_id": "decide", "goal": "Decide", "max_turns": 4},
+]
+
+
+class Calls:
+    """Counts fake LLM work across a test."""
+
+    def __init__(self):
+        self.responses = []
+        self.persona_requests = []
+        self.summaries = []
+        self.on_response = None
+
+
+class FakePersona:
+    calls: Calls = None
+
+    def __init__(self, name):
+        self.name = name
+        self.archetype = "Tester"
+        self.summary = {"objective_facts": [], "subjective_notes": {}}
+        self.belief_state = None
+
+    def response(self, ctx, prompt_logger=None):
+        phase_id = ctx["phase"]["phase_id"]
+        self.calls.responses.append((phase_id, ctx["turn_count"], self.name))
+        self.summary["objective_facts"].append(f"spoke at {phase_id}/{ctx['turn_count']}")
+        if self.calls.on_response:
+            self.calls.on_response(phase_id, ctx["turn_count"])
+        return {"response": f"{self.name} on {phase_id} turn {ctx['turn_count']}"}
+
+    def export_state(self):
+        return {"definition": {"Name": self.name}, "summary": self.summary}
+
+    @classmethod
+    def from_state(cls, state):
+        persona = cls(state["definition"]["Name"])
+        persona.summary = state["summary"]
+        return persona
+
+
+class FakePersonaManager:
+
+    def __init__(self, calls):
+        self.calls = calls
+        self.generated_personas = []
+
+    def persona_source(self, inspiration, phase_info, count):
+        return "generate"
+
+    async def request_personas_for_phase_async(self, inspiration, phase_info, count, domain):
+        self.calls.persona_requests.append(phase_info["phase_id"])
+        names = [f"{phase_info['phase_id']}-{n}" for n in range(2)]
+        self.generated_personas.extend(names)
+        return {name: FakePersona(name) for name in names}
+
+
+class FakeFacilitator:
+
+    def __init__(self, calls):
+        self.calls = calls
+        self.speaker_history = {}
+
+    def decide_next_speaker(self, phase, active_personas, recent_exchanges, shared_context, turn_count, max_turns):
+        if turn_count >= max_turns:
+            return None
+        names = list(active_personas)
+        return names[turn_count % len(names)]
+
+    def check_for_repetition(self, speaker_name, response_content):
+        self.speaker_history.setdefault(speaker_name, []).append(response_content)
+        return None
+
+    def summarize_phase(self, phase, exchanges, shared_context):
+        self.calls.summaries.append(phase["phase_id"])
+        return f"{phase['phase_id']}: {len(exchanges)} exchanges"
+
+
+class QuietMonitor:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+async def _no_llm(**kwargs):
+    return None
+
+
+@pytest.fixture(autouse=True)
+def offline_tracking(monkeypatch):
+    monkeypatch.setattr(orchestration, "extract_idea_concept_async", _no_llm)
+    monkeypatch.setattr(orchestration, "detect_rejections_async", _no_llm)
+    monkeypatch.setattr(orchestration, "Persona", FakePersona)
+
+
+def run_meeting(calls, logger, checkpoint, cancel_token=None):
+    FakePersona.calls = calls
+    facilitator = FakeFacilitator(calls)
+    shared_context = {"ideas": [], "ideas_discussed": []}
+    context = asyncio.run(orchestration.meeting_facilitator(
+        persona_manager=FakePersonaManager(calls),
+        inspiration="Tools for tiny teams",
+        phases=PHASES,
+        shared_context=shared_context,
+        facilitator=facilitator,
+        logger=logger,
+        monitor=QuietMonitor(),
+        enable_summary_updates=False,
+        enable_mediator=False,
+        memory_mode="none",
+        personas_per_phase=2,
+        cancel_token=cancel_token,
+        checkpoint=checkpoint,
+    ))
+    return context, facilitator
+
+
+def test_checkpoint_round_trip(tmp_path):
+    checkpoint = RunCheckpoint(tmp_path, every_turns=3)
+    checkpoint.run = {"inspiration": "x", "phases": PHASES}
+    checkpoint.save(position={"phase_index": 1}, shared_context={"ideas": ["a"]})
+
+    loaded = RunCheckpoint.load(tmp_path)
+    assert loaded.run["phases"] == PHASES
+    assert loaded.position == {"phase_index": 1}
+    assert loaded.state["shared_context"] == {"ideas": ["a"]}
+    assert [p.name for p in tmp_path.iterdir()] == [CHECKPOINT_FILENAME]
+
+
+def test_missing_checkpoint_raises(tmp_path):
+    assert not RunCheckpoint.exists(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        RunCheckpoint.load(tmp_path)
+
+
+def test_resume_mid_phase_skips_completed_work(tmp_path):
+    # Uninterrupted run for reference
+    reference_calls = Calls()
+    reference_logger = ConversationLogger(base_dir=str(tmp_path / "reference"))
+    reference, reference_facilitator = run_meeting(
+        reference_calls, reference_logger, RunCheckpoint(reference_logger.session_dir, every_turns=2),
+    )
+
+    # First attempt dies during the second phase, after its turn-2 checkpoint
+    calls = Calls()
+    token = CancellationToken()
+    calls.on_response = lambda phase_id, turn: token.cancel() if (phase_id, turn) == ("decide", 2) else None
+    logger = ConversationLogger(base_dir=str(tmp_path / "logs"))
+    with pytest.raises(RunCancelled):
+        run_meeting(calls, logger, RunCheckpoint(logger.session_dir, every_turns=2), cancel_token=token)
+    assert calls.summaries == ["explore"]
+
+    # Resume in a fresh process-like setup: new fakes, new logger on the same folder
+    resumed_calls = Calls()
+    resumed_logger = ConversationLogger(base_dir=str(tmp_path / "logs"), session_name=logger.session_dir.name)
+    checkpoint = RunCheckpoint.load(resumed_logger.session_dir, every_turns=2)
+    assert checkpoint.position == {"phase_index": 1}
+    context, facilitator = run_meeting(resumed_calls, resumed_logger, checkpoint)
+
+    assert resumed_calls.persona_requests == []  # Personas restored, not regenerated
+    assert resumed_calls.summaries == ["decide"]
+    assert resumed_calls.responses == [("decide", 2, "decide-0"), ("decide", 3, "decide-1")]
+
+    assert [e["content"] for e in context["logs"]] == [e["content"] for e in reference["logs"]]
+    assert [e["content"] for e in resumed_logger.exchanges] == [e["content"] for e in reference_logger.exchanges]
+    assert context["phase_summaries"] == reference["phase_summaries"]
+    assert facilitator.speaker_history == reference_facilitator.speaker_history
+    assert RunCheckpoint.load(resumed_logger.session_dir).position == {"phase_index": 2}
+
+
+# ---------------------------------------------------------------------------
+# POST /api/sessions/{id}/resume
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    os.environ["DASHBOARD_USER"] = "admin"
+    os.environ["DASHBOARD_PASS"] = ""
+    monkeypatch.setenv("DASHBOARD_STATE_DB", str(tmp_path / "runs.db"))
+
+    import importlib
+    import src.dashboard.server as server_module
+    importlib.reload(server_module)
+    monkeypatch.setattr(server_module, "scheduler", RunScheduler(use_processes=False, runs_dir=str(tmp_path / "runs")))
+    monkeypatch.setattr(server_module, "LOGS_DIR", tmp_path)
+    return server_module
+
+
+class TestResumeEndpoint:
+
+    def test_unknown_or_unsafe_session_is_404(self, server):
+        client = TestClient(server.app)
+        assert client.post("/api/sessions/session_missing/resume").status_code == 404
+        assert client.post("/api/sessions/..%2F..%2Fetc/resume").status_code == 404
+
+    def test_resume_runs_generator_on_the_stored_session(self, server, monkeypatch, tmp_path):
+        RunCheckpoint(tmp_path / "session_1").save(position={"phase_index": 1})
+        seen = {}
+
+        def target(emit, logs_dir, cancel_token=None, **kwargs):
+            seen.update(kwargs, logs_dir=logs_dir)
+            return ["resumed idea"]
+
+        monkeypatch.setattr(server, "execute_assembly_run", target)
+
+        with TestClient(server.app) as client:
+            resp = client.post("/api/sessions/session_1/resume", json={"checkpoint_every_turns": 3})
+            assert resp.status_code == 200
+            run_id = resp.json()["session_id"]
+
+            with client.websocket_connect(f"/ws/{run_id}") as ws:
+                events = []
+                while not events or events[-1]["type"] != "run_complete":
+                    frame = ws.receive_json()
+                    events.extend(frame["events"] if frame["type"] == "batch" else [frame])
+
+        assert events[-1]["ideas"] == ["resumed idea"]
+        assert seen["resume_session"] == "session_1"
+        assert seen["checkpoint_every"] == 3
+        assert seen["logs_dir"] == str(tmp_path.resolve())
@@ -0,0 +1,100 @@
+"""
+Tests for src/dashboard/delta.py and delta-encoded DashboardEventEmitter events.
+
+Verifies that:
+- diff() + apply_patch() round-trip nested dicts and lists (incl. escaped keys)
+- DeltaEncoder sends keyframes first, periodically and when a patch is larger
+  than the document, and deltas otherwise
+- The emitter's persona_states stream can be rebuilt exactly from its events
+  and shrinks per-turn payloads for slowly changing state
+"""
+
+import copy
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.dashboard.delta import DeltaEncoder, apply_patch, diff
+from src.dashboard.event_emitter import DashboardEventEmitter
+
+
+@pytest.mark.parametrize("old,new", [
+    ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "b": [1, 3]}),
+    ({"x/y": {"t~": [1]}}, {"x/y": {"t~": [1, {"z": None}]}, "n": "new"}),
+    ([{"name": "A", "summary": "s"}], [{"name": "A", "summary": "s2"}, {"name": "B"}]),
+    ({"flag": True}, {"flag": 1}),
+    ("old", ["new"]),
+])
+def test_diff_round_trip(old, new):
+    patch = diff(old, new)
+    assert apply_patch(copy.deepcopy(old), patch) == new
+    assert type(apply_patch(copy.deepcopy(old), patch)) is type(new)
+
+
+def test_append_only_list_diff_is_adds():
+    assert diff(["a"], ["a", "b", "c"]) == [
+        {"op": "add", "path": "/-", "value": "b"},
+        {"op": "add", "path": "/-", "value": "c"},
+    ]
+
+
+class TestDeltaEncoder:
+
+    def test_keyframe_then_deltas_then_periodic_keyframe(self):
+        encoder = DeltaEncoder(keyframe_interval=3)
+        doc = {"nuances": ["n0"] + ["padding" * 10]}
+        kinds = []
+        for n in range(1, 7):
+            doc["nuances"].append(f"n{n}")
+            kinds.append(encoder.encode("nuances_update", doc)["keyframe"])
+        assert kinds == [True, False, False, True, False, False]
+
+    def test_large_patch_falls_back_to_keyframe(self):
+        encoder = DeltaEncoder(keyframe_interval=100)
+        encoder.encode("s", {"a": "x" * 50})
+        assert encoder.encode("s", {"b": "y" * 50})["keyframe"]
+
+    def test_snapshot_is_isolated_from_later_mutation(self):
+        encoder = DeltaEncoder()
+        live = {"belief": {"confidence": 1}, "summary": "unchanged " * 20}
+        encoder.encode("s", live)
+        live["belief"]["confidence"] = 2
+        assert encoder.encode("s", live)["patch"] == [
+            {"op": "replace", "path": "/belief/confidence", "value": 2}
+        ]
+
+
+def test_emitter_persona_states_rebuild_exactly():
+    events = []
+    emitter = DashboardEventEmitter(sink=events.append)
+    emitter.deltas = DeltaEncoder(keyframe_interval=10)
+
+    personas = [
+        {"name": name, "archetype": "x", "summary": "long summary " * 40, "belief_state": {"turn": 0}}
+        for name in ("Ada", "Bo", "Cy")
+    ]
+    expected = []
+    for turn in range(1, 13):
+        personas[turn % 3]["belief_state"] = {"turn": turn}
+        emitter.on_persona_states_update(phase_id="p1", turn=turn, personas=personas)
+        expected.append(copy.deepcopy(personas))
+
+    assert [e["type"] for e in events].count("persona_states") == 2  # turn 1 + turn 11
+    rebuilt, doc, version = [], None, None
+    for event in events:
+        if event["type"] == "persona_states":
+            doc, version = {"personas": copy.deepcopy(event["personas"])}, event["version"]
+        else:
+            assert event["base_version"] == version
+            doc, version = apply_patch(doc, event["patch"]), event["version"]
+        assert event["turn"] == len(rebuilt) + 1
+        rebuilt.append(copy.deepcopy(doc["personas"]))
+    assert rebuilt == expected
+
+    delta_sizes = [len(json.dumps(e)) for e in events if e["type"] == "persona_states_delta"]
+    assert max(delta_sizes) * 5 < len(json.dumps(events[0]))
@@ -0,0 +1,109 @@
+"""
+Tests for EventBatcher in src/dashboard/event_emitter.py.
+
+Verifies that:
+- Events within a window arrive as one batch, in order
+- max_events flushes early; close() flushes what's left
+- Superseded memory_update / snapshot events are coalesced per window
+- Coalesced delta-encoded snapshots still rebuild the latest state exactly
+"""
+
+import copy
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.dashboard.delta import apply_patch
+from src.dashboard.event_emitter import DashboardEventEmitter, DashboardLogger, EventBatcher
+
+
+class Collector:
+    """Thread-safe downstream sink that records frames."""
+
+    def __init__(self):
+        self.frames = []
+        self.lock = threading.Lock()
+
+    def __call__(self, frame):
+        with self.lock:
+            self.frames.append(frame)
+
+    def events(self):
+        out = []
+        for frame in self.frames:
+            out.extend(frame["events"] if frame["type"] == "batch" else [frame])
+        return out
+
+
+def test_window_delivers_one_ordered_batch():
+    sink = Collector()
+    batcher = EventBatcher(sink, window=0.2, max_events=100)
+    for n in range(10):
+        batcher({"type": "turn_start", "turn_num": n})
+    batcher.close()
+
+    assert len(sink.frames) == 1
+    assert [e["turn_num"] for e in sink.events()] == list(range(10))
+
+
+def test_max_events_flushes_early():
+    sink = Collector()
+    batcher = EventBatcher(sink, window=10, max_events=3)
+    for n in range(3):
+        batcher({"type": "turn_start", "turn_num": n})
+    deadline = time.time() + 2
+    while not sink.frames and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(sink.frames) == 1
+    batcher({"type": "turn_start", "turn_num": 3})
+    batcher.close()
+    assert [e["turn_num"] for e in sink.events()] == [0, 1, 2, 3]
+
+
+def test_memory_updates_coalesce_to_latest():
+    sink = Collector()
+    batcher = EventBatcher(sink, window=0.2, max_events=100)
+    emitter = DashboardEventEmitter(sink=batcher)
+    emitter.on_memory_update("v1")
+    emitter.on_turn_start("Ada", 1, 5)
+    emitter.on_memory_update("v2")
+    batcher.close()
+
+    events = sink.events()
+    assert [e["type"] for e in events] == ["turn_start", "memory_update"]
+    assert events[-1]["shared_memory"] == "v2"
+    assert batcher.stats["coalesced"] == 1
+
+
+def test_coalesced_snapshots_keep_delta_chain(tmp_path):
+    sink = Collector()
+    batcher = EventBatcher(sink, window=0.05, max_events=100)
+    emitter = DashboardEventEmitter(sink=batcher)
+    logger = DashboardLogger(base_dir=str(tmp_path), sink=batcher)
+
+    nuances = ["seed " * 30]
+    for turn in range(30):
+        nuances.append(f"nuance {turn}")
+        emitter.on_nuances_update(nuances=nuances)
+        logger.log_exchange("p1", turn, "Ada", "x", f"turn {turn}")
+        if turn % 10 == 9:
+            time.sleep(0.1)  # Let a window close mid-run
+    batcher.close()
+
+    events = sink.events()
+    assert [e["turn"] for e in events if e["type"] == "message"] == list(range(30))
+
+    snapshots = [e for e in events if e["type"].startswith("nuances_update")]
+    assert len(snapshots) < 30
+    doc, version = None, None
+    for event in snapshots:
+        if event["type"] == "nuances_update":
+            doc, version = {"nuances": copy.deepcopy(event["nuances"])}, event["version"]
+        else:
+            assert event["base_version"] == version
+            doc, version = apply_patch(doc, event["patch"]), event["version"]
+    assert doc["nuances"] == nuances
@@ -0,0 +1,231 @@
+"""
+Tests for src/dashboard/event_log.py and the resumable /ws/{id} stream.
+
+Verifies that:
+- Events get monotonically increasing seq numbers and can be read from a cursor
+- Several subscribers read the same log independently
+- Each backpressure policy handles a full ring: spill keeps everything on
+  disk, coalesce drops superseded snapshots first (never a delta whose
+  keyframe is still current), block waits for readers
+- A WebSocket client reconnecting with ?cursor= only receives newer events
+
+No OpenAI key required — the assembly generator is never called.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.dashboard.delta import DeltaEncoder, apply_patch
+from src.dashboard.event_log import SessionEventLog
+from src.dashboard.scheduler import RunScheduler
+
+
+def turn(n: int) -> dict:
+    return {"type": "turn_start", "turn_num": n}
+
+
+async def collect(log: SessionEventLog, cursor: int = 0) -> list:
+    return [event async for event in log.subscribe(cursor)]
+
+
+def receive_events(ws) -> list:
+    """Read one WebSocket frame and unpack it (frames may carry a batch)."""
+    frame = ws.receive_json()
+    return frame["events"] if frame["type"] == "batch" else [frame]
+
+
+def receive_until_complete(ws) -> list:
+    events = []
+    while not events or events[-1]["type"] != "run_complete":
+        events.extend(receive_events(ws))
+    return events
+
+
+class TestSequencing:
+
+    def test_seq_and_cursor_reads(self):
+        log = SessionEventLog(capacity=10, policy="coalesce")
+        seqs = [log.append(turn(n)) for n in range(5)]
+        assert seqs == [1, 2, 3, 4, 5]
+        assert [e["turn_num"] for e in log.read(cursor=3)] == [3, 4]
+
+    def test_multiple_subscribers_see_everything(self):
+        async def scenario():
+            log = SessionEventLog(capacity=100, policy="coalesce")
+            readers = [asyncio.create_task(collect(log)) for _ in range(3)]
+            await asyncio.sleep(0)
+            for n in range(20):
+                await log.publish(turn(n))
+                await asyncio.sleep(0)
+            log.close()
+            return await asyncio.gather(*readers)
+
+        for events in asyncio.run(scenario()):
+            assert [e["seq"] for e in events] == list(range(1, 21))
+
+    def test_subscribe_from_cursor_after_close(self):
+        async def scenario():
+            log = SessionEventLog(capacity=100, policy="coalesce")
+            for n in range(6):
+                log.append(turn(n))
+            log.close()
+            return await collect(log, cursor=4)
+
+        assert [e["seq"] for e in asyncio.run(scenario())] == [5, 6]
+
+
+class TestBackpressure:
+
+    def test_spill_keeps_evicted_events_on_disk(self, tmp_path):
+        async def scenario():
+            log = SessionEventLog(capacity=3, policy="spill", spill_path=str(tmp_path / "events.jsonl"))
+            for n in range(10):
+                log.append(turn(n))
+            log.close()
+            return log, await collect(log, cursor=2)
+
+        log, events = asyncio.run(scenario())
+        assert log.stats["spilled"] == 7
+        assert [e["seq"] for e in events] == list(range(3, 11))
+
+    def test_coalesce_drops_superseded_snapshots_first(self):
+        log = SessionEventLog(capacity=4, policy="coalesce")
+        log.append({"type": "persona_states", "states": {"v": 1}})
+        log.append(turn(1))
+        log.append({"type": "persona_states", "states": {"v": 2}})
+        log.append(turn(2))
+        log.append(turn(3))
+
+        events = log.read(cursor=0)
+        assert [e["type"] for e in events] == ["turn_start", "persona_states", "turn_start", "turn_start"]
+        assert events[1]["states"] == {"v": 2}
+        assert log.stats["coalesced"] == 1
+
+    def test_coalesce_keeps_delta_chains_intact(self):
+        encoder = DeltaEncoder(keyframe_interval=4)
+
+        def snapshot(v):
+            encoded = encoder.encode("persona_states", {"states": {"v": v, "bio": "x" * 100}})
+            if encoded["keyframe"]:
+                return {"type": "persona_states", "version": encoded["version"], **encoded["state"]}
+            return {"type": "persona_states_delta", "version": encoded["version"],
+                    "base_version": encoded["base_version"], "patch": encoded["patch"]}
+
+        log = SessionEventLog(capacity=4, policy="coalesce")
+        for v in range(1, 7):  # keyframe v1, deltas v2-v4, keyframe v5, delta v6
+            log.append(snapshot(v))
+
+        # Only events behind the v5 keyframe were dropped
+        events = log.read(cursor=0)
+        assert [e["version"] for e in events] == [5, 6]
+        assert log.stats["coalesced"] == 4
+
+        state = {"states": events[0]["states"]}
+        assert events[1]["base_version"] == 5
+        assert apply_patch(state, events[1]["patch"])["states"]["v"] == 6
+
+        # A delta chain with no newer keyframe is evicted, not coalesced
+        log = SessionEventLog(capacity=4, policy="coalesce")
+        encoder = DeltaEncoder(keyframe_interval=20)
+        for v in range(1, 7):
+            log.append(snapshot(v))
+        events = log.read(cursor=0)
+        assert log.stats["coalesced"] == 0
+        assert events[0]["type"] == "gap" and events[1]["type"] == "persona_states_delta"
+
+    def test_coalesce_reports_gap_when_nothing_to_coalesce(self):
+        log = SessionEventLog(capacity=2, policy="coalesce")
+        for n in range(5):
+            log.append(turn(n))
+        events = log.read(cursor=0)
+        assert events[0] == {"type": "gap", "from_seq": 1, "to_seq": 3, "seq": 3}
+        assert [e["seq"] for e in events[1:]] == [4, 5]
+
+    def test_block_waits_for_slow_subscriber(self):
+        async def scenario():
+            log = SessionEventLog(capacity=2, policy="block", block_timeout=5)
+            received = []
+            release = asyncio.Event()
+
+            async def slow_reader():
+                async for event in log.subscribe(0):
+                    received.append(event["seq"])
+                    if len(received) == 1:
+                        await release.wait()
+
+            reader = asyncio.create_task(slow_reader())
+            await asyncio.sleep(0)
+            for n in range(2):
+                await log.publish(turn(n))
+            publisher = asyncio.create_task(log.publish(turn(2)))
+            await asyncio.sleep(0.05)
+            blocked = not publisher.done()
+
+            release.set()
+            await publisher
+            log.close()
+            await reader
+            return blocked, received
+
+        blocked, received = asyncio.run(scenario())
+        assert blocked
+        assert received == [1, 2, 3]
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            SessionEventLog(policy="drop")
+
+
+# ---------------------------------------------------------------------------
+# /ws/{id}?cursor=
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    os.environ["DASHBOARD_USER"] = "admin"
+    os.environ["DASHBOARD_PASS"] = ""
+    monkeypatch.setenv("DASHBOARD_STATE_DB", str(tmp_path / "runs.db"))
+
+    import importlib
+    import src.dashboard.server as server_module
+    importlib.reload(server_module)
+    monkeypatch.setattr(server_module, "scheduler", RunScheduler(use_processes=False, runs_dir=str(tmp_path / "runs")))
+    monkeypatch.setattr(server_module, "LOGS_DIR", tmp_path / "logs")
+    return server_module
+
+
+def test_websocket_resumes_from_cursor(server, monkeypatch):
+    def target(emit, logs_dir, cancel_token=None, **kwargs):
+        for n in range(5):
+            emit(turn(n))
+        return [{"title": "Done"}]
+
+    monkeypatch.setattr(server, "execute_assembly_run", target)
+
+    with TestClient(server.app) as client:
+        session_id = client.post("/api/run", json={"inspiration": "A long enough inspiration"}).json()["session_id"]
+
+        with client.websocket_connect(f"/ws/{session_id}") as ws:
+            everything = receive_until_complete(ws)
+
+        # Reconnecting with a cursor only delivers newer events
+        with client.websocket_connect(f"/ws/{session_id}?cursor=3") as ws:
+            rest = receive_until_complete(ws)
+
+        # A second tab reading from the start sees the whole run again
+        with client.websocket_connect(f"/ws/{session_id}") as ws:
+            again = receive_until_complete(ws)
+
+    seqs = [e["seq"] for e in everything]
+    assert seqs == list(range(1, len(seqs) + 1))
+    assert [e["seq"] for e in rest] == seqs[3:]
+    assert again == everything
+    assert [e["turn_num"] for e in everything if e["type"] == "turn_start"] == [0, 1, 2, 3, 4]
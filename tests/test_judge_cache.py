@@ -0,0 +1,142 @@
+"""
+Tests for benchmarks/judge_cache.py (memoized LLM-judge verdicts).
+
+Verifies that:
+- A verdict is computed once and then served from its own file under
+  judge_cache/, also by a fresh process-level cache instance
+- Verdicts written concurrently by many threads all persist
+- Changing the rubric, the judge model or the content misses the cache
+- Failed judgements are not cached
+- score_idea_llm, the role-adherence judge and the repetition judge only call
+  the API for content they have not judged before, and score_idea_llm caches
+  nothing unless given a cache_dir
+
+No OpenAI key required — the judge clients are local fakes.
+"""
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks import judge_cache as judge_cache_module
+from benchmarks.judge_cache import JUDGE_CACHE_DIR, JudgeCache, cached_judge, judge_cache
+from benchmarks.memory_system import run_memory_benchmark as memory_module
+from benchmarks.phase_1_system_validity import test_persona_role_adherence as role_module
+from benchmarks.phase_2_quality_vs_single_llm import scoring
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    monkeypatch.setattr(judge_cache_module, "_caches", {})
+
+
+def _fake_openai(reply, calls):
+    def create(**request):
+        calls.append(request)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+    return lambda *args, **kwargs: SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def test_verdicts_are_reused(tmp_path):
+    calls = []
+
+    def judge():
+        calls.append(1)
+        return {"score": 4}
+
+    assert cached_judge(str(tmp_path), "m", "rubric", {"idea": "x"}, judge) == {"score": 4}
+    assert cached_judge(str(tmp_path), "m", "rubric", {"idea": "x"}, judge) == {"score": 4}
+    assert len(calls) == 1
+
+    # Persisted: a new cache instance reads it back
+    reloaded = JudgeCache(str(tmp_path / JUDGE_CACHE_DIR))
+    assert len(reloaded) == 1
+    assert reloaded.get(next((tmp_path / JUDGE_CACHE_DIR).glob("*.json")).stem) == {"score": 4}
+    assert judge_cache(str(tmp_path)).hits == 1
+
+
+def test_concurrent_puts_all_persist(tmp_path):
+    def judge_one(n):
+        return cached_judge(str(tmp_path), "m", "rubric", f"idea {n}", lambda: {"score": n})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(judge_one, range(40))) == [{"score": n} for n in range(40)]
+
+    assert len(JudgeCache(str(tmp_path / JUDGE_CACHE_DIR))) == 40
+    assert not list((tmp_path / JUDGE_CACHE_DIR).glob("*.tmp"))
+
+
+def test_rubric_model_and_content_are_part_of_the_key(tmp_path):
+    calls = []
+
+    def judge():
+        calls.append(1)
+        return {"score": len(calls)}
+
+    cached_judge(str(tmp_path), "m", "rubric", "idea", judge)
+    cached_judge(str(tmp_path), "m", "rubric v2", "idea", judge)
+    cached_judge(str(tmp_path), "other", "rubric", "idea", judge)
+    cached_judge(str(tmp_path), "m", "rubric", "other idea", judge)
+    assert len(calls) == 4
+
+
+def test_failures_are_not_cached(tmp_path):
+    def failing():
+        raise ValueError("unparseable")
+
+    with pytest.raises(ValueError):
+        cached_judge(str(tmp_path), "m", "r", "c", failing)
+    assert cached_judge(str(tmp_path), "m", "r", "c", lambda: {"ok": True}) == {"ok": True}
+    assert cached_judge(None, "m", "r", "c", lambda: {"uncached": True}) == {"uncached": True}
+
+
+def test_score_idea_llm_uses_cache(monkeypatch, tmp_path):
+    calls = []
+    reply = json.dumps({"novelty": 4, "feasibility": 3, "specificity": 5, "commercial_clarity": 2, "notes": "ok"})
+    monkeypatch.setattr(scoring, "OpenAI", _fake_openai(reply, calls))
+
+    idea = {"title": "LedgerLoop"}
+    first = scoring.score_idea_llm(idea, "finance", model="judge", cache_dir=str(tmp_path))
+    second = scoring.score_idea_llm(idea, "finance", model="judge", cache_dir=str(tmp_path))
+    assert first == second and first.total == 14
+    assert len(calls) == 1
+
+    scoring.score_idea_llm(idea, "health", model="judge", cache_dir=str(tmp_path))
+    assert len(calls) == 2
+
+    # The cache is opt-in
+    scoring.score_idea_llm(idea, "finance", model="judge")
+    assert len(calls) == 3
+
+
+def test_unparseable_score_is_retried(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(scoring, "OpenAI", _fake_openai("no json here", calls))
+
+    for _ in range(2):
+        score = scoring.score_idea_llm({"title": "x"}, "finance", model="judge", cache_dir=str(tmp_path))
+        assert score.notes == "Parse error - default scores"
+    assert len(calls) == 2
+
+
+def test_role_and_repetition_judges_use_cache(monkeypatch, tmp_path):
+    role_calls, repetition_calls = [], []
+    monkeypatch.setattr(role_module, "OpenAI", _fake_openai('{"score": 5, "in_role": true, "reasoning": "ok"}', role_calls))
+    monkeypatch.setattr("openai.OpenAI", _fake_openai('{"repetition_count": 2}', repetition_calls))
+
+    exchange = {"speaker": "Risk Assessor", "archetype": "risk", "content": "What could fail?", "phase": "p1"}
+    for _ in range(2):
+        assert role_module.analyze_role_adherence_with_llm(exchange, "judge", cache_dir=str(tmp_path))["score"] == 5
+    assert len(role_calls) == 1
+
+    logs = [{"turn": 1, "speaker": "a", "content": "same point"}, {"turn": 2, "speaker": "b", "content": "same point"}]
+    for _ in range(2):
+        assert memory_module._count_repetitions_llm(logs, "finance", "judge", cache_dir=str(tmp_path)) == 2
+    assert len(repetition_calls) == 1
@@ -0,0 +1,118 @@
+"""
+Tests for the cost and latency dimensions of the memory benchmark
+(benchmarks/usage_meter.py and run_memory_benchmark.py).
+
+Verifies that:
+- UsageMeter counts the API-reported tokens of every pipeline client call,
+  and concurrent meters each see only their own calls
+- A metered meeting counts every call the backend answered, including the
+  ones made from worker threads
+- pareto_frontier marks dominated configs and the frontier's tiers
+- run_memory_benchmark reports per-run usage, a per-config cost summary and
+  a Pareto view next to the quality results
+
+No OpenAI key required — clients come from the simulated backend.
+"""
+
+import asyncio
+import copy
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.memory_system import run_memory_benchmark as memory_module
+from benchmarks.performance.run_performance_benchmark import SIMULATED_PHASES
+from benchmarks.performance.simulated_llm import SimulatedLLM, simulated_openai
+from benchmarks.phase_2_quality_vs_single_llm.scoring import IdeaScore
+from benchmarks.usage_meter import UsageMeter, metered_openai
+from framework import facilitator as facilitator_module
+from framework.logger import ConversationLogger
+from src.idea_generation import generator
+
+
+def _call(prompt):
+    client = facilitator_module.OpenAI()
+    return client.chat.completions.create(model="m", messages=[{"role": "user", "content": prompt}])
+
+
+def test_concurrent_meters_are_separate():
+    async def cell(calls, prompt):
+        with metered_openai(), UsageMeter() as meter:
+            for _ in range(calls):
+                await asyncio.to_thread(_call, prompt)
+        return meter.summary()
+
+    async def main():
+        return await asyncio.gather(cell(2, "short"), cell(3, "a much longer prompt " * 20))
+
+    with simulated_openai(SimulatedLLM()):
+        small, large = asyncio.run(main())
+        # Unmetered calls still work once the last block has exited
+        assert _call("after").choices[0].message.content
+
+    assert small["llm_calls"] == 2 and large["llm_calls"] == 3
+    assert large["prompt_tokens"] > small["prompt_tokens"] > 0
+    assert set(large["by_source"]) == {"framework.facilitator"}
+
+
+def test_meter_sees_every_meeting_call(monkeypatch, tmp_path):
+    monkeypatch.setattr(generator, "generate_phases_for_domain", lambda **kwargs: copy.deepcopy(SIMULATED_PHASES))
+    monkeypatch.chdir(tmp_path)
+    backend = SimulatedLLM()
+
+    with simulated_openai(backend), metered_openai(), UsageMeter() as meter:
+        asyncio.run(generator.run_assembly(
+            "Personal finance tools", mode="medium", logger=ConversationLogger(base_dir=str(tmp_path / "logs")),
+            persona_cache_dir=str(tmp_path / "personas"), persona_archive_dir=str(tmp_path / "archive"),
+        ))
+
+    usage = meter.summary()
+    tracked = sum(1 for call in backend.calls if call["kind"] in ("idea_extraction", "rejection_detection"))
+    assert usage["llm_calls"] == len(backend.calls)
+    assert tracked and usage["by_source"]["src.idea_generation.idea_tracker"]["llm_calls"] == tracked
+
+
+def test_pareto_frontier():
+    points = [
+        {"config": "full_history", "avg_score": 14.0, "avg_total_tokens": 90000},
+        {"config": "structured", "avg_score": 15.0, "avg_total_tokens": 40000},
+        {"config": "tiny", "avg_score": 11.0, "avg_total_tokens": 10000},
+    ]
+    frontier = memory_module.pareto_frontier(points)
+    by_config = {p["config"]: p for p in frontier}
+    assert [p["config"] for p in frontier] == ["tiny", "structured", "full_history"]
+    assert by_config["full_history"]["dominated_by"] == ["structured"]
+    assert by_config["structured"]["pareto_optimal"] and by_config["tiny"]["pareto_optimal"]
+    assert memory_module._deployment_tiers(frontier) == {"budget": "tiny", "quality": "structured"}
+
+
+def test_benchmark_reports_cost_and_pareto(monkeypatch, tmp_path):
+    async def fake_run_assembly(inspiration, number_of_ideas, mode, logger, config_overrides):
+        # full_history re-sends the growing transcript every turn
+        transcript = ""
+        for turn in range(4):
+            prompt = transcript if config_overrides["memory_mode"] == "full_history" else transcript[-200:]
+            reply = await asyncio.to_thread(_call, f"You are Ada. {prompt}")
+            content = reply.choices[0].message.content
+            logger.log_exchange("p1", turn, "Ada", "analyst", content)
+            transcript += content
+        return [{"title": "LedgerLoop"}]
+
+    monkeypatch.setattr(memory_module, "run_assembly", fake_run_assembly)
+    monkeypatch.setattr(memory_module, "score_idea_llm", lambda **kwargs: IdeaScore(4, 4, 4, 4))
+    monkeypatch.setattr(memory_module, "_count_repetitions_llm", lambda *args: 0)
+    monkeypatch.chdir(tmp_path)
+
+    with simulated_openai(SimulatedLLM()):
+        results = memory_module.run_memory_benchmark(["finance"], assembly_mode="fast", output_dir=str(tmp_path))
+
+    usage = results["comparisons"][0]["run_details"]["structured"]["usage"]
+    assert usage["llm_calls"] == 4 and usage["turns"] == 4
+    assert usage["by_source"]["framework.facilitator"]["llm_calls"] == 4
+
+    cost = results["cost_summary"]
+    assert cost["full_history"]["avg_prompt_tokens"] > cost["structured"]["avg_prompt_tokens"]
+    assert results["pareto"]["tiers"] == {"budget": "structured", "quality": "structured"}
+    assert [p["pareto_optimal"] for p in results["pareto"]["points"]] == [True, False]
@@ -0,0 +1,118 @@
+"""
+Tests for src/dashboard/metrics.py and the /metrics endpoint.
+
+Verifies that:
+- The registry renders counters, cumulative histogram buckets and collector
+  gauges in Prometheus text format
+- meeting_facilitator's LLM-call hook reports latency and token usage to the
+  monitor, and counts failures
+- llm_call events from a run feed /metrics and are not forwarded to browsers
+
+No OpenAI key required.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.monitor import ConversationMonitor
+from src.dashboard.metrics import MetricsRegistry
+from src.dashboard.scheduler import RunScheduler
+from src.idea_generation.orchestration import _observed
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry(prefix="test_")
+    calls = registry.counter("calls_total", "Calls", ("site",))
+    latency = registry.histogram("latency_seconds", "Latency", ("site",), buckets=(1.0, 5.0))
+    registry.collector(lambda: [("active", "gauge", "Active things", {"kind": 'a"b'}, 2)])
+
+    calls.inc(site="x")
+    calls.inc(2, site="x")
+    latency.observe(0.5, site="x")
+    latency.observe(3.0, site="x")
+
+    text = registry.render()
+    assert "# TYPE test_calls_total counter" in text
+    assert 'test_calls_total{site="x"} 3' in text
+    assert 'test_latency_seconds_bucket{site="x",le="1"} 1' in text
+    assert 'test_latency_seconds_bucket{site="x",le="5"} 2' in text
+    assert 'test_latency_seconds_bucket{site="x",le="+Inf"} 2' in text
+    assert 'test_latency_seconds_sum{site="x"} 3.5' in text
+    assert 'test_active{kind="a\\"b"} 2' in text
+    with pytest.raises(ValueError):
+        calls.inc(other="y")
+
+
+def test_observed_reports_usage_and_errors():
+    monitor = ConversationMonitor(enable_display=False)
+
+    async def ok():
+        return {"response": "hi", "usage": {"prompt_tokens": 12, "completion_tokens": 5}}
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    assert asyncio.run(_observed(monitor, "persona_response", ok()))["response"] == "hi"
+    with pytest.raises(RuntimeError):
+        asyncio.run(_observed(monitor, "persona_response", fail()))
+
+    stats = monitor.get_stats()["llm_calls"]["persona_response"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+    assert (stats["prompt_tokens"], stats["completion_tokens"]) == (12, 5)
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    os.environ["DASHBOARD_USER"] = "admin"
+    os.environ["DASHBOARD_PASS"] = ""
+    monkeypatch.setenv("DASHBOARD_STATE_DB", str(tmp_path / "runs.db"))
+
+    import importlib
+    import src.dashboard.server as server_module
+    importlib.reload(server_module)
+    monkeypatch.setattr(server_module, "scheduler", RunScheduler(use_processes=False, runs_dir=str(tmp_path / "runs")))
+    monkeypatch.setattr(server_module, "LOGS_DIR", tmp_path / "logs")
+    return server_module
+
+
+def test_run_events_feed_metrics(server, monkeypatch):
+    def target(emit, logs_dir, cancel_token=None, **kwargs):
+        emit({"type": "llm_call", "site": "persona_response", "seconds": 0.3,
+              "prompt_tokens": 100, "completion_tokens": 40, "ok": True, "ttft": 0.2})
+        emit({"type": "llm_call", "site": "phase_summary", "seconds": 2.0,
+              "prompt_tokens": 0, "completion_tokens": 0, "ok": False})
+        return ["an idea"]
+
+    monkeypatch.setattr(server, "execute_assembly_run", target)
+
+    with TestClient(server.app) as client:
+        session_id = client.post("/api/run", json={"inspiration": "A long enough inspiration"}).json()["session_id"]
+        with client.websocket_connect(f"/ws/{session_id}") as ws:
+            events = []
+            while not events or events[-1]["type"] != "run_complete":
+                frame = ws.receive_json()
+                events.extend(frame["events"] if frame["type"] == "batch" else [frame])
+        resp = client.get("/metrics")
+
+    assert "llm_call" not in [e["type"] for e in events]
+    assert resp.headers["content-type"].startswith("text/plain")
+    text = resp.text
+    assert 'assembly_llm_requests_total{site="persona_response",outcome="ok"} 1' in text
+    assert 'assembly_llm_requests_total{site="phase_summary",outcome="error"} 1' in text
+    assert 'assembly_llm_tokens_total{site="persona_response",direction="in"} 100' in text
+    assert 'assembly_llm_request_seconds_bucket{site="persona_response",le="0.5"} 1' in text
+    assert 'assembly_llm_time_to_first_token_seconds_bucket{site="persona_response",le="0.25"} 1' in text
+    assert 'assembly_runs_finished_total{status="complete"} 1' in text
+    assert 'assembly_websocket_connections_total{endpoint="run"} 1' in text
+    assert "assembly_runs_active 0" in text
+    assert 'assembly_executor_max_workers{executor="benchmarks"}' in text
+    assert 'assembly_events_dropped_total{reason="evicted"} 0' in text
@@ -0,0 +1,104 @@
+"""
+Tests for src/dashboard/output_routing.py and concurrent benchmark output.
+
+Verifies that:
+- print() output from jobs running in parallel threads stays with its own job
+- logging records are routed to the current job, not the console
+- output from guarded calls (CancellationToken worker threads) follows its job
+- run_benchmark streams each job's lines to its own queue
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.cancellation import CancellationToken
+from src.dashboard import benchmarks_runner
+from src.dashboard.output_routing import OutputRoute, route_output
+
+
+def test_parallel_jobs_keep_their_own_output():
+    outputs = {name: [] for name in ("a", "b", "c")}
+    barrier = threading.Barrier(len(outputs))
+
+    def job(name):
+        with route_output(OutputRoute(outputs[name].append)):
+            barrier.wait()
+            for n in range(50):
+                print(f"{name} line {n}")
+                print(f"{name} to stderr", file=sys.stderr)
+
+    threads = [threading.Thread(target=job, args=(name,)) for name in outputs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, lines in outputs.items():
+        assert len(lines) == 100
+        assert all(line.startswith(name) for line in lines)
+
+
+def test_partial_lines_are_joined_and_flushed():
+    lines = []
+    with route_output(OutputRoute(lines.append)):
+        sys.stdout.write("hello ")
+        sys.stdout.write("world\nlast")
+    assert lines == ["hello world", "last"]
+
+
+def test_logging_records_follow_the_route(caplog):
+    lines = []
+    log = logging.getLogger("assembly.test_output_routing")
+    with caplog.at_level(logging.INFO):
+        with route_output(OutputRoute(lines.append)):
+            log.info("inside the job")
+        log.info("outside the job")
+    assert lines == ["INFO assembly.test_output_routing: inside the job"]
+
+
+def test_guarded_calls_inherit_the_route():
+    lines = []
+    token = CancellationToken()
+    with route_output(OutputRoute(lines.append)):
+        token.call(print, "from a worker thread")
+
+        async def scenario():
+            await token.run_sync(print, "from run_sync")
+
+        asyncio.run(scenario())
+    assert lines == ["from a worker thread", "from run_sync"]
+
+
+def test_run_benchmark_streams_to_its_own_queue(monkeypatch):
+    def fake_dispatch(benchmark_id, params):
+        for n in range(20):
+            print(f"{benchmark_id} step {n}")
+        return {"id": benchmark_id}
+
+    monkeypatch.setattr(benchmarks_runner, "_dispatch", fake_dispatch)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        queues = {name: asyncio.Queue() for name in ("phase2_two_way", "memory_benchmark")}
+        await asyncio.gather(*(
+            loop.run_in_executor(None, benchmarks_runner.run_benchmark, name, queue, loop, {})
+            for name, queue in queues.items()
+        ))
+        await asyncio.sleep(0.05)  # Let call_soon_threadsafe puts land
+        drained = {}
+        for name, queue in queues.items():
+            drained[name] = []
+            while not queue.empty():
+                drained[name].append(queue.get_nowait())
+        return drained
+
+    for name, events in asyncio.run(scenario()).items():
+        logs = [e["line"] for e in events if e["type"] == "benchmark_log"]
+        assert logs == [f"{name} step {n}" for n in range(20)]
+        assert events[-1]["type"] == "benchmark_complete"
@@ -0,0 +1,84 @@
+"""
+Tests for benchmarks/performance (simulated LLM backend and profiler).
+
+Verifies that:
+- The simulated backend is deterministic and answers each pipeline step in
+  the format it parses (next speaker rotates over the offered names)
+- simulated_openai() swaps the clients and restores them afterwards
+- A fast-mode profile runs the real meeting loop offline and reports per-turn
+  stages, LLM calls, prompt tokens, peak RSS and event-loop blocking
+- run_performance_benchmark saves its results where the dashboard looks
+- The benchmark is registered and dispatched by benchmarks_runner
+
+No OpenAI key required — every client is simulated.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.performance import run_performance_benchmark as perf
+from benchmarks.performance.simulated_llm import SimulatedLLM, simulated_openai
+from framework import facilitator as facilitator_module
+from src.dashboard import benchmarks_runner
+
+
+def _speaker_request(turn):
+    prompt = f'- Turns so far: {turn}/5\nRespond with "next_speaker"\nOtherwise, choose from: ada, bo, cy'
+    return {"messages": [{"role": "system", "content": "Facilitator"}, {"role": "user", "content": prompt}]}
+
+
+def test_backend_is_deterministic():
+    request = {"messages": [{"role": "system", "content": "You are Ada"}, {"role": "user", "content": "Discuss"}]}
+    first = SimulatedLLM().complete(request)
+    assert first == SimulatedLLM().complete(request)
+    assert first[0] == "persona_response"
+    assert first[2]["prompt_tokens"] > 0 and first[2]["completion_tokens"] > 0
+
+    speakers = [json.loads(SimulatedLLM().complete(_speaker_request(t))[1])["next_speaker"] for t in range(4)]
+    assert speakers == ["ada", "bo", "cy", "ada"]
+
+
+def test_simulated_openai_restores_clients():
+    original = facilitator_module.OpenAI
+    with simulated_openai(SimulatedLLM()):
+        client = facilitator_module.OpenAI()
+        completion = client.chat.completions.create(**_speaker_request(0))
+        assert json.loads(completion.choices[0].message.content)["next_speaker"] == "ada"
+    assert facilitator_module.OpenAI is original
+
+
+def test_fast_profile(tmp_path):
+    profile = asyncio.run(perf.profile_mode("fast", str(tmp_path), latency=0.0))
+
+    summary = profile["summary"]
+    # bookends: 2 phases x max_turns_per_phase persona turns, no mediator in fast mode
+    assert summary["turns"] == 2 * profile["config"]["max_turns_per_phase"]
+    assert profile["phases"] == ["problem_discovery", "decision_synthesis"]
+    assert {"persona_response", "facilitator_next_speaker", "other"} <= set(summary["stage_seconds_per_turn"])
+    assert summary["calls_per_turn_by_kind"]["persona_response"] == 1.0
+    assert summary["calls_per_turn_by_kind"]["next_speaker"] == 1.0
+    assert summary["prompt_tokens_per_turn"] > 0
+    assert profile["llm_calls_by_kind"]["persona_generation"]["calls"] == 2
+    assert set(profile["event_loop"]) == {"blocked_seconds", "max_lag_seconds", "stalls"}
+    for turn in profile["turns"]:
+        assert abs(sum(turn["stages"].values()) - turn["wall_seconds"]) < 0.01
+
+
+def test_results_saved_and_registered(monkeypatch, tmp_path):
+    results = perf.run_performance_benchmark(modes=["fast"], latency_ms=0, output_dir=str(tmp_path))
+    files = list(tmp_path.glob("performance_benchmark_*.json"))
+    assert len(files) == 1
+    assert json.loads(files[0].read_text())["summary"]["fast"] == results["summary"]["fast"]
+
+    bm = next(b for b in benchmarks_runner.BENCHMARKS if b["id"] == "performance")
+    assert bm["results_pattern"] == "performance_benchmark_*.json"
+
+    calls = []
+    monkeypatch.setattr(perf, "run_performance_benchmark", lambda **kwargs: calls.append(kwargs) or {})
+    benchmarks_runner._dispatch("performance", {"modes": "medium", "latency_ms": 5})
+    assert calls[0]["modes"] == ["medium"] and calls[0]["latency_ms"] == 5.0
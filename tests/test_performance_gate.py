@@ -0,0 +1,75 @@
+"""
+Tests for the performance regression gate (benchmarks/performance/gate.py).
+
+Verifies that:
+- compare() flags metrics past their threshold, ignores latency noise below
+  the absolute slack and reports improvements
+- The diff table shows every compared metric
+- main() records a baseline, passes against it, and exits non-zero with the
+  table when a metric regresses
+- A real fast-mode measurement runs offline
+
+No OpenAI key required — every client is simulated.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.performance import gate
+
+BASELINE = {"fast": {"turn_seconds_p50": 0.07, "turn_seconds_p95": 0.08, "tokens_per_run": 30000, "calls_per_run": 24}}
+
+
+def test_compare_statuses():
+    current = {"fast": {"turn_seconds_p50": 0.073, "turn_seconds_p95": 0.2, "tokens_per_run": 20000, "calls_per_run": 30}}
+    rows = {row["metric"]: row for row in gate.compare(BASELINE, current)}
+
+    assert rows["turn_seconds_p50"]["status"] == "ok"
+    assert rows["turn_seconds_p95"]["status"] == "regressed"
+    assert rows["tokens_per_run"]["status"] == "improved"
+    assert rows["calls_per_run"]["status"] == "regressed" and rows["calls_per_run"]["change"] == 0.25
+
+    # +3 ms is +43% but within the absolute latency slack
+    small = {"fast": {**BASELINE["fast"], "turn_seconds_p50": 0.01}}
+    tiny = {"fast": {**BASELINE["fast"], "turn_seconds_p50": 0.013}}
+    assert gate.compare(small, tiny)[0]["status"] == "ok"
+
+    relaxed = gate.compare(BASELINE, current, {"calls_per_run": 0.5})
+    assert [r["status"] for r in relaxed if r["metric"] == "calls_per_run"] == ["ok"]
+    assert gate.compare({}, current)[0]["status"] == "no baseline"
+
+
+def test_format_table():
+    table = gate.format_table(gate.compare(BASELINE, {"fast": {**BASELINE["fast"], "calls_per_run": 48}}))
+    assert "calls_per_run" in table and "+100.0%" in table and "REGRESSED" in table
+    assert "70.0 ms" in table
+
+
+def test_main_exit_codes(monkeypatch, tmp_path, capsys):
+    baseline_path = str(tmp_path / "baseline.json")
+    measured = {"fast": dict(BASELINE["fast"])}
+    monkeypatch.setattr(gate, "measure", lambda modes, latency_ms, repeats: {m: dict(measured[m]) for m in modes})
+
+    assert gate.main(["--baseline", baseline_path]) == 2
+    assert gate.main(["--baseline", baseline_path, "--modes", "fast", "--update-baseline"]) == 0
+    assert json.loads(Path(baseline_path).read_text())["modes"] == BASELINE
+
+    assert gate.main(["--baseline", baseline_path]) == 0
+
+    measured["fast"]["tokens_per_run"] = 40000
+    report = tmp_path / "gate.json"
+    assert gate.main(["--baseline", baseline_path, "--output", str(report)]) == 1
+    assert "REGRESSED" in capsys.readouterr().out
+    assert [r["metric"] for r in json.loads(report.read_text())["rows"] if r["status"] == "regressed"] == ["tokens_per_run"]
+    assert gate.main(["--baseline", baseline_path, "--threshold", "tokens_per_run=0.5"]) == 0
+
+
+def test_measure_fast_mode():
+    metrics = gate.measure_mode("fast", latency_ms=0, repeats=1)
+    assert set(metrics) == set(gate.METRICS)
+    assert metrics["calls_per_run"] > 0 and metrics["tokens_per_run"] > 0
+    assert metrics["turn_seconds_p95"] >= metrics["turn_seconds_p50"] > 0
@@ -0,0 +1,120 @@
+"""
+Tests for the PersonaManager file cache (framework/persona_manager.py).
+
+Verifies that:
+- Generated personas are recorded in manifest.json under the full
+  (domain, phase_id, count) and reused on the next request without a
+  generation call
+- Domains sharing a first word no longer share cache entries
+- A request for a different count is a miss
+- Repeat loads come from the in-memory LRU, which evicts least-recently-used
+  entries, and get_stats reports the cache from the manifest
+- Persona files saved before the manifest existed are indexed once
+- Managers in separate processes sharing a cache_dir keep each other's
+  manifest entries
+
+No OpenAI key required — clients come from the simulated backend.
+"""
+
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.performance.simulated_llm import SimulatedLLM, simulated_openai
+from framework import persona_manager as pm_module
+from framework.persona_manager import PersonaManager
+
+PHASE = {"phase_id": "problem_discovery", "goal": "Map the problem space"}
+
+
+@pytest.fixture
+def backend():
+    backend = SimulatedLLM()
+    with simulated_openai(backend):
+        yield backend
+
+
+def _generations(backend):
+    return sum(1 for call in backend.calls if call["kind"] == "persona_generation")
+
+
+def _record_entries(cache_dir, worker, count):
+    """Top-level so it can run in a spawned process."""
+    manager = PersonaManager(cache_dir=cache_dir, archive_dir=cache_dir)
+    for index in range(count):
+        phase_id = f"phase_{worker}_{index}"
+        manager._write_manifest({
+            f"domain/{phase_id}/1": {"domain": "domain", "phase_id": phase_id, "count": 1, "files": []},
+        })
+
+
+def _manager(tmp_path, **kwargs):
+    return PersonaManager(cache_dir=str(tmp_path / "cache"), archive_dir=str(tmp_path / "archive"), **kwargs)
+
+
+def test_manifest_hit_skips_generation(backend, tmp_path):
+    first = _manager(tmp_path).request_personas_for_phase("Personal finance tools", PHASE, count=3)
+    assert len(first) == 3 and _generations(backend) == 1
+
+    manifest = json.loads((tmp_path / "cache" / pm_module.MANIFEST_NAME).read_text())
+    entry = manifest["entries"]["personal_finance_tools/problem_discovery/3"]
+    assert len(entry["files"]) == 3
+    assert all(path.startswith("personal_finance_tools/problem_discovery/") for path in entry["files"])
+
+    # A fresh manager (new process) finds the set through the manifest
+    again = _manager(tmp_path).request_personas_for_phase("Personal finance tools", PHASE, count=3)
+    assert set(again) == set(first) and _generations(backend) == 1
+
+
+def test_full_domain_and_count_are_keyed(backend, tmp_path):
+    manager = _manager(tmp_path)
+    manager.request_personas_for_phase("Personal finance tools", PHASE, count=3)
+    manager.request_personas_for_phase("Personal fitness coaching", PHASE, count=3)
+    manager.request_personas_for_phase("Personal finance tools", PHASE, count=2)
+    assert _generations(backend) == 3
+    assert manager.get_stats()["file_cache_sets"] == 3
+
+
+def test_lru_and_stats(backend, tmp_path):
+    manager = _manager(tmp_path, lru_size=1)
+    manager.request_personas_for_phase("Personal finance tools", PHASE, count=2)
+    manager.request_personas_for_phase("Healthcare access", PHASE, count=2)
+
+    manager.request_personas_for_phase("Healthcare access", PHASE, count=2)
+    assert manager.get_stats()["definition_lru_hits"] == 1
+
+    # The finance set was evicted, so it is re-read from disk (still no generation)
+    manager.request_personas_for_phase("Personal finance tools", PHASE, count=2)
+    stats = manager.get_stats()
+    assert _generations(backend) == 2
+    assert stats["definition_lru_size"] == 1 and stats["definition_lru_misses"] == 3
+    assert stats["file_cache_personas"] == 4
+
+
+def test_legacy_files_are_indexed(backend, tmp_path):
+    legacy_dir = tmp_path / "cache" / "healthcare_access"
+    legacy_dir.mkdir(parents=True)
+    for name in ("Nurse Lead", "Clinic Owner"):
+        definition = {"Name": name, "_metadata": {"domain": "healthcare_access", "phase_generated": "problem_discovery"}}
+        (legacy_dir / f"{name.lower().replace(' ', '_')}.json").write_text(json.dumps(definition))
+
+    manager = _manager(tmp_path)
+    personas = manager.request_personas_for_phase("Healthcare access", PHASE, count=2)
+    assert set(personas) == {"nurse_lead", "clinic_owner"} and _generations(backend) == 0
+
+
+def test_processes_keep_each_others_entries(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    with ProcessPoolExecutor(max_workers=4, mp_context=multiprocessing.get_context("spawn")) as pool:
+        for future in [pool.submit(_record_entries, cache_dir, worker, 25) for worker in range(4)]:
+            future.result()
+
+    manifest = json.loads((tmp_path / "cache" / pm_module.MANIFEST_NAME).read_text())
+    assert len(manifest["entries"]) == 100
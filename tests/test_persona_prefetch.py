@@ -0,0 +1,114 @@
+"""
+Tests for concurrent persona prefetch (PersonaManager.prefetch_personas).
+
+Verifies that:
+- Every phase's personas are generated concurrently, and requesting a phase
+  awaits its prefetched generation instead of making another call
+- Personas duplicating an earlier phase's are regenerated after the fact,
+  excluding every name in use; the injected Commercial Validator is exempt
+- Phases already in the file cache are not prefetched, and a request for a
+  different count falls back to on-demand generation
+- persona_source tells a prefetch wait and a file cache hit from a generation
+
+No OpenAI key required — clients come from the simulated backend.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.performance.simulated_llm import SimulatedLLM, simulated_openai
+from framework import persona_manager as pm_module
+from framework.generators import _COMMERCIAL_VALIDATOR_PERSONA
+from framework.persona_manager import PersonaManager
+
+INSPIRATION = "Personal finance tools"
+PHASES = [{"phase_id": f"phase_{i}", "goal": f"Goal {i}"} for i in range(4)]
+
+
+def _manager(tmp_path):
+    return PersonaManager(cache_dir=str(tmp_path / "cache"), archive_dir=str(tmp_path / "archive"))
+
+
+def _generations(backend):
+    return sum(1 for call in backend.calls if call["kind"] == "persona_generation")
+
+
+async def _run_phases(manager, phases, count):
+    manager.prefetch_personas(INSPIRATION, phases, count=count)
+    return [await manager.request_personas_for_phase_async(INSPIRATION, phase, count=count) for phase in phases]
+
+
+def test_phases_generate_concurrently(tmp_path):
+    backend = SimulatedLLM(latency=0.2)
+    with simulated_openai(backend):
+        manager = _manager(tmp_path)
+        start = time.perf_counter()
+        results = asyncio.run(_run_phases(manager, PHASES, count=2))
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6  # one round-trip at each phase boundary would take 0.8s
+    assert _generations(backend) == 4
+    assert all(len(personas) == 2 for personas in results)
+    assert manager.get_stats()["file_cache_sets"] == 4
+
+
+def test_duplicates_are_regenerated(monkeypatch, tmp_path):
+    validator = dict(_COMMERCIAL_VALIDATOR_PERSONA)
+    replies = {"phase_0": [{"Name": "Alpha"}, {"Name": "Beta"}, validator],
+               "phase_1": [{"Name": "Beta"}, {"Name": "Gamma"}, validator]}
+    calls = []
+
+    async def fake_generate(inspiration, phase_info, existing_personas, count, model_name, domain):
+        calls.append((phase_info["phase_id"], list(existing_personas), count))
+        if len(calls) > 2:
+            return [{"Name": "Delta"}, dict(validator)]
+        return [dict(d) for d in replies[phase_info["phase_id"]]]
+
+    monkeypatch.setattr(pm_module, "generate_personas_for_context_async", fake_generate)
+    with simulated_openai(SimulatedLLM()):
+        manager = _manager(tmp_path)
+        first, second = asyncio.run(_run_phases(manager, PHASES[:2], count=2))
+
+    assert list(first) == ["alpha", "beta", "commercial_validator"]
+    assert list(second) == ["gamma", "delta", "commercial_validator"]
+    # Both phases were prefetched blind; the reconcile call excludes every name in use
+    assert calls[2][0] == "phase_1" and calls[2][2] == 1
+    assert {"Alpha", "Beta", "Commercial Validator", "Gamma"} <= set(calls[2][1])
+
+
+def test_cached_phases_skip_prefetch(tmp_path):
+    backend = SimulatedLLM()
+    with simulated_openai(backend):
+        asyncio.run(_run_phases(_manager(tmp_path), PHASES[:2], count=2))
+        assert _generations(backend) == 2
+
+        manager = _manager(tmp_path)
+        results = asyncio.run(_run_phases(manager, PHASES[:3], count=2))
+        assert _generations(backend) == 3 and all(len(p) == 2 for p in results)
+
+        async def different_count():
+            manager.prefetch_personas(INSPIRATION, PHASES[3:], count=2)
+            return await manager.request_personas_for_phase_async(INSPIRATION, PHASES[3], count=3)
+
+        assert len(asyncio.run(different_count())) == 3
+        assert _generations(backend) == 4  # prefetch cancelled before its call; on-demand call made
+
+
+def test_persona_source(tmp_path):
+    with simulated_openai(SimulatedLLM()):
+        manager = _manager(tmp_path)
+        assert manager.persona_source(INSPIRATION, PHASES[0], count=2) == "generate"
+
+        async def prefetched():
+            manager.prefetch_personas(INSPIRATION, PHASES[:1], count=2)
+            sources = [manager.persona_source(INSPIRATION, PHASES[0], count=c) for c in (2, 3)]
+            await manager.request_personas_for_phase_async(INSPIRATION, PHASES[0], count=2)
+            return sources
+
+        assert asyncio.run(prefetched()) == ["prefetch", "generate"]
+        assert _manager(tmp_path).persona_source(INSPIRATION, PHASES[0], count=2) == "cache"
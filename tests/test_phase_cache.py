@@ -0,0 +1,87 @@
+"""
+Tests for cached phase plans (framework/phase_cache.py) and their use in
+run_assembly() (src/idea_generation/generator.py).
+
+Verifies that:
+- Plans are keyed by the normalized inspiration (case and whitespace
+  ignored), number_of_ideas and model
+- The freshness policy ignores plans older than max_age_days; 0 disables reuse
+- A repeat run_assembly reuses the cached plan without a phase-generation
+  call, and fresh_phases=True regenerates (and replaces) it
+
+No OpenAI key required — persona manager, facilitator, phase generation and
+the meeting are fakes.
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.logger import ConversationLogger
+from framework.phase_cache import PhasePlanCache
+from src.idea_generation import generator
+
+PHASES = [{"phase_id": "explore", "goal": "Explore"}, {"phase_id": "decide", "goal": "Decide"}]
+
+
+def test_key_normalization(tmp_path):
+    cache = PhasePlanCache(cache_dir=str(tmp_path))
+    cache.put("Personal finance\n   tools for students", 3, "gpt-5.1", PHASES)
+
+    assert cache.get("  personal FINANCE tools\tfor students ", 3, "gpt-5.1") == PHASES
+    assert cache.get("Personal finance tools for students", 1, "gpt-5.1") is None
+    assert cache.get("Personal finance tools for students", 3, "gpt-4o-mini") is None
+
+    # Callers may mutate what they get back without touching the cache
+    cache.get("personal finance tools for students", 3, "gpt-5.1")[0]["max_turns"] = 9
+    assert "max_turns" not in cache.get("personal finance tools for students", 3, "gpt-5.1")[0]
+
+
+def test_freshness_policy(tmp_path):
+    PhasePlanCache(cache_dir=str(tmp_path)).put("Healthcare access", 1, "m", PHASES)
+    plan_file = next(tmp_path.glob("*.json"))
+    entry = json.loads(plan_file.read_text())
+    entry["saved_at"] = (datetime.now() - timedelta(days=10)).isoformat()
+    plan_file.write_text(json.dumps(entry))
+
+    assert PhasePlanCache(cache_dir=str(tmp_path), max_age_days=30).get("Healthcare access", 1, "m") == PHASES
+    assert PhasePlanCache(cache_dir=str(tmp_path), max_age_days=7).get("Healthcare access", 1, "m") is None
+    assert PhasePlanCache(cache_dir=str(tmp_path), max_age_days=None).get("Healthcare access", 1, "m") == PHASES
+    assert PhasePlanCache(cache_dir=str(tmp_path), max_age_days=0).get("Healthcare access", 1, "m") is None
+
+
+def test_run_assembly_reuses_plan(monkeypatch, tmp_path, idle_persona_manager):
+    generated = []
+    seen_phases = []
+
+    def fake_generate_phases(**kwargs):
+        generated.append(kwargs)
+        return [dict(p) for p in PHASES]
+
+    async def fake_meeting(shared_context, phases, **kwargs):
+        seen_phases.append([p["phase_id"] for p in phases])
+        shared_context["ideas"] = [{"title": "LedgerLoop"}]
+        return shared_context
+
+    monkeypatch.setattr(generator, "FacilitatorAgent", lambda **kwargs: None)
+    monkeypatch.setattr(generator, "generate_phases_for_domain", fake_generate_phases)
+    monkeypatch.setattr(generator, "meeting_facilitator", fake_meeting)
+    monkeypatch.chdir(tmp_path)
+
+    def run(**kwargs):
+        return generator.multiple_llm_idea_generator(
+            "Personal finance tools", mode="fast", logger=ConversationLogger(base_dir=str(tmp_path / "logs")), **kwargs,
+        )
+
+    run()
+    run()
+    assert len(generated) == 1
+    assert seen_phases == [["explore", "decide"], ["explore", "decide"]]
+    assert len(list((tmp_path / "phase_plans").glob("*.json"))) == 1
+
+    run(fresh_phases=True)
+    assert len(generated) == 2
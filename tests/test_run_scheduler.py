@@ -0,0 +1,244 @@
+"""
+Tests for src/dashboard/scheduler.py.
+
+Verifies that:
+- Runs beyond the global cap wait in a FIFO queue with position events
+- Per-user caps let other users' runs overtake a user at their limit
+- A full queue refuses new runs
+- Worker events are forwarded before the run's result resolves
+- Worker exceptions propagate to the caller, after every event the worker
+  emitted before raising
+- Process workers run in isolated working directories with captured stdout
+- Assembly runs in those workers share the persona cache, persona archive
+  and phase plan cache given to them, instead of starting from empty ones in
+  their own directory
+
+No OpenAI key required — assembly runs use the simulated backend.
+"""
+
+import asyncio
+import os
+import sys
+import copy
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.performance.run_performance_benchmark import SIMULATED_PHASES
+from benchmarks.performance.simulated_llm import SimulatedLLM, simulated_openai
+from src.dashboard.scheduler import QueueFullError, RunScheduler, execute_assembly_run
+
+
+def gated_target(emit, gate: threading.Event, value, cancel_token=None):
+    emit({"type": "working", "value": value})
+    gate.wait(timeout=5)
+    return value
+
+
+def failing_target(emit, cancel_token=None):
+    raise ValueError("boom")
+
+
+def chatty_failing_target(emit, count, cancel_token=None):
+    for index in range(count):
+        emit({"type": "working", "value": index})
+    raise ValueError("boom")
+
+
+def isolated_target(emit, value, cancel_token=None):
+    """Top-level so it can be pickled into a spawned worker process."""
+    with open("meeting_logs.txt", "w") as f:
+        f.write(value)
+    print(f"hello from {value}")
+    emit({"type": "working", "value": value})
+    return {"pid": os.getpid(), "cwd": os.getcwd()}
+
+
+def simulated_assembly_run(emit, cancel_token=None, **kwargs):
+    """Assembly run against the simulated backend; returns its persona generation calls."""
+    backend = SimulatedLLM()
+    phases = lambda **kwargs: copy.deepcopy(SIMULATED_PHASES)  # not simulated by the backend
+    with simulated_openai(backend), mock.patch("src.idea_generation.generator.generate_phases_for_domain", phases):
+        execute_assembly_run(emit, cancel_token=cancel_token, **kwargs)
+    return sum(1 for call in backend.calls if call["kind"] == "persona_generation")
+
+
+def thread_scheduler(**kwargs) -> RunScheduler:
+    return RunScheduler(use_processes=False, **kwargs)
+
+
+async def wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestAdmission:
+
+    def test_global_cap_queues_fifo_with_positions(self):
+        async def scenario():
+            scheduler = thread_scheduler(max_workers=1, max_per_user=5)
+            gates = {name: threading.Event() for name in "abc"}
+            events = {name: [] for name in "abc"}
+            tasks = {
+                name: asyncio.create_task(scheduler.run(
+                    name, f"user-{name}", gated_target,
+                    {"gate": gates[name], "value": name}, events[name].append,
+                ))
+                for name in "abc"
+            }
+            await wait_until(lambda: scheduler.position("c") == 2)
+            assert scheduler.position("a") == 0
+            assert scheduler.position("b") == 1
+            assert {"type": "run_queued", "position": 2, "queued": 2} == {
+                k: v for k, v in events["c"][-1].items() if k != "ts"
+            }
+
+            gates["a"].set()
+            assert await tasks["a"] == "a"
+            await wait_until(lambda: scheduler.position("b") == 0)
+            assert scheduler.position("c") == 1
+            # The run_queued update is delivered via call_soon_threadsafe
+            await wait_until(lambda: events["c"][-1]["position"] == 1)
+
+            gates["b"].set()
+            gates["c"].set()
+            assert await asyncio.gather(tasks["b"], tasks["c"]) == ["b", "c"]
+            assert scheduler.stats()["running"] == 0
+            scheduler.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_per_user_cap_lets_other_users_overtake(self):
+        async def scenario():
+            scheduler = thread_scheduler(max_workers=2, max_per_user=1)
+            gate = threading.Event()
+            noop = lambda event: None
+            first = asyncio.create_task(scheduler.run("a1", "alice", gated_target, {"gate": gate, "value": 1}, noop))
+            second = asyncio.create_task(scheduler.run("a2", "alice", gated_target, {"gate": gate, "value": 2}, noop))
+            third = asyncio.create_task(scheduler.run("b1", "bob", gated_target, {"gate": gate, "value": 3}, noop))
+
+            await wait_until(lambda: scheduler.position("b1") == 0)
+            assert scheduler.position("a1") == 0
+            assert scheduler.position("a2") == 1
+
+            gate.set()
+            assert await asyncio.gather(first, second, third) == [1, 2, 3]
+            scheduler.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_full_queue_refuses_runs(self):
+        async def scenario():
+            scheduler = thread_scheduler(max_workers=1, max_queued=1)
+            gate = threading.Event()
+            noop = lambda event: None
+            running = asyncio.create_task(scheduler.run("a", "u", gated_target, {"gate": gate, "value": 1}, noop))
+            waiting = asyncio.create_task(scheduler.run("b", "u", gated_target, {"gate": gate, "value": 2}, noop))
+            await wait_until(lambda: scheduler.position("b") == 1)
+
+            assert scheduler.is_full("someone-else")
+            with pytest.raises(QueueFullError):
+                await scheduler.run("c", "v", gated_target, {"gate": gate, "value": 3}, noop)
+
+            gate.set()
+            await asyncio.gather(running, waiting)
+            scheduler.shutdown()
+
+        asyncio.run(scenario())
+
+
+class TestExecution:
+
+    def test_events_arrive_before_result(self):
+        async def scenario():
+            scheduler = thread_scheduler()
+            gate = threading.Event()
+            gate.set()
+            events = []
+            result = await scheduler.run("a", "u", gated_target, {"gate": gate, "value": 7}, events.append)
+            assert result == 7
+            assert [e["type"] for e in events] == ["run_dispatched", "working"]
+            scheduler.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_worker_exception_propagates(self):
+        async def scenario():
+            scheduler = thread_scheduler()
+            with pytest.raises(ValueError, match="boom"):
+                await scheduler.run("a", "u", failing_target, {}, lambda event: None)
+            assert scheduler.stats()["running"] == 0
+            scheduler.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_events_before_exception_are_delivered(self):
+        async def scenario():
+            scheduler = thread_scheduler(max_workers=4)
+            logs = {n: [] for n in range(20)}
+            outcomes = await asyncio.gather(*(
+                scheduler.run(f"r{n}", "u", chatty_failing_target, {"count": 201}, logs[n].append)
+                for n in range(20)
+            ), return_exceptions=True)
+            scheduler.shutdown()
+            return outcomes, logs
+
+        outcomes, logs = asyncio.run(scenario())
+        assert all(isinstance(o, ValueError) for o in outcomes)
+        assert all(sum(1 for e in events if e["type"] == "working") == 201 for events in logs.values())
+
+    def test_process_workers_are_isolated(self, tmp_path):
+        async def scenario():
+            scheduler = RunScheduler(max_workers=2, runs_dir=str(tmp_path / "runs"))
+            events = []
+            results = await asyncio.gather(*(
+                scheduler.run(name, "u", isolated_target, {"value": name}, events.append)
+                for name in ("r1", "r2")
+            ))
+            scheduler.shutdown()
+            return results, events
+
+        results, events = asyncio.run(scenario())
+
+        assert all(r["pid"] != os.getpid() for r in results)
+        for name in ("r1", "r2"):
+            work_dir = tmp_path / "runs" / name
+            assert (work_dir / "meeting_logs.txt").read_text() == name
+            assert f"hello from {name}" in (work_dir / "run.log").read_text()
+        assert sorted(e["value"] for e in events if e["type"] == "working") == ["r1", "r2"]
+        assert not Path("meeting_logs.txt").exists() or Path("meeting_logs.txt").read_text() not in ("r1", "r2")
+
+    def test_assembly_runs_share_persona_dirs(self, tmp_path):
+        kwargs = {
+            "inspiration": "Personal finance tools",
+            "mode": "fast",
+            "logs_dir": str(tmp_path / "logs"),
+            "persona_cache_dir": str(tmp_path / "dynamic_personas"),
+            "persona_archive_dir": str(tmp_path / "personas_archive"),
+            "phase_cache_dir": str(tmp_path / "phase_plans"),
+        }
+
+        async def scenario():
+            scheduler = RunScheduler(max_workers=1, runs_dir=str(tmp_path / "runs"))
+            noop = lambda event: None
+            generations = [await scheduler.run(name, "u", simulated_assembly_run, kwargs, noop) for name in ("r1", "r2")]
+            scheduler.shutdown()
+            return generations
+
+        first, second = asyncio.run(scenario())
+
+        assert first > 0 and second == 0  # the second run found the first run's personas
+        assert (tmp_path / "dynamic_personas").is_dir()
+        assert len(list((tmp_path / "phase_plans").glob("*.json"))) == 1
+        for name in ("r1", "r2"):
+            assert not (tmp_path / "runs" / name / "dynamic_personas").exists()
+            assert not (tmp_path / "runs" / name / "phase_plans").exists()
+            assert f"Archive: {tmp_path / 'personas_archive'}" in (tmp_path / "runs" / name / "run.log").read_text()
@@ -0,0 +1,171 @@
+"""
+Tests for src/dashboard/run_store.py, event journals and server restarts.
+
+Verifies that:
+- RunStore round-trips records (JSON columns decoded) and lists unfinished runs
+- A journaled SessionEventLog rebuilds with the same seqs (torn lines dropped)
+- After a restart, finished runs can be reattached to with a cursor
+- Interrupted runs with a checkpoint are resumed under the same session id;
+  runs without one are marked failed
+
+No OpenAI key required — the assembly generator is never called.
+"""
+
+import asyncio
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.checkpoint import RunCheckpoint
+from src.dashboard.event_log import SessionEventLog
+from src.dashboard.run_store import RunStore
+from src.dashboard.scheduler import RunScheduler
+
+
+def test_store_round_trip(tmp_path):
+    store = RunStore(str(tmp_path / "runs.db"))
+    store.create("a", "assembly", status="queued", params={"mode": "fast"}, run_kwargs={"timeout": 5})
+    store.create("b", "benchmark", status="complete", result={"score": 1})
+    store.update("a", status="running", log_session="session_1")
+
+    record = store.get("a")
+    assert record["params"] == {"mode": "fast"}
+    assert record["run_kwargs"] == {"timeout": 5}
+    assert record["log_session"] == "session_1"
+    assert [r["id"] for r in store.unfinished()] == ["a"]
+    assert store.get("b")["result"] == {"score": 1}
+    assert store.get("missing") is None
+    with pytest.raises(ValueError):
+        store.update("a", bogus=1)
+
+
+def test_journal_rebuilds_log(tmp_path):
+    journal = tmp_path / "events.journal.jsonl"
+
+    async def write():
+        log = SessionEventLog(capacity=3, policy="spill", journal_path=str(journal))
+        for n in range(10):
+            await log.publish({"type": "turn_start", "n": n})
+        log.close()
+
+    asyncio.run(write())
+    with open(journal, "ab") as f:
+        f.write(b'{"type": "torn')  # Crash mid-write
+
+    async def reopen():
+        log = SessionEventLog.from_journal(str(journal), capacity=3, policy="spill")
+        assert log.last_seq == 10
+        assert [e["n"] for e in log.read(0)] == list(range(10))
+        assert [e["seq"] for e in log.read(7)] == [8, 9, 10]
+        assert await log.publish({"type": "turn_start", "n": 10}) == 11
+        assert [e["n"] for e in log.read(0)] == list(range(11))
+
+    asyncio.run(reopen())
+
+
+# ---------------------------------------------------------------------------
+# Server restarts
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def restart(monkeypatch, tmp_path):
+    """Return a function that (re)loads the server against the same state dir."""
+    monkeypatch.setenv("DASHBOARD_USER", "admin")
+    monkeypatch.setenv("DASHBOARD_PASS", "")
+    monkeypatch.setenv("DASHBOARD_STATE_DB", str(tmp_path / "runs.db"))
+    seen = []
+
+    def target(emit, logs_dir, cancel_token=None, **kwargs):
+        seen.append(kwargs)
+        emit({"type": "log_session", "log_session": kwargs.get("resume_session") or "session_new"})
+        return ["an idea"]
+
+    def start():
+        import src.dashboard.server as server_module
+        importlib.reload(server_module)
+        monkeypatch.setattr(server_module, "scheduler", RunScheduler(use_processes=False, runs_dir=str(tmp_path / "runs")))
+        monkeypatch.setattr(server_module, "LOGS_DIR", tmp_path / "logs")
+        monkeypatch.setattr(server_module, "execute_assembly_run", target)
+        return server_module
+
+    start.seen = seen
+    return start
+
+
+def receive_until(ws, terminal):
+    events = []
+    while not events or events[-1]["type"] != terminal:
+        frame = ws.receive_json()
+        events.extend(frame["events"] if frame["type"] == "batch" else [frame])
+    return events
+
+
+def test_finished_run_reattaches_after_restart(restart):
+    server = restart()
+    with TestClient(server.app) as client:
+        session_id = client.post("/api/run", json={"inspiration": "A long enough inspiration"}).json()["session_id"]
+        with client.websocket_connect(f"/ws/{session_id}") as ws:
+            before = receive_until(ws, "run_complete")
+
+    server = restart()
+    with TestClient(server.app) as client:
+        status = client.get(f"/api/run/{session_id}").json()
+        assert status["status"] == "complete"
+        assert status["log_session"] == "session_new"
+        assert status["last_seq"] == before[-1]["seq"]
+        with client.websocket_connect(f"/ws/{session_id}?cursor=1") as ws:
+            after = receive_until(ws, "run_complete")
+    assert after == before[1:]
+
+
+def _seed_interrupted_run(tmp_path, run_id, log_session):
+    journal = tmp_path / "runs" / run_id / "events.journal.jsonl"
+
+    async def write():
+        log = SessionEventLog(journal_path=str(journal))
+        await log.publish({"type": "run_started", "session_id": run_id})
+        await log.publish({"type": "turn_start", "speaker": "Ada"})
+        log.close()
+
+    asyncio.run(write())
+    RunStore(str(tmp_path / "runs.db")).create(
+        run_id, "assembly", status="running", user="host:test",
+        params={"inspiration": "A long enough inspiration"},
+        run_kwargs={"generator_kwargs": {"inspiration": "A long enough inspiration", "mode": "fast"}, "timeout": None},
+        event_log=str(journal), log_session=log_session, last_seq=2,
+    )
+
+
+def test_interrupted_run_resumes_from_checkpoint(restart, tmp_path):
+    _seed_interrupted_run(tmp_path, "run-1", "session_1")
+    RunCheckpoint(tmp_path / "logs" / "session_1").save(position={"phase_index": 1})
+
+    server = restart()
+    with TestClient(server.app) as client:
+        with client.websocket_connect("/ws/run-1?cursor=2") as ws:
+            events = receive_until(ws, "run_complete")
+        assert client.get("/api/run/run-1").json()["status"] == "complete"
+
+    assert events[0]["type"] == "run_resumed"
+    assert events[0]["seq"] == 3
+    assert events[-1]["ideas"] == ["an idea"]
+    assert restart.seen[-1]["resume_session"] == "session_1"
+
+
+def test_interrupted_run_without_checkpoint_fails(restart, tmp_path):
+    _seed_interrupted_run(tmp_path, "run-2", None)
+
+    server = restart()
+    with TestClient(server.app) as client:
+        with client.websocket_connect("/ws/run-2") as ws:
+            events = receive_until(ws, "run_error")
+        assert client.get("/api/run/run-2").json()["status"] == "error"
+
+    assert [e["type"] for e in events] == ["run_started", "turn_start", "run_error"]
+    assert restart.seen == []
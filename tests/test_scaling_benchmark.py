@@ -0,0 +1,67 @@
+"""
+Tests for benchmarks/performance/run_scaling_benchmark.py.
+
+Verifies that:
+- fit_exponent recovers k from y = c * x^k and ignores non-positive points
+- Components whose fitted exponent exceeds the threshold are flagged
+- A small persona sweep runs offline, grows per-persona calls with the panel
+  size and saves the JSON and HTML report where the dashboard looks
+- The benchmark is registered and dispatched by benchmarks_runner
+
+No OpenAI key required — every client is simulated.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.performance import run_scaling_benchmark as scaling
+from src.dashboard import benchmarks_runner
+
+
+def test_fit_exponent():
+    xs = [2, 4, 8, 16]
+    assert scaling.fit_exponent(xs, [3 * x for x in xs]) == 1.0
+    assert scaling.fit_exponent(xs, [0.5 * x ** 2 for x in xs]) == 2.0
+    assert scaling.fit_exponent(xs, [7, 7, 7, 7]) == 0.0
+    assert scaling.fit_exponent(xs, [0, 0, 0, 5]) is None
+
+
+def test_superlinear_components():
+    xs = [2, 4, 8]
+    points = [
+        {"tokens_by_kind": {"linear": x, "quadratic": x * x}, "calls_by_kind": {"linear": x},
+         "stage_seconds": {"persona": 0.1 * x}, "tokens_total": x + x * x, "llm_calls_total": x,
+         "wall_seconds": 0.1 * x, "heap_peak_mb": 1.0}
+        for x in xs
+    ]
+    exponents = scaling.growth_exponents(xs, points)
+    assert exponents["totals"]["heap_peak_mb"] == 0.0
+    flagged = scaling.superlinear_components(exponents, threshold=1.2)
+    assert [(f["metric"], f["component"]) for f in flagged] == [("tokens", "quadratic"), ("totals", "tokens")]
+
+
+def test_persona_sweep_saved_and_registered(monkeypatch, tmp_path):
+    results = scaling.run_scaling_benchmark(
+        sweeps=["personas"], persona_counts=[2, 4], latency_ms=0, output_dir=str(tmp_path)
+    )
+    points = results["sweeps"]["personas"]["points"]
+    # One summary update per persona per turn
+    assert points[1]["calls_by_kind"]["summary_update"] > points[0]["calls_by_kind"]["summary_update"]
+    assert all(p["heap_peak_mb"] > 0 for p in points)
+
+    files = list(tmp_path.glob("scaling_benchmark_*.json"))
+    assert len(files) == 1
+    assert json.loads(files[0].read_text())["superlinear"] == results["superlinear"]
+    assert "<svg" in files[0].with_suffix(".html").read_text()
+
+    bm = next(b for b in benchmarks_runner.BENCHMARKS if b["id"] == "scaling")
+    assert bm["results_pattern"] == "scaling_benchmark_*.json"
+
+    calls = []
+    monkeypatch.setattr(scaling, "run_scaling_benchmark", lambda **kwargs: calls.append(kwargs) or {})
+    benchmarks_runner._dispatch("scaling", {"sweeps": "turns", "latency_ms": 0, "memory_mode": "full_history"})
+    assert calls[0]["sweeps"] == ["turns"] and calls[0]["memory_mode"] == "full_history"
@@ -0,0 +1,197 @@
+"""
+Tests for framework/search_index.py, ConversationReplayer.search_sessions()
+and the GET /api/search endpoint.
+
+Verifies that:
+- Exchanges, prompts, ideas and phase summaries are all indexed (including the
+  legacy phase_summaries.txt layout)
+- Results are ranked and filterable by kind and session
+- update() is incremental: unchanged sessions are skipped, modified sessions
+  are re-read and deleted sessions are dropped
+- Punctuation in user queries cannot break FTS5 syntax
+- /api/search only reads the index; the server's refresh sweep indexes
+  sessions not saved through a logger
+
+No OpenAI key required — the assembly generator is never called.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.replay import ConversationReplayer
+from framework.search_index import SearchIndex, extract_documents, to_match_query
+
+
+def write_json(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    d = tmp_path / "conversation_logs"
+
+    # Current layout (metadata/)
+    s1 = d / "session_20250101_000000" / "metadata"
+    write_json(s1 / "full_conversation.json", [
+        {"phase": "ideation", "turn": 1, "speaker": "Alice", "content": "Subscription pricing for meal kits."},
+        {"phase": "ideation", "turn": 2, "speaker": "Bob", "content": "Households waste groceries every week."},
+    ])
+    write_json(s1 / "prompt_inputs.json", [
+        {"phase": "ideation", "turn": 1, "speaker": "Alice",
+         "system_message": "You are a growth marketer", "enhanced_prompt": "Discuss onboarding funnels"},
+    ])
+    write_json(s1 / "phase_summaries.json", {"ideation": "The group converged on a freemium tier."})
+    write_json(s1 / "session_metadata.json", {
+        "ideas": [{"title": "PantryPal", "description": "Tracks pantry expiry dates"}],
+    })
+
+    # Legacy layout (top-level files + phase_summaries.txt)
+    s2 = d / "session_20250102_000000"
+    write_json(s2 / "full_conversation.json", [
+        {"phase": "research", "turn": 1, "speaker": "Cara", "content": "Carbon accounting is painful for SMEs."},
+    ])
+    write_json(s2 / "session_metadata.json", {"ideas": []})
+    (s2 / "phase_summaries.txt").write_text(
+        "=" * 70 + "\nPHASE SUMMARIES\n" + "=" * 70 + "\n\n"
+        "Phase: RESEARCH\n" + "-" * 70 + "\nInterviews surfaced spreadsheet fatigue.\n",
+        encoding="utf-8",
+    )
+    return d
+
+
+class TestExtractDocuments:
+
+    def test_collects_every_kind(self, logs_dir):
+        docs = extract_documents(logs_dir / "session_20250101_000000")
+        assert sorted({d["kind"] for d in docs}) == ["exchange", "idea", "phase_summary", "prompt"]
+
+    def test_parses_legacy_phase_summaries(self, logs_dir):
+        docs = extract_documents(logs_dir / "session_20250102_000000")
+        summaries = [d for d in docs if d["kind"] == "phase_summary"]
+        assert summaries == [{
+            "content": "Interviews surfaced spreadsheet fatigue.",
+            "kind": "phase_summary", "phase": "research", "speaker": None, "turn": None,
+        }]
+
+
+class TestSearchIndex:
+
+    def test_search_across_sessions(self, logs_dir):
+        index = SearchIndex.for_logs_dir(str(logs_dir))
+        index.update()
+        hits = index.search("carbon")
+        assert [h["session_id"] for h in hits] == ["session_20250102_000000"]
+        assert "[Carbon]" in hits[0]["snippet"]
+
+    def test_stemming_and_prefix(self, logs_dir):
+        index = SearchIndex.for_logs_dir(str(logs_dir))
+        index.update()
+        assert index.search("wasting groceries")  # porter: wasting -> wast(e)
+        assert index.search("subscri*")
+
+    def test_filter_by_kind_and_session(self, logs_dir):
+        index = SearchIndex.for_logs_dir(str(logs_dir))
+        index.update()
+        assert [h["kind"] for h in index.search("pantry", kinds=["idea"])] == ["idea"]
+        assert [h["kind"] for h in index.search("onboarding")] == ["prompt"]
+        assert index.search("freemium", session_id="session_20250102_000000") == []
+
+    def test_update_is_incremental(self, logs_dir):
+        index = SearchIndex.for_logs_dir(str(logs_dir))
+        assert index.update()["indexed"] == 2
+        assert index.update() == {"indexed": 0, "removed": 0, "unchanged": 2}
+
+        conv = logs_dir / "session_20250102_000000" / "full_conversation.json"
+        write_json(conv, [{"phase": "research", "turn": 1, "speaker": "Cara", "content": "Water metering."}])
+        os.utime(conv, (time.time() + 5, time.time() + 5))
+        assert index.update()["indexed"] == 1
+        assert index.search("carbon") == []
+        assert index.search("water")
+
+        shutil.rmtree(logs_dir / "session_20250101_000000")
+        assert index.update()["removed"] == 1
+        assert index.search("pantry") == []
+
+    def test_punctuation_is_safe(self, logs_dir):
+        index = SearchIndex.for_logs_dir(str(logs_dir))
+        index.update()
+        assert index.search('"meal" AND (kits') == []
+        assert to_match_query('say "hi"') == '"say" """hi"""'
+        assert index.search("   ") == []
+
+
+class TestReplayerSearch:
+
+    def test_search_sessions(self, logs_dir):
+        hits = ConversationReplayer.search_sessions("households", logs_dir=str(logs_dir))
+        assert hits[0]["speaker"] == "Bob"
+
+
+# ---------------------------------------------------------------------------
+# /api/search
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def server(logs_dir, monkeypatch, tmp_path):
+    os.environ["DASHBOARD_USER"] = "admin"
+    os.environ["DASHBOARD_PASS"] = ""
+    monkeypatch.setenv("DASHBOARD_STATE_DB", str(tmp_path / "runs.db"))
+    monkeypatch.setenv("DASHBOARD_RUNS_DIR", str(tmp_path / "runs"))
+
+    import importlib
+    import src.dashboard.server as server_module
+    importlib.reload(server_module)
+    monkeypatch.setattr(server_module, "LOGS_DIR", logs_dir)
+    monkeypatch.setattr(server_module, "SEARCH_REINDEX_SECONDS", 0)
+    return server_module
+
+
+@pytest.fixture
+def client(server, logs_dir):
+    # Sessions are indexed when their logger saves them
+    SearchIndex.for_logs_dir(str(logs_dir)).update(str(logs_dir))
+    with TestClient(server.app, raise_server_exceptions=False) as client:
+        yield client
+
+
+class TestSearchEndpoint:
+
+    def test_returns_ranked_hits(self, client):
+        resp = client.get("/api/search", params={"q": "pantry"})
+        assert resp.status_code == 200
+        assert resp.json()["results"][0]["session_id"] == "session_20250101_000000"
+
+    def test_kind_filter(self, client):
+        body = client.get("/api/search", params={"q": "spreadsheet", "kind": "phase_summary"}).json()
+        assert [h["kind"] for h in body["results"]] == ["phase_summary"]
+
+    def test_unknown_kind_returns_400(self, client):
+        assert client.get("/api/search", params={"q": "x", "kind": "bogus"}).status_code == 400
+
+    def test_missing_query_returns_422(self, client):
+        assert client.get("/api/search").status_code == 422
+
+    def test_only_the_refresh_sweep_indexes(self, server, monkeypatch):
+        refresh = server._refresh_search_index
+
+        async def no_refresh():
+            pass
+
+        monkeypatch.setattr(server, "_refresh_search_index", no_refresh)
+        with TestClient(server.app, raise_server_exceptions=False) as client:
+            assert client.get("/api/search", params={"q": "pantry"}).json()["results"] == []
+
+            asyncio.run(refresh())
+            assert client.get("/api/search", params={"q": "pantry"}).json()["results"]
@@ -0,0 +1,184 @@
+"""
+Tests for framework/session_catalog.py and the GET /api/sessions endpoint.
+
+Verifies that:
+- Session records are built from metadata + exchanges (turns, tokens, outcome)
+- The catalog supports filtering, sorting and pagination
+- reindex() backfills both the metadata/ and legacy top-level layouts and
+  prunes rows for deleted session folders
+- ConversationLogger.save_all() upserts the finished session
+- /api/sessions serves catalog pages and rejects unknown sort columns, and
+  still backfills older sessions when a new session created the catalog first
+
+No OpenAI key required — the assembly generator is never called.
+"""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.logger import ConversationLogger
+from framework.session_catalog import SessionCatalog, build_session_record, session_outcome
+
+
+def write_session(logs_dir: Path, name: str, metadata: dict, exchanges: list, nested: bool = True) -> Path:
+    """Write a minimal session folder in either the current or legacy layout."""
+    session_dir = logs_dir / name
+    json_dir = session_dir / "metadata" if nested else session_dir
+    json_dir.mkdir(parents=True)
+    (json_dir / "session_metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+    (json_dir / "full_conversation.json").write_text(json.dumps(exchanges), encoding="utf-8")
+    return session_dir
+
+
+def meta(timestamp: str, mode: str = "medium", model: str = "gpt-4o-mini", **extra) -> dict:
+    return {"timestamp": timestamp, "mode": mode, "model": model, "inspiration": "Fix meal planning", **extra}
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    d = tmp_path / "conversation_logs"
+    d.mkdir()
+    write_session(d, "session_20250101_000000", meta("2025-01-01T00:00:00", mode="fast"),
+                  [{"content": "a" * 40}], nested=False)
+    write_session(d, "session_20250102_000000", meta("2025-01-02T00:00:00", ideas=[{"title": "X"}]),
+                  [{"content": "b" * 8}] * 3)
+    write_session(d, "session_20250103_000000",
+                  meta("2025-01-03T00:00:00", model="gpt-4o", inspiration="Carbon tracking", ideas=[]),
+                  [{"content": "c"}] * 2)
+    return d
+
+
+# ---------------------------------------------------------------------------
+# Records
+# ---------------------------------------------------------------------------
+
+class TestBuildSessionRecord:
+
+    def test_counts_turns_and_tokens(self, tmp_path):
+        record = build_session_record("s1", tmp_path, meta("t"), [{"content": "x" * 40}, {"content": "y" * 8}])
+        assert record["turn_count"] == 2
+        assert record["token_count"] == 12
+
+    def test_outcome_labels(self):
+        assert session_outcome({"ideas": [{"title": "X"}]}) == "complete"
+        assert session_outcome({"ideas": []}) == "no_ideas"
+        assert session_outcome({"convergence_error": "boom"}) == "error"
+        assert session_outcome({}) == "incomplete"
+        assert session_outcome({"outcome": "cancelled", "ideas": [{}]}) == "cancelled"
+
+
+# ---------------------------------------------------------------------------
+# Catalog queries
+# ---------------------------------------------------------------------------
+
+class TestSessionCatalog:
+
+    def test_reindex_reads_both_layouts(self, logs_dir):
+        catalog = SessionCatalog.for_logs_dir(str(logs_dir))
+        assert catalog.reindex() == 3
+        assert catalog.get("session_20250101_000000")["mode"] == "fast"
+
+    def test_reindex_prunes_deleted_sessions(self, logs_dir):
+        catalog = SessionCatalog.for_logs_dir(str(logs_dir))
+        catalog.reindex()
+        shutil.rmtree(logs_dir / "session_20250101_000000")
+        catalog.reindex()
+        assert catalog.count() == 2
+
+    def test_default_sort_is_newest_first(self, logs_dir):
+        catalog = SessionCatalog.for_logs_dir(str(logs_dir))
+        catalog.reindex()
+        ids = [s["id"] for s in catalog.query()["sessions"]]
+        assert ids == ["session_20250103_000000", "session_20250102_000000", "session_20250101_000000"]
+
+    def test_pagination(self, logs_dir):
+        catalog = SessionCatalog.for_logs_dir(str(logs_dir))
+        catalog.reindex()
+        page = catalog.query(limit=1, offset=1)
+        assert page["total"] == 3
+        assert [s["id"] for s in page["sessions"]] == ["session_20250102_000000"]
+
+    def test_filters(self, logs_dir):
+        catalog = SessionCatalog.for_logs_dir(str(logs_dir))
+        catalog.reindex()
+        assert catalog.query(model="gpt-4o")["total"] == 1
+        assert catalog.query(outcome="complete")["total"] == 1
+        assert catalog.query(q="CARBON")["total"] == 1
+        assert catalog.query(mode="medium", model="gpt-4o-mini")["total"] == 1
+
+    def test_sort_by_turn_count(self, logs_dir):
+        catalog = SessionCatalog.for_logs_dir(str(logs_dir))
+        catalog.reindex()
+        turns = [s["turn_count"] for s in catalog.query(sort="turn_count", order="asc")["sessions"]]
+        assert turns == [1, 2, 3]
+
+    def test_unknown_sort_raises(self, logs_dir):
+        catalog = SessionCatalog.for_logs_dir(str(logs_dir))
+        with pytest.raises(ValueError):
+            catalog.query(sort="id; DROP TABLE sessions")
+
+
+class TestLoggerUpdatesCatalog:
+
+    def test_save_all_upserts_session(self, tmp_path):
+        logger = ConversationLogger(base_dir=str(tmp_path / "logs"))
+        logger.log_metadata("mode", "fast")
+        logger.log_exchange(phase_id="ideation", turn=1, speaker="Alice", archetype="Test", content="hello world!")
+        logger.save_all()
+
+        row = SessionCatalog.for_logs_dir(str(tmp_path / "logs")).get(logger.session_dir.name)
+        assert row is not None
+        assert row["mode"] == "fast"
+        assert row["turn_count"] == 1
+
+
+# ---------------------------------------------------------------------------
+# /api/sessions
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def client(logs_dir, monkeypatch):
+    os.environ["DASHBOARD_USER"] = "admin"
+    os.environ["DASHBOARD_PASS"] = ""
+
+    import importlib
+    import src.dashboard.server as server_module
+    importlib.reload(server_module)
+    monkeypatch.setattr(server_module, "LOGS_DIR", logs_dir)
+
+    return TestClient(server_module.app, raise_server_exceptions=False)
+
+
+class TestSessionsEndpoint:
+
+    def test_backfills_and_paginates(self, client):
+        resp = client.get("/api/sessions", params={"limit": 2})
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["total"] == 3
+        assert len(body["sessions"]) == 2
+
+    def test_filter_by_mode(self, client):
+        body = client.get("/api/sessions", params={"mode": "fast"}).json()
+        assert [s["id"] for s in body["sessions"]] == ["session_20250101_000000"]
+
+    def test_unknown_sort_returns_400(self, client):
+        resp = client.get("/api/sessions", params={"sort": "bogus"})
+        assert resp.status_code == 400
+
+    def test_backfills_after_a_new_session_created_the_catalog(self, client, logs_dir):
+        logger = ConversationLogger(base_dir=str(logs_dir))
+        logger.log_metadata("mode", "fast")
+        logger.save_all()
+        assert SessionCatalog.for_logs_dir(str(logs_dir)).count() == 1
+
+        assert client.get("/api/sessions").json()["total"] == 4
@@ -0,0 +1,116 @@
+"""
+Tests for GET /api/sessions/{id} payloads (src/dashboard/server.py, http_cache.py).
+
+Verifies that:
+- Without query parameters the full metadata + exchanges are returned
+- Exchanges can be narrowed by phase / turn range and paged with offset/limit
+- ETag and Last-Modified revalidate to 304 until the session files change
+- Large payloads are gzip-compressed when the client accepts it (and only
+  when it does: q=0 refuses an encoding)
+
+No OpenAI key required.
+"""
+
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.dashboard.http_cache import MIN_COMPRESS_BYTES, encode_json_body
+from src.dashboard.scheduler import RunScheduler
+
+
+def _write_session(logs_dir: Path, name: str = "session_1", turns: int = 5) -> Path:
+    metadata_dir = logs_dir / name / "metadata"
+    metadata_dir.mkdir(parents=True)
+    exchanges = [
+        {"phase": phase, "turn": turn, "speaker": f"P{turn % 2}", "archetype": "Tester", "content": "x" * 200}
+        for phase in ("explore", "decide")
+        for turn in range(turns)
+    ]
+    (metadata_dir / "full_conversation.json").write_text(json.dumps(exchanges), encoding="utf-8")
+    (metadata_dir / "session_metadata.json").write_text(json.dumps({"mode": "fast"}), encoding="utf-8")
+    return metadata_dir
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    os.environ["DASHBOARD_USER"] = "admin"
+    os.environ["DASHBOARD_PASS"] = ""
+    monkeypatch.setenv("DASHBOARD_STATE_DB", str(tmp_path / "runs.db"))
+
+    import importlib
+    import src.dashboard.server as server_module
+    importlib.reload(server_module)
+    monkeypatch.setattr(server_module, "scheduler", RunScheduler(use_processes=False))
+    monkeypatch.setattr(server_module, "LOGS_DIR", tmp_path / "logs")
+    _write_session(tmp_path / "logs")
+    return TestClient(server_module.app)
+
+
+def test_full_payload_is_backward_compatible(client):
+    data = client.get("/api/sessions/session_1").json()
+    assert data["metadata"] == {"mode": "fast"}
+    assert len(data["exchanges"]) == 10
+    assert data["page"]["next_offset"] is None
+    assert data["phases"] == [
+        {"phase": "explore", "offset": 0, "count": 5, "first_turn": 0, "last_turn": 4},
+        {"phase": "decide", "offset": 5, "count": 5, "first_turn": 0, "last_turn": 4},
+    ]
+
+
+def test_phase_turn_and_page_ranges(client):
+    data = client.get("/api/sessions/session_1?phase=decide&turn_from=1&turn_to=3&include=exchanges").json()
+    assert "metadata" not in data
+    assert [(e["phase"], e["turn"]) for e in data["exchanges"]] == [("decide", 1), ("decide", 2), ("decide", 3)]
+
+    first = client.get("/api/sessions/session_1?limit=4").json()
+    assert first["page"] == {"offset": 0, "limit": 4, "total": 10, "next_offset": 4}
+    last = client.get("/api/sessions/session_1?limit=4&offset=8").json()
+    assert [e["turn"] for e in last["exchanges"]] == [3, 4]
+    assert last["page"]["next_offset"] is None
+
+    assert client.get("/api/sessions/session_1?include=bogus").status_code == 400
+    assert client.get("/api/sessions/..%2Fsession_1").status_code == 404
+
+
+def test_conditional_requests(client, tmp_path):
+    resp = client.get("/api/sessions/session_1")
+    etag, modified = resp.headers["etag"], resp.headers["last-modified"]
+    assert client.get("/api/sessions/session_1", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/api/sessions/session_1", headers={"If-Modified-Since": modified}).status_code == 304
+    # Different ranges are different representations
+    assert client.get("/api/sessions/session_1?limit=2", headers={"If-None-Match": etag}).status_code == 200
+
+    conv_file = tmp_path / "logs" / "session_1" / "metadata" / "full_conversation.json"
+    conv_file.write_text(json.dumps([{"phase": "explore", "turn": 0, "content": "new"}]), encoding="utf-8")
+    fresh = client.get("/api/sessions/session_1", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert [e["content"] for e in fresh.json()["exchanges"]] == ["new"]
+
+
+def test_large_payloads_are_gzipped(client):
+    resp = client.get("/api/sessions/session_1", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert len(resp.json()["exchanges"]) == 10  # Client decodes transparently
+
+    raw = client.get("/api/sessions/session_1", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+    assert len(gzip.compress(raw.content)) < len(raw.content)
+
+
+def test_encode_json_body():
+    assert encode_json_body({"a": 1}, "gzip") == (b'{"a": 1}', None)
+
+    payload = {"text": "x" * MIN_COMPRESS_BYTES}
+    body, encoding = encode_json_body(payload, "gzip, deflate")
+    assert encoding == "gzip" and json.loads(gzip.decompress(body)) == payload
+    assert encode_json_body(payload, "gzip;q=0")[1] is None
+    assert encode_json_body(payload, "")[1] is None
@@ -0,0 +1,199 @@
+"""
+Tests for run_assembly() (src/idea_generation/generator.py) and
+stream_assembly() (src/dashboard/streaming.py).
+
+Verifies that:
+- run_assembly runs on the caller's event loop (two runs interleave on one loop)
+- multiple_llm_idea_generator still works as a synchronous wrapper
+- The final save_all (file writes, catalog and search index) runs off the loop
+- The convergence phase runs off the loop and receives the run's token
+- stream_assembly yields monitor/logger events in order, then run_complete,
+  and re-raises run failures after the events produced before them
+- Closing the stream early cancels the run
+- A consumer that falls behind is told about dropped events with a gap
+  instead of buffering without bound
+
+No OpenAI key required — persona manager, facilitator, phase generation and
+the meeting are fakes.
+"""
+
+import asyncio
+import sys
+import threading
+from contextlib import aclosing
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.cancellation import CancellationToken
+from framework.logger import ConversationLogger
+from src.dashboard import streaming
+from src.idea_generation import generator
+
+PHASES = [
+    {"phase_id": "explore", "goal": "Explore"},
+    {"phase_id": "decide", "goal": "Decide"},
+]
+
+
+class QuietMonitor:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+@pytest.fixture
+def offline(monkeypatch, tmp_path, idle_persona_manager):
+    """Replace every LLM-backed piece of run_assembly with a fake."""
+    order = []
+
+    async def fake_meeting(shared_context, monitor, logger, phases, **kwargs):
+        for phase in phases:
+            monitor.on_phase_start(phase_id=phase["phase_id"], goal=phase["goal"])
+            order.append((shared_context["inspiration"], phase["phase_id"]))
+            # Blocking work happens off the loop; another run may proceed meanwhile
+            await asyncio.to_thread(logger.log_exchange, phase["phase_id"], 0, "Ada", "Tester", "hello")
+            await asyncio.sleep(0)
+        shared_context["ideas"] = [{"title": shared_context["inspiration"]}]
+        return shared_context
+
+    monkeypatch.setattr(generator, "FacilitatorAgent", lambda **kwargs: None)
+    monkeypatch.setattr(generator, "generate_phases_for_domain", lambda **kwargs: [dict(p) for p in PHASES])
+    monkeypatch.setattr(generator, "meeting_facilitator", fake_meeting)
+    monkeypatch.chdir(tmp_path)  # meeting_logs.txt
+    return order
+
+
+def test_runs_share_the_callers_loop(offline, tmp_path):
+    async def main():
+        return await asyncio.gather(*(
+            generator.run_assembly(
+                name, mode="fast", monitor=QuietMonitor(),
+                logger=ConversationLogger(base_dir=str(tmp_path / name)),
+            )
+            for name in ("one", "two")
+        ))
+
+    results = asyncio.run(main())
+    assert results == [[{"title": "one"}], [{"title": "two"}]]
+    # Interleaved, not one run after the other
+    assert offline.index(("two", "explore")) < offline.index(("one", "decide"))
+
+
+def test_sync_wrapper(offline, tmp_path):
+    ideas = generator.multiple_llm_idea_generator(
+        "solo", mode="fast", monitor=QuietMonitor(), logger=ConversationLogger(base_dir=str(tmp_path)),
+    )
+    assert ideas == [{"title": "solo"}]
+
+
+def test_save_all_runs_off_the_loop(offline, tmp_path):
+    threads = []
+
+    class RecordingLogger(ConversationLogger):
+        def save_all(self):
+            threads.append(threading.current_thread())
+            super().save_all()
+
+    asyncio.run(generator.run_assembly(
+        "saved", mode="fast", monitor=QuietMonitor(), logger=RecordingLogger(base_dir=str(tmp_path)),
+    ))
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_convergence_phase_gets_the_token(offline, monkeypatch, tmp_path):
+    calls = []
+
+    def fake_convergence(cancel_token, **kwargs):
+        calls.append((cancel_token, threading.current_thread()))
+        return {"success": True, "convergence_output": {"title": "Refined"}, "turns": []}
+
+    monkeypatch.setattr(generator, "run_convergence_phase", fake_convergence)
+    monkeypatch.setattr(generator, "format_convergence_output", lambda output: "")
+    token = CancellationToken()
+
+    result = asyncio.run(generator.run_assembly(
+        "converged", mode="fast", monitor=QuietMonitor(), logger=ConversationLogger(base_dir=str(tmp_path)),
+        config_overrides={"enable_convergence_phase": True}, cancel_token=token,
+    ))
+    assert result == {"ideas": [{"title": "converged"}], "convergence": {"title": "Refined"}}
+    assert calls[0][0] is token and calls[0][1] is not threading.main_thread()
+
+
+def test_stream_yields_events_then_result(offline, tmp_path):
+    async def main():
+        async with aclosing(streaming.stream_assembly("streamed", logs_dir=str(tmp_path), mode="fast")) as events:
+            return [event async for event in events]
+
+    events = asyncio.run(main())
+    types = [e["type"] for e in events]
+    assert types[0] == "log_session"
+    assert types[-1] == "run_complete"
+    assert events[-1]["ideas"] == [{"title": "streamed"}]
+    assert [e["phase_id"] for e in events if e["type"] == "phase_start"] == ["explore", "decide"]
+    # Logger events emitted from worker threads arrive in order with the rest
+    assert types.index("message") < types.index("phase_start", types.index("phase_start") + 1)
+
+
+def test_stream_reraises_after_events(monkeypatch, tmp_path):
+    async def failing_run(inspiration, monitor, logger, **kwargs):
+        monitor.on_phase_start(phase_id="explore", goal="Explore")
+        raise RuntimeError("phase generation failed")
+
+    monkeypatch.setattr(streaming, "run_assembly", failing_run)
+
+    async def main():
+        seen = []
+        with pytest.raises(RuntimeError):
+            async for event in streaming.stream_assembly("x", logs_dir=str(tmp_path)):
+                seen.append(event["type"])
+        return seen
+
+    assert asyncio.run(main()) == ["log_session", "phase_start"]
+
+
+def test_closing_stream_cancels_run(monkeypatch, tmp_path):
+    state = {}
+
+    async def endless_run(inspiration, monitor, logger, cancel_token=None, **kwargs):
+        try:
+            while True:
+                monitor.on_turn_start(speaker="Ada", turn_num=0, max_turns=1)
+                await asyncio.sleep(0.01)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+
+    monkeypatch.setattr(streaming, "run_assembly", endless_run)
+    token = CancellationToken()
+
+    async def main():
+        async with aclosing(streaming.stream_assembly("x", logs_dir=str(tmp_path), cancel_token=token)) as events:
+            async for event in events:
+                if event["type"] == "turn_start":
+                    break
+
+    asyncio.run(main())
+    assert state["cancelled"]
+    assert token.cancelled
+
+
+def test_slow_consumer_sees_gap(monkeypatch, tmp_path):
+    async def chatty_run(inspiration, monitor, logger, **kwargs):
+        for n in range(50):
+            monitor.on_turn_start(speaker="Ada", turn_num=n, max_turns=50)
+        return []
+
+    monkeypatch.setattr(streaming, "run_assembly", chatty_run)
+
+    async def main():
+        stream = streaming.stream_assembly("x", logs_dir=str(tmp_path), buffer_size=10)
+        return [event async for event in stream]
+
+    events = asyncio.run(main())
+    types = [e["type"] for e in events]
+    assert types[:2] == ["log_session", "gap"]
+    assert [e["turn_num"] for e in events if e["type"] == "turn_start"] == list(range(40, 50))
+    assert types[-1] == "run_complete"
@@ -0,0 +1,198 @@
+"""
+Tests for streamed persona turns.
+
+Verifies that:
+- stream_chat_completion assembles chunks, forwards each to on_delta, picks
+  up usage from the final chunk and measures time to first token
+- An exception raised by on_delta stops reading the stream
+- DashboardEventEmitter merges chunks of one turn within a batch window into
+  a single turn_delta event
+- meeting_facilitator(stream_turns=True) forwards chunks to on_turn_delta,
+  logs the assembled message and reports TTFT through on_llm_call
+- run_convergence_phase reports each streamed turn's TTFT through
+  on_llm_call, which the dashboard folds into its TTFT histogram
+
+No OpenAI key required — the client and personas are fakes.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from framework.logger import ConversationLogger
+from framework.monitor import ConversationMonitor
+from framework.persona import stream_chat_completion
+from src.dashboard.event_emitter import DashboardEventEmitter, EventBatcher
+from src.dashboard import server
+from src.idea_generation import convergence, orchestration
+
+
+def _chunk(content=None, usage=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content is not None else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class FakeClient:
+    def __init__(self, chunks):
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self._chunks = chunks
+
+    def _create(self, **request):
+        self.requests.append(request)
+        return iter(self._chunks)
+
+
+def test_stream_chat_completion_assembles_chunks():
+    usage = SimpleNamespace(prompt_tokens=30, completion_tokens=3)
+    client = FakeClient([_chunk("Hel"), _chunk(""), _chunk("lo"), _chunk("!"), _chunk(usage=usage)])
+    deltas = []
+
+    result = stream_chat_completion(client, deltas.append, model="m", messages=[])
+
+    assert result["content"] == "Hello!"
+    assert deltas == ["Hel", "lo", "!"]
+    assert result["usage"] == {"prompt_tokens": 30, "completion_tokens": 3}
+    assert result["ttft"] is not None
+    assert client.requests[0]["stream"] is True
+
+
+def test_on_delta_exception_stops_stream():
+    read = []
+
+    def chunks():
+        for text in ("a", "b", "c"):
+            read.append(text)
+            yield _chunk(text)
+
+    client = FakeClient(chunks())
+
+    def stop(delta):
+        raise RuntimeError("cancelled")
+
+    with pytest.raises(RuntimeError):
+        stream_chat_completion(client, stop, model="m", messages=[])
+    assert read == ["a"]
+
+
+def test_emitter_merges_deltas_per_window():
+    delivered = []
+    batcher = EventBatcher(delivered.append, window=10, max_events=100)
+    emitter = DashboardEventEmitter(sink=batcher)
+    for text in ("one ", "two ", "three"):
+        emitter.on_turn_delta(speaker="Ada", delta=text, phase_id="explore", turn=2)
+    batcher.close()
+
+    assert len(delivered) == 1
+    assert delivered[0]["type"] == "turn_delta"
+    assert (delivered[0]["speaker"], delivered[0]["turn"], delivered[0]["delta"]) == ("Ada", 2, "one two three")
+
+
+# ---------------------------------------------------------------------------
+# meeting_facilitator(stream_turns=True)
+# ---------------------------------------------------------------------------
+
+class StreamingPersona:
+
+    def __init__(self, name):
+        self.name = name
+        self.archetype = "Tester"
+        self.summary = {"objective_facts": [], "subjective_notes": {}}
+        self.belief_state = None
+
+    def response(self, ctx, prompt_logger=None, on_delta=None):
+        words = [f"{self.name} ", "says ", f"turn {ctx['turn_count']}"]
+        for word in words:
+            on_delta(word)
+        return {"response": "".join(words), "usage": {"prompt_tokens": 10, "completion_tokens": 3}, "ttft": 0.05}
+
+
+class PersonaManager:
+    def persona_source(self, inspiration, phase_info, count):
+        return "generate"
+
+    async def request_personas_for_phase_async(self, inspiration, phase_info, count, domain):
+        return {"Ada": StreamingPersona("Ada")}
+
+
+class Facilitator:
+    speaker_history = {}
+
+    def decide_next_speaker(self, phase, active_personas, recent_exchanges, shared_context, turn_count, max_turns):
+        return "Ada" if turn_count < max_turns else None
+
+    def check_for_repetition(self, speaker_name, response_content):
+        return None
+
+    def summarize_phase(self, phase, exchanges, shared_context):
+        return "done"
+
+
+class RecordingMonitor(ConversationMonitor):
+    def __init__(self):
+        super().__init__(enable_display=False)
+        self.deltas = []
+
+    def on_turn_delta(self, speaker, delta, phase_id=None, turn=None):
+        self.deltas.append((phase_id, turn, speaker, delta))
+
+
+async def _no_llm(**kwargs):
+    return None
+
+
+def test_meeting_streams_turns(monkeypatch, tmp_path):
+    monkeypatch.setattr(orchestration, "extract_idea_concept_async", _no_llm)
+    monkeypatch.setattr(orchestration, "detect_rejections_async", _no_llm)
+    monitor = RecordingMonitor()
+    logger = ConversationLogger(base_dir=str(tmp_path))
+
+    asyncio.run(orchestration.meeting_facilitator(
+        persona_manager=PersonaManager(),
+        inspiration="Tools for tiny teams",
+        phases=[{"phase_id": "explore", "goal": "Explore", "max_turns": 2}],
+        shared_context={"ideas": [], "ideas_discussed": []},
+        facilitator=Facilitator(),
+        logger=logger,
+        monitor=monitor,
+        enable_summary_updates=False,
+        enable_mediator=False,
+        memory_mode="none",
+        stream_turns=True,
+    ))
+
+    for exchange in logger.exchanges:
+        streamed = "".join(d for p, t, s, d in monitor.deltas if (p, t, s) == ("explore", exchange["turn"], "Ada"))
+        assert streamed == exchange["content"]
+    stats = monitor.get_stats()["llm_calls"]["persona_response"]
+    assert stats["streamed"] == 2
+    assert stats["ttft_seconds"] == pytest.approx(0.1)
+    assert monitor.total_tokens == 26  # Reported usage, not the 500-token estimate
+
+
+def test_convergence_reports_ttft(monkeypatch):
+    usage = SimpleNamespace(prompt_tokens=20, completion_tokens=2)
+    client = FakeClient([_chunk("{}"), _chunk(usage=usage)])
+    monkeypatch.setattr(convergence, "OpenAI", lambda: client)
+    events = []
+    emitter = DashboardEventEmitter(sink=events.append)
+    sites = ("convergence_synthesis", "convergence_critique", "convergence_refinement")
+    before = {site: server._llm_ttft.count(site=site) for site in sites}
+
+    convergence.run_convergence_phase(
+        "Tools for tiny teams", logs=[], ideas_discussed=[], raw_ideas=[], verbose=False,
+        on_delta=lambda turn, delta: None, on_llm_call=emitter.on_llm_call,
+    )
+    for event in events:
+        if event["type"] == "llm_call":
+            server._record_llm_call(event)
+
+    stats = emitter.get_stats()["llm_calls"]
+    assert all(stats[site]["streamed"] == 1 and stats[site]["prompt_tokens"] == 20 for site in sites)
+    assert all(server._llm_ttft.count(site=site) == before[site] + 1 for site in sites)
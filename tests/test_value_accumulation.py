@@ -0,0 +1,130 @@
+"""
+Tests for batched turn-value extraction in
+benchmarks/phase_2_quality_vs_single_llm/value_accumulation.py.
+
+Verifies that:
+- A session is scored one request per window of turns, reusing one client
+- Concepts introduced in earlier windows reach the prompts of later windows
+- Turns missing from a batched response fall back to per-turn extraction
+- batch_size=1 keeps the original one-request-per-turn behaviour
+- analyze_sessions_value processes sessions concurrently, in input order,
+  and raises when a session could not be analyzed
+
+No OpenAI key required — the client is a local fake.
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.phase_2_quality_vs_single_llm import value_accumulation as va
+
+
+class FakeJudge:
+    """Marks every third turn (by turn number) as a new concept."""
+
+    def __init__(self, drop_index=None, delay=0.0):
+        self.prompts = []
+        self.clients = 0
+        self.drop_index = drop_index
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.clients += 1
+        return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=self.create)))
+
+    def create(self, messages, **kwargs):
+        prompt = messages[-1]["content"]
+        with self._lock:
+            self.prompts.append(prompt)
+        time.sleep(self.delay)
+        if "TURNS TO ANALYZE" in prompt:
+            turns = [int(n) for n in re.findall(r"^\[\d+\] Turn (\d+)", prompt, re.M)]
+            entries = [dict(self._verdict(turn), index=i) for i, turn in enumerate(turns) if i != self.drop_index]
+            content = json.dumps({"turns": entries})
+        else:
+            content = json.dumps(self._verdict(int(re.search(r"Content: turn (\d+)", prompt).group(1))))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    @staticmethod
+    def _verdict(turn):
+        is_new = turn % 3 == 0
+        return {"new_concept": is_new, "new_concept_description": f"concept-{turn}" if is_new else None}
+
+
+def _session(tmp_path, name, turns):
+    exchanges = [{"turn": t, "speaker": f"p{t % 2}", "content": f"turn {t}"} for t in range(turns)]
+    path = tmp_path / f"{name}_conversation.json"
+    path.write_text(json.dumps({"exchanges": exchanges}))
+    return str(path)
+
+
+def test_batched_session(monkeypatch, tmp_path):
+    judge = FakeJudge()
+    monkeypatch.setattr(va, "OpenAI", judge)
+
+    metrics = va.analyze_session_value(_session(tmp_path, "s", 25), batch_size=10)
+
+    assert len(judge.prompts) == 3 and judge.clients == 1
+    assert [t.turn for t in metrics.turn_scores] == list(range(25))
+    assert metrics.total_new_concepts == 9  # turns 0, 3, ..., 24
+    assert metrics.cumulative_concepts[-1] == 9
+    # Running concept list carries into later windows
+    assert "concept-9" in judge.prompts[1] and "concept-18" in judge.prompts[2]
+    assert "concept-12" not in judge.prompts[1]
+
+
+def test_missing_turns_fall_back_to_single_requests(monkeypatch, tmp_path):
+    judge = FakeJudge(drop_index=4)
+    monkeypatch.setattr(va, "OpenAI", judge)
+
+    metrics = va.analyze_session_value(_session(tmp_path, "s", 10), batch_size=5)
+
+    assert len(judge.prompts) == 4  # 2 windows + 1 retry each for the dropped turn
+    fallback = [p for p in judge.prompts if "CURRENT TURN TO ANALYZE" in p]
+    assert len(fallback) == 2 and "concept-3" in fallback[0]
+    assert metrics.total_new_concepts == 4
+
+
+def test_batch_size_one_is_per_turn(monkeypatch, tmp_path):
+    judge = FakeJudge()
+    monkeypatch.setattr(va, "OpenAI", judge)
+
+    metrics = va.analyze_session_value(_session(tmp_path, "s", 4), batch_size=1)
+    assert len(judge.prompts) == 4
+    assert all("CURRENT TURN TO ANALYZE" in p for p in judge.prompts)
+    assert metrics.total_new_concepts == 2
+
+
+def test_sessions_run_concurrently(monkeypatch, tmp_path):
+    judge = FakeJudge(delay=0.2)
+    monkeypatch.setattr(va, "OpenAI", judge)
+    paths = [_session(tmp_path, f"s{i}", 2 + i) for i in range(4)]
+
+    start = time.perf_counter()
+    results = va.analyze_sessions_value(paths, batch_size=5, max_workers=4)
+    assert time.perf_counter() - start < 0.6  # sequential would take 0.8s
+
+    assert [m.total_turns for m in results] == [2, 3, 4, 5]
+    comparison = va.compare_value_accumulation(results[3], results[0])
+    assert comparison["totals"]["assembly"]["new_concepts"] == 2
+    assert results[3].turn_scores[0].speaker == "p0"
+
+
+def test_failed_session_raises(monkeypatch, tmp_path):
+    monkeypatch.setattr(va, "OpenAI", FakeJudge())
+    paths = [_session(tmp_path, "s", 2), str(tmp_path / "missing_conversation.json")]
+
+    with pytest.raises(RuntimeError, match="missing_conversation.json"):
+        va.analyze_sessions_value(paths, batch_size=5)